@@ -10,124 +10,51 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from gitsage.utils import ProjectDetector
+from gitsage.generators.auto_readme import auto_readme
+from gitsage.utils.atomic_writer import write_if_changed
 
-def auto_generate_readme(output_path="output/README/AUTO-GENERATED-README.md"):
+
+def auto_generate_readme(output_path="output/README/AUTO-GENERATED-README.md", repo_path=".",
+                         fast=False, engine="sections", quiet=False, force=False):
     """
     Auto-generate README from project analysis
     No config file needed!
     """
+    say = (lambda *a, **k: None) if quiet else print
 
-    print("\n" + "="*60)
-    print("  Auto README Generator - Zero Config!")
-    print("="*60 + "\n")
-
-    # Analyze project
-    print("[1/3] Analyzing project...")
-    detector = ProjectDetector()
-    detection = detector.detect()
-
-    print(f"  Detected: {detection.get('type', 'unknown')} project")
-    print(f"  Language: {detection.get('primary_language', 'unknown')}")
-
-    # Generate README content
-    print("\n[2/3] Generating README...")
-
-    project_name = Path.cwd().name
-    project_type = detection.get('type', 'software')
-    language = detection.get('primary_language', 'Python')
-    framework = detection.get('framework', '')
-
-    readme_content = f"""# {project_name}
-
-> Auto-generated README by GitSage
-
-## Overview
-
-A {language}{' ' + framework if framework else ''} {project_type} project.
-
-## Features
-
-- Modern {language} implementation
-{f'- Built with {framework}' if framework else ''}
-- Well-structured codebase
-- Ready for development
-
-## Installation
-
-```bash
-# Clone the repository
-git clone https://github.com/yourusername/{project_name}.git
-cd {project_name}
-
-# Install dependencies
-pip install -r requirements.txt  # For Python projects
-# or npm install                 # For Node.js projects
-```
-
-## Usage
-
-```bash
-# Run the project
-python main.py  # Adjust based on your entry point
-```
+    say("\n" + "="*60)
+    say("  Auto README Generator - Zero Config!")
+    say("="*60 + "\n")
 
-## Project Structure
+    existing = Path(output_path).read_text(encoding='utf-8') if Path(output_path).is_file() else None
+    readme_content, info = auto_readme(repo_path, fast=fast, engine=engine, existing=existing, force=force)
+    detection = info['config']['detection']
+    timings = info['timings']
 
-```
-{project_name}/
-├── src/           # Source code
-├── tests/         # Test files
-├── docs/          # Documentation
-└── README.md      # This file
-```
-
-## Development
-
-### Prerequisites
-
-- {language} (version as specified in project)
-{f'- {framework}' if framework else ''}
-
-### Setup
-
-1. Clone the repository
-2. Install dependencies
-3. Run tests
-4. Start developing!
-
-## Contributing
-
-Contributions are welcome! Please:
-
-1. Fork the repository
-2. Create a feature branch
-3. Make your changes
-4. Submit a pull request
-
-## License
-
-MIT License - See LICENSE file for details
-
-## Contact
-
-For questions or support, please open an issue.
-
----
-
-*This README was auto-generated by GitSage. Edit as needed!*
-"""
+    # Analyze project
+    say(f"[1/3] Analyzed project{' (cached index)' if info['cached'] else ''} in {timings['detect']:.1f} ms")
+    say(f"  Detected: {detection.get('detected_type') or 'unknown'} project")
+    say(f"  Languages: {', '.join(detection.get('languages', {})) or 'unknown'}")
+    if detection.get('frameworks'):
+        say(f"  Frameworks: {', '.join(detection['frameworks'])}")
+
+    say(f"\n[2/3] Rendered {len(info['sections'])} sections in {timings['render']:.1f} ms")
+    say(f"  Sections: {', '.join(info['sections'])}")
+    merged = info['merge']
+    if merged:
+        say(f"  Updated: {', '.join(merged.updated + merged.added + merged.removed) or 'nothing'}"
+            f" ({len(merged.unchanged)} unchanged)")
+        if merged.conflicts:
+            say(f"  Kept hand-edited: {', '.join(merged.conflicts)} (use --force to regenerate)")
 
     # Write to file
-    print(f"\n[3/3] Writing to {output_path}...")
-    output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    output_file.write_text(readme_content)
+    say(f"\n[3/3] Writing to {output_path}...")
+    written = write_if_changed(output_path, readme_content)
 
-    print(f"\n✅ README generated successfully!")
-    print(f"   Location: {output_path}")
-    print(f"   Size: {len(readme_content)} bytes")
-    print(f"\n   Review and edit as needed!")
+    say(f"\n✅ README {'generated' if written else 'unchanged'} in {timings['total']:.1f} ms")
+    say(f"   Location: {output_path}")
+    say(f"   Size: {len(readme_content)} bytes")
+    say(f"\n   Review and edit as needed!")
 
     return output_path
 
@@ -138,7 +65,17 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Auto-generate README from project analysis')
     parser.add_argument('--output', '-o', default='output/README/AUTO-GENERATED-README.md',
                        help='Output file path')
+    parser.add_argument('--path', default='.',
+                       help='Repository to analyze (default: current directory)')
+    parser.add_argument('--fast', action='store_true',
+                       help='Reuse the cached detection index (.gitsage/detection.json) when unchanged')
+    parser.add_argument('--engine', choices=['sections', 'library'], default='sections',
+                       help='Detection-driven sections or the templates/readme library')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                       help='No output (for CI)')
+    parser.add_argument('--force', action='store_true',
+                       help='Regenerate sections even if they were edited by hand')
 
     args = parser.parse_args()
 
-    auto_generate_readme(args.output)
+    auto_generate_readme(args.output, args.path, args.fast, args.engine, args.quiet, args.force)
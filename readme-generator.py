@@ -17,13 +17,18 @@ Features:
 - [LICENSE] License detection
 """
 
+import mmap
 import os
 import sys
+import time
 import yaml
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+# libyaml's C loader parses configs ~10x faster when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 try:
     from rich.console import Console
@@ -39,18 +44,57 @@ except ImportError:
 try:
     sys.path.insert(0, str(Path(__file__).parent / "src"))
     from gitsage.utils import ProjectDetector, GitHubStatsGenerator, BeautificationScorer
+    from gitsage.utils.badge_renderer import write_badges
+    from gitsage.generators.readme_engine import render_template
+    from gitsage.utils.atomic_writer import stream_if_changed, write_if_changed
+    from gitsage.generators.section_merge import (
+        MergeResult, digest, iter_merge_sections, iter_render_sections, merge_sections, parse_blocks,
+        render_sections,
+    )
+    from gitsage.generators.api_reference import ApiReferenceBuilder, api_digest, iter_api_section
     GITSAGE_UTILS_AVAILABLE = True
 except ImportError:
     GITSAGE_UTILS_AVAILABLE = False
 
 
+LOGO_PATH = 'assets/logos/logo.png'
+
+
 class ReadmeGenerator:
     """Generate comprehensive README.md files"""
 
+    # Section -> (renderer, config paths it reads). A section is re-rendered on update
+    # only when the digest of these inputs differs from the one recorded in its marker.
+    SECTIONS = {
+        'header': ('generate_header', ('project.name', 'project.tagline', 'project.license', 'project.version',
+                                       'project.github_username', 'project.repo_name', 'badges')),
+        'toc': ('generate_toc', ('sections',)),
+        'description': ('generate_description', ('project.description',)),
+        'features': ('generate_features', ('sections.features', 'features')),
+        'installation': ('generate_installation', ('sections.installation', 'installation',
+                                                   'project.github_username', 'project.repo_name')),
+        'quick_start': ('generate_quick_start', ('sections.quick_start', 'template.type')),
+        'usage': ('generate_usage', ('sections.usage', 'usage_examples')),
+        'api_reference': ('generate_api_reference', ('sections.api_reference', 'api_reference')),
+        'contributing': ('generate_contributing', ('sections.contributing', 'contributing.guidelines_file')),
+        'license': ('generate_license', ('sections.license', 'project.license')),
+        'support': ('generate_support', ('sections.support', 'support')),
+        'footer': ('generate_footer', ('project.author',)),
+    }
+
     def __init__(self, config_path="readme-config.yaml"):
         self.config_path = config_path
-        self.config = self.load_or_create_config()
         self.console = Console() if RICH_AVAILABLE else None
+        self.config = self.load_or_create_config()
+
+    @classmethod
+    def from_config(cls, config: Dict, config_path: str = "readme-config.yaml") -> "ReadmeGenerator":
+        """Create a generator from an already-loaded config dict"""
+        generator = cls.__new__(cls)
+        generator.config_path = config_path
+        generator.console = None
+        generator.config = config
+        return generator
 
     def print(self, message, style=""):
         """Print with rich if available, plain otherwise"""
@@ -86,9 +130,11 @@ class ReadmeGenerator:
             'template': {
                 'type': 'cli-tool',  # cli-tool, library, web-app, data-science, game, mobile-app
                 'style': 'professional',  # professional, minimal, creative, technical
+                'engine': 'sections',  # sections, or library to render the packaged templates/readme/<type>.md
             },
             'badges': {
                 'enabled': True,
+                'local_dir': '',  # e.g. assets/badges - render static badges offline
                 'shields': [
                     'license',
                     'version',
@@ -131,6 +177,9 @@ class ReadmeGenerator:
                 'pip_package': 'your-package-name',
                 'requirements': 'requirements.txt',
             },
+            'api_reference': {
+                'paths': None,  # Source directories to document; default src/ or the project root
+            },
             'usage_examples': [
                 {
                     'title': 'Basic Usage',
@@ -169,18 +218,31 @@ class ReadmeGenerator:
         username = project.get('github_username', 'user')
         repo = project.get('repo_name', 'repo')
 
+        # Static badges can be rendered to local SVGs so the README makes no external requests
+        local_dir = self.config['badges'].get('local_dir') if GITSAGE_UTILS_AVAILABLE else None
+        local_specs = []
+
+        def static_badge(alt: str, label: str, message: str, color: str, url: str) -> str:
+            if local_dir:
+                local_specs.append((len(badges), alt, (label, message, color)))
+                return ""
+            return f"![{alt}]({url})"
+
         badges = []
 
         if 'license' in shields:
             license_name = project.get('license', 'MIT')
-            badges.append(f"![License]({self.badge_url('license', license_name, 'green')})")
+            badges.append(static_badge('License', 'license', license_name, 'green',
+                                       self.badge_url('license', license_name, 'green')))
 
         if 'version' in shields:
             version = project.get('version', '1.0.0')
-            badges.append(f"![Version]({self.badge_url('version', version, 'blue')})")
+            badges.append(static_badge('Version', 'version', version, 'blue',
+                                       self.badge_url('version', version, 'blue')))
 
         if 'python-version' in shields:
-            badges.append(f"![Python](https://img.shields.io/badge/python-3.8+-blue.svg)")
+            badges.append(static_badge('Python', 'python', '3.8+', 'blue',
+                                       "https://img.shields.io/badge/python-3.8+-blue.svg"))
 
         if 'build-status' in shields:
             badges.append(f"![Build](https://img.shields.io/github/actions/workflow/status/{username}/{repo}/ci.yml?branch=main)")
@@ -198,10 +260,17 @@ class ReadmeGenerator:
             badges.append(f"![Issues](https://img.shields.io/github/issues/{username}/{repo})")
 
         if 'pr-welcome' in shields:
-            badges.append(f"![PRs Welcome](https://img.shields.io/badge/PRs-welcome-brightgreen.svg)")
+            badges.append(static_badge('PRs Welcome', 'PRs', 'welcome', 'brightgreen',
+                                       "https://img.shields.io/badge/PRs-welcome-brightgreen.svg"))
 
         if 'maintained' in shields:
-            badges.append(f"![Maintenance](https://img.shields.io/badge/Maintained%3F-yes-green.svg)")
+            badges.append(static_badge('Maintenance', 'Maintained?', 'yes', 'green',
+                                       "https://img.shields.io/badge/Maintained%3F-yes-green.svg"))
+
+        if local_specs:
+            paths = write_badges([spec for _, _, spec in local_specs], local_dir)
+            for (index, alt, _), path in zip(local_specs, paths):
+                badges[index] = f"![{alt}]({Path(path).as_posix()})"
 
         return " ".join(badges) + "\n"
 
@@ -215,22 +284,20 @@ class ReadmeGenerator:
         name = project['name']
         tagline = project['tagline']
 
-        header = f"# {name}\n\n"
+        header = [f"# {name}\n\n"]
 
         # Add logo if exists
-        if os.path.exists('assets/logos/logo.png'):
-            header += f"<p align=\"center\">\n  <img src=\"assets/logos/logo.png\" alt=\"{name} Logo\" width=\"200\"/>\n</p>\n\n"
+        if os.path.exists(LOGO_PATH):
+            header.append(f"<p align=\"center\">\n  <img src=\"{LOGO_PATH}\" alt=\"{name} Logo\" width=\"200\"/>\n</p>\n\n")
 
-        header += f"> {tagline}\n\n"
-        header += self.generate_badges()
+        header.append(f"> {tagline}\n\n")
+        header.append(self.generate_badges())
 
-        return header
+        return "".join(header)
 
     def generate_toc(self) -> str:
         """Generate table of contents"""
         sections = self.config['sections']
-        toc = "## 📋 Table of Contents\n\n"
-
         items = []
         if sections.get('features'): items.append("- [Features](#features)")
         if sections.get('installation'): items.append("- [Installation](#installation)")
@@ -244,22 +311,25 @@ class ReadmeGenerator:
         if sections.get('changelog'): items.append("- [Changelog](#changelog)")
         if sections.get('license'): items.append("- [License](#license)")
 
-        toc += "\n".join(items) + "\n\n"
-        return toc
+        return "## 📋 Table of Contents\n\n" + "\n".join(items) + "\n\n"
+
+    def generate_description(self) -> str:
+        """Generate the project description paragraph"""
+        return f"\n{self.config['project']['description']}\n\n"
 
     def generate_features(self) -> str:
         """Generate features section"""
-        if not self.config['sections'].get('features'):
-            return ""
-
-        features = self.config['features']
-        section = "## [+] Features\n\n"
+        return "".join(self.iter_features())
 
-        for feature in features:
-            section += f"- {feature}\n"
+    def iter_features(self) -> Iterator[str]:
+        """Features section as chunks"""
+        if not self.config['sections'].get('features'):
+            return
 
-        section += "\n"
-        return section
+        yield "## [+] Features\n\n"
+        for feature in self.config['features']:
+            yield f"- {feature}\n"
+        yield "\n"
 
     def generate_installation(self) -> str:
         """Generate installation section"""
@@ -269,21 +339,21 @@ class ReadmeGenerator:
         install = self.config['installation']
         methods = install.get('methods', [])
 
-        section = "## [PKG] Installation\n\n"
+        section = ["## [PKG] Installation\n\n"]
 
         if 'pip' in methods:
             package = install.get('pip_package', 'package-name')
-            section += f"### Using pip\n\n```bash\npip install {package}\n```\n\n"
+            section.append(f"### Using pip\n\n```bash\npip install {package}\n```\n\n")
 
         if 'git' in methods:
             username = self.config['project'].get('github_username', 'user')
             repo = self.config['project'].get('repo_name', 'repo')
-            section += f"### From source\n\n```bash\ngit clone https://github.com/{username}/{repo}.git\ncd {repo}\n"
+            section.append(f"### From source\n\n```bash\ngit clone https://github.com/{username}/{repo}.git\ncd {repo}\n")
             if install.get('requirements'):
-                section += f"pip install -r {install['requirements']}\n"
-            section += "```\n\n"
+                section.append(f"pip install -r {install['requirements']}\n")
+            section.append("```\n\n")
 
-        return section
+        return "".join(section)
 
     def generate_quick_start(self) -> str:
         """Generate quick start section"""
@@ -305,39 +375,60 @@ class ReadmeGenerator:
 
     def generate_usage(self) -> str:
         """Generate usage section"""
-        if not self.config['sections'].get('usage'):
-            return ""
+        return "".join(self.iter_usage())
 
-        section = "## [CODE] Usage\n\n"
+    def iter_usage(self) -> Iterator[str]:
+        """Usage section as chunks, one per example"""
+        if not self.config['sections'].get('usage'):
+            return
 
-        examples = self.config.get('usage_examples', [])
-        for example in examples:
-            section += f"### {example['title']}\n\n"
+        yield "## [CODE] Usage\n\n"
+        for example in self.config.get('usage_examples', []):
             language = example.get('language', 'python')
-            section += f"```{language}\n{example['code']}\n```\n\n"
+            yield f"### {example['title']}\n\n```{language}\n{example['code']}\n```\n\n"
 
-        return section
+    def api_modules(self) -> List[Dict]:
+        """Public API parsed from the project sources (built once per generator, cached on disk)"""
+        if getattr(self, '_api_modules', None) is None:
+            options = self.config.get('api_reference') or {}
+            self._api_modules = ApiReferenceBuilder('.', paths=options.get('paths')).build()
+        return self._api_modules
+
+    def generate_api_reference(self) -> str:
+        """Generate API reference section from the project's Python sources"""
+        return "".join(self.iter_api_reference())
+
+    def iter_api_reference(self) -> Iterator[str]:
+        """API reference section as chunks, one per module"""
+        if not self.config['sections'].get('api_reference') or not GITSAGE_UTILS_AVAILABLE:
+            return
+
+        yield from iter_api_section(self.api_modules(), heading="## [TOOL] API Reference")
 
     def generate_contributing(self) -> str:
         """Generate contributing section"""
         if not self.config['sections'].get('contributing'):
             return ""
 
-        section = "## [CONTRIB] Contributing\n\n"
-        section += "Contributions are welcome! Please feel free to submit a Pull Request.\n\n"
+        section = [
+            "## [CONTRIB] Contributing\n\n",
+            "Contributions are welcome! Please feel free to submit a Pull Request.\n\n",
+        ]
 
         guidelines_file = self.config['contributing'].get('guidelines_file')
         if guidelines_file and os.path.exists(guidelines_file):
-            section += f"For detailed guidelines, see [{guidelines_file}]({guidelines_file}).\n\n"
-
-        section += "### Steps to Contribute\n\n"
-        section += "1. Fork the repository\n"
-        section += "2. Create your feature branch (`git checkout -b feature/AmazingFeature`)\n"
-        section += "3. Commit your changes (`git commit -m 'Add some AmazingFeature'`)\n"
-        section += "4. Push to the branch (`git push origin feature/AmazingFeature`)\n"
-        section += "5. Open a Pull Request\n\n"
+            section.append(f"For detailed guidelines, see [{guidelines_file}]({guidelines_file}).\n\n")
+
+        section.append(
+            "### Steps to Contribute\n\n"
+            "1. Fork the repository\n"
+            "2. Create your feature branch (`git checkout -b feature/AmazingFeature`)\n"
+            "3. Commit your changes (`git commit -m 'Add some AmazingFeature'`)\n"
+            "4. Push to the branch (`git push origin feature/AmazingFeature`)\n"
+            "5. Open a Pull Request\n\n"
+        )
 
-        return section
+        return "".join(section)
 
     def generate_license(self) -> str:
         """Generate license section"""
@@ -347,10 +438,10 @@ class ReadmeGenerator:
         project = self.config['project']
         license_name = project.get('license', 'MIT')
 
-        section = "## [LICENSE] License\n\n"
-        section += f"This project is licensed under the {license_name} License - see the [LICENSE](LICENSE) file for details.\n\n"
-
-        return section
+        return (
+            "## [LICENSE] License\n\n"
+            f"This project is licensed under the {license_name} License - see the [LICENSE](LICENSE) file for details.\n\n"
+        )
 
     def generate_support(self) -> str:
         """Generate support section"""
@@ -361,53 +452,194 @@ class ReadmeGenerator:
         if not any(support.values()):
             return ""
 
-        section = "## [CHAT] Support\n\n"
+        section = ["## [CHAT] Support\n\n"]
 
         if support.get('email'):
-            section += f"- 📧 Email: {support['email']}\n"
+            section.append(f"- 📧 Email: {support['email']}\n")
         if support.get('discord'):
-            section += f"- [CHAT] Discord: {support['discord']}\n"
+            section.append(f"- [CHAT] Discord: {support['discord']}\n")
         if support.get('forum'):
-            section += f"- 💭 Forum: {support['forum']}\n"
+            section.append(f"- 💭 Forum: {support['forum']}\n")
 
-        section += "\n"
-        return section
+        section.append("\n")
+        return "".join(section)
 
     def generate_footer(self) -> str:
         """Generate footer"""
         author = self.config['project'].get('author', 'Author')
         year = datetime.now().year
 
-        footer = "---\n\n"
-        footer += f"Made with ❤️ by {author} © {year}\n"
+        return f"---\n\nMade with ❤️ by {author} © {year}\n"
+
+    def _config_value(self, path: str):
+        value = self.config
+        for key in path.split('.'):
+            value = value.get(key) if isinstance(value, dict) else None
+        return value
+
+    def section_inputs(self, name: str) -> Dict:
+        """Everything section ``name`` renders from: its config paths plus files and date it looks at"""
+        inputs = {path: self._config_value(path) for path in self.SECTIONS[name][1]}
+        if name == 'header':
+            inputs['logo'] = os.path.exists(LOGO_PATH)
+        elif name == 'api_reference' and self.config['sections'].get('api_reference'):
+            inputs['api'] = api_digest(self.api_modules())
+        elif name == 'contributing':
+            inputs['guidelines'] = os.path.exists(self.config.get('contributing', {}).get('guidelines_file') or '')
+        elif name == 'footer':
+            inputs['year'] = datetime.now().year
+        return inputs
+
+    def section_chunks(self, name: str):
+        """Section ``name`` as chunks when it has an iter_* renderer, else as one string"""
+        method = self.SECTIONS[name][0]
+        chunked = getattr(self, 'iter_' + method[len('generate_'):], None)
+        return chunked() if chunked else getattr(self, method)()
+
+    def sections(self, streaming: bool = False) -> List:
+        """(name, inputs digest, renderer) for every section in README order"""
+        return [(name, digest(self.section_inputs(name)),
+                 (lambda name=name: self.section_chunks(name)) if streaming else getattr(self, method))
+                for name, (method, _) in self.SECTIONS.items()]
+
+    def _uses_library(self) -> bool:
+        return self.config.get('template', {}).get('engine') == 'library' and GITSAGE_UTILS_AVAILABLE
+
+    def render(self, markers: bool = False) -> str:
+        """
+        Render README markdown without writing it
+
+        Args:
+            markers: Wrap each section in gitsage:begin/end comments so update() can
+                     later re-render sections individually (sections engine only)
+        """
+        if self._uses_library():
+            template = self.config['template']
+            rendered = render_template(template.get('type', 'cli-tool'), self.config)
+            if rendered is not None:
+                return rendered
+            self.print(f"[WARN] No library template for '{template.get('type')}', using sections", "yellow")
+
+        if markers and GITSAGE_UTILS_AVAILABLE:
+            return render_sections(self.sections())
+        return "".join(getattr(self, method)() for method, _ in self.SECTIONS.values())
+
+    def update(self, existing: str, force: bool = False):
+        """
+        Merge this config's sections into an existing README
+
+        Only sections whose inputs changed are re-rendered; text outside the markers
+        and hand-edited sections are kept (edited ones are overwritten with ``force``).
+
+        Returns:
+            MergeResult, or None when ``existing`` has no section markers
+        """
+        if self._uses_library() or not GITSAGE_UTILS_AVAILABLE:
+            return None
+        return merge_sections(existing, self.sections(), force=force)
 
-        return footer
+    def build(self, output_path="README.md", force: bool = False):
+        """
+        README text for ``output_path``
 
-    def generate(self, output_path="README.md") -> str:
-        """Generate complete README"""
+        Returns:
+            (readme, merge) - merged into the file's marked sections when it has them
+            (merge is the MergeResult), otherwise a fresh marked render (merge is None)
+        """
+        merged = None
+        if os.path.exists(output_path):
+            with open(output_path, 'r', encoding='utf-8') as f:
+                merged = self.update(f.read(), force=force)
+        if merged is not None:
+            return merged.text, merged
+        return self.render(markers=True), None
+
+    def stream(self, output_path="README.md", force: bool = False) -> Dict:
+        """
+        Write the README straight to ``output_path`` chunk by chunk
+
+        Sections are written as they render and an existing marked README is merged
+        through an mmap, so memory use does not grow with the document.
+
+        Returns:
+            Stats counted while streaming: written, characters, lines, merge (MergeResult or None)
+        """
+        stats = {'written': False, 'characters': 0, 'lines': 0, 'merge': None}
+
+        def document():
+            if self._uses_library():
+                rendered = render_template(self.config['template'].get('type', 'cli-tool'), self.config)
+                if rendered is not None:
+                    yield rendered
+                    return
+            sections = self.sections(streaming=True)
+            if not os.path.exists(output_path) or not os.path.getsize(output_path):
+                yield from iter_render_sections(sections)
+                return
+            # The mapping is released when the generator finishes, before the file is replaced
+            with open(output_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as existing:
+                blocks = parse_blocks(existing)
+                if not blocks:
+                    yield from iter_render_sections(sections)
+                    return
+                stats['merge'] = MergeResult(text='')
+                yield from iter_merge_sections(existing, sections, stats['merge'], force, blocks)
+
+        def counted(chunks):
+            last = ''
+            for chunk in chunks:
+                stats['characters'] += len(chunk)
+                stats['lines'] += chunk.count('\n')
+                last = chunk or last
+                yield chunk
+            if last and not last.endswith('\n'):
+                stats['lines'] += 1
+
+        stats['written'] = stream_if_changed(output_path, counted(document()))
+        return stats
+
+    def _report(self, output_path: str, written: bool, merged, characters: int, lines: int) -> None:
+        if merged is not None:
+            self.print(f"  Sections: {len(merged.updated)} updated, {len(merged.added)} added, "
+                       f"{len(merged.removed)} removed, {len(merged.unchanged)} unchanged", "dim")
+            if merged.conflicts:
+                self.print(f"[WARN] Kept hand-edited sections: {', '.join(merged.conflicts)} "
+                           f"(use --force to regenerate them)", "yellow")
+
+        if written:
+            self.print(f"[*] README generated: {output_path}", "green bold")
+        else:
+            self.print(f"[*] README unchanged: {output_path}", "green bold")
+        self.print(f"  {characters} characters", "dim")
+        self.print(f"  {lines} lines", "dim")
+
+    def generate(self, output_path="README.md", force: bool = False, stream: bool = False) -> str:
+        """
+        Generate complete README, updating only changed sections of a marked existing one
+
+        Args:
+            stream: Write chunks straight to the file instead of building the document
+                    in memory (returns an empty string)
+        """
         self.print("\n[STYLE] Generating README.md...\n", "bold blue")
 
-        readme = ""
-        readme += self.generate_header()
-        readme += self.generate_toc()
-        readme += "\n" + self.config['project']['description'] + "\n\n"
-        readme += self.generate_features()
-        readme += self.generate_installation()
-        readme += self.generate_quick_start()
-        readme += self.generate_usage()
-        readme += self.generate_contributing()
-        readme += self.generate_license()
-        readme += self.generate_support()
-        readme += self.generate_footer()
-
-        # Write to file
-        with open(output_path, 'w') as f:
-            f.write(readme)
-
-        self.print(f"[*] README generated: {output_path}", "green bold")
-        self.print(f"  {len(readme)} characters", "dim")
-        self.print(f"  {len(readme.splitlines())} lines", "dim")
+        if stream and GITSAGE_UTILS_AVAILABLE:
+            stats = self.stream(output_path, force=force)
+            self._report(output_path, stats['written'], stats['merge'], stats['characters'], stats['lines'])
+            return ""
+
+        readme, merged = self.build(output_path, force=force)
+
+        # Write to file (skipped when the content is unchanged)
+        if GITSAGE_UTILS_AVAILABLE:
+            written = write_if_changed(output_path, readme)
+        else:
+            with open(output_path, 'w') as f:
+                f.write(readme)
+            written = True
 
+        self._report(output_path, written, merged, len(readme),
+                     readme.count('\n') + (1 if readme and not readme.endswith('\n') else 0))
         return readme
 
     def interactive_wizard(self) -> Dict:
@@ -654,6 +886,9 @@ Examples:
 
   # Quick template
   python readme-generator.py --template cli-tool
+
+  # Many repositories in parallel
+  python readme-generator.py --batch manifest.yaml --jobs 8
         """
     )
 
@@ -670,9 +905,30 @@ Examples:
                        help='[SEARCH] Analyze project and show detected information')
     parser.add_argument('--health-check', action='store_true',
                        help='[HEALTH] Show repository health report')
+    parser.add_argument('--engine', choices=['sections', 'library'],
+                       help='Build from config sections or render the templates/readme library')
+    parser.add_argument('--batch', metavar='MANIFEST',
+                       help='Render many READMEs from a manifest.yaml or a directory of configs')
+    parser.add_argument('--jobs', '-j', type=int,
+                       help='Worker processes for --batch (default: CPU count)')
+    parser.add_argument('--force', action='store_true',
+                       help='Regenerate sections even if they were edited by hand')
+    parser.add_argument('--stream', action='store_true',
+                       help='Write sections to the file as they render (constant memory for huge READMEs)')
+    parser.add_argument('--check-links', action='store_true',
+                       help='[CHECK] Verify every badge and link in the generated README')
 
     args = parser.parse_args()
 
+    # Batch mode
+    if args.batch:
+        start = time.perf_counter()
+        results = run_batch(args.batch, args.jobs)
+        print_batch_report(results, time.perf_counter() - start)
+        if any(result['status'] == 'error' for result in results):
+            sys.exit(1)
+        return
+
     # Health check mode
     if args.health_check:
         if GITSAGE_UTILS_AVAILABLE:
@@ -715,8 +971,164 @@ Examples:
 
         if args.template:
             generator.config['template']['type'] = args.template
+        if args.engine:
+            generator.config['template']['engine'] = args.engine
 
-        generator.generate(args.output)
+        generator.generate(args.output, force=args.force, stream=args.stream)
+
+    if args.check_links:
+        check_links(args.output)
+
+
+def _deep_merge(base: Dict, override: Dict) -> Dict:
+    """Recursively merge ``override`` into a copy of ``base``"""
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_batch_jobs(batch_path: str) -> List[Dict]:
+    """
+    Expand a batch manifest or a directory of configs into render jobs
+
+    Manifest format::
+
+        defaults:            # merged under every repo config
+          badges: {enabled: true}
+        repos:
+          - path: repos/app  # uses repos/app/readme-config.yaml -> repos/app/README.md
+          - config: configs/lib.yaml
+            output: repos/lib/README.md
+
+    A directory renders every ``*.yaml``/``*.yml`` config in it to the config's
+    ``output`` key, or a ``.md`` file of the same name.
+    """
+    batch_path = Path(batch_path)
+    jobs = []
+
+    if batch_path.is_dir():
+        for config_file in sorted([*batch_path.glob('*.yaml'), *batch_path.glob('*.yml')]):
+            jobs.append({'config': str(config_file), 'output': None, 'defaults': {}})
+        return jobs
+
+    with open(batch_path, 'r') as f:
+        manifest = yaml.load(f, Loader=YAML_LOADER) or {}
+
+    base = batch_path.parent
+    defaults = manifest.get('defaults', {})
+    for entry in manifest.get('repos', []):
+        if isinstance(entry, str):
+            entry = {'path': entry}
+        repo_dir = base / entry['path'] if entry.get('path') else None
+        config_file = base / entry['config'] if entry.get('config') else repo_dir / 'readme-config.yaml'
+        output = base / entry['output'] if entry.get('output') else None
+        if output is None and repo_dir is not None:
+            output = repo_dir / 'README.md'
+        jobs.append({
+            'config': str(config_file),
+            'output': str(output) if output else None,
+            'defaults': defaults,
+        })
+    return jobs
+
+
+def _init_batch_worker() -> None:
+    """Compile the README template library once per worker process"""
+    if GITSAGE_UTILS_AVAILABLE:
+        from gitsage.generators.readme_engine import available_templates, load_template
+        for name in available_templates():
+            load_template(name)
+
+
+def render_batch_job(job: Dict) -> Dict:
+    """Render one batch job and write it only when the content hash changed"""
+    start = time.perf_counter()
+    config_file = Path(job['config'])
+    result = {'config': str(config_file), 'output': job['output'], 'status': 'error', 'error': ''}
+
+    cwd = os.getcwd()
+    try:
+        with open(config_file, 'r') as f:
+            config = _deep_merge(job.get('defaults') or {}, yaml.load(f, Loader=YAML_LOADER) or {})
+        output = Path(job['output'] or config.get('output') or config_file.with_suffix('.md'))
+        result['output'] = str(output)
+
+        # Relative paths in a config (logo, CONTRIBUTING.md, badge dir) are resolved per repo
+        output = output.resolve()
+        os.chdir(output.parent)
+        readme, _ = ReadmeGenerator.from_config(config, str(config_file)).build(str(output))
+        os.chdir(cwd)
+
+        data = readme.encode('utf-8')
+        result['status'] = 'written' if write_if_changed(output, data) else 'unchanged'
+        result['bytes'] = len(data)
+    except Exception as e:
+        result['error'] = str(e)
+    finally:
+        os.chdir(cwd)
+
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def run_batch(batch_path: str, jobs: Optional[int] = None) -> List[Dict]:
+    """
+    Render every README of a batch in parallel worker processes
+
+    Args:
+        batch_path: Manifest file or directory of configs
+        jobs: Worker processes (default: CPU count; 1 renders in-process)
+
+    Returns:
+        Per-repo results with status, output path and seconds
+    """
+    batch_jobs = load_batch_jobs(batch_path)
+    workers = min(jobs or os.cpu_count() or 1, len(batch_jobs)) or 1
+
+    if workers == 1:
+        _init_batch_worker()
+        return [render_batch_job(job) for job in batch_jobs]
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker) as pool:
+        return list(pool.map(render_batch_job, batch_jobs, chunksize=max(1, len(batch_jobs) // (workers * 4))))
+
+
+def print_batch_report(results: List[Dict], elapsed: float) -> None:
+    """Print per-repo timings and a summary"""
+    for result in results:
+        detail = result['error'] if result['status'] == 'error' else result['output']
+        print(f"  {result['seconds'] * 1000:8.1f} ms  {result['status']:<9}  {detail}")
+
+    counts = {status: sum(1 for r in results if r['status'] == status)
+              for status in ('written', 'unchanged', 'error')}
+    rate = len(results) / elapsed if elapsed else 0
+    print(f"\n[BATCH] {len(results)} READMEs in {elapsed:.2f}s ({rate:.0f}/s): "
+          f"{counts['written']} written, {counts['unchanged']} unchanged, {counts['error']} failed")
+
+
+def check_links(readme_path: str) -> None:
+    """Verify badges and links in a generated README and exit non-zero on dead ones"""
+    if not GITSAGE_UTILS_AVAILABLE:
+        print("Link checking requires GitSage utilities")
+        return
+
+    from gitsage.utils import LinkChecker
+    report = LinkChecker(cache_file='.gitsage/link-cache.json').verify_file(readme_path)
+    print(f"\n[CHECK] {report['checked']} links checked in {report['elapsed']:.2f}s "
+          f"({report['cached']} cached)")
+    if not report['dead']:
+        print("[OK] All badges and links are alive")
+        return
+
+    print(f"[FAIL] {len(report['dead'])} dead:")
+    for link in report['dead']:
+        print(f"  - [{link['kind']}] {link['url']} ({link['error']})")
+    sys.exit(1)
 
 
 if __name__ == '__main__':
@@ -26,6 +26,14 @@ try:
 except ImportError:
     YAML_AVAILABLE = False
 
+# Try to import GitSage utilities
+try:
+    sys.path.insert(0, str(Path(__file__).parent / "src"))
+    from gitsage.utils.atomic_writer import MANIFEST_NAME, AtomicWriter, content_hash
+    GITSAGE_UTILS_AVAILABLE = True
+except ImportError:
+    GITSAGE_UTILS_AVAILABLE = False
+
 
 class ScriptGenerator:
     """Generate custom GitHub automation scripts with educational content"""
@@ -1231,13 +1239,24 @@ Press Enter to continue...
         output_dir.mkdir(exist_ok=True)
 
         filepath = output_dir / filename
-
-        with open(filepath, 'w') as f:
-            f.write(script_content)
-
-        # Make executable (Unix/Linux/macOS only)
-        if sys.platform != 'win32':
-            os.chmod(filepath, 0o755)
+        mode = None if sys.platform == 'win32' else 0o755  # Executable on Unix/Linux/macOS
+
+        if GITSAGE_UTILS_AVAILABLE:
+            with AtomicWriter(output_dir / MANIFEST_NAME) as writer:
+                existing = writer.find(content_hash(script_content))
+                if existing:
+                    message = f"Identical script already saved: {existing}"
+                    if self.console:
+                        self.console.print(f"\n[green]✅ {message}[/green]")
+                    else:
+                        print(f"\n✅ {message}")
+                    return existing
+                writer.write(filepath, script_content, mode)
+        else:
+            with open(filepath, 'w') as f:
+                f.write(script_content)
+            if mode is not None:
+                os.chmod(filepath, mode)
 
         if self.console:
             self.console.print(f"\n[green]✅ Script saved to:[/green] {filepath}")
@@ -1248,6 +1267,8 @@ Press Enter to continue...
             print(f"Make it executable: chmod +x {filepath}")
             print(f"Run it: ./{filepath}")
 
+        return filepath
+
     def run(self):
         """Main application loop"""
         while True:
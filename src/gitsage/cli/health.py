@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+GitSage Health Command
+======================
+Show the repository health report, or watch the repository and stream score changes.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add src to path for development
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from gitsage.utils import BeautificationScorer, RepositoryHealthChecker
+from gitsage.utils.health_watcher import HealthWatcher
+
+try:
+    from rich.console import Console
+    RICH_AVAILABLE = True
+except ImportError:
+    RICH_AVAILABLE = False
+
+
+def _print_event(event: Dict, as_json: bool, console=None) -> None:
+    """Print a watcher snapshot or delta"""
+    if as_json:
+        print(json.dumps(event, default=str), flush=True)
+        return
+
+    if event['type'] == 'snapshot':
+        message = (
+            f"[WATCH] {event['overall_score']}/{event['max_score']} "
+            f"({event['percentage']:.1f}%) - {event['level'].upper()} "
+            f"[{event['backend']}]"
+        )
+    else:
+        sign = '+' if event['score_delta'] >= 0 else ''
+        changed = ', '.join(
+            f"{name} {check['old_score']}->{check['new_score']}"
+            for name, check in event['changed_checks'].items()
+        )
+        message = (
+            f"[DELTA] {sign}{event['score_delta']} -> {event['overall_score']} "
+            f"({event['percentage']:.1f}%) {changed}"
+        )
+        if event['level_changed']:
+            message += f" | Level: {event['level'].upper()}"
+
+    if console:
+        console.print(message)
+    else:
+        print(message, flush=True)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        prog='gitsage health',
+        description='Repository health and beautification score'
+    )
+    parser.add_argument('path', nargs='?', default='.', help='Repository path')
+    parser.add_argument('--watch', '-w', action='store_true',
+                        help='Watch the repository and print score changes live')
+    parser.add_argument('--poll', action='store_true',
+                        help='Force polling instead of inotify')
+    parser.add_argument('--interval', type=float, default=1.0,
+                        help='Polling interval in seconds (default: 1.0)')
+    parser.add_argument('--debounce', type=float, default=0.5,
+                        help='Quiet period before re-scoring in seconds (default: 0.5)')
+    parser.add_argument('--json', action='store_true', help='Emit JSON lines')
+    parser.add_argument('--beautification', action='store_true',
+                        help='Show the gamified beautification report')
+
+    args = parser.parse_args(argv)
+    console = Console() if RICH_AVAILABLE and not args.json else None
+
+    if not args.watch:
+        if args.json:
+            print(json.dumps(RepositoryHealthChecker(args.path).check_all(), default=str))
+        elif args.beautification:
+            BeautificationScorer(args.path).display_beautification_report(console)
+        else:
+            RepositoryHealthChecker(args.path).display_health_report(console)
+        return
+
+    watcher = HealthWatcher(
+        args.path,
+        debounce=args.debounce,
+        poll_interval=args.interval,
+        use_polling=args.poll
+    )
+    try:
+        watcher.watch(lambda event: _print_event(event, args.json, console))
+    except KeyboardInterrupt:
+        watcher.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,41 @@
 """GitSage generators package."""
 
-__all__ = []
+from .readme_engine import available_templates, compile_template, placeholder_values, render_template
+from .auto_readme import auto_readme, build_config, render_readme, update_readme
+from .api_reference import ApiReferenceBuilder, render_api_section, render_wiki_pages
+from .doc_pages import EMITTERS, DocSite, build_site
+from .page_pool import PagePool
+from .content_harvester import ContentHarvester, harvest_sections
+from .search_index import SearchIndex, build_index
+from .link_graph import BrokenLink, check_links
+from .html_book import BookRenderer, book_chunks
+from .section_merge import MergeResult, merge_sections, render_sections
+
+__all__ = [
+    "available_templates",
+    "compile_template",
+    "placeholder_values",
+    "render_template",
+    "auto_readme",
+    "build_config",
+    "render_readme",
+    "update_readme",
+    "MergeResult",
+    "merge_sections",
+    "render_sections",
+    "ApiReferenceBuilder",
+    "render_api_section",
+    "render_wiki_pages",
+    "EMITTERS",
+    "DocSite",
+    "build_site",
+    "PagePool",
+    "ContentHarvester",
+    "harvest_sections",
+    "SearchIndex",
+    "build_index",
+    "BrokenLink",
+    "check_links",
+    "BookRenderer",
+    "book_chunks",
+]
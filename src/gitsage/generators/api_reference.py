@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+API Reference Builder
+=====================
+Extract public classes, functions, signatures and docstrings from Python
+sources with ``ast`` (nothing is imported), in parallel worker processes,
+cached by file hash, and render them as a README section or wiki pages.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ..utils.atomic_writer import write_if_changed
+
+API_CACHE = '.gitsage/api-cache.json'
+API_CACHE_VERSION = 1
+
+SKIP_DIRS = {'.git', '.gitsage', '.tox', '.venv', 'venv', 'node_modules', '__pycache__', 'build', 'dist',
+             'tests', 'test', 'docs', 'examples'}
+
+# Below this many files to parse, process start-up costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+_BINOPS = {ast.Add: ('+', 11), ast.Sub: ('-', 11), ast.Mult: ('*', 12), ast.MatMult: ('@', 12),
+           ast.Div: ('/', 12), ast.FloorDiv: ('//', 12), ast.Mod: ('%', 12), ast.Pow: ('**', 14),
+           ast.LShift: ('<<', 10), ast.RShift: ('>>', 10), ast.BitOr: ('|', 7), ast.BitXor: ('^', 8),
+           ast.BitAnd: ('&', 9)}
+_UNARYOPS = {ast.USub: '-', ast.UAdd: '+', ast.Invert: '~', ast.Not: 'not '}
+
+
+def _render(node: ast.AST) -> str:
+    """Minimal ``ast.unparse`` for the expressions found in signatures (Python 3.8)"""
+    if isinstance(node, ast.arguments):
+        return _render_arguments(node)
+    if isinstance(node, ast.Constant):
+        return '...' if node.value is Ellipsis else repr(node.value)
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return f"{_render(node.value)}.{node.attr}"
+    if isinstance(node, ast.Subscript):
+        index = node.slice.value if type(node.slice).__name__ == 'Index' else node.slice  # 3.8 wraps it
+        inner = (', '.join(_render(elt) for elt in index.elts) if isinstance(index, ast.Tuple) and index.elts
+                 else _render(index))
+        return f"{_render(node.value)}[{inner}]"
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        items = ', '.join(_render(elt) for elt in node.elts)
+        if isinstance(node, ast.List):
+            return f"[{items}]"
+        if isinstance(node, ast.Set):
+            return f"{{{items}}}" if items else 'set()'
+        return f"({items},)" if len(node.elts) == 1 else f"({items})"
+    if isinstance(node, ast.Dict):
+        return '{' + ', '.join(f"**{_render(v)}" if k is None else f"{_render(k)}: {_render(v)}"
+                               for k, v in zip(node.keys, node.values)) + '}'
+    if isinstance(node, ast.Call):
+        args = [_render(arg) for arg in node.args]
+        args += [f"**{_render(kw.value)}" if kw.arg is None else f"{kw.arg}={_render(kw.value)}"
+                 for kw in node.keywords]
+        return f"{_render(node.func)}({', '.join(args)})"
+    if isinstance(node, ast.Starred):
+        return f"*{_render(node.value)}"
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARYOPS:
+        return _UNARYOPS[type(node.op)] + _render(node.operand)
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINOPS:
+        symbol, precedence = _BINOPS[type(node.op)]
+
+        def side(operand: ast.AST, right: bool) -> str:
+            text = _render(operand)
+            if isinstance(operand, ast.BinOp) and type(operand.op) in _BINOPS:
+                inner = _BINOPS[type(operand.op)][1]
+                if inner < precedence or (inner == precedence and right):
+                    return f"({text})"
+            return text
+        return f"{side(node.left, False)} {symbol} {side(node.right, True)}"
+    return '...'
+
+
+def _render_arguments(args: ast.arguments) -> str:
+    def arg(node: ast.arg, default: Optional[ast.AST] = None) -> str:
+        text = node.arg
+        if node.annotation is not None:
+            text += f": {_render(node.annotation)}"
+        if default is not None:
+            text += f"={_render(default)}"
+        return text
+
+    positional = args.posonlyargs + args.args
+    defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+    parts = [arg(node, default) for node, default in zip(positional, defaults)]
+    if args.posonlyargs:
+        parts.insert(len(args.posonlyargs), '/')
+    if args.vararg:
+        parts.append('*' + arg(args.vararg))
+    elif args.kwonlyargs:
+        parts.append('*')
+    parts += [arg(node, default) for node, default in zip(args.kwonlyargs, args.kw_defaults)]
+    if args.kwarg:
+        parts.append('**' + arg(args.kwarg))
+    return ', '.join(parts)
+
+
+def unparse(node: ast.AST) -> str:
+    """Source text of an expression or argument list (``ast.unparse`` needs Python 3.9)"""
+    return ast.unparse(node) if hasattr(ast, 'unparse') else _render(node)
+
+
+def _signature(node: ast.AST, drop_first: bool = False) -> str:
+    args = node.args
+    if drop_first:
+        args = ast.arguments(**{field: getattr(args, field) for field in args._fields})
+        if args.posonlyargs:
+            args.posonlyargs = args.posonlyargs[1:]
+        elif args.args:
+            args.args = args.args[1:]
+    signature = f"({unparse(args)})"
+    if node.returns is not None:
+        signature += f" -> {unparse(node.returns)}"
+    return signature
+
+
+def _decorators(node: ast.AST) -> List[str]:
+    names = []
+    for decorator in node.decorator_list:
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        names.append(unparse(target))
+    return names
+
+
+def _function(node: ast.AST, method: bool = False) -> Dict:
+    decorators = _decorators(node)
+    kind = 'function'
+    if method:
+        kind = next((d for d in ('property', 'classmethod', 'staticmethod') if d in decorators), 'method')
+    return {
+        'name': node.name,
+        'signature': _signature(node, drop_first=method and kind != 'staticmethod'),
+        'doc': ast.get_docstring(node) or '',
+        'kind': kind,
+        'async': isinstance(node, ast.AsyncFunctionDef),
+        'line': node.lineno,
+    }
+
+
+def _class(node: ast.ClassDef) -> Dict:
+    methods = []
+    signature = ''
+    for item in node.body:
+        if not isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        if item.name == '__init__':
+            signature = _signature(item, drop_first=True)
+        elif not item.name.startswith('_'):
+            methods.append(_function(item, method=True))
+    return {
+        'name': node.name,
+        'signature': signature,
+        'bases': [unparse(base) for base in node.bases],
+        'doc': ast.get_docstring(node) or '',
+        'methods': methods,
+        'line': node.lineno,
+    }
+
+
+def _declared_all(tree: ast.Module) -> Optional[List[str]]:
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == '__all__' for t in node.targets)
+                and isinstance(node.value, (ast.List, ast.Tuple))):
+            return [elt.value for elt in node.value.elts
+                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str)]
+    return None
+
+
+def parse_module(source: str, filename: str = '<unknown>') -> Dict:
+    """
+    Public API of one module's source
+
+    Honours a literal ``__all__``; otherwise names without a leading underscore are public.
+
+    Returns:
+        {'doc', 'classes', 'functions'} (plus 'error' when the source does not parse)
+    """
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError) as e:
+        return {'doc': '', 'classes': [], 'functions': [], 'error': str(e)}
+
+    exported = _declared_all(tree)
+
+    def public(name: str) -> bool:
+        return name in exported if exported is not None else not name.startswith('_')
+
+    classes, functions = [], []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and public(node.name):
+            classes.append(_class(node))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and public(node.name):
+            functions.append(_function(node))
+
+    return {'doc': ast.get_docstring(tree) or '', 'classes': classes, 'functions': functions}
+
+
+def _parse_files(jobs: Sequence[Tuple[str, str]]) -> List[Tuple[str, Dict, str, int, int]]:
+    """Worker: (key, path) -> (key, module, sha256, size, mtime_ns)"""
+    results = []
+    for key, path in jobs:
+        with open(path, 'rb') as f:
+            data = f.read()
+        stat = os.stat(path)
+        module = parse_module(data.decode('utf-8', errors='replace'), path)
+        results.append((key, module, hashlib.sha256(data).hexdigest(), stat.st_size, stat.st_mtime_ns))
+    return results
+
+
+def _summary(doc: str) -> str:
+    return doc.strip().split('\n\n', 1)[0].replace('\n', ' ') if doc else ''
+
+
+class ApiReferenceBuilder:
+    """Build an API reference for the Python packages of a repository"""
+
+    def __init__(self, repo_path: str = ".", paths: Optional[Sequence[str]] = None,
+                 cache_path: Optional[str] = API_CACHE, jobs: Optional[int] = None):
+        """
+        Args:
+            repo_path: Repository root
+            paths: Source directories to document (default: src/ if present, else the root)
+            cache_path: Parsed-module cache relative to repo_path (None disables caching)
+            jobs: Worker processes for parsing (default: CPU count; 1 parses in-process)
+        """
+        self.repo_path = Path(repo_path).resolve()
+        if paths is None:
+            paths = ['src'] if (self.repo_path / 'src').is_dir() else ['.']
+        self.paths = [self.repo_path / path for path in paths]
+        self.cache_path = self.repo_path / cache_path if cache_path else None
+        self.jobs = jobs
+        self.stats = {'modules': 0, 'parsed': 0, 'cached': 0, 'seconds': 0.0}
+
+    def discover(self) -> Dict[str, Tuple[str, str]]:
+        """Source files to document: {path relative to the repo: (absolute path, module name)}"""
+        found = {}
+        repo = str(self.repo_path)
+        for root in self.paths:
+            # A package directory documents as its own name (src/gitsage -> gitsage.*)
+            base = str(root.parent if (root / '__init__.py').is_file() else root)
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = sorted(d for d in dirnames
+                                     if d not in SKIP_DIRS and not d.startswith(('.', '_')))
+                package = os.path.relpath(dirpath, base).replace(os.sep, '.')
+                package = '' if package == '.' else package
+                if package and not all(part.isidentifier() for part in package.split('.')):
+                    continue
+                rel_dir = os.path.relpath(dirpath, repo).replace(os.sep, '/')
+                for filename in filenames:
+                    if not filename.endswith('.py') or filename.startswith('test_'):
+                        continue
+                    stem = filename[:-3]
+                    if stem == '__init__':
+                        name = package
+                    elif stem.isidentifier() and not stem.startswith('_'):
+                        name = f"{package}.{stem}" if package else stem
+                    else:
+                        continue
+                    if name:
+                        key = filename if rel_dir == '.' else f"{rel_dir}/{filename}"
+                        found[key] = (os.path.join(dirpath, filename), name)
+        return found
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        return data.get('files', {}) if data.get('version') == API_CACHE_VERSION else {}
+
+    def _parse(self, pending: List[Tuple[str, str]]) -> List[Tuple[str, Dict, str, int, int]]:
+        workers = min(self.jobs or os.cpu_count() or 1, len(pending))
+        if workers <= 1 or len(pending) < PARALLEL_THRESHOLD:
+            return _parse_files(pending)
+
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        size = max(16, len(pending) // (workers * 4))
+        chunks = [pending[i:i + size] for i in range(0, len(pending), size)]
+        # Spawned, not forked: wiki-generator.py builds the reference on a format thread
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            return [result for chunk in pool.map(_parse_files, chunks) for result in chunk]
+
+    def build(self) -> List[Dict]:
+        """
+        Parse (or reuse) every module
+
+        A cached module is reused when its size and mtime are unchanged, or when
+        its content hash still matches after a touch/checkout.
+
+        Returns:
+            Modules sorted by name, each with 'name', 'path', 'doc', 'classes', 'functions'
+        """
+        start = time.perf_counter()
+        files = self.discover()
+        cache = self._load_cache()
+        entries: Dict[str, Dict] = {}
+        pending = []
+
+        for key, (path, _) in files.items():
+            entry = cache.get(key)
+            if entry:
+                stat = os.stat(path)
+                if (entry['size'], entry['mtime_ns']) == (stat.st_size, stat.st_mtime_ns):
+                    entries[key] = entry
+                    continue
+                if entry['size'] == stat.st_size:
+                    with open(path, 'rb') as f:
+                        digest = hashlib.sha256(f.read()).hexdigest()
+                    if digest == entry['sha256']:
+                        entries[key] = dict(entry, mtime_ns=stat.st_mtime_ns)
+                        continue
+            pending.append((key, path))
+
+        for key, module, digest, size, mtime_ns in self._parse(pending):
+            entries[key] = {'sha256': digest, 'size': size, 'mtime_ns': mtime_ns, 'module': module}
+
+        if self.cache_path and (pending or len(entries) != len(cache)):
+            write_if_changed(self.cache_path, json.dumps(
+                {'version': API_CACHE_VERSION, 'files': entries}, separators=(',', ':'), sort_keys=True))
+
+        modules = [dict(entries[key]['module'], name=name, path=key) for key, (_, name) in files.items()]
+        modules.sort(key=lambda module: module['name'])
+        self.stats = {
+            'modules': len(modules),
+            'parsed': len(pending),
+            'cached': len(files) - len(pending),
+            'seconds': time.perf_counter() - start,
+        }
+        return modules
+
+
+def api_digest(modules: List[Dict]) -> str:
+    """Hash of the documented API (changes only when signatures or docstrings change)"""
+    return hashlib.sha256(json.dumps(
+        [{k: v for k, v in module.items() if k != 'path'} for module in modules],
+        sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+
+def iter_api_section(modules: List[Dict], heading: str = '## API Reference') -> Iterator[str]:
+    """README section chunks, one per module: a line per public class, method and function"""
+    yield f"{heading}\n\n"
+    for module in modules:
+        if not module['classes'] and not module['functions']:
+            continue
+        parts = [f"### `{module['name']}`\n\n"]
+        if module['doc']:
+            parts.append(f"{_summary(module['doc'])}\n\n")
+        for cls in module['classes']:
+            parts.append(f"- **class `{cls['name']}{cls['signature']}`**"
+                         f"{' - ' + _summary(cls['doc']) if cls['doc'] else ''}\n")
+            for method in cls['methods']:
+                signature = '' if method['kind'] == 'property' else method['signature']
+                parts.append(f"  - `{method['name']}{signature}`"
+                             f"{' - ' + _summary(method['doc']) if method['doc'] else ''}\n")
+        for function in module['functions']:
+            parts.append(f"- `{'async ' if function['async'] else ''}{function['name']}{function['signature']}`"
+                         f"{' - ' + _summary(function['doc']) if function['doc'] else ''}\n")
+        parts.append("\n")
+        yield "".join(parts)
+
+
+def render_api_section(modules: List[Dict], heading: str = '## API Reference') -> str:
+    """Compact README section: one line per public class, method and function"""
+    return "".join(iter_api_section(modules, heading))
+
+
+def wiki_page_name(module_name: str, prefix: str = 'API') -> str:
+    """Wiki page name for a module"""
+    return f"{prefix}-{module_name}"
+
+
+def render_wiki_pages(modules: List[Dict], prefix: str = 'API') -> Dict[str, str]:
+    """
+    Wiki pages for the API: an index plus one page per module with full docstrings
+
+    Returns:
+        {file name: markdown}
+    """
+    documented = [module for module in modules if module['classes'] or module['functions']]
+    index = [f"# API Reference\n\n{len(documented)} modules\n\n"]
+    pages = {}
+
+    for module in documented:
+        page = wiki_page_name(module['name'], prefix)
+        index.append(f"- **[{module['name']}]({page})**"
+                     f"{' - ' + _summary(module['doc']) if module['doc'] else ''}\n")
+
+        parts = [f"# `{module['name']}`\n\n*Source: `{module['path']}`*\n\n"]
+        if module['doc']:
+            parts.append(f"{module['doc']}\n\n")
+        for cls in module['classes']:
+            bases = f"({', '.join(cls['bases'])})" if cls['bases'] else ''
+            parts.append(f"## class `{cls['name']}`\n\n```python\nclass {cls['name']}{bases}\n"
+                         f"{cls['name']}{cls['signature'] or '()'}\n```\n\n")
+            if cls['doc']:
+                parts.append(f"{cls['doc']}\n\n")
+            for method in cls['methods']:
+                label = f" *({method['kind']})*" if method['kind'] != 'method' else ''
+                parts.append(f"### `{cls['name']}.{method['name']}`{label}\n\n"
+                             f"```python\n{'async ' if method['async'] else ''}def {method['name']}"
+                             f"{method['signature']}\n```\n\n")
+                if method['doc']:
+                    parts.append(f"{method['doc']}\n\n")
+        for function in module['functions']:
+            parts.append(f"## `{function['name']}`\n\n```python\n{'async ' if function['async'] else ''}def "
+                         f"{function['name']}{function['signature']}\n```\n\n")
+            if function['doc']:
+                parts.append(f"{function['doc']}\n\n")
+        parts.append(f"---\n\n[Back to API Reference]({prefix}-Reference)\n")
+        pages[f"{page}.md"] = "".join(parts)
+
+    pages[f"{prefix}-Reference.md"] = "".join(index)
+    return pages
+
+
+if __name__ == "__main__":
+    builder = ApiReferenceBuilder()
+    modules = builder.build()
+    print(render_api_section(modules))
+    print(f"[{builder.stats['modules']} modules, {builder.stats['parsed']} parsed, "
+          f"{builder.stats['cached']} cached, {builder.stats['seconds'] * 1000:.0f} ms]")
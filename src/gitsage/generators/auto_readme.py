@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Auto README Pipeline
+====================
+Zero-prompt README generation: detect the project, choose sections from the
+detected languages, frameworks and technologies, then render them.
+"""
+
+import json
+import re
+import subprocess
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..utils.git_remote import get_primary_remote
+from ..utils.project_detector import ProjectDetector
+from .readme_engine import render_template
+from .section_merge import MergeResult, digest, merge_sections, render_sections
+
+try:
+    import tomllib
+    TOMLLIB_AVAILABLE = True
+except ImportError:
+    TOMLLIB_AVAILABLE = False
+
+# Detected project type -> readme-generator --template choice
+DETECTED_TEMPLATES = {
+    'python-library': 'library',
+    'cli-tool': 'cli-tool',
+    'web-application': 'web-app',
+    'data-science': 'data-science',
+    'npm-package': 'npm-package',
+    'mobile-app': 'mobile-app',
+}
+
+PROJECT_KINDS = {
+    'python-library': 'Python library',
+    'cli-tool': 'command-line tool',
+    'web-application': 'web application',
+    'data-science': 'data science project',
+    'npm-package': 'npm package',
+    'mobile-app': 'mobile app',
+    'wordpress-plugin': 'WordPress plugin',
+    'blockchain': 'smart contract project',
+    'docker-app': 'containerized application',
+}
+
+# Install commands per ecosystem, keyed by the manifest file that makes a project installable
+INSTALL_COMMANDS = {
+    'pyproject.toml': ('pip', 'pip install {package}'),
+    'setup.py': ('pip', 'pip install {package}'),
+    'package.json': ('npm', 'npm install {package}'),
+    'go.mod': ('go', 'go install github.com/{owner}/{repo}@latest'),
+    'Cargo.toml': ('cargo', 'cargo install {package}'),
+    'Gemfile': ('gem', 'gem install {package}'),
+}
+
+TEST_COMMANDS = {
+    'Pytest': 'pytest',
+    'Jest': 'npx jest',
+}
+
+LICENSE_FILES = ('LICENSE', 'LICENSE.md', 'LICENSE.txt', 'COPYING')
+
+# SPDX id -> pattern matched against the start of a license file; more specific licenses first
+LICENSE_PATTERNS = [
+    ('AGPL-3.0', r'GNU AFFERO GENERAL PUBLIC LICENSE\s+Version 3'),
+    ('LGPL-3.0', r'GNU LESSER GENERAL PUBLIC LICENSE\s+Version 3'),
+    ('LGPL-2.1', r'GNU LESSER GENERAL PUBLIC LICENSE\s+Version 2\.1'),
+    ('GPL-3.0', r'GNU GENERAL PUBLIC LICENSE\s+Version 3'),
+    ('GPL-2.0', r'GNU GENERAL PUBLIC LICENSE\s+Version 2'),
+    ('Apache-2.0', r'Apache License,?\s+Version 2\.0'),
+    ('MPL-2.0', r'Mozilla Public License,?\s+Version 2\.0'),
+    ('BSD-3-Clause', r'BSD 3-Clause'),
+    ('BSD-2-Clause', r'BSD 2-Clause'),
+    ('ISC', r'^\s*ISC License'),
+    ('Unlicense', r'This is free and unencumbered software released into the public domain'),
+    ('MIT', r'^\s*(?:The )?MIT License|^\s*MIT\s*$|Permission is hereby granted, free of charge'),
+]
+_SPDX_RE = re.compile(r'SPDX-License-Identifier:\s*([\w.+-]+)')
+
+
+def read_project_metadata(repo_path: Path) -> Dict[str, str]:
+    """Name, description, version and license from pyproject.toml or package.json"""
+    metadata: Dict[str, str] = {}
+
+    pyproject = repo_path / 'pyproject.toml'
+    if pyproject.is_file():
+        text = pyproject.read_text(encoding='utf-8', errors='ignore')
+        project = {}
+        if TOMLLIB_AVAILABLE:
+            try:
+                project = tomllib.loads(text).get('project', {})
+            except tomllib.TOMLDecodeError:
+                project = {}
+        else:
+            section = re.search(r'^\[project\]\s*$(.*?)(?=^\[|\Z)', text, re.MULTILINE | re.DOTALL)
+            for key in ('name', 'description', 'version'):
+                match = section and re.search(rf'^{key}\s*=\s*"([^"]*)"', section.group(1), re.MULTILINE)
+                if match:
+                    project[key] = match.group(1)
+        license_info = project.get('license')
+        if isinstance(license_info, dict):
+            license_info = license_info.get('text')
+        metadata.update({k: v for k, v in {
+            'name': project.get('name'),
+            'description': project.get('description'),
+            'version': project.get('version'),
+            'license': license_info,
+        }.items() if isinstance(v, str) and v})
+
+    package_json = repo_path / 'package.json'
+    if package_json.is_file():
+        try:
+            data = json.loads(package_json.read_text(encoding='utf-8'))
+            for key in ('name', 'description', 'version', 'license'):
+                if isinstance(data.get(key), str) and key not in metadata:
+                    metadata[key] = data[key]
+        except ValueError:
+            pass
+
+    return metadata
+
+
+def detect_license(repo_path: Path) -> str:
+    """SPDX id of the repository's license file, from its SPDX tag or title; '' when unknown"""
+    for name in LICENSE_FILES:
+        path = repo_path / name
+        if not path.is_file():
+            continue
+        with open(path, encoding='utf-8', errors='ignore') as f:
+            head = f.read(2048)
+        match = _SPDX_RE.search(head)
+        if match:
+            return match.group(1)
+        for spdx, pattern in LICENSE_PATTERNS:
+            if re.search(pattern, head, re.IGNORECASE | re.MULTILINE):
+                return spdx
+        return ''
+    return ''
+
+
+def last_commit_date(repo_path: Path) -> str:
+    """Committer date (YYYY-MM-DD) of HEAD; '' outside a git repository"""
+    try:
+        result = subprocess.run(['git', '-C', str(repo_path), 'log', '-1', '--format=%cs'],
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return ''
+    return result.stdout.strip() if result.returncode == 0 else ''
+
+
+def build_config(detection: Dict, repo_path: str = ".") -> Dict:
+    """
+    Build a readme-generator config from detection results
+
+    Returns:
+        Config dict compatible with ReadmeGenerator.from_config()
+    """
+    root = Path(repo_path).resolve()
+    metadata = read_project_metadata(root)
+    remote = get_primary_remote(str(root))
+    languages = list(detection.get('languages', {}))
+    frameworks = detection.get('frameworks', [])
+    technologies = detection.get('technologies', [])
+    detected_type = detection.get('detected_type')
+
+    name = metadata.get('name') or root.name
+    kind = PROJECT_KINDS.get(detected_type, 'project')
+    primary = languages[0] if languages else ''
+    stack = ', '.join(frameworks[:3])
+    tagline = metadata.get('description') or (
+        f"A {primary + ' ' if primary else ''}{kind}{' built with ' + stack if stack else ''}"
+    )
+
+    features = [f"Built with {fw}" for fw in frameworks]
+    features += [f"{tech} integration" for tech in technologies if tech not in ('Pytest', 'Jest')]
+
+    shields = ['license']
+    if metadata.get('version'):
+        shields.append('version')
+    if 'GitHub Actions' in technologies and remote:
+        shields.append('build-status')
+    shields.append('pr-welcome')
+
+    return {
+        'project': {
+            'name': name,
+            'tagline': tagline,
+            'description': tagline,
+            'version': metadata.get('version', ''),
+            'license': metadata.get('license') or detect_license(root),
+            'github_username': remote.owner if remote else '',
+            'repo_name': remote.repo if remote else root.name,
+            'author': remote.owner if remote else '',
+        },
+        'template': {'type': DETECTED_TEMPLATES.get(detected_type, 'cli-tool'), 'engine': 'sections'},
+        'badges': {'enabled': True, 'shields': shields},
+        'features': features,
+        'manifests': [name for name in INSTALL_COMMANDS if (root / name).is_file()],
+        'detection': detection,
+        'last_commit': last_commit_date(root),
+    }
+
+
+def _section_badges(config: Dict) -> str:
+    project = config['project']
+    badges = []
+    if project['license']:
+        badges.append(f"![License](https://img.shields.io/badge/license-{project['license'].replace('-', '--')}-green)")
+    if project['version']:
+        badges.append(f"![Version](https://img.shields.io/badge/version-{project['version'].replace('-', '--')}-blue)")
+    if 'build-status' in config['badges']['shields']:
+        badges.append(f"![Build](https://img.shields.io/github/actions/workflow/status/"
+                      f"{project['github_username']}/{project['repo_name']}/ci.yml?branch=main)")
+    badges.append("![PRs Welcome](https://img.shields.io/badge/PRs-welcome-brightgreen.svg)")
+    return " ".join(badges) + "\n\n"
+
+
+def _section_languages(config: Dict) -> str:
+    languages = config['detection'].get('languages', {})
+    total = sum(languages.values()) or 1
+    rows = "".join(f"| {lang} | {count} | {count * 100 / total:.0f}% |\n" for lang, count in languages.items())
+    return f"## Languages\n\n| Language | Files | Share |\n|----------|-------|-------|\n{rows}\n"
+
+
+def _section_features(config: Dict) -> str:
+    return "## Features\n\n" + "".join(f"- {feature}\n" for feature in config['features']) + "\n"
+
+
+def _section_installation(config: Dict) -> str:
+    project = config['project']
+    parts = ["## Installation\n\n"]
+    seen = set()
+    for manifest in config['manifests']:
+        tool, command = INSTALL_COMMANDS[manifest]
+        if tool in seen:
+            continue
+        seen.add(tool)
+        command = command.format(package=project['name'], owner=project['github_username'] or 'owner',
+                                 repo=project['repo_name'])
+        parts.append(f"### Using {tool}\n\n```bash\n{command}\n```\n\n")
+
+    if project['github_username']:
+        parts.append(
+            f"### From source\n\n```bash\ngit clone https://github.com/{project['github_username']}/"
+            f"{project['repo_name']}.git\ncd {project['repo_name']}\n```\n\n"
+        )
+    if 'Docker' in config['detection'].get('technologies', []):
+        parts.append(f"### With Docker\n\n```bash\ndocker build -t {project['repo_name']} .\n"
+                     f"docker run --rm {project['repo_name']}\n```\n\n")
+    return "".join(parts)
+
+
+def _section_usage(config: Dict) -> str:
+    project = config['project']
+    detected_type = config['detection'].get('detected_type')
+    module = re.sub(r'[^a-z0-9_]', '_', project['name'].lower())
+
+    if detected_type == 'python-library':
+        body = f"```python\nimport {module}\n```\n\n"
+    elif detected_type == 'npm-package':
+        body = f"```javascript\nconst {module} = require('{project['name']}');\n```\n\n"
+    elif detected_type == 'web-application':
+        body = "```bash\n# Start the development server\npython app.py\n```\n\n" \
+            if 'Python' in config['detection'].get('languages', {}) else "```bash\nnpm start\n```\n\n"
+    else:
+        body = f"```bash\n{project['repo_name']} --help\n```\n\n"
+    return "## Usage\n\n" + body
+
+
+def _section_stack(config: Dict) -> str:
+    detection = config['detection']
+    items = detection.get('frameworks', []) + detection.get('technologies', [])
+    return "## Tech Stack\n\n" + "".join(f"- {item}\n" for item in items) + "\n"
+
+
+def _section_testing(config: Dict) -> str:
+    commands = [cmd for tech, cmd in TEST_COMMANDS.items() if tech in config['detection'].get('technologies', [])]
+    return "## Testing\n\n```bash\n" + "\n".join(commands) + "\n```\n\n"
+
+
+def _section_contributing(config: Dict) -> str:
+    return (
+        "## Contributing\n\n"
+        "Contributions are welcome! Please feel free to submit a Pull Request.\n\n"
+    )
+
+
+def _section_license(config: Dict) -> str:
+    return (
+        f"## License\n\nThis project is licensed under the {config['project']['license']} License - "
+        f"see the [LICENSE](LICENSE) file for details.\n\n"
+    )
+
+
+# (name, applies?, renderer) in README order
+SECTION_RULES: List[Tuple[str, Callable[[Dict], bool], Callable[[Dict], str]]] = [
+    ('languages', lambda c: len(c['detection'].get('languages', {})) > 1, _section_languages),
+    ('features', lambda c: bool(c['features']), _section_features),
+    ('installation', lambda c: bool(c['manifests'] or c['project']['github_username']), _section_installation),
+    ('usage', lambda c: bool(c['detection'].get('detected_type')), _section_usage),
+    ('tech_stack', lambda c: bool(c['detection'].get('frameworks') or c['detection'].get('technologies')),
+     _section_stack),
+    ('testing', lambda c: any(t in c['detection'].get('technologies', []) for t in TEST_COMMANDS), _section_testing),
+    ('contributing', lambda c: True, _section_contributing),
+    ('license', lambda c: bool(c['project']['license']), _section_license),
+]
+
+
+# Config/detection inputs of each section; a marked README re-renders a section only when these change
+SECTION_INPUTS = {
+    'title': ('project', 'badges'),
+    'languages': ('detection.languages',),
+    'features': ('features',),
+    'installation': ('project', 'manifests', 'detection.technologies'),
+    'usage': ('project.name', 'project.repo_name', 'detection.detected_type', 'detection.languages'),
+    'tech_stack': ('detection.frameworks', 'detection.technologies'),
+    'testing': ('detection.technologies',),
+    'contributing': (),
+    'license': ('project.license',),
+}
+
+
+def _section_title(config: Dict) -> str:
+    project = config['project']
+    return f"# {project['name']}\n\n> {project['tagline']}\n\n" + _section_badges(config)
+
+
+def _section_footer(config: Dict) -> str:
+    # The last commit's date, not today's, so an unchanged project renders an unchanged README
+    updated = config.get('last_commit')
+    return f"---\n\n*README generated by GitSage{' (last commit ' + updated + ')' if updated else ''}*\n"
+
+
+def _config_value(config: Dict, path: str):
+    value = config
+    for key in path.split('.'):
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+
+def select_sections(config: Dict) -> List[str]:
+    """Names of the sections that apply to the detected project"""
+    return [name for name, applies, _ in SECTION_RULES if applies(config)]
+
+
+def readme_sections(config: Dict) -> List[Tuple[str, str, Callable[[], str]]]:
+    """(name, inputs digest, renderer) for each applicable section, title and footer included"""
+    sections = [('title', digest({p: _config_value(config, p) for p in SECTION_INPUTS['title']}),
+                 lambda: _section_title(config))]
+    for name, applies, render in SECTION_RULES:
+        if applies(config):
+            inputs = {path: _config_value(config, path) for path in SECTION_INPUTS[name]}
+            sections.append((name, digest(inputs), lambda render=render: render(config)))
+    sections.append(('footer', digest(config.get('last_commit', '')), lambda: _section_footer(config)))
+    return sections
+
+
+def render_readme(config: Dict, markers: bool = False) -> str:
+    """Render the README for a config from build_config(), optionally with section markers"""
+    sections = readme_sections(config)
+    if markers:
+        return render_sections(sections)
+    return "".join(render() for _, _, render in sections)
+
+
+def update_readme(existing: str, config: Dict, force: bool = False) -> Optional[MergeResult]:
+    """Re-render only the sections of a marked README whose detection or config inputs changed"""
+    return merge_sections(existing, readme_sections(config), force=force)
+
+
+def auto_readme(repo_path: str = ".", fast: bool = False, engine: str = 'sections',
+                existing: Optional[str] = None, force: bool = False) -> Tuple[str, Dict]:
+    """
+    Run the full pipeline: detect, build config, render
+
+    Args:
+        repo_path: Repository to document
+        fast: Reuse the cached detection index when the repository is unchanged
+        engine: 'sections' (detection-driven sections) or 'library' (templates/readme)
+        existing: Current README text; if it has section markers only changed sections are re-rendered
+        force: Also regenerate sections that were edited by hand
+
+    Returns:
+        (markdown, info) where info holds the config, the merge result (if any) and per-stage timings in ms
+    """
+    timings = {}
+    start = time.perf_counter()
+    detector = ProjectDetector(repo_path)
+    detection = detector.detect_cached() if fast else detector.detect()
+    timings['detect'] = (time.perf_counter() - start) * 1000
+
+    stage = time.perf_counter()
+    config = build_config(detection, repo_path)
+    timings['config'] = (time.perf_counter() - stage) * 1000
+
+    stage = time.perf_counter()
+    markdown = merged = None
+    if engine == 'library':
+        markdown = render_template(config['template']['type'], config)
+    elif existing:
+        merged = update_readme(existing, config, force=force)
+        markdown = merged.text if merged else None
+    if markdown is None:
+        markdown = render_readme(config, markers=engine != 'library')
+    timings['render'] = (time.perf_counter() - stage) * 1000
+    timings['total'] = (time.perf_counter() - start) * 1000
+
+    return markdown, {
+        'config': config,
+        'sections': select_sections(config),
+        'merge': merged,
+        'cached': detection.get('cached', False),
+        'timings': timings,
+    }
+
+
+if __name__ == "__main__":
+    readme, info = auto_readme(fast=True)
+    print(readme)
+    print(f"[{info['timings']['total']:.1f} ms, sections: {', '.join(info['sections'])}]")
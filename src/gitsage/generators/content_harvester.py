@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Content Harvester
+=================
+Collect documentation that already lives in a repository - Markdown under
+docs/, module docstrings, argparse command-line definitions and example
+files - in one streamed walk, and turn it into wiki pages.
+
+Fragments extracted from each file are cached by content hash in
+.gitsage/harvest-cache.json, so a rebuild only reads files that changed.
+"""
+
+import ast
+import hashlib
+import io
+import json
+import os
+import re
+import time
+import tokenize
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ..utils.atomic_writer import write_if_changed
+from .api_reference import unparse
+from .doc_pages import page_slug
+
+HARVEST_CACHE = '.gitsage/harvest-cache.json'
+HARVEST_CACHE_VERSION = 1
+
+SKIP_DIRS = {'.git', '.gitsage', '.tox', '.venv', 'venv', 'node_modules', '__pycache__', 'build', 'dist',
+             'site', 'htmlcov', 'generated-docs', 'tests', 'test'}
+
+DOC_EXTENSIONS = ('.md', '.markdown')
+
+# Example file extension -> code fence language
+EXAMPLE_LANGUAGES = {
+    '.py': 'python', '.sh': 'bash', '.ps1': 'powershell', '.bat': 'batch', '.js': 'javascript',
+    '.ts': 'typescript', '.go': 'go', '.rb': 'ruby', '.rs': 'rust', '.java': 'java',
+    '.yaml': 'yaml', '.yml': 'yaml', '.json': 'json', '.toml': 'toml',
+}
+
+# Larger example files are linked instead of inlined
+MAX_EXAMPLE_BYTES = 20_000
+
+_HEADING_RE = re.compile(r'^#\s+(.+?)\s*#*\s*$', re.MULTILINE)
+# Path separators, control characters and characters Windows does not allow in file names
+_UNSAFE_NAME_RE = re.compile(r'[\x00-\x1f\x7f/\\:*?"<>|]+')
+
+
+def _title(stem: str) -> str:
+    """'getting-started' -> 'Getting Started'"""
+    return re.sub(r'[-_]+', ' ', stem).strip().title()
+
+
+def safe_name(name: str) -> str:
+    """
+    A harvested title made safe as a page file name in every format
+
+    'CI/CD Setup' -> 'CI CD Setup', '../../etc' -> 'etc'
+    """
+    name = _UNSAFE_NAME_RE.sub(' ', name)
+    name = re.sub(r'\.{2,}', ' ', name)  # No '..' path segments
+    return ' '.join(name.split()).strip(' .') or 'Untitled'
+
+
+def leading_docstring(source: str) -> str:
+    """Module docstring read from the first tokens only, without parsing the whole file"""
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(source).readline):
+            if token.type in (tokenize.COMMENT, tokenize.NL, tokenize.NEWLINE, tokenize.ENCODING):
+                continue
+            if token.type == tokenize.STRING:
+                value = ast.literal_eval(token.string)
+                return value.strip() if isinstance(value, str) else ''
+            return ''
+    except (tokenize.TokenError, SyntaxError, ValueError):
+        pass
+    return ''
+
+
+def _literal(node: ast.AST):
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, RecursionError):
+        return unparse(node)  # e.g. type=int
+
+
+def parse_cli(tree: ast.AST) -> Optional[Dict]:
+    """argparse parser description, options and subcommands defined in a module, if any"""
+    cli: Dict = {'description': '', 'arguments': [], 'commands': []}
+    found = False
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        name = func.attr if isinstance(func, ast.Attribute) else func.id if isinstance(func, ast.Name) else ''
+        keywords = {kw.arg: _literal(kw.value) for kw in node.keywords if kw.arg}
+        if name == 'ArgumentParser':
+            found = True
+            if not cli['description'] and isinstance(keywords.get('description'), str):
+                cli['description'] = keywords['description'].strip()
+        elif name == 'add_argument':
+            flags = [arg.value for arg in node.args if isinstance(arg, ast.Constant) and isinstance(arg.value, str)]
+            if flags:
+                found = True
+                cli['arguments'].append({
+                    'flags': flags,
+                    'help': keywords.get('help', '') if isinstance(keywords.get('help'), str) else '',
+                    'default': keywords.get('default'),
+                    'choices': keywords.get('choices') if isinstance(keywords.get('choices'), list) else None,
+                    'line': node.lineno,
+                })
+        elif name == 'add_parser' and node.args and isinstance(node.args[0], ast.Constant):
+            cli['commands'].append({'name': str(node.args[0].value), 'help': str(keywords.get('help', '')),
+                                    'line': node.lineno})
+    if not found:
+        return None
+    # ast.walk is breadth-first; present options in source order
+    cli['arguments'].sort(key=lambda argument: argument['line'])
+    cli['commands'].sort(key=lambda command: command['line'])
+    return cli
+
+
+def extract(key: str, kind: str, data: bytes) -> List[Dict]:
+    """
+    Fragments of one file
+
+    Args:
+        key: Path relative to the repository (forward slashes)
+        kind: 'doc', 'example' or 'python'
+        data: File content
+
+    Returns:
+        JSON-serialisable fragments, each with a 'kind'
+    """
+    text = data.decode('utf-8', errors='replace')
+    stem = os.path.splitext(os.path.basename(key))[0]
+
+    if kind == 'doc':
+        heading = _HEADING_RE.search(text)
+        return [{'kind': 'doc', 'title': heading.group(1) if heading else _title(stem), 'body': text}]
+
+    if kind == 'example':
+        language = EXAMPLE_LANGUAGES[os.path.splitext(key)[1].lower()]
+        doc = leading_docstring(text) if language == 'python' else ''
+        code = text if len(data) <= MAX_EXAMPLE_BYTES else None
+        return [{'kind': 'example', 'title': _title(stem), 'language': language, 'doc': doc, 'code': code}]
+
+    fragments = []
+    if 'add_argument' in text or 'ArgumentParser' in text:
+        # Only files that look like CLIs pay for a full parse
+        try:
+            tree = ast.parse(text, key)
+        except SyntaxError:
+            tree = None
+        if tree is not None:
+            doc = ast.get_docstring(tree) or ''
+            cli = parse_cli(tree)
+            if cli:
+                fragments.append(dict(cli, kind='cli', prog=os.path.basename(key)))
+        else:
+            doc = ''
+    else:
+        doc = leading_docstring(text)
+    if doc:
+        fragments.insert(0, {'kind': 'module', 'doc': doc})
+    return fragments
+
+
+class ContentHarvester:
+    """Harvest documentation fragments from a repository"""
+
+    def __init__(self, repo_path: str = ".", docs: Sequence[str] = ('docs',),
+                 examples: Sequence[str] = ('examples',), modules: bool = True, cli: bool = True,
+                 cache_path: Optional[str] = HARVEST_CACHE):
+        """
+        Args:
+            repo_path: Repository root
+            docs: Directories whose Markdown files become guide pages
+            examples: Directories whose source files become example pages
+            modules: Harvest module docstrings of Python files elsewhere in the repo
+            cli: Harvest argparse definitions of Python files elsewhere in the repo
+            cache_path: Fragment cache relative to repo_path (None disables caching)
+        """
+        self.repo_path = Path(repo_path).resolve()
+        self.docs = tuple(path.strip('/') for path in docs)
+        self.examples = tuple(path.strip('/') for path in examples)
+        self.modules = modules
+        self.cli = cli
+        self.cache_path = self.repo_path / cache_path if cache_path else None
+        self.stats = {'files': 0, 'harvested': 0, 'cached': 0, 'seconds': 0.0}
+
+    def _kind(self, key: str, filename: str) -> Optional[str]:
+        extension = os.path.splitext(filename)[1].lower()
+        if any(key.startswith(f'{root}/') for root in self.docs):
+            return 'doc' if extension in DOC_EXTENSIONS else None
+        if any(key.startswith(f'{root}/') for root in self.examples):
+            return 'example' if extension in EXAMPLE_LANGUAGES else None
+        if (self.modules or self.cli) and extension == '.py' and not filename.startswith('test_'):
+            return 'python'
+        return None
+
+    def _walk(self) -> Iterator[Tuple[str, str, str]]:
+        """(key, absolute path, kind) of every harvestable file, in a stable order"""
+        repo = str(self.repo_path)
+        for dirpath, dirnames, filenames in os.walk(repo):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith('.'))
+            rel_dir = os.path.relpath(dirpath, repo).replace(os.sep, '/')
+            for filename in sorted(filenames):
+                key = filename if rel_dir == '.' else f"{rel_dir}/{filename}"
+                kind = self._kind(key, filename)
+                if kind:
+                    yield key, os.path.join(dirpath, filename), kind
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        return data.get('files', {}) if data.get('version') == HARVEST_CACHE_VERSION else {}
+
+    def harvest(self) -> Iterator[Tuple[str, str, List[Dict]]]:
+        """
+        Stream (key, sha256, fragments) per file while walking the repository
+
+        A cached file is reused when its size and mtime are unchanged, or when its
+        content hash still matches; only the remaining files are read and extracted.
+        The cache is saved once the walk is complete.
+        """
+        start = time.perf_counter()
+        cache = self._load_cache()
+        entries: Dict[str, Dict] = {}
+        harvested = 0
+
+        for key, path, kind in self._walk():
+            stat = os.stat(path)
+            entry = cache.get(key)
+            if entry and entry['kind'] == kind and (entry['size'], entry['mtime_ns']) == (stat.st_size,
+                                                                                         stat.st_mtime_ns):
+                entries[key] = entry
+                yield key, entry['sha256'], entry['fragments']
+                continue
+
+            with open(path, 'rb') as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()
+            if entry and entry['kind'] == kind and entry['sha256'] == digest:
+                entries[key] = dict(entry, mtime_ns=stat.st_mtime_ns)
+            else:
+                harvested += 1
+                entries[key] = {'kind': kind, 'sha256': digest, 'size': stat.st_size,
+                                'mtime_ns': stat.st_mtime_ns, 'fragments': extract(key, kind, data)}
+            yield key, digest, entries[key]['fragments']
+
+        if self.cache_path and (harvested or entries != cache):
+            write_if_changed(self.cache_path, json.dumps(
+                {'version': HARVEST_CACHE_VERSION, 'files': entries}, separators=(',', ':'), sort_keys=True))
+        self.stats = {
+            'files': len(entries),
+            'harvested': harvested,
+            'cached': len(entries) - harvested,
+            'seconds': time.perf_counter() - start,
+        }
+
+    def sections(self) -> List[Dict]:
+        """Harvest the repository into ``content.sections`` entries (see harvest_sections())"""
+        skip = {kind for kind, wanted in (('module', self.modules), ('cli', self.cli)) if not wanted}
+        files = ((key, digest, [f for f in fragments if f['kind'] not in skip])
+                 for key, digest, fragments in self.harvest())
+        return harvest_sections(files, self.docs)
+
+
+def _cell(text) -> str:
+    return str(text).replace('|', '\\|').replace('\n', ' ')
+
+
+def _docstring_markdown(doc: str) -> Tuple[str, str]:
+    """(title, body) of a docstring; 'Title\\n=====' underlines become the title"""
+    lines = doc.strip().splitlines()
+    if len(lines) > 1 and lines[1].strip() and set(lines[1].strip()) <= set('=-'):
+        return lines[0].strip(), '\n'.join(lines[2:]).strip()
+    summary, _, rest = doc.strip().partition('\n\n')
+    return summary.replace('\n', ' '), rest.strip()
+
+
+def _cli_page(key: str, cli: Dict) -> str:
+    prog = cli['prog']
+    runner = 'python ' if prog.endswith('.py') else ''
+    page = [f"# {prog}\n\n"]
+    if cli['description']:
+        page.append(f"{cli['description']}\n\n")
+    page.append(f"## Usage\n\n```bash\n{runner}{key} [options]\n```\n\n")
+    if cli['commands']:
+        page.append("## Commands\n\n")
+        page.extend(f"- `{command['name']}` - {command['help']}\n" for command in cli['commands'])
+        page.append("\n")
+    if cli['arguments']:
+        page.append("## Options\n\n| Option | Description | Default |\n|--------|-------------|---------|\n")
+        for argument in cli['arguments']:
+            flags = ', '.join(f"`{flag}`" for flag in argument['flags'])
+            description = argument['help']
+            if argument['choices']:
+                description += f" (choices: {', '.join(map(str, argument['choices']))})"
+            default = '' if argument['default'] in (None, False) else f"`{argument['default']}`"
+            page.append(f"| {flags} | {_cell(description)} | {_cell(default)} |\n")
+    return ''.join(page)
+
+
+def _module_page(package: str, modules: List[Tuple[str, str]]) -> str:
+    page = [f"# {package}\n\n"]
+    for key, doc in modules:
+        title, body = _docstring_markdown(doc)
+        page.append(f"## {title}\n\n`{key}`\n\n")
+        if body:
+            page.append(f"{body}\n\n")
+    return ''.join(page).rstrip('\n') + '\n'
+
+
+def _example_page(key: str, example: Dict) -> str:
+    page = [f"# {example['title']}\n\n`{key}`\n\n"]
+    if example['doc']:
+        page.append(f"{example['doc']}\n\n")
+    if example['code'] is None:
+        page.append(f"This example is too large to show inline; see `{key}` in the repository.\n")
+    else:
+        page.append(f"```{example['language']}\n{example['code'].rstrip()}\n```\n")
+    return ''.join(page)
+
+
+def harvest_sections(files: Iterator[Tuple[str, str, List[Dict]]],
+                     docs: Sequence[str] = ('docs',)) -> List[Dict]:
+    """
+    Map harvested fragments onto wiki sections
+
+    Guides are grouped by their docs/ subdirectory, followed by one section each for
+    command-line tools, modules (one page per package) and examples.
+
+    Returns:
+        ``content.sections`` entries whose pages carry 'markdown' and 'sources' ({key: sha256})
+    """
+    guides: Dict[str, List[Dict]] = {}
+    commands: List[Dict] = []
+    packages: Dict[str, List[Tuple[str, str]]] = {}
+    package_sources: Dict[str, Dict[str, str]] = {}
+    examples: List[Dict] = []
+
+    for key, digest, fragments in files:
+        for fragment in fragments:
+            kind = fragment['kind']
+            if kind == 'doc':
+                root = next((root for root in docs if key.startswith(f'{root}/')), '')
+                subdir = os.path.dirname(key[len(root) + 1:])
+                group = _title(subdir.split('/')[0]) if subdir else 'Guides'
+                guides.setdefault(group, []).append(
+                    {'name': fragment['title'], 'markdown': fragment['body'], 'sources': {key: digest}})
+            elif kind == 'cli':
+                commands.append({'name': fragment['prog'], 'markdown': _cli_page(key, fragment),
+                                 'sources': {key: digest}})
+            elif kind == 'module':
+                package = re.sub(r'^(src|lib)/', '', os.path.dirname(key)).replace('/', '.') or 'Scripts'
+                packages.setdefault(package, []).append((key, fragment['doc']))
+                package_sources.setdefault(package, {})[key] = digest
+            elif kind == 'example':
+                examples.append({'name': f"{fragment['title']} Example", 'markdown': _example_page(key, fragment),
+                                 'sources': {key: digest}})
+
+    sections = [{'title': title, 'icon': '📖', 'pages': pages} for title, pages in guides.items()]
+    if commands:
+        sections.append({'title': 'Command Line', 'icon': '[TOOL]', 'pages': commands})
+    if packages:
+        sections.append({'title': 'Modules', 'icon': '📦', 'pages': [
+            {'name': package, 'markdown': _module_page(package, modules), 'sources': package_sources[package]}
+            for package, modules in packages.items()
+        ]})
+    if examples:
+        sections.append({'title': 'Examples', 'icon': '💡', 'pages': examples})
+
+    # Page names become file names: they must stay inside the output directory and
+    # two guides titled alike must not collide
+    seen = set()
+    for section in sections:
+        section['title'] = safe_name(section['title'])
+        for page in section['pages']:
+            page['name'] = safe_name(page['name'])
+            name, count = page['name'], 1
+            while page_slug(page['name']) in seen:
+                count += 1
+                page['name'] = f"{name} ({count})"
+            seen.add(page_slug(page['name']))
+    return sections
+
+
+if __name__ == "__main__":
+    import sys
+
+    harvester = ContentHarvester(sys.argv[1] if len(sys.argv) > 1 else '.', cache_path=None)
+    for section in harvester.sections():
+        print(f"{section['title']}: {', '.join(page['name'] for page in section['pages'])}")
+    print(f"{harvester.stats['files']} files in {harvester.stats['seconds']:.2f}s")
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Documentation Markup
+====================
+Parse the Markdown subset used by generated documentation pages into a small
+block model once, and serialize that model to reStructuredText (Sphinx /
+Read the Docs), Confluence storage format (XHTML with ``ac:`` macros) or
+plain HTML (the offline site and print book).
+
+Supported: ATX headings, paragraphs, bullet and numbered lists, fenced code,
+horizontal rules, pipe tables and the inline spans ``**strong**``,
+``*emphasis*``, ```code``` and ``[text](target)``.
+"""
+
+import html
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .link_graph import github_anchor
+
+# (kind, text, target) with kind one of: text, strong, em, code, link
+Span = Tuple[str, str, str]
+Inline = List[Span]
+
+# Maps an internal link target (page slug) to the linked page's name, or None if unknown
+Resolver = Callable[[str], Optional[str]]
+
+# Link targets may hold balanced parentheses, e.g. https://en.wikipedia.org/wiki/Python_(language)
+_TARGET = r'(?P<target>(?:[^()\s]|\([^()\s]*\))+)'
+_INLINE_RE = re.compile(
+    r'`(?P<code>[^`]+)`'
+    r'|\[(?P<label>[^\]]+)\]\(' + _TARGET + r'\)'
+    r'|\*\*(?P<strong>.+?)\*\*'
+    r'|(?<![\w*])\*(?P<em>[^*\s][^*]*?)\*(?![\w*])'
+)
+_LINK_RE = re.compile(r'^\[(?P<label>[^\]]+)\]\(' + _TARGET + r'\)$')
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+_BULLET_RE = re.compile(r'^\s*[-*+]\s+(.*)$')
+_ORDERED_RE = re.compile(r'^\s*\d+[.)]\s+(.*)$')
+_RULE_RE = re.compile(r'^\s*(?:-{3,}|\*{3,}|_{3,})\s*$')
+_TABLE_SEPARATOR_RE = re.compile(r'^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$')
+_SCHEME_RE = re.compile(r'^([a-zA-Z][a-zA-Z0-9+.-]*):')
+_CONTROL_RE = re.compile(r'[\x00-\x20\x7f]')  # Browsers drop these inside a scheme ("java\tscript:")
+SAFE_SCHEMES = ('http', 'https', 'mailto')
+_INTERNAL_RE = re.compile(r'^(?P<slug>\w[\w.&\'-]*)(?:#(?P<anchor>[\w-]+))?$')  # Page names may hold . & '
+
+RST_UNDERLINES = '=-~^"\''
+
+
+@dataclass
+class Block:
+    """One block of a parsed page"""
+
+    kind: str  # heading, paragraph, list, code, rule, table
+    level: int = 0  # Heading level
+    inline: Inline = field(default_factory=list)  # Heading and paragraph text
+    items: List[Inline] = field(default_factory=list)  # List items
+    ordered: bool = False
+    code: str = ''
+    lang: str = ''
+    rows: List[List[Inline]] = field(default_factory=list)  # Table rows, header first
+
+
+def parse_inline(text: str) -> Inline:
+    """Split a line of Markdown into text and formatted spans"""
+    spans: Inline = []
+    position = 0
+    for match in _INLINE_RE.finditer(text):
+        if match.start() > position:
+            spans.append(('text', text[position:match.start()], ''))
+        if match.group('code') is not None:
+            spans.append(('code', match.group('code'), ''))
+        elif match.group('label') is not None:
+            spans.append(('link', match.group('label'), match.group('target')))
+        elif match.group('strong') is not None:
+            # A bold link (e.g. "**[Home](Home)**") keeps the link; formats can't nest them
+            link = _LINK_RE.match(match.group('strong'))
+            spans.append(('link', link.group('label'), link.group('target')) if link
+                         else ('strong', match.group('strong'), ''))
+        else:
+            spans.append(('em', match.group('em'), ''))
+        position = match.end()
+    if position < len(text):
+        spans.append(('text', text[position:], ''))
+    return spans
+
+
+def _table_row(line: str) -> List[Inline]:
+    cells = line.strip().strip('|').split('|')
+    return [parse_inline(cell.strip()) for cell in cells]
+
+
+def parse_markdown(text: str) -> List[Block]:
+    """Parse page Markdown into blocks"""
+    blocks: List[Block] = []
+    lines = text.splitlines()
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        if not stripped:
+            i += 1
+        elif stripped.startswith('```'):
+            lang = stripped[3:].strip()
+            body = []
+            i += 1
+            while i < len(lines) and not lines[i].strip().startswith('```'):
+                body.append(lines[i])
+                i += 1
+            blocks.append(Block('code', code='\n'.join(body), lang=lang))
+            i += 1
+        elif _HEADING_RE.match(stripped):
+            match = _HEADING_RE.match(stripped)
+            blocks.append(Block('heading', level=len(match.group(1)), inline=parse_inline(match.group(2))))
+            i += 1
+        elif _RULE_RE.match(stripped):
+            blocks.append(Block('rule'))
+            i += 1
+        elif stripped.startswith('|') and i + 1 < len(lines) and _TABLE_SEPARATOR_RE.match(lines[i + 1]):
+            rows = [_table_row(line)]
+            i += 2
+            while i < len(lines) and lines[i].strip().startswith('|'):
+                rows.append(_table_row(lines[i]))
+                i += 1
+            blocks.append(Block('table', rows=rows))
+        elif _BULLET_RE.match(line) or _ORDERED_RE.match(line):
+            ordered = bool(_ORDERED_RE.match(line))
+            pattern = _ORDERED_RE if ordered else _BULLET_RE
+            items = []
+            while i < len(lines) and pattern.match(lines[i]):
+                items.append(parse_inline(pattern.match(lines[i]).group(1)))
+                i += 1
+            blocks.append(Block('list', items=items, ordered=ordered))
+        else:
+            paragraph = []
+            while i < len(lines) and lines[i].strip() and not (
+                    lines[i].strip().startswith(('```', '#', '|'))
+                    or _BULLET_RE.match(lines[i]) or _ORDERED_RE.match(lines[i])
+                    or _RULE_RE.match(lines[i])):
+                paragraph.append(lines[i].strip())
+                i += 1
+            blocks.append(Block('paragraph', inline=parse_inline(' '.join(paragraph))))
+    return blocks
+
+
+def internal_target(target: str) -> Optional[Tuple[str, str]]:
+    """(page slug, anchor) for a link to another documentation page, None for URLs and files"""
+    match = _INTERNAL_RE.match(target)
+    if not match:
+        return None
+    return match.group('slug').lower(), match.group('anchor') or ''
+
+
+def safe_url(target: str) -> Optional[str]:
+    """``target`` if it is relative or uses an allowed scheme (http, https, mailto), else None"""
+    scheme = _SCHEME_RE.match(_CONTROL_RE.sub('', target))
+    if scheme and scheme.group(1).lower() not in SAFE_SCHEMES:
+        return None
+    return target
+
+
+def plain_text(inline: Inline) -> str:
+    """Inline spans without formatting"""
+    return ''.join(text for _, text, _ in inline)
+
+
+def _display_width(text: str) -> int:
+    """Columns taken by text in a monospace font (wide characters count double)"""
+    return sum(2 if unicodedata.east_asian_width(char) in 'WF' else 1 for char in text)
+
+
+# reStructuredText
+
+_RST_SPECIAL_RE = re.compile(r'([\\`*|_])')
+
+
+def _rst_escape(text: str) -> str:
+    return _RST_SPECIAL_RE.sub(r'\\\1', text)
+
+
+def _rst_span(kind: str, text: str, target: str, resolve: Resolver) -> Tuple[str, bool]:
+    """(reStructuredText, whether it is inline markup) for one span"""
+    if kind == 'strong':
+        return f'**{text}**', True
+    if kind == 'em':
+        return f'*{text}*', True
+    if kind == 'code':
+        return f'``{text}``', True
+    if kind == 'link':
+        internal = internal_target(target)
+        if not internal:
+            if safe_url(target):
+                return f'`{_rst_escape(text)} <{target}>`__', True
+        elif resolve(internal[0]):
+            return f':doc:`{_rst_escape(text)} <{internal[0]}>`', True
+    return _rst_escape(text), False  # Plain text, or a link to a page not in this site
+
+
+def _rst_inline(inline: Inline, resolve: Resolver) -> str:
+    parts = []
+    after_markup = False
+    for kind, text, target in inline:
+        rst, markup = _rst_span(kind, text, target, resolve)
+        # Inline markup may not touch word characters on either side
+        if (markup and parts and parts[-1][-1:].isalnum()) or (after_markup and rst[:1].isalnum()):
+            parts.append('\\ ')
+        parts.append(rst)
+        after_markup = markup
+    return ''.join(parts)
+
+
+def to_rst(blocks: List[Block], resolve: Resolver) -> str:
+    """reStructuredText for parsed blocks"""
+    out = []
+    for index, block in enumerate(blocks):
+        if block.kind == 'heading':
+            title = _rst_inline(block.inline, resolve)
+            underline = RST_UNDERLINES[min(block.level, len(RST_UNDERLINES)) - 1]
+            out.append(f'{title}\n{underline * max(_display_width(title), 3)}\n')
+        elif block.kind == 'paragraph':
+            out.append(_rst_inline(block.inline, resolve) + '\n')
+        elif block.kind == 'list':
+            marker = '#.' if block.ordered else '-'
+            out.append(''.join(f'{marker} {_rst_inline(item, resolve)}\n' for item in block.items))
+        elif block.kind == 'code':
+            body = ''.join(f'   {line}\n' if line else '\n' for line in block.code.split('\n'))
+            out.append(f'.. code-block:: {block.lang or "text"}\n\n{body}')
+        elif block.kind == 'table':
+            width = max(len(row) for row in block.rows)
+            table = ['.. list-table::\n   :header-rows: 1\n\n']
+            for row in block.rows:
+                cells = [_rst_inline(cell, resolve) for cell in row] + [''] * (width - len(row))
+                table.append(f'   * - {cells[0]}\n' + ''.join(f'     - {cell}\n' for cell in cells[1:]))
+            out.append(''.join(table))
+        elif block.kind == 'rule' and 0 < index < len(blocks) - 1 and blocks[index - 1].kind != 'rule':
+            # Transitions may not start or end a document
+            out.append('----\n')
+    return '\n'.join(out)
+
+
+# Confluence storage format
+
+def _cdata(text: str) -> str:
+    return '<![CDATA[' + text.replace(']]>', ']]]]><![CDATA[>') + ']]>'
+
+
+def _storage_inline(inline: Inline, resolve: Resolver) -> str:
+    parts = []
+    for kind, text, target in inline:
+        if kind == 'text':
+            parts.append(html.escape(text, quote=False))
+        elif kind == 'strong':
+            parts.append(f'<strong>{html.escape(text, quote=False)}</strong>')
+        elif kind == 'em':
+            parts.append(f'<em>{html.escape(text, quote=False)}</em>')
+        elif kind == 'code':
+            parts.append(f'<code>{html.escape(text, quote=False)}</code>')
+        else:
+            internal = internal_target(target)
+            title = resolve(internal[0]) if internal else None
+            if title:
+                anchor = f' ac:anchor="{html.escape(internal[1])}"' if internal[1] else ''
+                parts.append(f'<ac:link{anchor}><ri:page ri:content-title="{html.escape(title)}"/>'
+                             f'<ac:plain-text-link-body>{_cdata(text)}</ac:plain-text-link-body></ac:link>')
+            elif internal or not safe_url(target):
+                parts.append(html.escape(text, quote=False))
+            else:
+                parts.append(f'<a href="{html.escape(target)}">{html.escape(text, quote=False)}</a>')
+    return ''.join(parts)
+
+
+def to_storage(blocks: List[Block], resolve: Resolver) -> str:
+    """Confluence storage format (XHTML) for parsed blocks"""
+    out = []
+    for block in blocks:
+        if block.kind == 'heading':
+            out.append(f'<h{block.level}>{_storage_inline(block.inline, resolve)}</h{block.level}>')
+        elif block.kind == 'paragraph':
+            out.append(f'<p>{_storage_inline(block.inline, resolve)}</p>')
+        elif block.kind == 'list':
+            tag = 'ol' if block.ordered else 'ul'
+            items = ''.join(f'<li>{_storage_inline(item, resolve)}</li>' for item in block.items)
+            out.append(f'<{tag}>{items}</{tag}>')
+        elif block.kind == 'code':
+            language = (f'<ac:parameter ac:name="language">{html.escape(block.lang)}</ac:parameter>'
+                        if block.lang else '')
+            out.append(f'<ac:structured-macro ac:name="code">{language}'
+                       f'<ac:plain-text-body>{_cdata(block.code)}</ac:plain-text-body></ac:structured-macro>')
+        elif block.kind == 'rule':
+            out.append('<hr/>')
+        elif block.kind == 'table':
+            header, *rows = block.rows
+            table = ['<table><tbody>',
+                     '<tr>' + ''.join(f'<th>{_storage_inline(cell, resolve)}</th>' for cell in header) + '</tr>']
+            table.extend('<tr>' + ''.join(f'<td>{_storage_inline(cell, resolve)}</td>' for cell in row) + '</tr>'
+                         for row in rows)
+            table.append('</tbody></table>')
+            out.append(''.join(table))
+    return '\n'.join(out) + '\n'
+
+
+# HTML
+
+def _html_inline(inline: Inline, resolve: Resolver) -> str:
+    parts = []
+    for kind, text, target in inline:
+        escaped = html.escape(text)
+        if kind == 'text':
+            parts.append(escaped)
+        elif kind == 'strong':
+            parts.append(f'<strong>{escaped}</strong>')
+        elif kind == 'em':
+            parts.append(f'<em>{escaped}</em>')
+        elif kind == 'code':
+            parts.append(f'<code>{escaped}</code>')
+        else:
+            internal = internal_target(target)
+            if internal and resolve(internal[0]):
+                anchor = f'#{internal[1]}' if internal[1] else ''
+                parts.append(f'<a href="{html.escape(internal[0] + ".html" + anchor)}">{escaped}</a>')
+            elif internal or not safe_url(target):
+                parts.append(escaped)  # A page outside this site, or a script/data URL
+            else:
+                parts.append(f'<a href="{html.escape(target)}">{escaped}</a>')
+    return ''.join(parts)
+
+
+def to_html(blocks: List[Block], resolve: Resolver) -> str:
+    """
+    HTML for parsed blocks
+
+    Internal links point at ``<slug>.html``; headings get GitHub-style ids, so
+    ``[text](page#heading)`` links keep working. Text is escaped including
+    quotes, so ``id="`` and ``href="`` only ever occur as attributes.
+    """
+    out = []
+    seen: Dict[str, int] = {}
+    for block in blocks:
+        if block.kind == 'heading':
+            slug = github_anchor(plain_text(block.inline))
+            count = seen.get(slug, 0)
+            seen[slug] = count + 1
+            heading_id = html.escape(f'{slug}-{count}' if count else slug)
+            out.append(f'<h{block.level} id="{heading_id}">{_html_inline(block.inline, resolve)}</h{block.level}>')
+        elif block.kind == 'paragraph':
+            out.append(f'<p>{_html_inline(block.inline, resolve)}</p>')
+        elif block.kind == 'list':
+            tag = 'ol' if block.ordered else 'ul'
+            items = ''.join(f'<li>{_html_inline(item, resolve)}</li>' for item in block.items)
+            out.append(f'<{tag}>{items}</{tag}>')
+        elif block.kind == 'code':
+            language = f' class="language-{html.escape(block.lang)}"' if block.lang else ''
+            out.append(f'<pre><code{language}>{html.escape(block.code)}</code></pre>')
+        elif block.kind == 'rule':
+            out.append('<hr>')
+        elif block.kind == 'table':
+            header, *rows = block.rows
+            table = ['<table><thead>',
+                     '<tr>' + ''.join(f'<th>{_html_inline(cell, resolve)}</th>' for cell in header) + '</tr>',
+                     '</thead><tbody>']
+            table.extend('<tr>' + ''.join(f'<td>{_html_inline(cell, resolve)}</td>' for cell in row) + '</tr>'
+                         for row in rows)
+            table.append('</tbody></table>')
+            out.append(''.join(table))
+    return '\n'.join(out) + '\n'
+
+
+if __name__ == "__main__":
+    sample = "# Demo\n\nSee the **[Guide](guide)** or `demo --help`.\n\n- one\n- [two](https://example.com)\n"
+    parsed = parse_markdown(sample)
+    titles = {'guide': 'Guide'}.get
+    print(to_rst(parsed, titles))
+    print(to_storage(parsed, titles))
+    print(to_html(parsed, titles))
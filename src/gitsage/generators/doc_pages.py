@@ -0,0 +1,849 @@
+#!/usr/bin/env python3
+"""
+Documentation Page Pipeline
+===========================
+Render every documentation page once into a format-neutral page list,
+then let per-format emitters (GitHub Wiki, GitBook, MkDocs, Sphinx / Read
+the Docs, Confluence, offline HTML) serialize file names, page files and
+navigation from it. Pages are parsed into blocks at most once, on first use
+by a format that is not Markdown.
+
+Every output file declares what it depends on (config keys such as
+``project.version``, template ids, the navigation structure), so a build can
+skip rendering files whose dependencies did not change.
+"""
+
+import html
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache, partial
+from string import Formatter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import quoteattr
+
+import yaml
+
+from .doc_markup import Block, internal_target, parse_markdown, to_html, to_rst, to_storage
+from .section_merge import digest
+
+# Page bodies by template name, filled with str.format_map(template_values(project))
+PAGE_TEMPLATES = {
+    'quickstart': '''# Quick Start Guide
+
+Get up and running with {name} in just minutes.
+
+## Prerequisites
+
+- Git
+- Python 3.8+
+- GitHub CLI
+
+## Installation
+
+```bash
+git clone {github_url}.git
+cd {slug}
+python {main_script}
+```
+
+## First Steps
+
+1. Run the launcher
+2. Follow the setup wizard
+3. Configure your preferences
+4. Start managing repositories!
+
+## Next Steps
+
+- [Read the Installation Guide](installation)
+- [Explore Advanced Features](advanced-features)
+- [Join the Community](community)
+''',
+    'installation': '''# Installation Guide
+
+Complete installation instructions for {name}.
+
+## System Requirements
+
+- **Operating System:** Windows 10+, macOS 10.14+, Linux
+- **Python:** 3.8 or higher
+- **Git:** Latest version
+- **GitHub CLI:** Latest version
+
+## Installation Steps
+
+### 1. Install Prerequisites
+
+**Git:**
+- Windows: [Download from git-scm.com](https://git-scm.com/download/win)
+- macOS: `brew install git`
+- Linux: `sudo apt install git`
+
+**GitHub CLI:**
+- Windows: `winget install GitHub.cli`
+- macOS: `brew install gh`
+- Linux: `sudo snap install gh`
+
+### 2. Clone Repository
+
+```bash
+git clone {github_url}.git
+cd {slug}
+```
+
+### 3. Install Dependencies
+
+```bash
+pip install -r requirements.txt
+```
+
+### 4. Run Setup Wizard
+
+```bash
+python utils/setup_wizard.py
+```
+
+## Verification
+
+Test your installation:
+
+```bash
+python launcher.py
+```
+
+You should see the main menu. Success!
+
+## Troubleshooting
+
+If you encounter issues, see the [Troubleshooting Guide](troubleshooting).
+''',
+}
+
+GENERIC_PAGE = '''# {page}
+
+This page contains information about {page_lower}.
+
+## Overview
+
+Documentation coming soon...
+
+## See Also
+
+- [Home](home)
+- [Quick Start](quick-start)
+'''
+
+# Template placeholder -> config key it is filled from (see template_values())
+TEMPLATE_FIELDS = {
+    'name': 'project.name',
+    'slug': 'project.name',
+    'github_url': 'project.github_url',
+    'main_script': 'project.main_script',
+}
+
+WIKI_SIDEBAR_FOOTER = '''---
+
+## 🔗 Project Links
+
+- **[GitHub]({github_url})**
+- **[Issues]({issues_url})**
+- **[Releases]({github_url}/releases)**
+
+## 📞 Support
+
+- **[Troubleshooting](Troubleshooting)**
+- **[FAQ](FAQ)**
+- **[Community](Community)**
+
+---
+
+*v{version}*
+'''
+
+HTML_DOCUMENT = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<link rel="stylesheet" href="style.css">
+</head>
+<body>
+<nav class="sidebar">
+{navigation}</nav>
+<main>
+{content}</main>
+</body>
+</html>
+'''
+
+# No web fonts or scripts: the site works from the file system without a network
+HTML_SITE_CSS = '''body {
+  margin: 0; display: flex; color: #24292f;
+  font: 16px/1.6 -apple-system, "Segoe UI", Helvetica, Arial, sans-serif;
+}
+.sidebar {
+  flex: 0 0 17rem; height: 100vh; overflow-y: auto; position: sticky; top: 0; box-sizing: border-box;
+  padding: 1rem; background: #f6f8fa; border-right: 1px solid #d0d7de; font-size: 14px;
+}
+.sidebar h2 { font-size: 13px; text-transform: uppercase; color: #57606a; margin: 1.2rem 0 .3rem; }
+.sidebar ul { list-style: none; margin: 0; padding: 0; }
+.sidebar a { color: #24292f; text-decoration: none; }
+.sidebar a:hover { text-decoration: underline; }
+main { flex: 1; max-width: 52rem; padding: 2rem 3rem; min-width: 0; }
+a { color: #0969da; }
+pre { background: #f6f8fa; padding: 1rem; overflow-x: auto; border-radius: 6px; }
+code { font-family: ui-monospace, SFMono-Regular, Menlo, Consolas, monospace; font-size: 85%; }
+table { border-collapse: collapse; }
+th, td { border: 1px solid #d0d7de; padding: .4rem .8rem; }
+@media (max-width: 48rem) {
+  body { display: block; }
+  .sidebar { height: auto; position: static; }
+  main { padding: 1rem; }
+}
+@media print { .sidebar { display: none; } }
+'''
+
+
+@dataclass
+class Page:
+    """A documentation page, rendered at most once and independent of output format"""
+
+    name: str
+    section: str
+    template: Optional[str]
+    depends: Dict[str, Any]  # Template id and config values the body is made from
+    render: Callable[[], str] = field(repr=False, compare=False)
+
+    @property
+    def slug(self) -> str:
+        """Format-neutral page id, also used by internal links ("quick-start")"""
+        return page_slug(self.name)
+
+    @cached_property
+    def body(self) -> str:
+        """Markdown body, rendered on first use"""
+        return self.render()
+
+    @cached_property
+    def blocks(self) -> List[Block]:
+        """The body parsed into blocks, shared by every non-Markdown format"""
+        return parse_markdown(self.body)
+
+
+@dataclass
+class DocSection:
+    """A navigation group of pages"""
+
+    title: str
+    icon: str
+    pages: List[Page] = field(default_factory=list)
+
+
+# (relative file name, dependencies, render function) of one output file
+Output = Tuple[str, Dict[str, Any], Callable[[], str]]
+
+
+@dataclass
+class DocSite:
+    """Everything the emitters need: project metadata and pages in navigation order"""
+
+    project: Dict
+    sections: List[DocSection]
+    api_reference: Optional[str] = None  # Index page of generated API docs, if any
+    formats: Dict = field(default_factory=dict)  # The config's per-format settings
+    landing: Optional[Page] = None  # Site index for formats without a landing page of their own
+
+    @property
+    def pages(self) -> Iterator[Page]:
+        for section in self.sections:
+            yield from section.pages
+
+    @cached_property
+    def _by_slug(self) -> Dict[str, Page]:
+        return {page.slug: page for page in self.pages}
+
+    @cached_property
+    def structure(self) -> str:
+        """
+        Digest of the section titles, icons and page names: what navigation and cross-links are made from
+
+        Every cross-linking page depends on it, so it is hashed once here rather than
+        serialized again into each page's dependency digest.
+        """
+        return digest([[section.title, section.icon, [page.name for page in section.pages]]
+                       for section in self.sections])
+
+    def page(self, slug: str) -> Optional[Page]:
+        """The page an internal link points to, if it is part of the site"""
+        return self._by_slug.get(slug)
+
+    def page_name(self, slug: str) -> Optional[str]:
+        page = self.page(slug)
+        return page.name if page else None
+
+    def options(self, fmt: str) -> Dict:
+        """Settings of one output format (config keys use underscores)"""
+        return self.formats.get(fmt.replace('-', '_')) or self.formats.get(fmt) or {}
+
+    def value(self, key: str) -> Any:
+        """Config value for a dotted key such as 'project.version' or 'formats.mkdocs.theme'"""
+        value: Any = {'project': self.project, 'formats': self.formats, 'api_reference': self.api_reference}
+        for part in key.split('.'):
+            value = value.get(part) if isinstance(value, dict) else None
+        return value
+
+    def depends(self, *keys: str, structure: bool = False) -> Dict[str, Any]:
+        """Dependency dict of config keys (plus the navigation structure, if asked)"""
+        depends = {key: self.value(key) for key in keys}
+        if structure:
+            depends['structure'] = self.structure
+        return depends
+
+
+def page_slug(name: str) -> str:
+    return name.lower().replace(' ', '-')
+
+
+def template_values(project: Dict) -> Dict[str, str]:
+    """Placeholder values shared by all page templates"""
+    return {
+        'name': project.get('name', ''),
+        'slug': project.get('name', '').lower().replace(' ', '-'),
+        'github_url': project.get('github_url', ''),
+        'main_script': project.get('main_script', ''),
+    }
+
+
+def render_page(name: str, template: Optional[str], values: Dict[str, str]) -> str:
+    """Markdown body of one page"""
+    if template and template in PAGE_TEMPLATES:
+        return PAGE_TEMPLATES[template].format_map(values)
+    return GENERIC_PAGE.format(page=name, page_lower=name.lower())
+
+
+_MD_HEADING_RE = re.compile(r'^(#{1,6})\s')
+_MD_ITEM_RE = re.compile(r'^\s*(?:[-*+]|\d+[.)])\s')
+_MD_RULE_RE = re.compile(r'^\s*(?:-{3,}|\*{3,}|_{3,})\s*$')
+_MD_LINK_ONLY_RE = re.compile(r'^[\s*_]*\[[^\]]+\]\([^)\s]+\)[\s*_]*$')
+
+
+def prune_links(markdown: str, page: Callable[[str], Optional['Page']]) -> str:
+    """
+    Boilerplate Markdown without its links to pages the site does not have
+
+    List items and lines that are such a link are dropped, a link inside other text
+    keeps only its label, and headings left without content go as well.
+
+    Args:
+        page: Looks up an internal link's page slug (DocSite.page)
+    """
+    def missing(target: str) -> bool:
+        internal = internal_target(target)
+        return internal is not None and page(internal[0]) is None
+
+    lines: List[Tuple[str, str]] = []  # (line, 'heading' | 'blank' | 'rule' | 'content')
+    fenced = pruned = False
+    for line in markdown.split('\n'):
+        if line.startswith('```'):
+            fenced = not fenced
+        elif not fenced and any(missing(match.group(2)) for match in _MD_LINK_RE.finditer(line)):
+            pruned = True
+            if _MD_ITEM_RE.match(line) or _MD_LINK_ONLY_RE.match(line):
+                continue
+            line = _MD_LINK_RE.sub(lambda match: match.group(1)[1:-2] if missing(match.group(2)) else match.group(0),
+                                   line)
+        if fenced or line.startswith('```'):
+            kind = 'content'
+        elif _MD_HEADING_RE.match(line):
+            kind = 'heading'
+        else:
+            kind = 'blank' if not line.strip() else 'rule' if _MD_RULE_RE.match(line) else 'content'
+        lines.append((line, kind))
+    if not pruned:
+        return markdown
+
+    # Bottom-up: a heading stays if content follows before a rule or the next heading of its level or above
+    filled = [False] * 7
+    kept: List[Tuple[str, str]] = []
+    for line, kind in reversed(lines):
+        if kind == 'heading':
+            level = len(_MD_HEADING_RE.match(line).group(1))
+            if not filled[level]:
+                continue
+            filled[level:] = [False] * (7 - level)
+        elif kind != 'blank':
+            filled = [kind == 'content'] * 7  # A rule closes the sections above it
+        kept.append((line, kind))
+
+    # Drop the blank lines and rules that stood between removed lines
+    result: List[str] = []
+    previous = ''
+    for line, kind in reversed(kept):
+        if kind == 'blank' and previous in ('blank', 'rule-blank') or kind == 'rule' and previous in ('rule', 'rule-blank'):
+            continue
+        previous = 'rule-blank' if kind == 'blank' and previous in ('rule', 'rule-blank') else kind
+        result.append(line)
+    return '\n'.join(result)
+
+
+@lru_cache(maxsize=None)
+def _template_links(template: Optional[str]) -> Tuple[str, ...]:
+    """Page slugs a page template links to"""
+    text = PAGE_TEMPLATES.get(template or '', GENERIC_PAGE)
+    return tuple(sorted({internal[0] for internal in (internal_target(match.group(2))
+                                                       for match in _MD_LINK_RE.finditer(text)) if internal}))
+
+
+@lru_cache(maxsize=None)
+def _template_info(template: Optional[str]) -> Tuple[Tuple[str, ...], str, str]:
+    """(config keys, dependency name, text digest) of a page template, shared by every site in the process"""
+    if not template or template not in PAGE_TEMPLATES:
+        return (), 'template:generic', digest(GENERIC_PAGE)
+    text = PAGE_TEMPLATES[template]
+    keys = tuple(sorted({TEMPLATE_FIELDS[name] for _, name, _, _ in Formatter().parse(text) if name}))
+    return keys, f'template:{template}', digest(text)
+
+
+def template_depends(template: Optional[str], site: DocSite) -> Dict[str, Any]:
+    """Template id (with a digest of its text) and the config values its placeholders read"""
+    keys, name, text_digest = _template_info(template)
+    return dict(site.depends(*keys), **{name: text_digest})
+
+
+def build_site(config: Dict, api_reference: Optional[str] = None,
+               harvested: Optional[List[Dict]] = None) -> DocSite:
+    """
+    Collect the pages of a wiki config; each body is rendered once, when first needed
+
+    Args:
+        config: wiki-config.yaml contents
+        api_reference: Name of the generated API index page to link from navigation
+        harvested: Sections harvested from the repository (see content_harvester); a
+            harvested page replaces the configured page of the same name
+
+    Returns:
+        DocSite for the emitters
+    """
+    project = config['project']
+    site = DocSite(project, [], api_reference, config.get('formats') or {})
+    values = template_values(project)
+    harvested_pages = {page_slug(page['name']): page for section in harvested or () for page in section['pages']}
+    used = set()
+    templated: List[Page] = []
+
+    def harvested_page(page: Dict, section: str) -> Page:
+        used.add(page_slug(page['name']))
+        depends = {'page': page['name'], 'sources': page['sources']}
+        return Page(page['name'], section, None, depends, lambda markdown=page['markdown']: markdown)
+
+    for section in config['content']['sections']:
+        doc_section = DocSection(section['title'], section.get('icon', '📄'))
+        for page in section['pages']:
+            name = page['name'] if isinstance(page, dict) else page
+            template = page.get('template') if isinstance(page, dict) else None
+            if page_slug(name) in harvested_pages:
+                doc_section.pages.append(harvested_page(harvested_pages[page_slug(name)], section['title']))
+                continue
+            depends = dict(template_depends(template, site), page=name)
+            templated.append(Page(name, section['title'], template, depends,
+                                  lambda name=name, template=template: prune_links(render_page(name, template, values),
+                                                                                   site.page)))
+            doc_section.pages.append(templated[-1])
+        site.sections.append(doc_section)
+
+    for section in harvested or ():
+        pages = [page for page in section['pages'] if page_slug(page['name']) not in used]
+        if pages:
+            site.sections.append(DocSection(section['title'], section.get('icon', '📄'),
+                                            [harvested_page(page, section['title']) for page in pages]))
+    # Template links to pages this config does not define are left out (see prune_links())
+    for page in templated:
+        page.depends['links'] = [slug for slug in _template_links(page.template) if site.page(slug)]
+    site.landing = landing_page(site)
+    return site
+
+
+def landing_page(site: DocSite) -> Page:
+    """Site index: project name, description and a link to every page"""
+    project = site.project
+
+    def render() -> str:
+        body = [f"# {project.get('name', 'Documentation')}\n\n"]
+        if project.get('description'):
+            body.append(f"{project['description']}\n\n")
+        for section in site.sections:
+            body.append(f"## {section.title}\n\n")
+            body.extend(f"- [{page.name}]({page.slug})\n" for page in section.pages)
+            body.append("\n")
+        return ''.join(body).rstrip('\n') + '\n'
+
+    depends = site.depends('project.name', 'project.description', structure=True)
+    return Page(project.get('name', 'Documentation'), '', None, depends, render)
+
+
+_MD_LINK_RE = re.compile(r'(\[[^\]]+\]\()([^)\s]+)(\))')
+_MD_FENCE_RE = re.compile(r'(^```.*?^```[^\n]*$)', re.MULTILINE | re.DOTALL)
+_MODULE_RE = re.compile(r'^[A-Za-z_]\w*(\.[A-Za-z_]\w*)*$')
+
+
+class Emitter(ABC):
+    """Serialize a DocSite into the files of one output format"""
+
+    format = ''
+    title = ''
+    directory = ''
+    navigation_file = ''
+    navigation_keys: Tuple[str, ...] = ()  # Config keys shown in the navigation file
+    links_pages = False  # Whether page content depends on which other pages exist
+
+    @abstractmethod
+    def page_file(self, page: Page) -> str:
+        """File name of a page in this format"""
+
+    def page_link(self, page: Page) -> str:
+        """Link target used for a page in navigation"""
+        return self.page_file(page)
+
+    def page_content(self, page: Page, site: DocSite) -> str:
+        """Page file content in this format"""
+        return page.body
+
+    def _relink(self, body: str, site: DocSite) -> str:
+        """Markdown with internal page links ("quick-start#setup") pointing at this format's files"""
+        def link(match: 're.Match') -> str:
+            internal = internal_target(match.group(2))
+            page = site.page(internal[0]) if internal else None
+            if not page:
+                return match.group(0)
+            anchor = f'#{internal[1]}' if internal[1] else ''
+            return f'{match.group(1)}{self.page_link(page)}{anchor}{match.group(3)}'
+
+        # Code fences are copied verbatim
+        parts = _MD_FENCE_RE.split(body)
+        return ''.join(part if index % 2 else _MD_LINK_RE.sub(link, part) for index, part in enumerate(parts))
+
+    def page_depends(self, page: Page, site: DocSite) -> Dict[str, Any]:
+        if self.links_pages:
+            return dict(page.depends, structure=site.structure)
+        return page.depends
+
+    @abstractmethod
+    def navigation(self, site: DocSite) -> str:
+        """Content of the navigation file"""
+
+    def support_files(self, site: DocSite) -> Iterator[Output]:
+        """Build configuration and index files, if the format needs any"""
+        return iter(())
+
+    def outputs(self, site: DocSite, skip: Tuple[str, ...] = ()) -> Iterator[Output]:
+        """
+        Every page, the navigation and support files, unrendered
+
+        Args:
+            skip: Page files written separately (e.g. a richer landing page)
+        """
+        for page in site.pages:
+            filename = self.page_file(page)
+            if filename not in skip:
+                yield filename, self.page_depends(page, site), partial(self.page_content, page, site)
+        yield (self.navigation_file, site.depends(*self.navigation_keys, structure=True),
+               partial(self.navigation, site))
+        yield from self.support_files(site)
+
+    def emit(self, site: DocSite, skip: Tuple[str, ...] = ()) -> Iterator[Tuple[str, str]]:
+        """(relative file name, content) of every output file"""
+        for filename, _, render in self.outputs(site, skip):
+            yield filename, render()
+
+
+class GitHubWikiEmitter(Emitter):
+    """GitHub Wiki: Title-Case-With-Dashes.md pages and _Sidebar.md"""
+
+    format = 'github-wiki'
+    title = 'GitHub Wiki'
+    directory = 'github-wiki'
+    navigation_file = '_Sidebar.md'
+    navigation_keys = ('project.github_url', 'project.issues_url', 'project.version', 'api_reference')
+    links_pages = True
+
+    def page_file(self, page: Page) -> str:
+        return page.name.replace(' ', '-') + '.md'
+
+    def page_link(self, page: Page) -> str:
+        return page.name.replace(' ', '-')
+
+    def page_content(self, page: Page, site: DocSite) -> str:
+        return self._relink(page.body, site)
+
+    def navigation(self, site: DocSite) -> str:
+        sidebar = ["# [DOCS] Documentation\n\n"]
+        for section in site.sections:
+            sidebar.append(f"## {section.icon} {section.title}\n\n")
+            sidebar.extend(f"- **[{page.name}]({self.page_link(page)})**\n" for page in section.pages)
+            sidebar.append("\n")
+
+        if site.api_reference:
+            sidebar.append(f"## [TOOL] Code Reference\n\n- **[API Reference]({site.api_reference})**\n\n")
+
+        project = site.project
+        sidebar.append(prune_links(WIKI_SIDEBAR_FOOTER.format(
+            github_url=project['github_url'], issues_url=project['issues_url'], version=project['version']), site.page))
+        return ''.join(sidebar)
+
+
+class GitBookEmitter(Emitter):
+    """GitBook: lower-case-with-dashes.md pages and SUMMARY.md"""
+
+    format = 'gitbook'
+    title = 'GitBook'
+    directory = 'gitbook'
+    navigation_file = 'SUMMARY.md'
+    links_pages = True
+
+    def page_file(self, page: Page) -> str:
+        return page.name.replace(' ', '-').lower() + '.md'
+
+    def page_content(self, page: Page, site: DocSite) -> str:
+        return self._relink(page.body, site)
+
+    def navigation(self, site: DocSite) -> str:
+        summary = ["# Summary\n\n", "* [Introduction](README.md)\n\n"]
+        for section in site.sections:
+            summary.append(f"## {section.title}\n\n")
+            summary.extend(f"* [{page.name}]({self.page_link(page)})\n" for page in section.pages)
+            summary.append("\n")
+        return ''.join(summary)
+
+
+class MkDocsEmitter(Emitter):
+    """MkDocs: mkdocs.yml plus docs/*.md with links rewritten to page files"""
+
+    format = 'mkdocs'
+    title = 'MkDocs'
+    directory = 'mkdocs'
+    navigation_file = 'mkdocs.yml'
+    navigation_keys = ('project.name', 'project.description', 'project.author', 'project.github_url',
+                       'formats.mkdocs.theme')
+    links_pages = True
+
+    def page_file(self, page: Page) -> str:
+        return f'docs/{page.slug}.md'
+
+    def page_link(self, page: Page) -> str:
+        return f'{page.slug}.md'
+
+    def page_content(self, page: Page, site: DocSite) -> str:
+        return self._relink(page.body, site)
+
+    def navigation(self, site: DocSite) -> str:
+        project = site.project
+        theme = {'name': site.options(self.format).get('theme', 'material')}
+        if theme['name'] == 'material':
+            theme['font'] = False  # No Google Fonts request, so the site builds and renders offline
+        config = {
+            'site_name': project.get('name', 'Documentation'),
+            'site_description': project.get('description', ''),
+            'site_author': project.get('author', ''),
+            'repo_url': project.get('github_url', ''),
+            'docs_dir': 'docs',
+            'use_directory_urls': False,  # Browsable straight from the file system
+            'theme': theme,
+            'plugins': ['search'],
+            'nav': [{'Home': 'index.md'}] + [
+                {section.title: [{page.name: self.page_link(page)} for page in section.pages]}
+                for section in site.sections
+            ],
+        }
+        config = {key: value for key, value in config.items() if value != ''}
+        return yaml.safe_dump(config, sort_keys=False, allow_unicode=True)
+
+    def support_files(self, site: DocSite) -> Iterator[Output]:
+        yield 'docs/index.md', site.landing.depends, lambda: self._relink(site.landing.body, site)
+
+
+class SphinxEmitter(Emitter):
+    """Read the Docs: a Sphinx project (docs/conf.py, docs/index.rst, docs/*.rst, .readthedocs.yaml)"""
+
+    format = 'readthedocs'
+    title = 'Read the Docs'
+    directory = 'readthedocs'
+    navigation_file = 'docs/index.rst'
+    navigation_keys = ('project.name', 'project.description')
+    links_pages = True
+
+    def page_file(self, page: Page) -> str:
+        return f'docs/{page.slug}.rst'
+
+    def page_link(self, page: Page) -> str:
+        return page.slug
+
+    def page_content(self, page: Page, site: DocSite) -> str:
+        blocks = page.blocks
+        if not blocks or blocks[0].kind != 'heading':
+            blocks = parse_markdown(f'# {page.name}\n') + blocks  # Every document needs a title
+        return to_rst(blocks, site.page_name)
+
+    def navigation(self, site: DocSite) -> str:
+        index = [to_rst(site.landing.blocks, site.page_name)]
+        for section in site.sections:
+            index.append(f"\n.. toctree::\n   :hidden:\n   :maxdepth: 2\n   :caption: {section.title}\n\n")
+            index.extend(f"   {self.page_link(page)}\n" for page in section.pages)
+        return ''.join(index)
+
+    def _theme(self, site: DocSite) -> str:
+        """Theme module name; pip names are accepted and anything else falls back to the default"""
+        theme = str(site.options(self.format).get('theme') or 'sphinx_rtd_theme').replace('-', '_')
+        return theme if _MODULE_RE.match(theme) else 'sphinx_rtd_theme'
+
+    def _conf(self, site: DocSite) -> str:
+        project = site.project
+        theme = self._theme(site)
+        return f'''# Sphinx configuration generated by GitSage
+project = {project.get('name', 'Documentation')!r}
+author = {project.get('author', '')!r}
+version = release = {str(project.get('version', ''))!r}
+
+root_doc = master_doc = 'index'
+extensions = []
+exclude_patterns = ['_build']
+
+# Fall back to Sphinx's built-in theme so the docs also build offline without extras
+try:
+    import {theme}  # noqa: F401
+    html_theme = {theme!r}
+except ImportError:
+    html_theme = 'alabaster'
+'''
+
+    def support_files(self, site: DocSite) -> Iterator[Output]:
+        theme_key = 'formats.readthedocs.theme'
+        yield ('docs/conf.py', site.depends('project.name', 'project.author', 'project.version', theme_key),
+               partial(self._conf, site))
+        yield ('docs/requirements.txt', site.depends(theme_key),
+               lambda: f"sphinx\n{self._theme(site).replace('_', '-')}\n")
+        yield '.readthedocs.yaml', {}, lambda: (
+            "version: 2\n\n"
+            "build:\n  os: ubuntu-22.04\n  tools:\n    python: \"3.11\"\n\n"
+            "sphinx:\n  configuration: docs/conf.py\n\n"
+            "python:\n  install:\n    - requirements: docs/requirements.txt\n"
+        )
+
+
+class ConfluenceEmitter(Emitter):
+    """Confluence: one storage-format (XHTML) file per page and space.xml describing the page tree"""
+
+    format = 'confluence'
+    title = 'Confluence'
+    directory = 'confluence'
+    navigation_file = 'space.xml'
+    navigation_keys = ('project.name', 'formats.confluence.space_key', 'formats.confluence.parent_page')
+    links_pages = True
+
+    def page_file(self, page: Page) -> str:
+        return f'{page.slug}.xml'
+
+    def page_content(self, page: Page, site: DocSite) -> str:
+        return to_storage(page.blocks, site.page_name)
+
+    def _section_file(self, section: DocSection) -> str:
+        return f'section-{page_slug(section.title)}.xml'
+
+    def navigation(self, site: DocSite) -> str:
+        options = site.options(self.format)
+        root = options.get('parent_page') or 'Documentation'
+        tree = ['<?xml version="1.0" encoding="UTF-8"?>\n',
+                f'<space key={quoteattr(options.get("space_key") or "DOCS")} '
+                f'name={quoteattr(site.project.get("name", root))}>\n',
+                f'  <page title={quoteattr(root)} file="index.xml">\n']
+        for section in site.sections:
+            tree.append(f'    <page title={quoteattr(section.title)} file="{self._section_file(section)}">\n')
+            tree.extend(f'      <page title={quoteattr(page.name)} file="{self.page_file(page)}"/>\n'
+                        for page in section.pages)
+            tree.append('    </page>\n')
+        tree.append('  </page>\n</space>\n')
+        return ''.join(tree)
+
+    def support_files(self, site: DocSite) -> Iterator[Output]:
+        yield 'index.xml', site.landing.depends, lambda: to_storage(site.landing.blocks, site.page_name)
+        for section in site.sections:
+            # Section pages list their children with Confluence's own macro
+            yield self._section_file(section), {}, lambda: '<ac:structured-macro ac:name="children"/>\n'
+
+
+class HtmlEmitter(Emitter):
+    """Offline HTML site of the ``pdf`` format: site/*.html pages with a navigation sidebar"""
+
+    format = 'pdf'
+    title = 'HTML / PDF'
+    directory = 'pdf'
+    navigation_file = 'site/index.html'
+    navigation_keys = ('project.name', 'project.description')
+    links_pages = True
+
+    def __init__(self, fragments: Optional[Callable[[Page], str]] = None):
+        """
+        Args:
+            fragments: Returns a page's body as HTML (e.g. html_book.BookRenderer.fragment,
+                which caches it); by default the page is converted here
+        """
+        self.fragments = fragments
+        self._sidebar: Tuple[Optional[DocSite], str] = (None, '')
+
+    def page_file(self, page: Page) -> str:
+        return f'site/{page.slug}.html'
+
+    def page_link(self, page: Page) -> str:
+        return f'{page.slug}.html'
+
+    def page_depends(self, page: Page, site: DocSite) -> Dict[str, Any]:
+        return dict(super().page_depends(page, site), **site.depends('project.name'))
+
+    def _navigation_html(self, site: DocSite) -> str:
+        """Sidebar shared by every page, built once per site"""
+        if self._sidebar[0] is not site:
+            nav = [f'<a href="index.html"><strong>{html.escape(site.project.get("name", "Documentation"))}'
+                   f'</strong></a>\n']
+            for section in site.sections:
+                nav.append(f'<h2>{html.escape(section.title)}</h2>\n<ul>\n')
+                nav.extend(f'<li><a href="{html.escape(self.page_link(page))}">{html.escape(page.name)}</a></li>\n'
+                           for page in section.pages)
+                nav.append('</ul>\n')
+            self._sidebar = (site, ''.join(nav))
+        return self._sidebar[1]
+
+    def _document(self, site: DocSite, title: str, content: str) -> str:
+        project = site.project.get('name', 'Documentation')
+        return HTML_DOCUMENT.format(title=html.escape(title if title == project else f'{title} - {project}'),
+                                    navigation=self._navigation_html(site), content=content)
+
+    def page_content(self, page: Page, site: DocSite) -> str:
+        body = self.fragments(page) if self.fragments else to_html(page.blocks, site.page_name)
+        return self._document(site, page.name, body)
+
+    def navigation(self, site: DocSite) -> str:
+        return self._document(site, site.landing.name, to_html(site.landing.blocks, site.page_name))
+
+    def support_files(self, site: DocSite) -> Iterator[Output]:
+        yield 'site/style.css', {}, lambda: HTML_SITE_CSS
+
+
+# Output format -> emitter
+EMITTERS: Dict[str, Emitter] = {
+    emitter.format: emitter for emitter in (
+        GitHubWikiEmitter(), GitBookEmitter(), MkDocsEmitter(), SphinxEmitter(), ConfluenceEmitter(),
+        HtmlEmitter(),
+    )
+}
+
+
+if __name__ == "__main__":
+    import sys
+    import yaml
+
+    with open(sys.argv[1] if len(sys.argv) > 1 else 'wiki-config.yaml', encoding='utf-8') as f:
+        site = build_site(yaml.safe_load(f))
+    for emitter in EMITTERS.values():
+        files = list(emitter.emit(site))
+        print(f"{emitter.format}: {len(files)} files ({', '.join(name for name, _ in files[:4])}, ...)")
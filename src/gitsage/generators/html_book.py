@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+HTML Book
+=========
+Build the ``pdf`` format without Node or gitbook-cli:
+
+    site/        offline HTML site, one file per page (see doc_pages.HtmlEmitter)
+    book.html    every page in navigation order in one print-ready file
+    book.pdf     book.html typeset by WeasyPrint, when it is installed
+
+Each page is converted to HTML once per content: fragments are cached in
+.gitsage/html-cache/ under a hash of the page's Markdown and of the set of
+pages it may link to, and cache misses are converted on a process pool. The
+book is streamed to disk page by page rather than assembled in memory.
+"""
+
+import html
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Union
+
+from ..utils.atomic_writer import content_hash, file_hash, write_if_changed
+from .doc_markup import parse_markdown, to_html
+from .doc_pages import DocSite, Page
+
+try:
+    from weasyprint import HTML as WeasyHTML
+    WEASYPRINT_AVAILABLE = True
+except (ImportError, OSError):  # OSError: WeasyPrint installed without its Pango libraries
+    WEASYPRINT_AVAILABLE = False
+
+HTML_CACHE = '.gitsage/html-cache'
+BOOK_HTML = 'book.html'
+BOOK_PDF = 'book.pdf'
+
+# Below this many cache misses, starting worker processes costs more than it saves
+PARALLEL_THRESHOLD = 32
+
+_PAPER_RE = re.compile(r'^[A-Za-z0-9 ]+$')
+_ID_RE = re.compile(r' id="([^"]*)"')
+_PAGE_HREF_RE = re.compile(r' href="([^"/#:]+)\.html(?:#([^"]*))?"')
+
+BOOK_CSS = '''@page {{ size: {paper}; margin: 2cm 2cm 2.5cm; @bottom-center {{ content: counter(page); }} }}
+body {{ font: 11pt/1.5 Georgia, "Times New Roman", serif; color: #111; max-width: 48rem; margin: 0 auto; }}
+h1, h2, h3, h4 {{ font-family: Helvetica, Arial, sans-serif; break-after: avoid; }}
+a {{ color: inherit; }}
+pre {{ background: #f4f4f4; padding: .6rem; white-space: pre-wrap; break-inside: avoid; }}
+code {{ font-family: Menlo, Consolas, monospace; font-size: 9pt; }}
+table {{ border-collapse: collapse; break-inside: avoid; }}
+th, td {{ border: 1px solid #999; padding: .2rem .5rem; }}
+.cover {{ text-align: center; padding-top: 30%; break-after: page; }}
+.toc {{ break-after: page; }}
+.toc ul {{ list-style: none; }}
+.part {{ break-before: page; font-size: 24pt; }}
+.page {{ break-before: page; }}
+.part + .page {{ break-before: avoid; }}
+'''
+
+_worker_slugs: FrozenSet[str] = frozenset()
+
+
+def _init_worker(slugs: FrozenSet[str]) -> None:
+    global _worker_slugs
+    _worker_slugs = slugs
+
+
+def _worker_resolve(slug: str) -> Optional[str]:
+    return slug if slug in _worker_slugs else None
+
+
+def _convert(body: str) -> str:
+    """Page Markdown -> HTML fragment (runs in a worker process)"""
+    return to_html(parse_markdown(body), _worker_resolve)
+
+
+@lru_cache(maxsize=1)
+def _code_version() -> str:
+    """Hash of the converter code, so cached fragments die with a converter change"""
+    here = Path(__file__)
+    return ''.join(file_hash(here.with_name(name))[:12] for name in ('doc_markup.py', 'html_book.py'))
+
+
+def print_fragment(slug: str, fragment: str) -> str:
+    """
+    A site page fragment made fit for the single-file book
+
+    Heading ids are prefixed with the page slug (pages share heading names) and
+    links to other pages' files become links into the book.
+    """
+    prefix = html.escape(slug)
+
+    def href(match: 're.Match') -> str:
+        page, anchor = match.group(1), match.group(2)
+        return f' href="#{page}--{anchor}"' if anchor else f' href="#{page}"'
+
+    fragment = _ID_RE.sub(lambda match: f' id="{prefix}--{match.group(1)}"', fragment)
+    return _PAGE_HREF_RE.sub(href, fragment)
+
+
+class BookRenderer:
+    """Convert pages to HTML fragments, each at most once per content"""
+
+    def __init__(self, site: DocSite, cache_dir: Optional[Union[str, Path]] = HTML_CACHE,
+                 jobs: Optional[int] = None):
+        """
+        Args:
+            site: Pages to render (see doc_pages.build_site())
+            cache_dir: Fragment cache directory, None to keep fragments in memory only
+            jobs: Worker processes for converting cache misses (default: CPU count)
+        """
+        self.site = site
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.jobs = jobs or os.cpu_count() or 1
+        self.stats = {'converted': 0, 'cached': 0}
+        self._slugs = frozenset(page.slug for page in site.pages)
+        # Links render differently once the page they point at exists
+        self._salt = content_hash('\0'.join(sorted(self._slugs) + [_code_version()]))
+        self._fragments: Dict[str, str] = {}
+
+    def key(self, page: Page) -> str:
+        """Cache key: hash of the page's Markdown and of the pages it may link to"""
+        return content_hash(f"{self._salt}\0{page.body}")
+
+    def _cache_file(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.html"
+
+    def _cached(self, key: str) -> Optional[str]:
+        if key in self._fragments:
+            return self._fragments[key]
+        if self.cache_dir is None:
+            return None
+        try:
+            fragment = self._cache_file(key).read_text(encoding='utf-8')
+        except OSError:
+            return None
+        self._fragments[key] = fragment
+        self.stats['cached'] += 1
+        return fragment
+
+    def _store(self, key: str, fragment: str) -> None:
+        self._fragments[key] = fragment
+        self.stats['converted'] += 1
+        if self.cache_dir is not None:
+            write_if_changed(self._cache_file(key), fragment)
+
+    def prefetch(self, pages: Iterable[Page]) -> None:
+        """Convert every page missing from the cache, on worker processes when there are many"""
+        missing: Dict[str, str] = {}
+        for page in pages:
+            key = self.key(page)
+            if self._cached(key) is None:
+                missing.setdefault(key, page.body)
+        if not missing:
+            return
+
+        bodies = list(missing.values())
+        if self.jobs > 1 and len(bodies) >= PARALLEL_THRESHOLD:
+            workers = min(self.jobs, len(bodies) // PARALLEL_THRESHOLD + 1)
+            # Spawned, not forked: prefetch runs on a format thread beside the writer threads
+            with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_worker, initargs=(self._slugs,)) as pool:
+                fragments = list(pool.map(_convert, bodies, chunksize=max(1, len(bodies) // (workers * 4))))
+        else:
+            fragments = [to_html(parse_markdown(body), self._resolve) for body in bodies]
+        for key, fragment in zip(missing, fragments):
+            self._store(key, fragment)
+
+    def _resolve(self, slug: str) -> Optional[str]:
+        return slug if slug in self._slugs else None
+
+    def fragment(self, page: Page) -> str:
+        """HTML of one page body, from memory, the cache or converted now"""
+        key = self.key(page)
+        fragment = self._cached(key)
+        if fragment is None:
+            fragment = to_html(parse_markdown(page.body), self._resolve)
+            self._store(key, fragment)
+        return fragment
+
+    def prune(self) -> int:
+        """Delete cached fragments of pages that no longer exist in this form; returns the count"""
+        if self.cache_dir is None or not self.cache_dir.is_dir():
+            return 0
+        keep = {f"{self.key(page)}.html" for page in self.site.pages}
+        removed = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.html') and entry.name not in keep:
+                os.unlink(entry.path)
+                removed += 1
+        return removed
+
+
+def book_chunks(site: DocSite, renderer: BookRenderer, options: Optional[Dict] = None) -> Iterator[str]:
+    """
+    book.html, one piece at a time: cover, table of contents and every page
+
+    Args:
+        options: The config's formats.pdf settings (``format``: paper size, ``toc``)
+    """
+    options = options or {}
+    project = site.project
+    name = html.escape(project.get('name', 'Documentation'))
+    paper = str(options.get('format') or 'A4')
+    paper = paper if _PAPER_RE.match(paper) else 'A4'
+
+    yield (f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n<title>{name}</title>\n'
+           f'<style>\n{BOOK_CSS.format(paper=paper)}</style>\n</head>\n<body>\n')
+    cover = [f'<h1>{name}</h1>']
+    if project.get('description'):
+        cover.append(f'<p>{html.escape(project["description"])}</p>')
+    if project.get('version'):
+        cover.append(f'<p>Version {html.escape(str(project["version"]))}</p>')
+    yield '<header class="cover">\n' + '\n'.join(cover) + '\n</header>\n'
+
+    if options.get('toc', True):
+        toc: List[str] = ['<nav class="toc">\n<h1>Contents</h1>\n']
+        for section in site.sections:
+            toc.append(f'<h2>{html.escape(section.title)}</h2>\n<ul>\n')
+            toc.extend(f'<li><a href="#{html.escape(page.slug)}">{html.escape(page.name)}</a></li>\n'
+                       for page in section.pages)
+            toc.append('</ul>\n')
+        toc.append('</nav>\n')
+        yield ''.join(toc)
+
+    for section in site.sections:
+        yield f'<h1 class="part">{html.escape(section.title)}</h1>\n'
+        for page in section.pages:
+            yield (f'<section class="page" id="{html.escape(page.slug)}">\n'
+                   f'{print_fragment(page.slug, renderer.fragment(page))}</section>\n')
+    yield '</body>\n</html>\n'
+
+
+def render_pdf(book_path: Union[str, Path]) -> bytes:
+    """PDF of a book.html (needs WeasyPrint)"""
+    if not WEASYPRINT_AVAILABLE:
+        raise RuntimeError("PDF output needs WeasyPrint: pip install weasyprint")
+    return WeasyHTML(filename=str(book_path)).write_pdf()
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    import yaml
+
+    from ..utils.atomic_writer import stream_if_changed
+    from .doc_pages import build_site
+
+    with open(sys.argv[1] if len(sys.argv) > 1 else 'wiki-config.yaml', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    site = build_site(config)
+    start = time.perf_counter()
+    renderer = BookRenderer(site)
+    renderer.prefetch(site.pages)
+    stream_if_changed(BOOK_HTML, book_chunks(site, renderer, site.options('pdf')))
+    print(f"{BOOK_HTML}: {renderer.stats['converted']} pages converted, {renderer.stats['cached']} cached "
+          f"in {time.perf_counter() - start:.2f}s")
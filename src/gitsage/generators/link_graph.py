@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Documentation Link Graph
+========================
+Check every internal link of a generated documentation tree after a build.
+
+One pass reads each file once, recording the pages that exist and the
+anchors their headings create (hash sets) plus the links it makes; a second
+pass resolves every link against those sets. Both passes are linear in the
+size of the output, so whole doc sets can be checked on every build.
+
+Link resolution follows the output format:
+
+    github-wiki   flat pages linked by name without ".md", case-sensitive
+    gitbook       relative paths to .md files, GitHub-style heading anchors
+    mkdocs        relative paths under docs/, Python-Markdown heading anchors
+    readthedocs   :doc: references and toctree entries pointing at .rst documents
+    confluence    page titles declared in space.xml
+    pdf           relative href links and id anchors of the HTML site and book
+"""
+
+import html
+import os
+import posixpath
+import re
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+_FENCE_RE = re.compile(r'^\s*(```|~~~)')
+_CODE_SPAN_RE = re.compile(r'(`+).+?\1')
+_MD_HEADING_RE = re.compile(r'^#{1,6}\s+(.*?)\s*#*\s*$')
+_MD_LINK_RE = re.compile(r'!?\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)')
+_MD_REFERENCE_RE = re.compile(r'^\s{0,3}\[[^\]]+\]:\s*<?(\S+?)>?(?:\s+"[^"]*")?\s*$')
+_HTML_ANCHOR_RE = re.compile(r'<a\s+(?:name|id)="([^"]+)"')
+_SCHEME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*:|^//')
+_RST_DOC_RE = re.compile(r':doc:`(?:[^`<]*<([^>`]+)>|([^`<]+))`')
+_RST_TOCTREE_RE = re.compile(r'^\.\. toctree::')
+_XML_TITLE_RE = re.compile(r'ri:content-title="([^"]*)"')
+_SPACE_PAGE_RE = re.compile(r'<page title="([^"]*)" file="([^"]*)"')
+_HTML_ID_RE = re.compile(r'\sid="([^"]+)"')
+_HTML_HREF_RE = re.compile(r'\shref="([^"]+)"')
+
+
+@dataclass(frozen=True)
+class BrokenLink:
+    """An internal link that does not resolve"""
+
+    source: str  # File containing the link, relative to the checked root
+    line: int
+    target: str
+    reason: str  # missing page, missing anchor or missing file
+
+    def __str__(self) -> str:
+        return f"{self.source}:{self.line}: {self.reason}: {self.target}"
+
+
+def github_anchor(text: str) -> str:
+    """Heading anchor as GitHub (and GitBook) generate it"""
+    text = _CODE_SPAN_RE.sub(lambda match: match.group(0).strip('`'), text)
+    text = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', text)  # Link text only
+    return re.sub(r'[^\w\- ]', '', text.strip().lower()).replace(' ', '-')
+
+
+def mkdocs_anchor(text: str) -> str:
+    """Heading anchor as Python-Markdown's toc extension (MkDocs) generates it"""
+    text = _CODE_SPAN_RE.sub(lambda match: match.group(0).strip('`'), text)
+    text = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', text)
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    text = re.sub(r'[^\w\s-]', '', text).strip().lower()
+    return re.sub(r'[-\s]+', '-', text)
+
+
+# Link = (source file, line, target)
+Link = Tuple[str, int, str]
+
+
+class LinkGraph:
+    """Pages, anchors and links of one generated documentation tree"""
+
+    def __init__(self, root: str, fmt: str):
+        """
+        Args:
+            root: Output directory of the format (e.g. generated-docs/gitbook)
+            fmt: Format name; decides how links and anchors resolve (see module docstring)
+        """
+        self.root = Path(root)
+        self.format = fmt
+        self.files: Set[str] = set()
+        self.anchors: Set[Tuple[str, str]] = set()
+        self.titles: Set[str] = set()
+        self.links: List[Link] = []
+        self._declared: List[Link] = []  # Files named by space.xml (Confluence)
+
+    def _walk(self) -> Iterator[str]:
+        root = str(self.root)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith(('.', '_build')))
+            rel_dir = os.path.relpath(dirpath, root).replace(os.sep, '/')
+            for filename in sorted(filenames):
+                yield filename if rel_dir == '.' else f"{rel_dir}/{filename}"
+
+    def collect(self) -> 'LinkGraph':
+        """First pass: read every file once"""
+        for key in self._walk():
+            self.files.add(key)
+            extension = os.path.splitext(key)[1]
+            if extension in ('.md', '.markdown'):
+                self._scan_markdown(key)
+            elif extension == '.rst':
+                self._scan_rst(key)
+            elif extension == '.xml' and self.format == 'confluence':
+                self._scan_storage(key)
+            elif extension == '.html':
+                self._scan_html(key)
+        return self
+
+    def _read(self, key: str) -> List[str]:
+        return (self.root / key).read_text(encoding='utf-8', errors='replace').splitlines()
+
+    def _scan_markdown(self, key: str) -> None:
+        anchor = mkdocs_anchor if self.format == 'mkdocs' else github_anchor
+        separator = '_' if self.format == 'mkdocs' else '-'
+        seen: Dict[str, int] = {}
+        fenced = None
+        for number, line in enumerate(self._read(key), 1):
+            fence = _FENCE_RE.match(line)
+            if fence:
+                if fenced is None:
+                    fenced = fence.group(1)
+                elif fence.group(1) == fenced:
+                    fenced = None
+                continue
+            if fenced:
+                continue
+
+            heading = _MD_HEADING_RE.match(line)
+            if heading:
+                slug = anchor(heading.group(1))
+                count = seen.get(slug, 0)
+                seen[slug] = count + 1
+                self.anchors.add((key, f"{slug}{separator}{count}" if count else slug))
+            for name in _HTML_ANCHOR_RE.findall(line):
+                self.anchors.add((key, name))
+
+            text = _CODE_SPAN_RE.sub('', line)
+            for target in _MD_LINK_RE.findall(text):
+                self.links.append((key, number, target))
+            reference = _MD_REFERENCE_RE.match(text)
+            if reference:
+                self.links.append((key, number, reference.group(1)))
+
+    def _scan_rst(self, key: str) -> None:
+        in_toctree = False
+        for number, line in enumerate(self._read(key), 1):
+            if _RST_TOCTREE_RE.match(line):
+                in_toctree = True
+                continue
+            if in_toctree:
+                entry = line.strip()
+                if line and not line[0].isspace():
+                    in_toctree = False
+                elif entry and not entry.startswith(':'):
+                    self.links.append((key, number, f"doc:{entry}"))
+                    continue
+            for explicit, bare in _RST_DOC_RE.findall(line):
+                self.links.append((key, number, f"doc:{(explicit or bare).strip()}"))
+
+    def _scan_storage(self, key: str) -> None:
+        for number, line in enumerate(self._read(key), 1):
+            if key == 'space.xml':
+                for title, filename in _SPACE_PAGE_RE.findall(line):
+                    self.titles.add(title)
+                    self._declared.append((key, number, filename))
+            for title in _XML_TITLE_RE.findall(line):
+                self.links.append((key, number, f"title:{title}"))
+
+    def _scan_html(self, key: str) -> None:
+        # Generated HTML escapes quotes in text, so id="" and href="" only match attributes
+        for number, line in enumerate(self._read(key), 1):
+            for name in _HTML_ID_RE.findall(line):
+                self.anchors.add((key, html.unescape(name)))
+            for target in _HTML_HREF_RE.findall(line):
+                self.links.append((key, number, html.unescape(target)))
+
+    def _resolve_page(self, source: str, path: str) -> Optional[str]:
+        """File an internal link path points at, or None"""
+        if self.format == 'github-wiki':
+            # Wiki pages are flat and linked by name; a trailing .md also works
+            name = path[:-3] if path.endswith('.md') else path
+            return f"{name}.md" if f"{name}.md" in self.files else (path if path in self.files else None)
+        resolved = posixpath.normpath(posixpath.join(posixpath.dirname(source), path))
+        if resolved in self.files:
+            return resolved
+        for index in ('index.md', 'README.md'):
+            candidate = posixpath.join(resolved, index)
+            if candidate in self.files:
+                return candidate
+        return None
+
+    def _check(self, source: str, line: int, target: str) -> Optional[BrokenLink]:
+        if target.startswith('doc:'):
+            document = target[4:]
+            base = '' if document.startswith('/') else posixpath.dirname(source)
+            resolved = posixpath.normpath(posixpath.join(base, document.lstrip('/'))) + '.rst'
+            return None if resolved in self.files else BrokenLink(source, line, document, 'missing page')
+        if target.startswith('title:'):
+            title = target[6:]
+            return None if title in self.titles else BrokenLink(source, line, title, 'missing page')
+        if _SCHEME_RE.match(target):
+            return None  # External links are the link health checker's job
+
+        path, _, anchor = target.partition('#')
+        path = unquote(path)
+        page = source if not path else self._resolve_page(source, path)
+        if page is None:
+            reason = 'missing page' if path.endswith('.md') or '.' not in posixpath.basename(path) else 'missing file'
+            return BrokenLink(source, line, target, reason)
+        if anchor and page.endswith(('.md', '.html')):
+            anchor = unquote(anchor)
+            if (page, anchor) not in self.anchors and (page, anchor.lower()) not in self.anchors:
+                return BrokenLink(source, line, target, 'missing anchor')
+        return None
+
+    def broken(self) -> List[BrokenLink]:
+        """Second pass: every link that does not resolve, in file order"""
+        problems = [BrokenLink(source, line, filename, 'missing file')
+                    for source, line, filename in self._declared if filename not in self.files]
+        for source, line, target in self.links:
+            problem = self._check(source, line, target)
+            if problem:
+                problems.append(problem)
+        return problems
+
+
+def check_links(root: str, fmt: str) -> List[BrokenLink]:
+    """Broken internal links of one generated format directory"""
+    return LinkGraph(root, fmt).collect().broken()
+
+
+if __name__ == "__main__":
+    import sys
+
+    output = Path(sys.argv[1] if len(sys.argv) > 1 else 'generated-docs')
+    total = 0
+    for fmt in ('github-wiki', 'gitbook', 'mkdocs', 'readthedocs', 'confluence', 'pdf'):
+        if (output / fmt).is_dir():
+            for problem in check_links(str(output / fmt), fmt):
+                total += 1
+                print(f"{fmt}/{problem}")
+    print(f"{total} broken links")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Page Render Pool
+================
+Render the output files of the built-in formats on worker processes.
+
+Page rendering (template filling, relinking, RST and Confluence serialization)
+is CPU-bound Python, so threads only interleave it under the GIL. Each worker
+builds its own copy of the site from the same config once and always gets the
+same share of the pages, so a page is rendered and parsed into blocks by one
+worker for every format. File contents come back in order; writing stays with
+the caller (AtomicWriter / WriteQueue).
+
+Workers are spawned, not forked: the pool starts on a format thread while the
+writer threads run, and a forked child could inherit a lock one of them holds.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .doc_pages import EMITTERS, DocSite, build_site
+
+# Below this many stale files in a format, rendering in-process beats shipping them to workers
+PARALLEL_THRESHOLD = 64
+
+# Files per round trip to a worker
+CHUNK_SIZE = 32
+
+_worker_site: Optional[DocSite] = None
+_worker_outputs: Dict[Tuple[str, Tuple[str, ...]], Dict] = {}
+
+
+def _init_worker(config: Dict, api_reference: Optional[str], harvested: Optional[List[Dict]]) -> None:
+    global _worker_site
+    _worker_site = build_site(config, api_reference=api_reference, harvested=harvested)
+    _worker_outputs.clear()
+
+
+def _render(fmt: str, skip: Tuple[str, ...], filenames: Sequence[str]) -> List[str]:
+    """Contents of some output files of one format (runs in a worker process)"""
+    key = (fmt, skip)
+    if key not in _worker_outputs:
+        _worker_outputs[key] = {name: render for name, _, render in EMITTERS[fmt].outputs(_worker_site, skip)}
+    renders = _worker_outputs[key]
+    return [renders[name]() for name in filenames]
+
+
+class PagePool:
+    """Worker processes holding a copy of one site, started on first use"""
+
+    def __init__(self, config: Dict, api_reference: Optional[str] = None,
+                 harvested: Optional[List[Dict]] = None, jobs: Optional[int] = None):
+        """
+        Args:
+            config, api_reference, harvested: What the site was built from (see build_site())
+            jobs: Worker processes (default: CPU count)
+        """
+        self._site_args = (config, api_reference, harvested)
+        self.jobs = jobs or os.cpu_count() or 1
+        self._workers: List[ProcessPoolExecutor] = []
+        self._lock = threading.Lock()
+
+    def wanted(self, fmt: str, count: int) -> bool:
+        """Whether ``count`` stale files of a format are worth rendering on the pool"""
+        return self.jobs > 1 and count >= PARALLEL_THRESHOLD and fmt in EMITTERS
+
+    def render(self, fmt: str, files: Sequence[Tuple[int, str]], total: int,
+               skip: Tuple[str, ...] = ()) -> Iterator[str]:
+        """
+        Contents of some output files of one format, in order, as workers finish them
+
+        Args:
+            fmt: A key of EMITTERS
+            files: (position, file name) in the emitter's outputs(), in order
+            total: Number of files outputs() yields; position * jobs // total picks the worker
+            skip: The same ``skip`` the caller passes to outputs()
+        """
+        with self._lock:  # Formats may be generated on several threads
+            if not self._workers:
+                context = multiprocessing.get_context('spawn')
+                self._workers = [ProcessPoolExecutor(1, mp_context=context, initializer=_init_worker,
+                                                     initargs=self._site_args)
+                                 for _ in range(self.jobs)]
+        skip = tuple(skip)
+        futures = []
+        shard: List[str] = []
+        current = 0
+        for position, filename in files:
+            worker = min(position * self.jobs // max(total, 1), self.jobs - 1)
+            if shard and (worker != current or len(shard) == CHUNK_SIZE):
+                futures.append(self._workers[current].submit(_render, fmt, skip, shard))
+                shard = []
+            current = worker
+            shard.append(filename)
+        if shard:
+            futures.append(self._workers[current].submit(_render, fmt, skip, shard))
+        for future in futures:
+            yield from future.result()
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.shutdown()
+        self._workers = []
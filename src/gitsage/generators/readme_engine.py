@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+README Template Engine
+======================
+Compile the templates/readme library into cached render functions and fill
+their {PLACEHOLDER} fields from a readme-config.yaml dictionary. The library
+ships inside the package (gitsage/templates/readme), so it is found in an
+installed wheel as well as in a source checkout.
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+def _package_templates() -> Path:
+    """The template library installed with the package"""
+    try:
+        from importlib.resources import files  # Python 3.9+
+    except ImportError:
+        return Path(__file__).resolve().parents[1] / 'templates' / 'readme'
+    return Path(str(files('gitsage') / 'templates' / 'readme'))
+
+
+TEMPLATE_DIR = _package_templates()
+
+# --template / wizard choices that differ from the template file stem
+TEMPLATE_ALIASES = {
+    'library': 'python-library',
+    'web-app': 'web-application',
+    'data-science': 'machine-learning',
+}
+
+# Placeholder spellings used across the templates -> value key
+PLACEHOLDERS = {
+    'PROJECT_NAME': 'name',
+    'ProjectName': 'name',
+    'project': 'name',
+    'PROJECT_DESCRIPTION': 'tagline',
+    'project-name': 'slug',
+    'project_name': 'slug',
+    'VERSION': 'version',
+    'LICENSE': 'license',
+    'REPO_URL': 'repo_url',
+    'repo_url': 'repo_url',
+    'AUTHOR_NAME': 'author',
+    'AUTHOR_GITHUB': 'github_username',
+    'AUTHOR_GITHUB_URL': 'author_url',
+    'SUPPORT_EMAIL': 'email',
+    'DOCS_URL': 'docs_url',
+    'DEMO_URL': 'demo_url',
+    'package-name': 'package',
+    'package_name': 'package',
+    'package': 'package',
+    'command': 'command',
+    'cli-name': 'command',
+    'PROJECT_PREFIX': 'prefix',
+}
+
+_FIELD_RE = re.compile(r'\{([A-Za-z][A-Za-z0-9_-]*)\}')
+
+RenderFunction = Callable[[Dict[str, str]], str]
+
+
+def compile_template(text: str) -> RenderFunction:
+    """
+    Compile template text into a render function
+
+    Known placeholders become str.format fields; every other brace (code samples,
+    unknown placeholders) is escaped, so rendering is one format_map call.
+
+    Returns:
+        Function taking the dict from placeholder_values() and returning markdown
+    """
+    pieces: List[str] = []
+    position = 0
+    for match in _FIELD_RE.finditer(text):
+        key = PLACEHOLDERS.get(match.group(1))
+        if key is None:
+            continue
+        pieces.append(text[position:match.start()].replace('{', '{{').replace('}', '}}'))
+        pieces.append(f"{{{key}}}")
+        position = match.end()
+    pieces.append(text[position:].replace('{', '{{').replace('}', '}}'))
+    return ''.join(pieces).format_map
+
+
+def template_path(template_type: str, template_dir: Optional[Path] = None) -> Optional[Path]:
+    """Template file for a --template choice, or None when the library has none"""
+    stem = TEMPLATE_ALIASES.get(template_type, template_type)
+    path = Path(template_dir or TEMPLATE_DIR) / f"{stem}.md"
+    return path if path.is_file() else None
+
+
+def available_templates(template_dir: Optional[Path] = None) -> List[str]:
+    """Template names in the library"""
+    return sorted(path.stem for path in Path(template_dir or TEMPLATE_DIR).glob('*.md'))
+
+
+@lru_cache(maxsize=64)
+def _compiled(path: str, mtime_ns: int) -> RenderFunction:
+    return compile_template(Path(path).read_text(encoding='utf-8'))
+
+
+def load_template(template_type: str, template_dir: Optional[Path] = None) -> Optional[RenderFunction]:
+    """Compiled render function for a template type, cached until the file changes"""
+    path = template_path(template_type, template_dir)
+    if path is None:
+        return None
+    return _compiled(str(path), path.stat().st_mtime_ns)
+
+
+def placeholder_values(config: Dict) -> Dict[str, str]:
+    """
+    Placeholder values from a README config
+
+    Values missing from the config keep their placeholder so the gap stays visible.
+    """
+    project = config.get('project', {})
+    install = config.get('installation', {})
+    support = config.get('support', {})
+
+    username = project.get('github_username') or '{AUTHOR_GITHUB}'
+    slug = project.get('repo_name') or re.sub(r'[^a-z0-9]+', '-', project.get('name', 'project').lower()).strip('-')
+    repo_url = f"https://github.com/{username}/{slug}" if project.get('github_username') else '{REPO_URL}'
+    package = install.get('pip_package') or install.get('npm_package') or slug
+
+    return {
+        'name': project.get('name') or '{PROJECT_NAME}',
+        'tagline': project.get('tagline') or project.get('description') or '{PROJECT_DESCRIPTION}',
+        'slug': slug,
+        'version': str(project.get('version') or '{VERSION}'),
+        'license': project.get('license') or '{LICENSE}',
+        'repo_url': repo_url,
+        'author': project.get('author') or '{AUTHOR_NAME}',
+        'github_username': username,
+        'author_url': f"https://github.com/{username}" if project.get('github_username') else '{AUTHOR_GITHUB_URL}',
+        'email': support.get('email') or project.get('email') or '{SUPPORT_EMAIL}',
+        'docs_url': project.get('homepage') or (f"{repo_url}#readme" if project.get('github_username') else '{DOCS_URL}'),
+        'demo_url': project.get('demo_url') or '{DEMO_URL}',
+        'package': package,
+        'command': project.get('command') or slug,
+        'prefix': re.sub(r'[^A-Z0-9]+', '_', slug.upper()).strip('_'),
+    }
+
+
+def render_template(template_type: str, config: Dict,
+                    template_dir: Optional[Path] = None) -> Optional[str]:
+    """
+    Render a library template for a config
+
+    Returns:
+        README markdown, or None when there is no template for ``template_type``
+    """
+    render = load_template(template_type, template_dir)
+    if render is None:
+        return None
+    return render(placeholder_values(config))
+
+
+if __name__ == "__main__":
+    import sys
+
+    name = sys.argv[1] if len(sys.argv) > 1 else 'cli-tool'
+    print(render_template(name, {'project': {'name': 'Example', 'github_username': 'octocat'}}))
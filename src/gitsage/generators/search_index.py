@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Documentation Search Index
+==========================
+Build a compact inverted index of the generated documentation pages and
+query it straight from a memory-mapped file.
+
+The index is one little-endian binary file (search-index.bin):
+
+    header      magic, version, document and term counts, total token count,
+                offsets of the sections below
+    documents   metadata offsets + JSON metadata blob (slug, title, section,
+                snippet), decoded only for results
+    terms       fixed-size entries sorted by term (binary searchable in place)
+                + the UTF-8 term blob
+    postings    per term: document ids (u32) and term frequencies (u16)
+    tokens      every page as a sequence of term ids (u32) with per-page
+                offsets: page lengths for ranking and word positions for
+                phrase queries
+
+Opening an index reads the header only; a query touches the term entries it
+binary-searches and the postings of the matching terms.
+"""
+
+import heapq
+import json
+import math
+import mmap
+import re
+import struct
+import sys
+from array import array
+from collections import Counter
+from functools import cached_property
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .doc_markup import plain_text
+
+SEARCH_INDEX = 'search-index.bin'
+
+MAGIC = b'GSIX'
+VERSION = 1
+# magic, version, reserved, documents, terms, total tokens, seven section offsets
+HEADER = struct.Struct('<4sHHIIQ7Q')
+# term offset, term length, document frequency, postings offset, term id in the token stream
+TERM_ENTRY = struct.Struct('<IIIQI')
+
+MAX_TOKEN_LENGTH = 64
+SNIPPET_LENGTH = 160
+MAX_PREFIX_TERMS = 64
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+_TOKEN_RE = re.compile(r'\b\w{1,%d}\b' % MAX_TOKEN_LENGTH)  # Longer runs (hashes, data) are dropped
+_PHRASE_RE = re.compile(r'"([^"]+)"')
+
+# (slug, title, section, text) of one page
+Document = Tuple[str, str, str, str]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def page_text(blocks) -> str:
+    """Searchable text of a parsed page, without Markdown syntax or link targets"""
+    parts = []
+    for block in blocks:
+        if block.kind in ('heading', 'paragraph'):
+            parts.append(plain_text(block.inline))
+        elif block.kind == 'list':
+            parts.extend(plain_text(item) for item in block.items)
+        elif block.kind == 'table':
+            parts.extend(plain_text(cell) for row in block.rows for cell in row)
+        elif block.kind == 'code':
+            parts.append(block.code)
+    return '\n'.join(parts)
+
+
+def site_documents(site) -> Iterator[Document]:
+    """Documents of every page of a DocSite (see doc_pages.build_site())"""
+    for page in site.pages:
+        yield page.slug, page.name, page.section, page_text(page.blocks)
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode: str, data) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def build_index(documents: Iterable[Document]) -> bytes:
+    """
+    Serialize documents into the binary index format
+
+    Args:
+        documents: (slug, title, section, text) per page; the title is indexed with the text
+
+    Returns:
+        Index file content
+    """
+    term_ids: Dict[str, int] = {}
+    postings: List[Tuple[List[int], List[int]]] = []  # (document ids, frequencies) per term id
+    token_offsets = array('Q', [0])
+    tokens = bytearray()
+    metadata = []
+    for doc_id, (slug, title, section, text) in enumerate(documents):
+        snippet = ' '.join(text.split())
+        if len(snippet) > SNIPPET_LENGTH:
+            snippet = snippet[:SNIPPET_LENGTH].rsplit(' ', 1)[0] + '…'
+        metadata.append(json.dumps({'slug': slug, 'title': title, 'section': section, 'snippet': snippet},
+                                   ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        ids = array('I', [term_ids.setdefault(token, len(term_ids)) for token in tokenize(f"{title}\n{text}")])
+        postings.extend(([], []) for _ in range(len(term_ids) - len(postings)))
+        for term_id, frequency in Counter(ids).items():
+            docs, frequencies = postings[term_id]
+            docs.append(doc_id)
+            frequencies.append(frequency if frequency <= 0xFFFF else 0xFFFF)
+        tokens += _little_endian(ids)
+        token_offsets.append(token_offsets[-1] + len(ids))
+
+    doc_offsets = array('I', [0])
+    for blob in metadata:
+        doc_offsets.append(doc_offsets[-1] + len(blob))
+
+    term_blob = bytearray()
+    entries = bytearray()
+    posting_data = bytearray()
+    for term in sorted(term_ids, key=lambda term: term.encode('utf-8')):
+        term_id = term_ids[term]
+        docs, frequencies = postings[term_id]
+        encoded = term.encode('utf-8')
+        entries += TERM_ENTRY.pack(len(term_blob), len(encoded), len(docs), len(posting_data), term_id)
+        posting_data += _little_endian(array('I', docs)) + _little_endian(array('H', frequencies))
+        term_blob += encoded
+
+    sections = [_little_endian(doc_offsets), _little_endian(token_offsets), b''.join(metadata),
+                bytes(entries), bytes(term_blob), bytes(posting_data), bytes(tokens)]
+    offsets = []
+    position = HEADER.size
+    for section in sections:
+        offsets.append(position)
+        position += len(section)
+    header = HEADER.pack(MAGIC, VERSION, 0, len(metadata), len(term_ids), token_offsets[-1], *offsets)
+    return header + b''.join(sections)
+
+
+class SearchIndex:
+    """Query a search index file through a read-only memory map"""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            fields = HEADER.unpack_from(self._map, 0)
+        except struct.error:
+            self._map.close()
+            raise ValueError(f"{path} is not a search index")
+        magic, version, _, self.documents, self.terms, total, *offsets = fields
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} search index")
+        (self._doc_offsets, self._token_offsets, self._doc_blob, self._term_table, self._term_blob,
+         self._posting_data, self._tokens) = offsets
+        self._average_length = total / self.documents if total else 1.0
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _entry(self, index: int) -> Tuple[int, int, int, int, int]:
+        return TERM_ENTRY.unpack_from(self._map, self._term_table + index * TERM_ENTRY.size)
+
+    def _term(self, index: int) -> bytes:
+        offset, length, _, _, _ = self._entry(index)
+        start = self._term_blob + offset
+        return self._map[start:start + length]
+
+    def _search_terms(self, term: bytes) -> int:
+        """Index of the first term >= ``term`` (binary search over the mapped table)"""
+        low, high = 0, self.terms
+        while low < high:
+            middle = (low + high) // 2
+            if self._term(middle) < term:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def lookup(self, term: str, prefix: bool = False) -> List[int]:
+        """Term-table indexes of ``term`` (or of every term starting with it, when ``prefix``)"""
+        encoded = term.encode('utf-8')
+        index = self._search_terms(encoded)
+        found = []
+        while index < self.terms and len(found) < (MAX_PREFIX_TERMS if prefix else 1):
+            candidate = self._term(index)
+            if candidate == encoded or (prefix and candidate.startswith(encoded)):
+                found.append(index)
+                index += 1
+            else:
+                break
+        return found
+
+    def _postings(self, index: int) -> Tuple[array, array]:
+        _, _, count, offset, _ = self._entry(index)
+        start = self._posting_data + offset
+        ids = _from_little_endian('I', self._map[start:start + 4 * count])
+        frequencies = _from_little_endian('H', self._map[start + 4 * count:start + 6 * count])
+        return ids, frequencies
+
+    def _document(self, doc_id: int) -> Dict:
+        start, end = struct.unpack_from('<II', self._map, self._doc_offsets + 4 * doc_id)
+        return json.loads(self._map[self._doc_blob + start:self._doc_blob + end].decode('utf-8'))
+
+    @cached_property
+    def _spans(self) -> array:
+        """Token offset of every page (plus the end), loaded on the first query"""
+        return _from_little_endian('Q', self._map[self._token_offsets:self._token_offsets + 8 * (self.documents + 1)])
+
+    @cached_property
+    def _norms(self) -> List[float]:
+        """BM25 length normalisation per page"""
+        spans = self._spans
+        return [K1 * (1 - B + B * (end - start) / self._average_length) for start, end in zip(spans, spans[1:])]
+
+    def _phrase_matches(self, tokens: Sequence[str], candidates: set) -> set:
+        """Candidates whose token stream contains the phrase's term ids back to back"""
+        indexes = [self.lookup(token) for token in tokens]
+        if not all(indexes):
+            return set()
+        pattern = _little_endian(array('I', [self._entry(found[0])[4] for found in indexes]))
+        matches = set()
+        for doc_id in candidates:
+            start, end = self._spans[doc_id], self._spans[doc_id + 1]
+            stream = self._map[self._tokens + 4 * start:self._tokens + 4 * end]
+            found = stream.find(pattern)
+            while found > 0 and found % 4:  # Only term-aligned matches count
+                found = stream.find(pattern, found + 1)
+            if found >= 0:
+                matches.add(doc_id)
+        return matches
+
+    def search(self, query: str, limit: int = 10, prefix: bool = True) -> List[Dict]:
+        """
+        Pages matching every word of ``query``, best BM25 score first
+
+        Quoted parts ("write queue") must appear as a phrase. When ``prefix`` is set
+        the last word also matches longer terms, for search-as-you-type.
+
+        Returns:
+            Result dicts with slug, title, section, snippet and score
+        """
+        phrases = [tokenize(phrase) for phrase in _PHRASE_RE.findall(query)]
+        words = tokenize(query)
+        if not words or not self.documents:
+            return []
+        open_ended = prefix and not query.rstrip().endswith('"') and query[-1:].isalnum()
+
+        norms = self._norms
+        scores: Optional[Dict[int, float]] = None
+        for word in dict.fromkeys(words):
+            term_scores: Dict[int, float] = {}
+            for index in self.lookup(word, prefix=open_ended and word == words[-1]):
+                ids, frequencies = self._postings(index)
+                idf = math.log(1 + (self.documents - len(ids) + 0.5) / (len(ids) + 0.5))
+                for doc_id, frequency in zip(ids, frequencies):
+                    score = idf * frequency * (K1 + 1) / (frequency + norms[doc_id])
+                    term_scores[doc_id] = max(term_scores.get(doc_id, 0.0), score)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {doc_id: score + term_scores[doc_id] for doc_id, score in scores.items()
+                          if doc_id in term_scores}
+            if not scores:
+                return []
+
+        candidates = set(scores)
+        for phrase in phrases:
+            if len(phrase) > 1:
+                candidates = self._phrase_matches(phrase, candidates)
+
+        best = heapq.nlargest(limit, ((score, doc_id) for doc_id, score in scores.items()
+                                      if doc_id in candidates), key=lambda item: (item[0], -item[1]))
+        return [dict(self._document(doc_id), score=round(score, 4)) for score, doc_id in best]
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    pages = [
+        ('quick-start', 'Quick Start', 'Getting Started', 'Install GitSage and generate your first README.'),
+        ('write-queue', 'Write Queue', 'Internals', 'The write queue batches page writes across threads.'),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / SEARCH_INDEX
+        path.write_bytes(build_index(pages))
+        with SearchIndex(str(path)) as index:
+            for query in ('readme', '"write queue"', 'gen'):
+                print(query, '->', [result['slug'] for result in index.search(query)])
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+README Section Markers
+======================
+Wrap generated README sections in HTML comment markers and merge a fresh
+render into an existing README: only sections whose inputs changed are
+re-rendered, everything outside the markers is kept byte for byte.
+
+Sections can render to a string or to an iterator of chunks, and the
+existing README can be a string or a bytes buffer such as an mmap, so a
+document can be streamed to disk without ever being held in memory.
+"""
+
+import codecs
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+BEGIN_MARKER = '<!-- gitsage:begin {name} inputs={inputs} -->\n'
+END_MARKER = '<!-- gitsage:end {name} output={output} -->\n'
+
+_BLOCK_PATTERN = (
+    r'^<!-- gitsage:begin (?P<name>[\w.-]+) inputs=(?P<inputs>[0-9a-f]+) -->\n'
+    r'(?P<body>.*?)'
+    r'^<!-- gitsage:end (?P=name) output=(?P<output>[0-9a-f]+) -->(?:\n|\Z)'
+)
+_BLOCK_RE = re.compile(_BLOCK_PATTERN, re.MULTILINE | re.DOTALL)
+_BLOCK_RE_BYTES = re.compile(_BLOCK_PATTERN.encode('ascii'), re.MULTILINE | re.DOTALL)
+
+# Unchanged text copied out of a bytes buffer is decoded in pieces of this size
+COPY_CHUNK = 1 << 16
+
+Chunks = Union[str, Iterable[str]]
+Source = Union[str, bytes, bytearray, memoryview, 'mmap.mmap']
+
+# (name, inputs digest, render function returning text or chunks) in document order
+Section = Tuple[str, str, Callable[[], Chunks]]
+
+
+def digest(value: Any) -> str:
+    """Short stable hash of JSON-serialisable inputs or of rendered text"""
+    sha = hashlib.sha256()
+    if isinstance(value, str):
+        sha.update(value.encode('utf-8'))
+    else:
+        # Encoded piecewise so large inputs (e.g. usage examples) are never one big string
+        for piece in json.JSONEncoder(sort_keys=True, default=str).iterencode(value):
+            sha.update(piece.encode('utf-8'))
+    return sha.hexdigest()[:12]
+
+
+def _chunks(rendered: Chunks) -> Iterator[str]:
+    if isinstance(rendered, str):
+        yield rendered
+    else:
+        yield from rendered
+
+
+def iter_section(name: str, inputs: str, rendered: Chunks) -> Iterator[str]:
+    """
+    Section chunks between begin/end markers
+
+    The output digest is computed while streaming and written into the end marker.
+    Sections that render nothing produce nothing, so disabled sections leave no trace.
+    """
+    sha = hashlib.sha256()
+    last = ''
+    started = False
+    for chunk in _chunks(rendered):
+        if not chunk:
+            continue
+        if not started:
+            yield BEGIN_MARKER.format(name=name, inputs=inputs)
+            started = True
+        sha.update(chunk.encode('utf-8'))
+        last = chunk
+        yield chunk
+    if not started:
+        return
+    if not last.endswith('\n'):
+        sha.update(b'\n')
+        yield '\n'
+    yield END_MARKER.format(name=name, output=sha.hexdigest()[:12])
+
+
+def wrap_section(name: str, inputs: str, content: Chunks) -> str:
+    """Section content between begin/end markers ('' stays '')"""
+    return ''.join(iter_section(name, inputs, content))
+
+
+@dataclass
+class Block:
+    """A marked section found in an existing README"""
+
+    name: str
+    inputs: str
+    output: str
+    start: int
+    end: int
+    body_start: int
+    body_end: int
+    source: Source = field(repr=False)
+
+    @property
+    def body(self) -> str:
+        body = self.source[self.body_start:self.body_end]
+        return body if isinstance(body, str) else bytes(body).decode('utf-8')
+
+    @property
+    def edited(self) -> bool:
+        """Whether the text between the markers was changed by hand"""
+        if isinstance(self.source, str):
+            return digest(self.body) != self.output
+        with memoryview(self.source) as view:
+            return hashlib.sha256(view[self.body_start:self.body_end]).hexdigest()[:12] != self.output
+
+
+@dataclass
+class MergeResult:
+    """Merged README text and what happened to each section"""
+
+    text: str
+    unchanged: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    conflicts: List[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.updated or self.added or self.removed)
+
+
+def parse_blocks(source: Source) -> List[Block]:
+    """Marked sections of a README (text or UTF-8 bytes) in document order"""
+    if isinstance(source, str):
+        return [Block(m.group('name'), m.group('inputs'), m.group('output'), m.start(), m.end(),
+                      m.start('body'), m.end('body'), source)
+                for m in _BLOCK_RE.finditer(source)]
+    return [Block(m.group('name').decode('ascii'), m.group('inputs').decode('ascii'),
+                  m.group('output').decode('ascii'), m.start(), m.end(), m.start('body'), m.end('body'), source)
+            for m in _BLOCK_RE_BYTES.finditer(source)]
+
+
+def _copy(source: Source, start: int, end: int) -> Iterator[str]:
+    """Text of ``source[start:end]``, decoded piecewise when ``source`` is a buffer"""
+    if isinstance(source, str):
+        if end > start:
+            yield source[start:end]
+        return
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for offset in range(start, end, COPY_CHUNK):
+        text = decoder.decode(source[offset:min(offset + COPY_CHUNK, end)])
+        if text:
+            yield text
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def iter_render_sections(sections: Sequence[Section]) -> Iterator[str]:
+    """Chunks of a complete README made of marked sections"""
+    for name, inputs, render in sections:
+        yield from iter_section(name, inputs, render())
+
+
+def render_sections(sections: Sequence[Section]) -> str:
+    """A complete README made of marked sections"""
+    return ''.join(iter_render_sections(sections))
+
+
+def iter_merge_sections(existing: Source, sections: Sequence[Section], result: MergeResult,
+                        force: bool = False, blocks: Optional[List[Block]] = None) -> Iterator[str]:
+    """
+    Chunks of ``existing`` with freshly rendered sections merged in
+
+    Fills ``result`` (except ``text``) as the chunks are consumed; see merge_sections().
+    """
+    if blocks is None:
+        blocks = parse_blocks(existing)
+    wanted = {name: (inputs, render) for name, inputs, render in sections}
+    present = {block.name for block in blocks}
+
+    # New sections hang off the closest earlier section that exists (or lead the first block)
+    inserts_after: Dict[Optional[str], List[str]] = {}
+    anchor: Optional[str] = None
+    for name, _, _ in sections:
+        if name in present:
+            anchor = name
+        else:
+            inserts_after.setdefault(anchor, []).append(name)
+
+    def new_sections(names: List[str]) -> Iterator[str]:
+        for name in names:
+            inputs, render = wanted[name]
+            emitted = False
+            for chunk in iter_section(name, inputs, render()):
+                emitted = True
+                yield chunk
+            if emitted:
+                result.added.append(name)
+
+    def keep(block: Block) -> Iterator[str]:
+        yield from _copy(existing, block.start, block.end)
+        if existing[block.end - 1:block.end] not in ('\n', b'\n'):
+            yield '\n'
+
+    position = 0
+    for index, block in enumerate(blocks):
+        yield from _copy(existing, position, block.start)
+        position = block.end
+        if index == 0:
+            yield from new_sections(inserts_after.pop(None, []))
+
+        if block.name not in wanted:
+            if block.edited and not force:
+                yield from keep(block)
+                result.conflicts.append(block.name)
+            else:
+                result.removed.append(block.name)
+        else:
+            inputs, render = wanted[block.name]
+            if inputs == block.inputs and not (force and block.edited):
+                yield from keep(block)
+                result.unchanged.append(block.name)
+            elif block.edited and not force:
+                yield from keep(block)
+                result.conflicts.append(block.name)
+            else:
+                emitted = False
+                for chunk in iter_section(block.name, inputs, render()):
+                    emitted = True
+                    yield chunk
+                (result.updated if emitted else result.removed).append(block.name)
+
+        yield from new_sections(inserts_after.pop(block.name, []))
+
+    yield from _copy(existing, position, len(existing))
+
+
+def merge_sections(existing: str, sections: Sequence[Section], force: bool = False) -> Optional[MergeResult]:
+    """
+    Merge freshly rendered sections into an existing README
+
+    Sections whose inputs digest matches the marker are copied without rendering.
+    Blocks edited by hand are left alone (reported as conflicts) unless ``force``.
+    New sections are inserted after the nearest preceding section already present.
+
+    Returns:
+        MergeResult, or None when ``existing`` has no markers to merge into
+    """
+    blocks = parse_blocks(existing)
+    if not blocks:
+        return None
+    result = MergeResult(text='')
+    result.text = ''.join(iter_merge_sections(existing, sections, result, force, blocks))
+    return result
+
+
+if __name__ == "__main__":
+    sections = [('intro', digest({'name': 'Demo'}), lambda: "# Demo\n"),
+                ('usage', digest({'cmd': 'demo'}), lambda: "## Usage\n\n    demo --help\n")]
+    readme = render_sections(sections) + "\nHand-written notes stay here.\n"
+    sections[1] = ('usage', digest({'cmd': 'demo2'}), lambda: iter(["## Usage\n\n", "    demo2 --help\n"]))
+    merged = merge_sections(readme, sections)
+    print(merged.text)
+    print(f"updated: {merged.updated}, unchanged: {merged.unchanged}")
@@ -1,3 +1,5 @@
 """GitSage managers package."""
 
-__all__ = []
+from .wiki_deployer import DeployResult, WikiDeployer, WikiDeployError, deploy_cache, wiki_url
+
+__all__ = ['DeployResult', 'WikiDeployer', 'WikiDeployError', 'deploy_cache', 'wiki_url']
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Wiki Deployer
+=============
+Publish a generated GitHub Wiki by building the commit with git plumbing in a
+persistent local clone, instead of cloning, copying and committing the whole
+wiki on every deploy.
+
+The clone is bare and lives in .gitsage/wiki-deploy/. Each deploy fetches the
+remote, finds the files whose blob differs from the remote tree (blob ids are
+cached per build-manifest hash, so unchanged files are not even read), writes
+only those with ``hash-object``, updates a private index with ``update-index``
+and records the result with ``write-tree`` / ``commit-tree`` before pushing.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from ..utils.atomic_writer import AtomicWriter, write_if_changed
+
+DEPLOY_CACHE = '.gitsage/wiki-deploy'
+STATE_FILE = 'gitsage-deploy.json'
+INDEX_FILE = 'gitsage-index'
+
+# Used when git has no user.name / user.email configured (same as the old deploy script)
+DEFAULT_AUTHOR = ('Documentation Bot', 'docs@generator.local')
+
+FILE_MODE = '100644'
+NULL_OID = '0' * 40
+
+
+class WikiDeployError(Exception):
+    """A git step of the deployment failed"""
+
+
+@dataclass
+class DeployResult:
+    """What a deployment changed"""
+
+    commit: Optional[str] = None  # Pushed commit, None when the wiki was already up to date
+    branch: str = ''
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return self.commit is not None
+
+
+def wiki_url(repo_url: str) -> str:
+    """Wiki repository of a GitHub repository URL (``.../repo.git`` -> ``.../repo.wiki.git``)"""
+    url = repo_url.rstrip('/')
+    if url.endswith('.wiki.git'):
+        return url
+    if url.endswith('.git'):
+        url = url[:-4]
+    return f"{url}.wiki.git"
+
+
+def deploy_cache(remote_url: str, root: Union[str, Path] = '.') -> Path:
+    """Persistent clone directory of a wiki remote under ``root``"""
+    return Path(root) / DEPLOY_CACHE / hashlib.sha1(remote_url.encode('utf-8')).hexdigest()[:12]
+
+
+class WikiDeployer:
+    """Incrementally deploy a directory of wiki pages to a git remote"""
+
+    def __init__(self, source_dir: Union[str, Path], remote_url: str, cache_dir: Optional[Union[str, Path]] = None,
+                 branch: Optional[str] = None, manifest_path: Optional[Union[str, Path]] = None,
+                 prune: bool = False):
+        """
+        Args:
+            source_dir: Generated wiki pages (e.g. generated-docs/github-wiki)
+            remote_url: Wiki repository to push to
+            cache_dir: Persistent bare clone (default: .gitsage/wiki-deploy/<url hash>)
+            branch: Remote branch (default: the remote's HEAD branch, else master)
+            manifest_path: Build manifest with content hashes of the generated files
+            prune: Also delete remote pages that were never deployed from here (e.g. edited online)
+        """
+        self.source_dir = Path(source_dir)
+        self.remote_url = remote_url
+        self.git_dir = Path(cache_dir) if cache_dir else deploy_cache(remote_url)
+        self.branch = branch
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.prune = prune
+        self.state_path = self.git_dir / STATE_FILE
+        self._env = dict(os.environ, GIT_INDEX_FILE=str((self.git_dir / INDEX_FILE).resolve()))
+
+    def _git(self, *args: str, stdin: Optional[str] = None) -> str:
+        result = subprocess.run(['git', '--git-dir', str(self.git_dir), *args], input=stdin,
+                                capture_output=True, text=True, env=self._env)
+        if result.returncode != 0:
+            raise WikiDeployError(f"git {args[0]} failed: {result.stderr.strip() or result.stdout.strip()}")
+        return result.stdout
+
+    def _load_state(self) -> Dict:
+        try:
+            return json.loads(self.state_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    def _prepare(self, state: Dict) -> None:
+        """Create the bare clone on first use and fetch the remote"""
+        if not (self.git_dir / 'HEAD').exists():
+            self.git_dir.mkdir(parents=True, exist_ok=True)
+            self._git('init', '--bare', '--quiet')
+            self._git('remote', 'add', 'origin', self.remote_url)
+        elif self._git('remote', 'get-url', 'origin').strip() != self.remote_url:
+            self._git('remote', 'set-url', 'origin', self.remote_url)
+        self._git('fetch', '--quiet', '--prune', 'origin', '+refs/heads/*:refs/remotes/origin/*')
+
+        if not self.branch:
+            self.branch = state.get('branch') or self._remote_branch()
+
+    def _remote_branch(self) -> str:
+        for line in self._git('ls-remote', '--symref', 'origin', 'HEAD').splitlines():
+            if line.startswith('ref: refs/heads/'):
+                return line.split('\t')[0][len('ref: refs/heads/'):]
+        for name in ('master', 'main'):  # Empty HEAD: GitHub wikis use master
+            if self._parent(name):
+                return name
+        return 'master'
+
+    def _parent(self, branch: str) -> Optional[str]:
+        result = subprocess.run(['git', '--git-dir', str(self.git_dir), 'rev-parse', '--verify', '--quiet',
+                                 f'refs/remotes/origin/{branch}^{{commit}}'],
+                                capture_output=True, text=True, env=self._env)
+        return result.stdout.strip() or None
+
+    def _remote_files(self, parent: Optional[str]) -> Dict[str, str]:
+        """path -> blob id of the remote tree"""
+        if not parent:
+            return {}
+        files = {}
+        for entry in self._git('ls-tree', '-r', '-z', parent).split('\0'):
+            if entry:
+                meta, path = entry.split('\t', 1)
+                files[path] = meta.split()[2]
+        return files
+
+    def _local_files(self) -> Dict[str, str]:
+        """path -> cache key of every generated page: its manifest hash when the manifest is current"""
+        source = self.source_dir.resolve()
+        manifest, prefix = {}, None
+        if self.manifest_path:
+            prefix = os.path.relpath(source, self.manifest_path.parent.resolve()).replace(os.sep, '/')
+            if not prefix.startswith('..'):
+                manifest = AtomicWriter(self.manifest_path).entries
+        files = {}
+        for dirpath, dirnames, filenames in os.walk(source):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            for filename in filenames:
+                if filename.startswith('.'):
+                    continue
+                full = os.path.join(dirpath, filename)
+                path = os.path.relpath(full, source).replace(os.sep, '/')
+                stat = os.stat(full)
+                entry = manifest.get(path if prefix == '.' else f"{prefix}/{path}")
+                if entry and (entry['size'], entry['mtime_ns']) == (stat.st_size, stat.st_mtime_ns):
+                    files[path] = entry['sha256']
+                else:
+                    files[path] = f"{stat.st_size}:{stat.st_mtime_ns}"
+        return files
+
+    def _author_env(self) -> None:
+        configured = subprocess.run(['git', '--git-dir', str(self.git_dir), 'config', 'user.email'],
+                                    capture_output=True, text=True, env=self._env).stdout.strip()
+        if not configured and 'GIT_AUTHOR_EMAIL' not in self._env:
+            name, email = DEFAULT_AUTHOR
+            self._env.update(GIT_AUTHOR_NAME=name, GIT_AUTHOR_EMAIL=email,
+                             GIT_COMMITTER_NAME=name, GIT_COMMITTER_EMAIL=email)
+
+    def _commit(self, parent: Optional[str], updated: List[str], removed: List[str], blobs: Dict[str, str],
+                message: Optional[str], reuse_index: bool) -> str:
+        """Build the commit for the changed paths in the private index and push it"""
+        if not reuse_index:  # Otherwise the index still holds the tree of the last deploy, i.e. the parent
+            if parent:
+                self._git('read-tree', parent)
+            else:
+                self._git('read-tree', '--empty')
+        entries = [f"{FILE_MODE} {blobs[path]}\t{path}\0" for path in updated]
+        entries += [f"0 {NULL_OID}\t{path}\0" for path in removed]
+        self._git('update-index', '-z', '--index-info', stdin=''.join(entries))
+        tree = self._git('write-tree').strip()
+
+        self._author_env()
+        message = message or (f"[DOCS] Auto-update documentation - {datetime.now():%Y-%m-%d %H:%M:%S}\n\n"
+                              f"{len(updated)} updated, {len(removed)} removed")
+        commit = self._git('commit-tree', tree, '-m', message, *(['-p', parent] if parent else [])).strip()
+        self._git('push', '--quiet', 'origin', f"{commit}:refs/heads/{self.branch}")
+        self._git('update-ref', f'refs/remotes/origin/{self.branch}', commit)
+        return commit
+
+    def deploy(self, message: Optional[str] = None) -> DeployResult:
+        """
+        Push the generated pages as one commit on top of the remote branch
+
+        Returns:
+            DeployResult; ``commit`` is None when the remote already matches
+        """
+        if not self.source_dir.is_dir():
+            raise WikiDeployError(f"{self.source_dir} does not exist; generate the wiki first")
+
+        state = self._load_state()
+        self._prepare(state)
+        parent = self._parent(self.branch)
+        remote = self._remote_files(parent)
+        local = self._local_files()
+
+        # Blob ids of files seen before; everything else is hashed (and stored) in one git call
+        known = state.get('blobs', {})
+        blobs: Dict[str, str] = {}
+        unknown = []
+        for path, key in local.items():
+            cached = known.get(path)
+            if cached and cached[0] == key:
+                blobs[path] = cached[1]
+            else:
+                unknown.append(path)
+        if unknown:
+            stdin = ''.join(f"{self.source_dir.resolve() / path}\n" for path in unknown)
+            for path, oid in zip(unknown, self._git('hash-object', '-w', '--stdin-paths', stdin=stdin).split()):
+                blobs[path] = oid
+
+        deployed = set(state.get('deployed', []))
+        updated = sorted(path for path, oid in blobs.items() if remote.get(path) != oid)
+        removed = sorted(path for path in remote if path not in local and (self.prune or path in deployed))
+        result = DeployResult(branch=self.branch, updated=updated, removed=removed)
+
+        if updated or removed:
+            index = self.git_dir / INDEX_FILE
+            try:
+                result.commit = parent = self._commit(parent, updated, removed, blobs, message,
+                                                      reuse_index=state.get('commit') == parent and index.exists())
+            except WikiDeployError:
+                index.unlink(missing_ok=True)  # May hold changes that never reached the remote
+                raise
+
+        state = {
+            'branch': self.branch,
+            'commit': parent,
+            'deployed': sorted(local),
+            'blobs': {path: [local[path], oid] for path, oid in blobs.items()},
+        }
+        write_if_changed(self.state_path, json.dumps(state, separators=(',', ':'), sort_keys=True))
+        return result
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 3:
+        print("Usage: wiki_deployer.py <wiki-dir> <wiki-remote-url>")
+        sys.exit(1)
+    deployed = WikiDeployer(sys.argv[1], sys.argv[2]).deploy()
+    print(f"{deployed.commit or 'up to date'}: {len(deployed.updated)} updated, {len(deployed.removed)} removed")
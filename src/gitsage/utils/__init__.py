@@ -1,25 +1,44 @@
 """GitSage utilities package."""
 
-from .colors import Colors
-from .environment import EnvironmentDetector, InstallationHelper
-from .logger import GitSageLogger, RichLogger, get_logger
-from .validators import ValidationError, Validators
-from .project_detector import ProjectDetector
-from .repo_health import RepositoryHealthChecker
-from .beautification_scorer import BeautificationScorer
-from .github_stats import GitHubStatsGenerator
+from importlib import import_module
 
-__all__ = [
-    "Colors",
-    "EnvironmentDetector",
-    "InstallationHelper",
-    "Validators",
-    "ValidationError",
-    "GitSageLogger",
-    "RichLogger",
-    "get_logger",
-    "ProjectDetector",
-    "RepositoryHealthChecker",
-    "BeautificationScorer",
-    "GitHubStatsGenerator",
-]
+# Exports are imported on first access so lightweight tools (e.g. auto-readme in CI)
+# don't pay for numpy, asyncio or rich at startup.
+_EXPORTS = {
+    "Colors": ".colors",
+    "EnvironmentDetector": ".environment",
+    "InstallationHelper": ".environment",
+    "Validators": ".validators",
+    "ValidationError": ".validators",
+    "GitSageLogger": ".logger",
+    "RichLogger": ".logger",
+    "get_logger": ".logger",
+    "ProjectDetector": ".project_detector",
+    "RepositoryHealthChecker": ".repo_health",
+    "HealthCheck": ".repo_health",
+    "CHECK_REGISTRY": ".repo_health",
+    "BeautificationScorer": ".beautification_scorer",
+    "GitHubStatsGenerator": ".github_stats",
+    "FleetScorer": ".fleet_scorer",
+    "AtomicWriter": ".atomic_writer",
+    "write_if_changed": ".atomic_writer",
+    "stream_if_changed": ".atomic_writer",
+    "WriteQueue": ".atomic_writer",
+    "LinkChecker": ".link_checker",
+    "LinkResult": ".link_checker",
+    "extract_links": ".link_checker",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Atomic Writer
+=============
+Write generated files only when their content changed, atomically via a
+temporary file and rename, and remember what was written in a hash manifest.
+
+The manifest can also record what each file was generated from (config values,
+template ids), so build tools can skip rendering outputs whose inputs are unchanged,
+and which files a build produced, so outputs it no longer produces can be pruned.
+"""
+
+import hashlib
+import json
+import os
+import queue
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
+
+MANIFEST_NAME = '.gitsage-manifest.json'
+
+# Existing files are hashed in blocks of this size
+HASH_BLOCK = 1 << 20
+
+# Files created through mkstemp are 0600; new outputs get the usual umask-based mode instead
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def content_hash(data: Union[str, bytes]) -> str:
+    """SHA-256 hex digest of text (UTF-8) or bytes"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def inputs_digest(depends: Dict[str, Any]) -> str:
+    """Stable digest of a file's dependencies (name -> JSON-serialisable value)"""
+    sha = hashlib.sha256()
+    for piece in json.JSONEncoder(sort_keys=True, default=str).iterencode(depends):
+        sha.update(piece.encode('utf-8'))
+    return sha.hexdigest()
+
+
+def file_hash(path: Union[str, Path]) -> str:
+    """SHA-256 hex digest of a file, read in blocks"""
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+class AtomicWriter:
+    """Skip unchanged writes and replace changed files atomically"""
+
+    def __init__(self, manifest_path: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            manifest_path: JSON file recording hash, size and mtime of written files.
+                           With a manifest, unchanged files are skipped with a single stat().
+        """
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.root = self.manifest_path.parent.resolve() if self.manifest_path else None
+        self.entries: Dict[str, Dict] = self._load_manifest()
+        self.written = 0
+        self.skipped = 0
+        self.removed = 0
+        self._produced: Set[str] = set()  # Manifest keys written or found up to date by this writer
+        self._dirty = False
+        self._lock = threading.Lock()  # Writes may come from several WriteQueue threads
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        if not self.manifest_path or not self.manifest_path.exists():
+            return {}
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding='utf-8'))
+            return data.get('files', {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _key(self, path: Path) -> str:
+        resolved = path.resolve()
+        if self.root:
+            try:
+                return resolved.relative_to(self.root).as_posix()
+            except ValueError:
+                pass
+        return resolved.as_posix()
+
+    def is_current(self, path: Union[str, Path], digest: str, size: Optional[int] = None) -> bool:
+        """Whether ``path`` already holds content with ``digest`` (and ``size`` bytes, if given)"""
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+
+        entry = self.entries.get(self._key(path))
+        if (entry and entry['sha256'] == digest
+                and (entry['size'], entry['mtime_ns']) == (stat.st_size, stat.st_mtime_ns)):
+            return True
+
+        # No usable manifest entry: compare the file itself, unless the size already differs
+        if size is not None and size != stat.st_size:
+            return False
+        if file_hash(path) == digest:
+            self._record(path, digest, stat)
+            return True
+        return False
+
+    def is_built(self, path: Union[str, Path], depends: Dict[str, Any]) -> bool:
+        """
+        Whether ``path`` was generated from exactly these dependencies and is untouched since
+
+        A True answer costs one stat(), so callers can skip rendering the file altogether.
+        """
+        path = Path(path)
+        key = self._key(path)
+        entry = self.entries.get(key)
+        if not entry or entry.get('inputs') != inputs_digest(depends):
+            return False
+        if not self.is_current(path, entry['sha256'], entry['size']):
+            return False
+        with self._lock:
+            self._produced.add(key)
+        return True
+
+    def write(self, path: Union[str, Path], content: Union[str, bytes],
+              mode: Optional[int] = None, depends: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Write ``content`` to ``path`` unless it is already there
+
+        Args:
+            path: Output file
+            content: Text (written as UTF-8) or bytes
+            mode: Permission bits to apply (e.g. 0o755 for scripts)
+            depends: What the content was generated from, recorded for is_built()
+
+        Returns:
+            True if the file was written, False if it was unchanged
+        """
+        path = Path(path)
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        digest = hashlib.sha256(data).hexdigest()
+
+        if self.is_current(path, digest, len(data)):
+            if mode is not None and (path.stat().st_mode & 0o7777) != mode:
+                os.chmod(path, mode)
+            if depends is not None:
+                self._record(path, digest, path.stat(), depends)
+            with self._lock:
+                self.skipped += 1
+                self._produced.add(self._key(path))
+            return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if mode is None:
+            try:
+                mode = path.stat().st_mode & 0o7777
+            except OSError:
+                mode = 0o666 & ~_UMASK
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._record(path, digest, path.stat(), depends)
+        with self._lock:
+            self.written += 1
+        return True
+
+    def write_stream(self, path: Union[str, Path], chunks: Iterable[Union[str, bytes]],
+                     mode: Optional[int] = None, depends: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Stream ``chunks`` to ``path`` without holding the whole content in memory
+
+        The chunks go to a temporary file while being hashed; it replaces ``path``
+        only when the result differs from the current content. ``depends`` is
+        recorded for is_built() as in write().
+
+        Returns:
+            True if the file was written, False if it was unchanged
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        sha = hashlib.sha256()
+        size = 0
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    data = chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+                    sha.update(data)
+                    size += len(data)
+                    f.write(data)
+
+            digest = sha.hexdigest()
+            if self.is_current(path, digest, size):
+                os.unlink(tmp_path)
+                if mode is not None and (path.stat().st_mode & 0o7777) != mode:
+                    os.chmod(path, mode)
+                if depends is not None:
+                    self._record(path, digest, path.stat(), depends)
+                with self._lock:
+                    self.skipped += 1
+                    self._produced.add(self._key(path))
+                return False
+
+            if mode is None:
+                try:
+                    mode = path.stat().st_mode & 0o7777
+                except OSError:
+                    mode = 0o666 & ~_UMASK
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._record(path, digest, path.stat(), depends)
+        with self._lock:
+            self.written += 1
+        return True
+
+    def _record(self, path: Path, digest: str, stat: os.stat_result,
+                depends: Optional[Dict[str, Any]] = None) -> None:
+        if self.manifest_path is None:
+            return
+        key = self._key(path)
+        with self._lock:
+            self._produced.add(key)
+        entry = {
+            'sha256': digest,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+        if depends is not None:
+            entry['inputs'] = inputs_digest(depends)
+            entry['depends'] = sorted(depends)
+        with self._lock:
+            previous = self.entries.get(key)
+            if depends is None and previous and previous.get('sha256') == digest and 'inputs' in previous:
+                entry.update(inputs=previous['inputs'], depends=previous['depends'])
+            if previous != entry:
+                self.entries[key] = entry
+                self._dirty = True
+
+    def prune(self, directory: Union[str, Path]) -> List[Path]:
+        """
+        Delete the manifest's files under ``directory`` that this writer did not produce
+
+        Call it after a complete build: a renamed or removed page leaves its old file
+        behind otherwise. Files the manifest does not know (added by hand) are kept,
+        and directories left empty are removed.
+
+        Returns:
+            The deleted files
+        """
+        if self.manifest_path is None:
+            return []
+        directory = Path(directory).resolve()
+        prefix = self._key(directory) + '/'
+        removed = []
+        with self._lock:
+            stale = [key for key in self.entries if key.startswith(prefix) and key not in self._produced]
+            for key in stale:
+                del self.entries[key]
+            self._dirty = self._dirty or bool(stale)
+        for key in sorted(stale):
+            path = self.root / key if not Path(key).is_absolute() else Path(key)
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            removed.append(path)
+            parent = path.parent
+            while parent != directory and parent.is_dir() and not any(parent.iterdir()):
+                parent.rmdir()
+                parent = parent.parent
+        self.removed += len(removed)
+        return removed
+
+    def find(self, digest: str) -> Optional[Path]:
+        """A manifest file that still holds content with ``digest``, if any"""
+        for key, entry in self.entries.items():
+            if entry['sha256'] != digest:
+                continue
+            path = self.root / key if self.root and not Path(key).is_absolute() else Path(key)
+            if self.is_current(path, digest):
+                return path
+        return None
+
+    def save(self) -> None:
+        """Persist the manifest (itself written atomically)"""
+        if self.manifest_path is None or not self._dirty:
+            return
+        with self._lock:
+            data = json.dumps({'version': 1, 'files': self.entries}, indent=2, sort_keys=True)
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.manifest_path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, self.manifest_path)
+        self._dirty = False
+
+    def __enter__(self) -> 'AtomicWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.save()
+
+
+class WriteQueue:
+    """
+    Run file writes on a pool of threads fed through a bounded queue
+
+    Producers block in put() once ``maxsize`` writes are pending, so rendering can
+    run ahead of the disk without holding a whole documentation set in memory.
+    """
+
+    def __init__(self, write: Callable[..., bool], workers: Optional[int] = None,
+                 maxsize: Optional[int] = None):
+        """
+        Args:
+            write: Called as ``write(path, content, mode, depends)`` on a worker thread,
+                   e.g. AtomicWriter.write; returns True if the file was written
+            workers: Writer threads (default: CPU count)
+            maxsize: Pending writes before put() blocks (default: 4 per worker)
+        """
+        self.write = write
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.queued = 0
+        self.written = 0
+        self._queue: queue.Queue = queue.Queue(maxsize or self.workers * 4)
+        self._errors: List[BaseException] = []
+        self._lock = threading.Lock()
+        self._threads = [threading.Thread(target=self._run, name=f'gitsage-writer-{i}', daemon=True)
+                         for i in range(self.workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                if self.write(*item):
+                    with self._lock:
+                        self.written += 1
+            except BaseException as e:  # Re-raised in the producer by put()/close()
+                self._errors.append(e)
+
+    def put(self, path: Union[str, Path], content: Union[str, bytes], mode: Optional[int] = None,
+            depends: Optional[Dict[str, Any]] = None) -> None:
+        """Queue a write, blocking while the queue is full"""
+        if self._errors:
+            raise self._errors[0]
+        self._queue.put((path, content, mode, depends))
+        self.queued += 1
+
+    def close(self) -> None:
+        """Wait for all queued writes; re-raises the first failed write"""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        if self._errors:
+            raise self._errors[0]
+
+    def __enter__(self) -> 'WriteQueue':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_if_changed(path: Union[str, Path], content: Union[str, bytes],
+                     mode: Optional[int] = None) -> bool:
+    """Atomically write ``content`` unless ``path`` already holds it; True if written"""
+    return AtomicWriter().write(path, content, mode)
+
+
+def stream_if_changed(path: Union[str, Path], chunks: Iterable[Union[str, bytes]],
+                      mode: Optional[int] = None) -> bool:
+    """Atomically stream ``chunks`` to ``path`` unless it already holds that content; True if written"""
+    return AtomicWriter().write_stream(path, chunks, mode)
+
+
+if __name__ == "__main__":
+    with AtomicWriter(Path(tempfile.gettempdir()) / MANIFEST_NAME) as writer:
+        target = Path(tempfile.gettempdir()) / 'gitsage-atomic-demo.txt'
+        print(f"First write: {writer.write(target, 'hello')}")
+        print(f"Second write: {writer.write(target, 'hello')}")
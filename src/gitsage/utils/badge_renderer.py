@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Offline Badge Renderer
+======================
+Render shields.io-style SVG badges locally, without any network requests.
+"""
+
+import re
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple, Union
+
+# Verdana 11px advance widths for printable ASCII (what shields.io measures with)
+VERDANA_11_WIDTHS = {
+    ' ': 3.87, '!': 4.33, '"': 5.05, '#': 9.0, '$': 6.99, '%': 11.84, '&': 7.99, "'": 2.95,
+    '(': 4.99, ')': 4.99, '*': 6.99, '+': 9.0, ',': 4.0, '-': 4.99, '.': 4.0, '/': 4.99,
+    '0': 6.99, '1': 6.99, '2': 6.99, '3': 6.99, '4': 6.99, '5': 6.99, '6': 6.99, '7': 6.99,
+    '8': 6.99, '9': 6.99, ':': 4.99, ';': 4.99, '<': 9.0, '=': 9.0, '>': 9.0, '?': 6.0,
+    '@': 11.0, 'A': 7.52, 'B': 7.54, 'C': 7.68, 'D': 8.48, 'E': 6.96, 'F': 6.32, 'G': 8.53,
+    'H': 8.27, 'I': 4.61, 'J': 5.0, 'K': 7.62, 'L': 6.12, 'M': 9.27, 'N': 8.23, 'O': 8.66,
+    'P': 6.63, 'Q': 8.66, 'R': 7.6, 'S': 7.52, 'T': 6.78, 'U': 8.05, 'V': 7.52, 'W': 10.88,
+    'X': 7.54, 'Y': 6.77, 'Z': 7.54, '[': 4.99, '\\': 4.99, ']': 4.99, '^': 9.0, '_': 6.99,
+    '`': 6.99, 'a': 6.61, 'b': 6.85, 'c': 5.73, 'd': 6.85, 'e': 6.55, 'f': 3.87, 'g': 6.85,
+    'h': 6.96, 'i': 3.02, 'j': 3.79, 'k': 6.51, 'l': 3.02, 'm': 10.7, 'n': 6.96, 'o': 6.68,
+    'p': 6.85, 'q': 6.85, 'r': 4.69, 's': 5.73, 't': 4.33, 'u': 6.96, 'v': 6.51, 'w': 8.98,
+    'x': 6.51, 'y': 6.51, 'z': 5.78, '{': 6.98, '|': 4.99, '}': 6.98, '~': 9.0,
+}
+DEFAULT_CHAR_WIDTH = 11.0  # Non-ASCII glyphs are mostly wide (CJK, emoji)
+
+NAMED_COLORS = {
+    'brightgreen': '#4c1',
+    'green': '#97ca00',
+    'yellowgreen': '#a4a61d',
+    'yellow': '#dfb317',
+    'orange': '#fe7d37',
+    'red': '#e05d44',
+    'blue': '#007ec6',
+    'lightgrey': '#9f9f9f',
+    'lightgray': '#9f9f9f',
+    'grey': '#555',
+    'gray': '#555',
+    'blueviolet': '#8a2be2',
+    'success': '#4c1',
+    'important': '#fe7d37',
+    'critical': '#e05d44',
+    'informational': '#007ec6',
+    'inactive': '#9f9f9f',
+}
+LABEL_COLOR = '#555'
+
+STYLES = ('flat', 'flat-square', 'plastic', 'for-the-badge', 'social')
+
+
+def text_width(text: str, style: str = 'flat') -> float:
+    """Rendered width of ``text`` in pixels for a badge style"""
+    if style == 'for-the-badge':
+        # 10px bold, uppercase, 1.25px letter spacing
+        return sum(VERDANA_11_WIDTHS.get(ch, DEFAULT_CHAR_WIDTH) * 1.0 + 1.25 for ch in text.upper())
+    return sum(VERDANA_11_WIDTHS.get(ch, DEFAULT_CHAR_WIDTH) for ch in text)
+
+
+def resolve_color(color: str) -> str:
+    """Map a shields.io color name or bare hex value to a CSS color"""
+    color = (color or 'blue').strip()
+    if color.lower() in NAMED_COLORS:
+        return NAMED_COLORS[color.lower()]
+    if re.fullmatch(r'#?[0-9a-fA-F]{3}([0-9a-fA-F]{3})?', color):
+        return color if color.startswith('#') else f"#{color}"
+    return color  # Let the SVG renderer interpret CSS color names
+
+
+@lru_cache(maxsize=4096)
+def render_badge(label: str, message: str, color: str = 'blue', style: str = 'flat') -> str:
+    """
+    Render a badge as an SVG document
+
+    Args:
+        label: Left-hand text (may be empty)
+        message: Right-hand text
+        color: Named shields.io color or hex value
+        style: One of STYLES
+
+    Returns:
+        SVG markup
+    """
+    if style not in STYLES:
+        style = 'flat'
+
+    if style == 'for-the-badge':
+        label, message = label.upper(), message.upper()
+        height, padding, font_size, radius = 28, 12, 10, 0
+    elif style == 'plastic':
+        height, padding, font_size, radius = 18, 5, 11, 4
+    else:
+        height, padding, font_size, radius = 20, 5, 11, 0 if style == 'flat-square' else 3
+
+    fill = resolve_color(color)
+    label_fill = '#fafafa' if style == 'social' else LABEL_COLOR
+    if style == 'social':
+        fill = '#fff'
+        radius = 3
+
+    label_w = round(text_width(label, style) + 2 * padding) if label else 0
+    message_w = round(text_width(message, style) + 2 * padding)
+    total_w = label_w + message_w
+    text_y = height * 0.7 if style != 'for-the-badge' else 17.5
+    text_fill = '#333' if style == 'social' else '#fff'
+
+    title = escape(f"{label}: {message}" if label else message)
+    label_text = escape(label)
+    message_text = escape(message)
+
+    gradient = ''
+    overlay = ''
+    if style in ('flat', 'plastic', 'social'):
+        stop_opacity = '.2' if style == 'plastic' else '.1'
+        gradient = (
+            '<linearGradient id="s" x2="0" y2="100%">'
+            f'<stop offset="0" stop-color="#bbb" stop-opacity="{stop_opacity}"/>'
+            '<stop offset="1" stop-opacity=".1"/></linearGradient>'
+        )
+        overlay = f'<rect width="{total_w}" height="{height}" fill="url(#s)"/>'
+
+    clip_open = clip_close = ''
+    if radius:
+        gradient += (
+            f'<clipPath id="r"><rect width="{total_w}" height="{height}" rx="{radius}" fill="#fff"/>'
+            '</clipPath>'
+        )
+        clip_open, clip_close = '<g clip-path="url(#r)">', '</g>'
+    else:
+        clip_open, clip_close = '<g>', '</g>'
+
+    stroke = ' stroke="#d5d5d5"' if style == 'social' else ''
+    label_rect = (
+        f'<rect width="{label_w}" height="{height}" fill="{label_fill}"{stroke}/>' if label else ''
+    )
+    label_svg = ''
+    if label:
+        label_svg = (
+            f'<text x="{label_w / 2:.1f}" y="{text_y:.1f}" fill="{text_fill}">{label_text}</text>'
+        )
+
+    weight = ' font-weight="bold"' if style == 'for-the-badge' else ''
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{total_w}" height="{height}" '
+        f'role="img" aria-label="{title}"><title>{title}</title>{gradient}'
+        f'{clip_open}{label_rect}'
+        f'<rect x="{label_w}" width="{message_w}" height="{height}" fill="{fill}"{stroke}/>'
+        f'{overlay}{clip_close}'
+        f'<g fill="#fff" text-anchor="middle" font-family="Verdana,Geneva,DejaVu Sans,sans-serif" '
+        f'font-size="{font_size}"{weight}>'
+        f'{label_svg}'
+        f'<text x="{label_w + message_w / 2:.1f}" y="{text_y:.1f}" fill="{text_fill}">{message_text}</text>'
+        f'</g></svg>'
+    )
+
+
+def badge_filename(label: str, message: str, color: str = 'blue', style: str = 'flat') -> str:
+    """Stable, filesystem-safe file name for a badge"""
+    parts = [label, message, color.lstrip('#'), style]
+    slug = '-'.join(re.sub(r'[^A-Za-z0-9.+]+', '_', part).strip('_') or '_' for part in parts)
+    return f"{slug.lower()}.svg"
+
+
+BadgeSpec = Union[Tuple[str, str], Tuple[str, str, str], Tuple[str, str, str, str], Dict[str, str]]
+
+
+def write_badges(badges: Iterable[BadgeSpec], output_dir: Union[str, Path] = 'assets/badges',
+                 style: str = 'flat') -> List[Path]:
+    """
+    Render badges and write them as SVG files
+
+    Args:
+        badges: (label, message[, color[, style]]) tuples or dicts with the same keys
+        output_dir: Directory for the SVG files
+        style: Default style for badges that don't set one
+
+    Returns:
+        Paths of the badge files, in input order
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+
+    for spec in badges:
+        if isinstance(spec, dict):
+            label = spec.get('label', '')
+            message = spec.get('message', '')
+            color = spec.get('color', 'blue')
+            badge_style = spec.get('style', style)
+        else:
+            label, message = spec[0], spec[1]
+            color = spec[2] if len(spec) > 2 else 'blue'
+            badge_style = spec[3] if len(spec) > 3 else style
+
+        svg = render_badge(label, message, color, badge_style)
+        path = output_dir / badge_filename(label, message, color, badge_style)
+        if not path.exists() or path.read_text(encoding='utf-8') != svg:
+            path.write_text(svg, encoding='utf-8')
+        paths.append(path)
+
+    return paths
+
+
+if __name__ == "__main__":
+    for path in write_badges([('license', 'MIT', 'green'), ('PRs', 'welcome', 'brightgreen')]):
+        print(f"Wrote {path}")
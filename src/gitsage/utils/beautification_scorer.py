@@ -7,7 +7,7 @@ Gamify GitHub best practices with scoring and leveling system.
 
 import os
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from .repo_health import RepositoryHealthChecker
 
 
@@ -73,18 +73,22 @@ class BeautificationScorer:
         }
     }
 
-    def __init__(self, repo_path: str = "."):
+    def __init__(self, repo_path: str = ".", disabled_categories: Optional[Iterable[str]] = None):
         self.repo_path = Path(repo_path)
-        self.health_checker = RepositoryHealthChecker(repo_path)
+        self.health_checker = RepositoryHealthChecker(repo_path, disabled_categories=disabled_categories)
 
-    def calculate_score(self) -> Dict:
+    def calculate_score(self, categories: Optional[Iterable[str]] = None) -> Dict:
         """
         Calculate comprehensive beautification score
 
+        Args:
+            categories: Only score these category ids; checks for other categories are not run
+
         Returns:
             Dict with score, level, achievements, category_scores, and recommendations
         """
-        health_results = self.health_checker.check_all()
+        categories = list(categories) if categories is not None else None
+        health_results = self.health_checker.check_all(categories=categories)
 
         results = {
             'total_score': health_results['overall_score'],
@@ -105,7 +109,7 @@ class BeautificationScorer:
         results['achievements'] = self._check_achievements(health_results['checks'])
 
         # Calculate category scores
-        results['category_scores'] = self._calculate_category_scores(health_results['checks'])
+        results['category_scores'] = self._calculate_category_scores(health_results['checks'], categories)
 
         # Generate improvement suggestions
         results['improvements'] = self._generate_improvements(
@@ -165,11 +169,17 @@ class BeautificationScorer:
 
         return unlocked
 
-    def _calculate_category_scores(self, checks: Dict) -> Dict[str, Dict]:
+    def _calculate_category_scores(self, checks: Dict,
+                                   categories: Optional[List[str]] = None) -> Dict[str, Dict]:
         """Calculate score for each category"""
         category_results = {}
 
         for cat_id, cat_info in self.CATEGORIES.items():
+            if categories is not None and cat_id not in categories:
+                continue
+            if cat_id in self.health_checker.disabled_categories:
+                continue
+
             total = 0
             max_total = 0
 
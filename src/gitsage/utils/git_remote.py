@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Git Remote Introspection
+========================
+Parse git remotes straight from .git/config (no subprocess), cached per
+repository by the config file's mtime.
+"""
+
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class RemoteInfo:
+    """A parsed git remote"""
+
+    name: str
+    url: str
+    host: str
+    owner: str
+    repo: str
+    is_github: bool
+
+    @property
+    def web_url(self) -> str:
+        """Browser URL of the repository"""
+        return f"https://{self.host}/{self.owner}/{self.repo}"
+
+
+# Hosts treated as GitHub in addition to github.com (GitHub Enterprise)
+ENTERPRISE_HOSTS_ENV = ('GITSAGE_GITHUB_HOSTS', 'GH_HOST')
+
+_SECTION_RE = re.compile(r'^\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+_SCP_RE = re.compile(r'^(?:(?P<user>[^@/]+)@)?(?P<host>[^:/]+):(?P<path>(?!//).+)$')
+
+_lock = threading.Lock()
+_config_cache: Dict[Path, Tuple[int, Dict[str, 'RemoteInfo']]] = {}
+_gitdir_cache: Dict[Path, Tuple[Path, Path]] = {}
+_ssh_cache: Dict[Path, Tuple[int, Dict[str, str]]] = {}
+
+
+def find_git_dirs(repo_path: str = ".") -> Optional[Tuple[Path, Path]]:
+    """
+    Locate the git directories for a working tree (handles worktrees and submodules)
+
+    Returns:
+        (git_dir, common_dir); they differ for linked worktrees
+    """
+    start = Path(repo_path).resolve()
+    with _lock:
+        if start in _gitdir_cache:
+            return _gitdir_cache[start]
+
+    found = None
+    for directory in (start, *start.parents):
+        dot_git = directory / '.git'
+        if dot_git.is_dir():
+            git_dir = dot_git
+        elif dot_git.is_file():
+            content = dot_git.read_text(encoding='utf-8', errors='ignore').strip()
+            if not content.startswith('gitdir:'):
+                continue
+            git_dir = (directory / content[len('gitdir:'):].strip()).resolve()
+        else:
+            continue
+
+        # Linked worktrees keep shared config and refs in the common dir
+        common_dir = git_dir
+        commondir = git_dir / 'commondir'
+        if commondir.is_file():
+            common_dir = (git_dir / commondir.read_text(encoding='utf-8').strip()).resolve()
+        found = (git_dir, common_dir)
+        break
+
+    if found is not None:
+        with _lock:
+            _gitdir_cache[start] = found
+    return found
+
+
+def find_config(repo_path: str = ".") -> Optional[Path]:
+    """Locate the git config file for a working tree"""
+    dirs = find_git_dirs(repo_path)
+    return dirs[1] / 'config' if dirs else None
+
+
+def read_head(repo_path: str = ".") -> Optional[str]:
+    """HEAD commit id read from the git directory (loose or packed refs), without spawning git"""
+    dirs = find_git_dirs(repo_path)
+    if not dirs:
+        return None
+    git_dir, common_dir = dirs
+    try:
+        head = (git_dir / 'HEAD').read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    if not head.startswith('ref:'):
+        return head or None
+
+    ref = head[4:].strip()
+    for base in (git_dir, common_dir):
+        try:
+            return (base / ref).read_text(encoding='utf-8').strip() or None
+        except OSError:
+            continue
+    try:
+        for line in (common_dir / 'packed-refs').read_text(encoding='utf-8').splitlines():
+            sha, _, name = line.partition(' ')
+            if name == ref:
+                return sha
+    except OSError:
+        pass
+    return None  # Unborn branch
+
+
+def parse_git_config(text: str) -> Dict[Tuple[str, Optional[str]], Dict[str, list]]:
+    """
+    Parse git config text into {(section, subsection): {key: [values]}}
+
+    Section and key names are lower-cased as git treats them case-insensitively.
+    """
+    sections: Dict[Tuple[str, Optional[str]], Dict[str, list]] = {}
+    current = None
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line[0] in '#;':
+            continue
+
+        match = _SECTION_RE.match(line)
+        if match:
+            name, sub = match.group(1).lower(), match.group(2)
+            if sub is None and '.' in name:
+                # Deprecated [section.subsection] syntax
+                name, sub = name.split('.', 1)
+            current = sections.setdefault((name, sub), {})
+            continue
+
+        if current is None:
+            continue
+
+        key, sep, value = line.partition('=')
+        key = key.strip().lower()
+        value = value.strip() if sep else 'true'
+        value = re.split(r'\s[#;]', value, maxsplit=1)[0].strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+        current.setdefault(key, []).append(value)
+
+    return sections
+
+
+def _ssh_host_aliases() -> Dict[str, str]:
+    """Host -> HostName mapping from ~/.ssh/config, cached by mtime"""
+    path = Path.home() / '.ssh' / 'config'
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return {}
+
+    with _lock:
+        cached = _ssh_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+    aliases: Dict[str, str] = {}
+    hosts = []
+    for raw in path.read_text(encoding='utf-8', errors='ignore').splitlines():
+        parts = raw.strip().split(None, 1)
+        if len(parts) != 2 or parts[0].startswith('#'):
+            continue
+        keyword, value = parts[0].lower(), parts[1].strip()
+        if keyword == 'host':
+            hosts = [h for h in value.split() if '*' not in h and '?' not in h]
+        elif keyword == 'hostname':
+            for host in hosts:
+                aliases.setdefault(host, value)
+
+    with _lock:
+        _ssh_cache[path] = (mtime, aliases)
+    return aliases
+
+
+def enterprise_hosts() -> set:
+    """GitHub Enterprise hosts configured through the environment"""
+    hosts = set()
+    for var in ENTERPRISE_HOSTS_ENV:
+        hosts.update(h.strip().lower() for h in os.environ.get(var, '').split(',') if h.strip())
+    return hosts
+
+
+def parse_remote_url(url: str, insteadof: Optional[Dict[str, str]] = None) -> Optional[Tuple[str, str, str]]:
+    """
+    Split a remote URL into (host, owner, repo)
+
+    Supports https/ssh/git URLs, scp-like ``user@host:owner/repo``, ``url.<base>.insteadOf``
+    rewrites and ~/.ssh/config host aliases.
+    """
+    if insteadof:
+        # Longest matching prefix wins, as in git
+        for prefix in sorted(insteadof, key=len, reverse=True):
+            if url.startswith(prefix):
+                url = insteadof[prefix] + url[len(prefix):]
+                break
+
+    if '://' in url:
+        rest = url.split('://', 1)[1]
+        authority, _, path = rest.partition('/')
+        host = authority.rsplit('@', 1)[-1].split(':', 1)[0]
+    else:
+        match = _SCP_RE.match(url)
+        if not match:
+            return None
+        host, path = match.group('host'), match.group('path')
+
+    host = _ssh_host_aliases().get(host, host).lower()
+    parts = [part for part in path.strip('/').split('/') if part]
+    if len(parts) < 2:
+        return None
+
+    repo = parts[-1]
+    if repo.endswith('.git'):
+        repo = repo[:-4]
+    return host, parts[-2], repo
+
+
+def get_remotes(repo_path: str = ".") -> Dict[str, RemoteInfo]:
+    """
+    All remotes of the repository containing ``repo_path``
+
+    Parsed once per config file and reused until the file's mtime changes.
+    """
+    config = find_config(repo_path)
+    if config is None:
+        return {}
+    try:
+        mtime = config.stat().st_mtime_ns
+    except OSError:
+        return {}
+
+    with _lock:
+        cached = _config_cache.get(config)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+    sections = parse_git_config(config.read_text(encoding='utf-8', errors='ignore'))
+    insteadof = {
+        prefix: base
+        for (name, base), values in sections.items() if name == 'url' and base
+        for prefix in values.get('insteadof', [])
+    }
+    github_hosts = {'github.com'} | enterprise_hosts()
+
+    remotes = {}
+    for (name, sub), values in sections.items():
+        if name != 'remote' or not sub or not values.get('url'):
+            continue
+        url = values['url'][0]
+        parsed = parse_remote_url(url, insteadof)
+        if not parsed:
+            continue
+        host, owner, repo = parsed
+        remotes[sub] = RemoteInfo(
+            name=sub,
+            url=url,
+            host=host,
+            owner=owner,
+            repo=repo,
+            is_github=host in github_hosts or 'github' in host
+        )
+
+    with _lock:
+        _config_cache[config] = (mtime, remotes)
+    return remotes
+
+
+def get_primary_remote(repo_path: str = ".",
+                       preferred: Iterable[str] = ('origin', 'upstream')) -> Optional[RemoteInfo]:
+    """The preferred GitHub remote (origin first), else any GitHub remote"""
+    remotes = get_remotes(repo_path)
+    for name in preferred:
+        remote = remotes.get(name)
+        if remote and remote.is_github:
+            return remote
+    for remote in remotes.values():
+        if remote.is_github:
+            return remote
+    return None
+
+
+def clear_cache() -> None:
+    """Forget all cached lookups (e.g. after moving repositories)"""
+    with _lock:
+        _config_cache.clear()
+        _gitdir_cache.clear()
+        _ssh_cache.clear()
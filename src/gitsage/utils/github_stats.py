@@ -6,8 +6,50 @@ Generate badges, stats, and visual repository statistics.
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional
-import subprocess
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple, Union
+import os
+
+from .badge_renderer import write_badges
+from .git_remote import RemoteInfo, get_primary_remote
+from .repo_stats import RepoStatsEngine
+
+
+SHIELDS_URL = "https://img.shields.io"
+
+# shields.io paths per badge type; {repo} is replaced by 'owner/repo'
+BADGE_PATHS = {
+    'license': 'github/license/{repo}',
+    'version': 'github/v/release/{repo}',
+    'release-date': 'github/release-date/{repo}',
+    'stars': 'github/stars/{repo}',
+    'forks': 'github/forks/{repo}',
+    'issues': 'github/issues/{repo}',
+    'issues-closed': 'github/issues-closed/{repo}',
+    'prs': 'github/issues-pr/{repo}',
+    'prs-closed': 'github/issues-pr-closed/{repo}',
+    'contributors': 'github/contributors/{repo}',
+    'commit-activity': 'github/commit-activity/m/{repo}',
+    'last-commit': 'github/last-commit/{repo}',
+    'code-size': 'github/languages/code-size/{repo}',
+    'repo-size': 'github/repo-size/{repo}',
+    'downloads': 'github/downloads/{repo}/total',
+    'top-language': 'github/languages/top/{repo}',
+    'maintained': 'badge/Maintained%3F-yes-green.svg',
+    'pr-welcome': 'badge/PRs-welcome-brightgreen.svg',
+}
+
+
+def _compile_badge_table(paths: Dict[str, str]) -> Dict[str, Tuple[str, str, bool]]:
+    """Split each badge path into (markdown head, url tail up to '?style=', needs repo)"""
+    table = {}
+    for badge_type, path in paths.items():
+        alt_text = badge_type.replace('-', ' ').title()
+        head, marker, tail = path.partition('{repo}')
+        table[badge_type] = (f"![{alt_text}]({SHIELDS_URL}/{head}", f"{tail}?style=", bool(marker))
+    return table
+
+
+BADGE_TABLE = _compile_badge_table(BADGE_PATHS)
 
 
 class GitHubStatsGenerator:
@@ -15,57 +57,36 @@ class GitHubStatsGenerator:
 
     BADGE_STYLES = ['flat', 'flat-square', 'plastic', 'for-the-badge', 'social']
 
-    def __init__(self, username: str = None, repo: str = None, repo_path: str = "."):
+    # Badges whose content is known without querying GitHub: (label, message, color)
+    STATIC_BADGES = {
+        'maintained': ('Maintained?', 'yes', 'green'),
+        'pr-welcome': ('PRs', 'welcome', 'brightgreen'),
+    }
+
+    def __init__(self, username: str = None, repo: str = None, repo_path: str = ".",
+                 badge_dir: Optional[str] = None, stats_dir: Optional[str] = None):
         self.repo_path = Path(repo_path)
+        self.badge_dir = Path(badge_dir) if badge_dir else None
+        self.stats_dir = Path(stats_dir) if stats_dir else None
+        self._local_stats: Optional[Dict] = None
         self.username = username or self._detect_github_username()
         self.repo = repo or self._detect_repo_name()
 
+    def _primary_remote(self) -> Optional[RemoteInfo]:
+        """GitHub remote for this repository (shared, mtime-validated cache)"""
+        if not hasattr(self, '_remote'):
+            self._remote = get_primary_remote(self.repo_path)
+        return self._remote
+
     def _detect_github_username(self) -> str:
         """Detect GitHub username from git remote"""
-        try:
-            result = subprocess.run(
-                ['git', 'config', '--get', 'remote.origin.url'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            url = result.stdout.strip()
-
-            # Parse GitHub URL
-            if 'github.com' in url:
-                # https://github.com/username/repo.git
-                # git@github.com:username/repo.git
-                parts = url.replace('.git', '').split('/')
-                if len(parts) >= 2:
-                    username = parts[-2].split(':')[-1]
-                    return username
-        except Exception:
-            pass
-
-        return 'username'
+        remote = self._primary_remote()
+        return remote.owner if remote else 'username'
 
     def _detect_repo_name(self) -> str:
         """Detect repository name from git remote"""
-        try:
-            result = subprocess.run(
-                ['git', 'config', '--get', 'remote.origin.url'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            url = result.stdout.strip()
-
-            # Parse repo name
-            if 'github.com' in url:
-                parts = url.replace('.git', '').split('/')
-                if parts:
-                    return parts[-1]
-        except Exception:
-            pass
-
-        return self.repo_path.name
+        remote = self._primary_remote()
+        return remote.repo if remote else self.repo_path.resolve().name
 
     def generate_badge(self, badge_type: str, style: str = 'flat', **kwargs) -> str:
         """
@@ -79,45 +100,86 @@ class GitHubStatsGenerator:
         Returns:
             Markdown string for badge
         """
-        base_url = "https://img.shields.io"
-
-        badge_templates = {
-            'license': f"github/license/{self.username}/{self.repo}",
-            'version': f"github/v/release/{self.username}/{self.repo}",
-            'release-date': f"github/release-date/{self.username}/{self.repo}",
-            'stars': f"github/stars/{self.username}/{self.repo}",
-            'forks': f"github/forks/{self.username}/{self.repo}",
-            'issues': f"github/issues/{self.username}/{self.repo}",
-            'issues-closed': f"github/issues-closed/{self.username}/{self.repo}",
-            'prs': f"github/issues-pr/{self.username}/{self.repo}",
-            'prs-closed': f"github/issues-pr-closed/{self.username}/{self.repo}",
-            'contributors': f"github/contributors/{self.username}/{self.repo}",
-            'commit-activity': f"github/commit-activity/m/{self.username}/{self.repo}",
-            'last-commit': f"github/last-commit/{self.username}/{self.repo}",
-            'code-size': f"github/languages/code-size/{self.username}/{self.repo}",
-            'repo-size': f"github/repo-size/{self.username}/{self.repo}",
-            'downloads': f"github/downloads/{self.username}/{self.repo}/total",
-            'top-language': f"github/languages/top/{self.username}/{self.repo}",
-        }
+        if self.badge_dir and (badge_type == 'custom' or badge_type in self.STATIC_BADGES):
+            return self.generate_local_badge(badge_type, style, **kwargs)
 
         # Custom badges
         if badge_type == 'custom':
             label = kwargs.get('label', 'badge')
             message = kwargs.get('message', 'message')
             color = kwargs.get('color', 'blue')
-            badge_url = f"{base_url}/badge/{label}-{message}-{color}?style={style}"
-        elif badge_type == 'maintained':
-            badge_url = f"{base_url}/badge/Maintained%3F-yes-green.svg?style={style}"
-        elif badge_type == 'pr-welcome':
-            badge_url = f"{base_url}/badge/PRs-welcome-brightgreen.svg?style={style}"
-        elif badge_type in badge_templates:
-            badge_url = f"{base_url}/{badge_templates[badge_type]}?style={style}"
+            badge_url = f"{SHIELDS_URL}/badge/{label}-{message}-{color}?style={style}"
+            return f"![Custom]({badge_url})"
+
+        compiled = BADGE_TABLE.get(badge_type)
+        if compiled is None:
+            return ""
+
+        head, tail, per_repo = compiled
+        return f"{head}{self.username}/{self.repo}{tail}{style})" if per_repo else f"{head}{tail}{style})"
+
+    @classmethod
+    def generate_badge_batch(cls, repos: Iterable[Union[str, Tuple[str, str]]],
+                             badge_types: List[str], styles: Iterable[str] = ('flat',),
+                             writer: Optional[TextIO] = None,
+                             separator: str = ' ') -> Optional[Dict[str, Dict[str, str]]]:
+        """
+        Generate badge markdown for many repositories and styles in one call
+
+        Args:
+            repos: 'owner/repo' strings or (owner, repo) tuples
+            badge_types: Badge types from BADGE_TABLE (unknown types are skipped)
+            styles: Badge styles to render for every repository
+            writer: Optional text stream; blocks are written to it instead of returned
+            separator: String placed between badges of one block
+
+        Returns:
+            {'owner/repo': {style: markdown}}, or None when streaming to ``writer``
+        """
+        styles = list(styles)
+        compiled = [BADGE_TABLE[badge_type] for badge_type in badge_types if badge_type in BADGE_TABLE]
+        # Per style: tails with the style already appended, so each badge is one concatenation
+        styled = {
+            style: [(head, f"{tail}{style})", per_repo) for head, tail, per_repo in compiled]
+            for style in styles
+        }
+        results: Dict[str, Dict[str, str]] = {}
+
+        for repo in repos:
+            slug = repo if isinstance(repo, str) else f"{repo[0]}/{repo[1]}"
+            blocks = {}
+            for style, entries in styled.items():
+                blocks[style] = separator.join(
+                    [head + slug + tail if per_repo else head + tail for head, tail, per_repo in entries]
+                )
+
+            if writer is not None:
+                for style, markdown in blocks.items():
+                    writer.write(f"<!-- {slug} [{style}] -->\n{markdown}\n")
+            else:
+                results[slug] = blocks
+
+        return None if writer is not None else results
+
+    def generate_local_badge(self, badge_type: str, style: str = 'flat', **kwargs) -> str:
+        """
+        Render a static badge into ``badge_dir`` and return markdown linking to it
+
+        Only badges whose content is known offline (custom, maintained, pr-welcome)
+        can be rendered locally; live GitHub data still needs shields.io.
+        """
+        if badge_type == 'custom':
+            spec = (kwargs.get('label', 'badge'), kwargs.get('message', 'message'),
+                    kwargs.get('color', 'blue'))
+        elif badge_type in self.STATIC_BADGES:
+            spec = self.STATIC_BADGES[badge_type]
         else:
             return ""
 
-        # Create markdown
+        path = write_badges([spec + (style,)], self.badge_dir)[0]
+        link = os.path.relpath(path, self.repo_path).replace(os.sep, '/')
         alt_text = badge_type.replace('-', ' ').title()
-        return f"![{alt_text}]({badge_url})"
+        return f"![{alt_text}]({link})"
 
     def generate_badge_set(self, badges: List[str], style: str = 'flat') -> str:
         """
@@ -139,8 +201,34 @@ class GitHubStatsGenerator:
 
         return '\n'.join(badge_lines)
 
+    def local_stats(self) -> Dict:
+        """Render local stats cards into ``stats_dir`` (cached by HEAD commit)"""
+        if self._local_stats is None:
+            self._local_stats = RepoStatsEngine(self.repo_path, self.stats_dir).render()
+        return self._local_stats
+
+    def _local_card(self, card: str) -> str:
+        """README-relative link to a rendered stats card"""
+        path = self.local_stats()['cards'][card]
+        return os.path.relpath(path, self.repo_path).replace(os.sep, '/')
+
     def generate_stats_section(self) -> str:
         """Generate comprehensive stats section for README"""
+        if self.stats_dir:
+            stats = self.local_stats()
+            top_language = next(iter(stats['languages']), 'n/a')
+            return f"""## [STATS] Repository Stats
+
+![Commit Activity]({self._local_card('activity')})
+![Contributors]({self._local_card('contributors')})
+
+- **Commits:** {stats['total_commits']}
+- **Contributors:** {len(stats['contributors'])}
+- **Code Size:** {stats['code_size'] / 1024:.1f} KB
+- **Top Language:** {top_language}
+
+"""
+
         stats_md = f"""## [STATS] Repository Stats
 
 ![Contributors](https://img.shields.io/github/contributors/{self.username}/{self.repo})
@@ -159,6 +247,8 @@ class GitHubStatsGenerator:
 
     def generate_language_stats_card(self) -> str:
         """Generate language stats card"""
+        if self.stats_dir:
+            return f"![Top Languages]({self._local_card('languages')})\n"
         return f"""[![Top Languages](https://github-readme-stats.vercel.app/api/top-langs/?username={self.username}&layout=compact)](https://github.com/{self.username}/{self.repo})
 """
 
@@ -171,6 +261,11 @@ class GitHubStatsGenerator:
 
     def generate_contribution_graph(self) -> str:
         """Generate contribution activity graph"""
+        if self.stats_dir:
+            return f"""## [CHART] Contribution Activity
+
+![Activity Graph]({self._local_card('activity')})
+"""
         return f"""## [CHART] Contribution Activity
 
 [![{self.username}'s Activity Graph](https://github-readme-activity-graph.vercel.app/graph?username={self.username}&theme=react-dark)](https://github.com/{self.username}/{self.repo})
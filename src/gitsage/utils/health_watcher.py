@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Repository Health Watcher
+=========================
+Live-update health and beautification scores as repository files change.
+"""
+
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+from .beautification_scorer import BeautificationScorer
+from .repo_health import CHECK_REGISTRY, HealthCheck
+
+
+class HealthWatcher:
+    """Re-score only the checks affected by changed paths, with debouncing"""
+
+    def __init__(self, repo_path: str = ".", debounce: float = 0.5, poll_interval: float = 1.0,
+                 use_polling: bool = False):
+        self.repo_path = Path(repo_path).resolve()
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_polling = use_polling or not WATCHDOG_AVAILABLE
+        self.scorer = BeautificationScorer(str(self.repo_path))
+        self.checker = self.scorer.health_checker
+        self.results: Optional[Dict] = None
+        self._changes: "queue.Queue[str]" = queue.Queue()
+        self._stop = threading.Event()
+
+    @property
+    def backend(self) -> str:
+        """Name of the change-notification backend in use"""
+        return 'polling' if self.use_polling else 'watchdog'
+
+    def local_checks(self) -> List[HealthCheck]:
+        """Checks that depend on repository files"""
+        return [
+            check for check in CHECK_REGISTRY
+            if check.category not in self.checker.disabled_categories
+            and any(not inp.startswith(('git:', 'remote:')) for inp in check.inputs)
+        ]
+
+    def checks_for_paths(self, paths: Iterable[str]) -> List[HealthCheck]:
+        """
+        Map changed repository paths to the checks that read them
+
+        Args:
+            paths: Paths relative to the repository root (POSIX separators)
+
+        Returns:
+            Affected checks in registry order
+        """
+        paths = {path.strip('/') for path in paths}
+        affected = []
+
+        for check in self.local_checks():
+            for inp in check.inputs:
+                target = inp.rstrip('/')
+                is_dir = inp.endswith('/')
+                if any(
+                    path == target
+                    or (is_dir and path.startswith(target + '/'))
+                    or target.startswith(path + '/')
+                    for path in paths
+                ):
+                    affected.append(check)
+                    break
+
+        return affected
+
+    def snapshot(self) -> Dict:
+        """Run a full check and return the scored state"""
+        self.results = self.checker.check_all()
+        return self._score_state()
+
+    def rescore(self, paths: Iterable[str]) -> Optional[Dict]:
+        """
+        Re-run checks affected by ``paths`` and return the score delta
+
+        Returns:
+            Delta dict, or None when nothing relevant changed
+        """
+        if self.results is None:
+            self.snapshot()
+
+        affected = self.checks_for_paths(paths)
+        if not affected:
+            return None
+
+        before = self._score_state()
+        updated = self.checker.run_checks(affected)
+
+        changed = {}
+        for name, new in updated.items():
+            old = self.results['checks'].get(name)
+            if old is None or (old['score'], old['status']) != (new['score'], new['status']):
+                changed[name] = {
+                    'old_score': old['score'] if old else None,
+                    'new_score': new['score'],
+                    'status': new['status'],
+                    'message': new['message']
+                }
+            self.results['checks'][name] = new
+
+        if not changed:
+            return None
+
+        checks = self.results['checks']
+        self.results['overall_score'] = sum(check['score'] for check in checks.values())
+        self.results['recommendations'] = self.checker._generate_recommendations(checks)
+        self.results['quick_wins'] = self.checker._identify_quick_wins(checks)
+        self.results['critical_issues'] = self.checker._identify_critical_issues(checks)
+
+        after = self._score_state()
+        return {
+            'changed_checks': changed,
+            'overall_score': after['overall_score'],
+            'score_delta': after['overall_score'] - before['overall_score'],
+            'percentage': after['percentage'],
+            'level': after['level'],
+            'level_changed': after['level'] != before['level'],
+            'category_scores': {
+                cat_id: cat for cat_id, cat in after['category_scores'].items()
+                if cat['score'] != before['category_scores'][cat_id]['score']
+            }
+        }
+
+    def _score_state(self) -> Dict:
+        """Derive beautification score fields from the current health results"""
+        checks = self.results['checks']
+        percentage = (self.results['overall_score'] / self.results['max_score']) * 100
+        level, _ = self.scorer._get_level(percentage)
+        return {
+            'overall_score': self.results['overall_score'],
+            'max_score': self.results['max_score'],
+            'percentage': percentage,
+            'level': level,
+            'category_scores': self.scorer._calculate_category_scores(checks),
+            'checks': checks
+        }
+
+    def notify(self, path: str) -> None:
+        """Queue a changed path (absolute or repo-relative)"""
+        path_obj = Path(path)
+        if path_obj.is_absolute():
+            try:
+                path_obj = path_obj.relative_to(self.repo_path)
+            except ValueError:
+                return
+        rel = path_obj.as_posix()
+        if rel == '.git' or rel.startswith('.git/'):
+            return
+        self._changes.put(rel)
+
+    def stop(self) -> None:
+        """Stop a running watch loop"""
+        self._stop.set()
+
+    def events(self, include_snapshot: bool = True, heartbeat: bool = False) -> Iterator[Dict]:
+        """
+        Yield the initial state, then a delta after each debounced burst of changes
+
+        Runs until ``stop()`` is called.
+
+        Args:
+            heartbeat: Also yield ``{'type': 'heartbeat'}`` after every idle ``poll_interval``,
+                so a streaming consumer writes often enough to notice a closed connection
+        """
+        self._stop.clear()
+        state = self.snapshot()
+        if include_snapshot:
+            yield {'type': 'snapshot', 'backend': self.backend, **self._public(state)}
+
+        stop_backend = self._start_backend()
+        try:
+            pending: Set[str] = set()
+            while not self._stop.is_set():
+                try:
+                    timeout = self.debounce if pending else self.poll_interval
+                    pending.add(self._changes.get(timeout=timeout))
+                    continue
+                except queue.Empty:
+                    pass
+
+                if not pending and heartbeat:
+                    yield {'type': 'heartbeat'}
+                if pending:
+                    delta = self.rescore(pending)
+                    pending = set()
+                    if delta:
+                        yield {'type': 'delta', **delta}
+        finally:
+            stop_backend()
+
+    def watch(self, callback: Callable[[Dict], None]) -> None:
+        """Blocking watch loop that passes every snapshot/delta to ``callback``"""
+        for event in self.events():
+            callback(event)
+
+    def _public(self, state: Dict) -> Dict:
+        """State without the full check dicts"""
+        return {key: value for key, value in state.items() if key != 'checks'}
+
+    def _start_backend(self) -> Callable[[], None]:
+        """Start inotify (via watchdog) or polling; return a stop function"""
+        if not self.use_polling:
+            watcher = self
+
+            class _Handler(FileSystemEventHandler):
+                def on_any_event(self, event):
+                    watcher.notify(event.src_path)
+                    dest = getattr(event, 'dest_path', None)
+                    if dest:
+                        watcher.notify(dest)
+
+            observer = Observer()
+            observer.schedule(_Handler(), str(self.repo_path), recursive=True)
+            observer.start()
+
+            def stop_observer():
+                observer.stop()
+                observer.join(timeout=5)
+
+            return stop_observer
+
+        stopped = threading.Event()
+
+        def poll():
+            previous = self._poll_state()
+            while not stopped.wait(self.poll_interval):
+                current = self._poll_state()
+                for path in previous.keys() | current.keys():
+                    if previous.get(path) != current.get(path):
+                        self._changes.put(path)
+                previous = current
+
+        thread = threading.Thread(target=poll, name='gitsage-health-poll', daemon=True)
+        thread.start()
+
+        def stop_polling():
+            stopped.set()
+            thread.join(timeout=5)
+
+        return stop_polling
+
+    def _poll_state(self) -> Dict[str, Tuple[int, int]]:
+        """Stat only the paths that local checks read"""
+        state = {}
+        for check in self.local_checks():
+            for inp in check.inputs:
+                if inp.startswith(('git:', 'remote:')):
+                    continue
+                path = self.repo_path / inp
+                if inp.endswith('/'):
+                    if path.is_dir():
+                        for child in path.iterdir():
+                            stat = child.stat()
+                            state[f"{inp}{child.name}"] = (stat.st_mtime_ns, stat.st_size)
+                elif path.exists():
+                    stat = path.stat()
+                    state[inp] = (stat.st_mtime_ns, stat.st_size)
+        return state
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Link Health Checker
+===================
+Extract badges and links from generated markdown and verify them concurrently
+with asyncio, pooled keep-alive connections, per-host rate limits and a TTL cache.
+"""
+
+import asyncio
+import json
+import re
+import ssl
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+USER_AGENT = 'GitSage-LinkChecker/1.0'
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+MAX_BODY_BYTES = 1024 * 1024
+
+# shields.io answers 200 with an error message for missing repos, workflows and packages
+SHIELDS_HOSTS = ('img.shields.io',)
+SHIELDS_ERROR_MESSAGES = (
+    'not found', 'invalid', 'inaccessible', 'no releases', 'unknown', 'no status', 'not specified',
+)
+
+_IMAGE_RE = re.compile(r'!\[[^\]]*\]\(\s*<?(https?://[^)\s>]+)')
+_LINK_RE = re.compile(r'(?<!!)\[(?:[^\[\]]|!\[[^\]]*\]\([^)]*\))*\]\(\s*<?(https?://[^)\s>]+)')
+_REF_RE = re.compile(r'^\s{0,3}\[[^\]]+\]:\s*<?(https?://[^\s>]+)', re.MULTILINE)
+_HTML_IMG_RE = re.compile(r'<img\b[^>]*?\bsrc=["\'](https?://[^"\']+)', re.IGNORECASE)
+_HTML_A_RE = re.compile(r'<a\b[^>]*?\bhref=["\'](https?://[^"\']+)', re.IGNORECASE)
+_TITLE_RE = re.compile(rb'<title>([^<]*)</title>')
+
+
+@dataclass
+class LinkResult:
+    """Outcome of checking one URL"""
+
+    url: str
+    ok: bool
+    status: Optional[int] = None
+    error: str = ''
+    final_url: str = ''
+    elapsed: float = 0.0
+    cached: bool = False
+
+
+def extract_links(text: str) -> List[Tuple[str, str]]:
+    """
+    Find every http(s) badge image and link in markdown/HTML
+
+    Returns:
+        (kind, url) pairs in first-seen order, kind being 'image' or 'link'
+    """
+    found = []
+    for kind, pattern in (('image', _IMAGE_RE), ('image', _HTML_IMG_RE),
+                          ('link', _LINK_RE), ('link', _HTML_A_RE), ('link', _REF_RE)):
+        for match in pattern.finditer(text):
+            found.append((match.start(1), kind, match.group(1)))
+
+    seen = set()
+    links = []
+    for _, kind, url in sorted(found):
+        if url not in seen:
+            seen.add(url)
+            links.append((kind, url))
+    return links
+
+
+class _HostLimiter:
+    """Bound concurrent requests and request rate for one host"""
+
+    def __init__(self, concurrency: int, rate: float):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        if self.interval:
+            async with self._lock:
+                now = asyncio.get_running_loop().time()
+                wait = self._next_slot - now
+                self._next_slot = max(now, self._next_slot) + self.interval
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+    async def __aexit__(self, *exc):
+        self.semaphore.release()
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections keyed by (scheme, host, port)"""
+
+    def __init__(self, timeout: float, max_idle_per_host: int = 4):
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.opened = 0
+        self._idle: Dict[Tuple[str, str, int], List] = {}
+        self._ssl = None
+
+    async def acquire(self, key: Tuple[str, str, int], server_hostname: str):
+        """Return (reader, writer, reused)"""
+        idle = self._idle.get(key)
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+
+        scheme, host, port = key
+        ssl_context = None
+        if scheme == 'https':
+            if self._ssl is None:
+                self._ssl = ssl.create_default_context()
+            ssl_context = self._ssl
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=ssl_context,
+                                    server_hostname=server_hostname if ssl_context else None),
+            self.timeout
+        )
+        self.opened += 1
+        return reader, writer, False
+
+    def release(self, key: Tuple[str, str, int], reader, writer, reusable: bool) -> None:
+        idle = self._idle.setdefault(key, [])
+        if reusable and len(idle) < self.max_idle_per_host:
+            idle.append((reader, writer))
+        else:
+            writer.close()
+
+    async def close(self) -> None:
+        for idle in self._idle.values():
+            for _, writer in idle:
+                writer.close()
+        self._idle.clear()
+
+
+class LinkChecker:
+    """Concurrent link verifier with connection pooling, rate limits and a TTL cache"""
+
+    def __init__(self, concurrency: int = 20, per_host: int = 4, rate: float = 10.0,
+                 timeout: float = 10.0, ttl: float = 3600.0, max_redirects: int = 5,
+                 cache_file: Optional[str] = None, host_map: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            concurrency: Maximum requests in flight overall
+            per_host: Maximum requests in flight per host
+            rate: Maximum requests per second per host (0 disables)
+            timeout: Per-request timeout in seconds
+            ttl: Seconds a result stays cached
+            max_redirects: Redirects followed before giving up
+            cache_file: Optional JSON file persisting the cache between runs
+            host_map: Route hosts to another origin, e.g. {'img.shields.io': 'http://127.0.0.1:8080'}
+                      (the Host header is unchanged, so a local stub server can stand in)
+        """
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.rate = rate
+        self.timeout = timeout
+        self.ttl = ttl
+        self.max_redirects = max_redirects
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.host_map = host_map or {}
+        self.requests_made = 0
+        self.connections_opened = 0
+        self._cache: Dict[str, Tuple[float, Dict]] = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Tuple[float, Dict]]:
+        if not self.cache_file or not self.cache_file.exists():
+            return {}
+        try:
+            data = json.loads(self.cache_file.read_text(encoding='utf-8'))
+            return {url: (entry['checked_at'], entry['result']) for url, entry in data.items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _save_cache(self) -> None:
+        if not self.cache_file:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        data = {url: {'checked_at': at, 'result': result} for url, (at, result) in self._cache.items()}
+        self.cache_file.write_text(json.dumps(data, indent=2), encoding='utf-8')
+
+    def _cached(self, url: str) -> Optional[LinkResult]:
+        entry = self._cache.get(url)
+        if entry and time.time() - entry[0] < self.ttl:
+            return LinkResult(**{**entry[1], 'cached': True})
+        return None
+
+    async def check(self, urls: Iterable[str]) -> List[LinkResult]:
+        """Check URLs concurrently; duplicates are requested once"""
+        urls = list(dict.fromkeys(urls))
+        pool = _ConnectionPool(self.timeout)
+        limiters: Dict[str, _HostLimiter] = {}
+        overall = asyncio.Semaphore(self.concurrency)
+
+        async def run(url: str) -> LinkResult:
+            cached = self._cached(url)
+            if cached:
+                return cached
+            async with overall:
+                result = await self._check_url(url, pool, limiters)
+            if result.status is not None:
+                # Network errors are transient; only HTTP answers are cached
+                self._cache[url] = (time.time(), {**asdict(result), 'cached': False})
+            return result
+
+        try:
+            results = await asyncio.gather(*(run(url) for url in urls))
+        finally:
+            self.connections_opened += pool.opened
+            await pool.close()
+        self._save_cache()
+        return list(results)
+
+    def check_sync(self, urls: Iterable[str]) -> List[LinkResult]:
+        """Blocking wrapper around check()"""
+        return asyncio.run(self.check(urls))
+
+    async def _check_url(self, url: str, pool: _ConnectionPool,
+                         limiters: Dict[str, _HostLimiter]) -> LinkResult:
+        start = time.perf_counter()
+        current = url
+        try:
+            for _ in range(self.max_redirects + 1):
+                host = urlsplit(current).hostname or ''
+                # shields.io bodies are inspected for error badges, other URLs only need headers
+                method = 'GET' if host in SHIELDS_HOSTS else 'HEAD'
+                limiter = limiters.setdefault(host, _HostLimiter(self.per_host, self.rate))
+                async with limiter:
+                    status, headers, body = await self._request(method, current, pool)
+                    if method == 'HEAD' and status in (403, 405, 501):
+                        status, headers, body = await self._request('GET', current, pool)
+
+                if status in REDIRECT_STATUSES and headers.get('location'):
+                    current = urljoin(current, headers['location'])
+                    continue
+
+                error = ''
+                if status >= 400:
+                    error = f"HTTP {status}"
+                elif host in SHIELDS_HOSTS:
+                    error = self._shields_error(body)
+                return LinkResult(url, not error, status, error, current, time.perf_counter() - start)
+
+            return LinkResult(url, False, status, 'Too many redirects', current,
+                              time.perf_counter() - start)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+            return LinkResult(url, False, None, str(e) or type(e).__name__, current,
+                              time.perf_counter() - start)
+
+    @staticmethod
+    def _shields_error(body: bytes) -> str:
+        """Error message of a shields.io badge rendered for a missing resource"""
+        match = _TITLE_RE.search(body)
+        if not match:
+            return ''
+        message = match.group(1).decode('utf-8', 'replace').rsplit(':', 1)[-1].strip().lower()
+        if any(err in message for err in SHIELDS_ERROR_MESSAGES):
+            return f"Badge reports '{message}'"
+        return ''
+
+    async def _request(self, method: str, url: str,
+                       pool: _ConnectionPool) -> Tuple[int, Dict[str, str], bytes]:
+        """Send one HTTP/1.1 request over a pooled connection"""
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+
+        scheme, host = parts.scheme, parts.hostname
+        port = parts.port or (443 if scheme == 'https' else 80)
+        host_header = host if not parts.port else f"{host}:{parts.port}"
+        target = self.host_map.get(host)
+        if target:
+            mapped = urlsplit(target)
+            scheme, port = mapped.scheme, mapped.port or (443 if mapped.scheme == 'https' else 80)
+            key = (scheme, mapped.hostname, port)
+        else:
+            key = (scheme, host, port)
+
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        request = (
+            f"{method} {path} HTTP/1.1\r\nHost: {host_header}\r\nUser-Agent: {USER_AGENT}\r\n"
+            f"Accept: */*\r\nConnection: keep-alive\r\n\r\n"
+        ).encode('latin-1')
+
+        for attempt in range(2):
+            reader, writer, reused = await pool.acquire(key, host)
+            try:
+                writer.write(request)
+                await writer.drain()
+                status, headers, body, reusable = await asyncio.wait_for(
+                    self._read_response(reader, method), self.timeout
+                )
+            except (OSError, asyncio.IncompleteReadError, ConnectionError):
+                writer.close()
+                if reused and attempt == 0:
+                    continue  # Server dropped an idle connection; retry on a fresh one
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            self.requests_made += 1
+            pool.release(key, reader, writer, reusable)
+            return status, headers, body
+
+        raise ConnectionError(f"Connection to {host} failed")
+
+    @staticmethod
+    async def _read_response(reader: asyncio.StreamReader,
+                             method: str) -> Tuple[int, Dict[str, str], bytes, bool]:
+        """Parse status, headers and body; report whether the connection can be reused"""
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError('Connection closed')
+        version, status = status_line.decode('latin-1').split(None, 2)[:2]
+        status = int(status)
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        reusable = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+        body = b''
+        if method == 'HEAD' or status in (204, 304) or 100 <= status < 200:
+            pass
+        elif 'chunked' in headers.get('transfer-encoding', '').lower():
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';', 1)[0].strip() or b'0', 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            body = b''.join(chunks)
+        elif 'content-length' in headers:
+            length = int(headers['content-length'])
+            if length > MAX_BODY_BYTES:
+                reusable = False
+            else:
+                body = await reader.readexactly(length)
+        else:
+            body = await reader.read(MAX_BODY_BYTES)
+            reusable = False
+
+        return status, headers, body, reusable
+
+    def verify_markdown(self, text: str) -> Dict:
+        """
+        Check every badge and link in markdown text
+
+        Returns:
+            Dict with checked count, dead links and all results
+        """
+        start = time.perf_counter()
+        links = extract_links(text)
+        kinds = dict((url, kind) for kind, url in links)
+        results = self.check_sync(kinds)
+        dead = [
+            {'url': r.url, 'kind': kinds[r.url], 'status': r.status, 'error': r.error}
+            for r in results if not r.ok
+        ]
+        return {
+            'checked': len(results),
+            'dead': dead,
+            'cached': sum(1 for r in results if r.cached),
+            'results': results,
+            'elapsed': time.perf_counter() - start,
+        }
+
+    def verify_file(self, path: str) -> Dict:
+        """Check every badge and link in a generated file"""
+        return self.verify_markdown(Path(path).read_text(encoding='utf-8'))
+
+
+if __name__ == "__main__":
+    import sys
+
+    report = LinkChecker().verify_file(sys.argv[1] if len(sys.argv) > 1 else 'README.md')
+    print(f"Checked {report['checked']} links in {report['elapsed']:.2f}s "
+          f"({report['cached']} cached), {len(report['dead'])} dead")
+    for link in report['dead']:
+        print(f"  [{link['kind']}] {link['url']} - {link['error']}")
+    sys.exit(1 if report['dead'] else 0)
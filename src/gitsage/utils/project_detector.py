@@ -7,9 +7,13 @@ Auto-detect project type from codebase analysis.
 
 import os
 import json
+import hashlib
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from .git_remote import read_head
+
 
 class ProjectDetector:
     """Intelligently detect project type from codebase"""
@@ -62,8 +66,53 @@ class ProjectDetector:
         }
     }
 
+    LANGUAGE_EXTENSIONS = {
+        '.py': 'Python',
+        '.js': 'JavaScript',
+        '.ts': 'TypeScript',
+        '.jsx': 'React',
+        '.tsx': 'React/TypeScript',
+        '.java': 'Java',
+        '.go': 'Go',
+        '.rs': 'Rust',
+        '.rb': 'Ruby',
+        '.php': 'PHP',
+        '.cpp': 'C++',
+        '.c': 'C',
+        '.cs': 'C#',
+        '.swift': 'Swift',
+        '.kt': 'Kotlin',
+        '.sol': 'Solidity'
+    }
+
+    # Never descended into while indexing (vendored or generated trees)
+    INDEX_SKIP_DIRS = {'.git', 'node_modules', 'venv', '.venv', '__pycache__', '.tox',
+                       '.mypy_cache', '.pytest_cache', '.gitsage'}
+    # Directories excluded from language counts
+    LANGUAGE_SKIP_DIRS = {'node_modules', 'venv', 'build', 'dist'}
+    DETECTION_CACHE = '.gitsage/detection.json'
+    DETECTION_CACHE_VERSION = 1
+
     def __init__(self, repo_path: str = "."):
         self.repo_path = Path(repo_path)
+        self._index: Optional[Tuple[List[str], List[str]]] = None
+
+    def scan(self) -> Tuple[List[str], List[str]]:
+        """
+        Walk the repository once and index it
+
+        Returns:
+            (files, dirs) as POSIX paths relative to the repository root
+        """
+        files, dirs = [], []
+        root = str(self.repo_path)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in self.INDEX_SKIP_DIRS]
+            rel = os.path.relpath(dirpath, root).replace(os.sep, '/')
+            prefix = '' if rel == '.' else rel + '/'
+            dirs.extend(prefix + d for d in dirnames)
+            files.extend(prefix + f for f in filenames)
+        return files, dirs
 
     def detect(self) -> Dict[str, any]:
         """
@@ -72,6 +121,71 @@ class ProjectDetector:
         Returns:
             Dict with detected_type, confidence, technologies, and suggestions
         """
+        self._index = self.scan()
+        try:
+            return self._detect()
+        finally:
+            self._index = None
+
+    def fingerprint(self) -> str:
+        """
+        Cheap signature of detection inputs: HEAD commit, top-level entries and
+        size/mtime of every marker file the detector looks for by name
+        """
+        parts = [read_head(str(self.repo_path)) or '']
+        try:
+            # Skip our own cache dir so creating it doesn't invalidate the index
+            parts.append(','.join(sorted(set(os.listdir(self.repo_path)) - {'.gitsage'})))
+        except OSError:
+            pass
+        for name in sorted(self._marker_files()):
+            try:
+                stat = (self.repo_path / name).stat()
+                parts.append(f"{name}:{stat.st_size}:{stat.st_mtime_ns}")
+            except OSError:
+                continue
+        return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()
+
+    def _marker_files(self) -> set:
+        """Exact file names referenced by the detection rules"""
+        names = {'package.json', 'requirements.txt', 'pyproject.toml', 'setup.py'}
+        for criteria in self.PROJECT_TYPES.values():
+            for pattern in criteria.get('files', []) + criteria.get('optional', []):
+                if '*' not in pattern and not pattern.endswith('/') and '.' in pattern:
+                    names.add(pattern)
+        return names
+
+    def detect_cached(self, cache_path: Optional[str] = None) -> Dict[str, any]:
+        """
+        detect() backed by an on-disk index keyed by fingerprint()
+
+        Returns:
+            Detection results, with 'cached' set when served from the index
+        """
+        cache_file = Path(cache_path) if cache_path else self.repo_path / self.DETECTION_CACHE
+        fingerprint = self.fingerprint()
+        try:
+            cached = json.loads(cache_file.read_text(encoding='utf-8'))
+            if (cached.get('version') == self.DETECTION_CACHE_VERSION
+                    and cached.get('fingerprint') == fingerprint):
+                return {**cached['results'], 'cached': True}
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        results = self.detect()
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps({
+                'version': self.DETECTION_CACHE_VERSION,
+                'fingerprint': fingerprint,
+                'results': results,
+            }, indent=2), encoding='utf-8')
+        except OSError:
+            pass
+        return {**results, 'cached': False}
+
+    def _detect(self) -> Dict[str, any]:
+        """Run detection (uses the scan index when one is set)"""
         results = {
             'detected_type': None,
             'confidence': 0.0,
@@ -107,28 +221,19 @@ class ProjectDetector:
 
     def _detect_languages(self) -> Dict[str, int]:
         """Detect programming languages and count files"""
-        extensions = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.jsx': 'React',
-            '.tsx': 'React/TypeScript',
-            '.java': 'Java',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.rb': 'Ruby',
-            '.php': 'PHP',
-            '.cpp': 'C++',
-            '.c': 'C',
-            '.cs': 'C#',
-            '.swift': 'Swift',
-            '.kt': 'Kotlin',
-            '.sol': 'Solidity'
-        }
-
         language_counts = {}
 
-        for ext, lang in extensions.items():
+        if self._index is not None:
+            for rel in self._index[0]:
+                parts = rel.split('/')
+                if any(part.startswith('.') or part in self.LANGUAGE_SKIP_DIRS for part in parts):
+                    continue
+                lang = self.LANGUAGE_EXTENSIONS.get(os.path.splitext(parts[-1])[1])
+                if lang:
+                    language_counts[lang] = language_counts.get(lang, 0) + 1
+            return dict(sorted(language_counts.items(), key=lambda x: x[1], reverse=True))
+
+        for ext, lang in self.LANGUAGE_EXTENSIONS.items():
             files = list(self.repo_path.rglob(f'*{ext}'))
             # Exclude common directories
             files = [f for f in files if not any(
@@ -172,6 +277,13 @@ class ProjectDetector:
 
     def _find_files(self, pattern: str) -> List[Path]:
         """Find files matching pattern"""
+        if self._index is not None and (pattern.endswith('/') or '*' in pattern):
+            files, dirs = self._index
+            if pattern.endswith('/'):
+                name = pattern.rstrip('/')
+                return [self.repo_path / d for d in dirs if d == name or d.endswith('/' + name)]
+            return [self.repo_path / f for f in files if fnmatch(f.rsplit('/', 1)[-1], pattern)]
+
         if pattern.endswith('/'):
             # Directory pattern
             return [p for p in self.repo_path.rglob('*') if p.is_dir() and p.name == pattern.rstrip('/')]
@@ -5,24 +5,138 @@ Repository Health Checker
 Analyze repository and teach GitHub best practices.
 """
 
+import json
 import os
 import subprocess
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 
 
+@dataclass(frozen=True)
+class HealthCheck:
+    """Declarative description of a single health check"""
+
+    id: str
+    name: str  # Display name, used as the key in check_all()['checks']
+    method: str
+    category: str
+    cost: str = 'local'  # local, git, remote
+    inputs: Tuple[str, ...] = ()  # Repo paths (dirs end with '/'), 'git:*' or 'remote:*'
+
+
+# Cheap checks run first; remote-metadata checks share one batched fetch
+COST_ORDER = {'local': 0, 'git': 1, 'remote': 2}
+
+CHECK_REGISTRY: Tuple[HealthCheck, ...] = (
+    HealthCheck('readme', 'README.md', '_check_readme', 'documentation',
+                inputs=('README.md',)),
+    HealthCheck('license', 'LICENSE', '_check_license', 'community',
+                inputs=('LICENSE', 'LICENSE.md', 'LICENSE.txt', 'COPYING')),
+    HealthCheck('contributing', 'CONTRIBUTING.md', '_check_contributing', 'community',
+                inputs=('CONTRIBUTING.md',)),
+    HealthCheck('gitignore', '.gitignore', '_check_gitignore', 'security',
+                inputs=('.gitignore',)),
+    HealthCheck('code_of_conduct', 'CODE_OF_CONDUCT.md', '_check_code_of_conduct', 'community',
+                inputs=('CODE_OF_CONDUCT.md',)),
+    HealthCheck('security_policy', 'SECURITY.md', '_check_security_policy', 'security',
+                inputs=('SECURITY.md',)),
+    HealthCheck('github_actions', 'GitHub Actions', '_check_github_actions', 'automation',
+                inputs=('.github/workflows/',)),
+    HealthCheck('issues', 'Issues', '_check_issues_enabled', 'engagement',
+                cost='remote', inputs=('remote:hasIssuesEnabled',)),
+    HealthCheck('wiki', 'Wiki', '_check_wiki_enabled', 'documentation',
+                cost='remote', inputs=('remote:hasWikiEnabled',)),
+    HealthCheck('description', 'Description', '_check_repo_description', 'discoverability',
+                cost='remote', inputs=('remote:description',)),
+    HealthCheck('topics', 'Topics', '_check_topics', 'discoverability',
+                cost='remote', inputs=('remote:repositoryTopics',)),
+    HealthCheck('branch_protection', 'Branch Protection', '_check_branch_protection', 'automation',
+                cost='remote', inputs=('remote:branchProtection',)),
+    HealthCheck('documentation', 'Documentation', '_check_documentation', 'documentation',
+                inputs=('docs/',)),
+)
+
+
 class RepositoryHealthChecker:
     """Analyze repository health and provide educational feedback"""
 
-    def __init__(self, repo_path: str = "."):
+    def __init__(self, repo_path: str = ".", disabled_categories: Optional[Iterable[str]] = None,
+                 fetch_remote: bool = False):
         self.repo_path = Path(repo_path)
         self.checks = {}
+        self.disabled_categories = set(disabled_categories or [])
+        self.fetch_remote = fetch_remote
+        self.remote_metadata: Optional[Dict] = None
+
+    def schedule(self, categories: Optional[Iterable[str]] = None,
+                 check_ids: Optional[Iterable[str]] = None) -> List[HealthCheck]:
+        """
+        Select and order the checks to run
+
+        Args:
+            categories: Only run checks in these categories (default: all enabled)
+            check_ids: Only run these check ids
+
+        Returns:
+            Checks ordered cheapest first, registry order within a cost class
+        """
+        categories = set(categories) if categories is not None else None
+        check_ids = set(check_ids) if check_ids is not None else None
+
+        selected = [
+            check for check in CHECK_REGISTRY
+            if check.category not in self.disabled_categories
+            and (categories is None or check.category in categories)
+            and (check_ids is None or check.id in check_ids)
+        ]
+        return sorted(selected, key=lambda check: COST_ORDER.get(check.cost, len(COST_ORDER)))
+
+    def run_checks(self, checks: Iterable[HealthCheck]) -> Dict[str, Dict]:
+        """Run scheduled checks, fetching remote metadata at most once"""
+        results = {}
+        for check in checks:
+            if check.cost == 'remote' and self.remote_metadata is None:
+                self.remote_metadata = self._fetch_remote_metadata()
+            results[check.name] = getattr(self, check.method)()
+        return results
 
-    def check_all(self) -> Dict[str, any]:
+    def _fetch_remote_metadata(self) -> Dict:
+        """Fetch all remote repository metadata in a single GitHub CLI call"""
+        if not self.fetch_remote:
+            return {}
+
+        fields = sorted({
+            field.split(':', 1)[1]
+            for check in CHECK_REGISTRY if check.cost == 'remote'
+            for field in check.inputs
+            if field.startswith('remote:') and field != 'remote:branchProtection'
+        })
+        try:
+            result = subprocess.run(
+                ['gh', 'repo', 'view', '--json', ','.join(fields)],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+            if result.returncode == 0:
+                return json.loads(result.stdout)
+        except Exception:
+            pass
+
+        return {}
+
+    def check_all(self, categories: Optional[Iterable[str]] = None,
+                  check_ids: Optional[Iterable[str]] = None) -> Dict[str, any]:
         """
         Run all health checks
 
+        Args:
+            categories: Only run checks in these categories (e.g. ['security'])
+            check_ids: Only run these check ids (see CHECK_REGISTRY)
+
         Returns:
             Dict with overall_score, checks, and recommendations
         """
@@ -35,27 +149,18 @@ class RepositoryHealthChecker:
             'critical_issues': []
         }
 
-        # Run all checks
-        checks = [
-            self._check_readme(),
-            self._check_license(),
-            self._check_contributing(),
-            self._check_gitignore(),
-            self._check_code_of_conduct(),
-            self._check_security_policy(),
-            self._check_github_actions(),
-            self._check_issues_enabled(),
-            self._check_wiki_enabled(),
-            self._check_repo_description(),
-            self._check_topics(),
-            self._check_branch_protection(),
-            self._check_documentation(),
-        ]
+        scheduled = self.schedule(categories, check_ids)
+        check_results = self.run_checks(scheduled)
+
+        # Report in registry order regardless of execution order
+        for check in CHECK_REGISTRY:
+            if check.name in check_results:
+                check_result = check_results[check.name]
+                results['checks'][check.name] = check_result
+                results['overall_score'] += check_result['score']
 
-        for check_result in checks:
-            name = check_result['name']
-            results['checks'][name] = check_result
-            results['overall_score'] += check_result['score']
+        if len(scheduled) < len(CHECK_REGISTRY):
+            results['max_score'] = sum(check['max_score'] for check in results['checks'].values())
 
         # Generate recommendations
         results['recommendations'] = self._generate_recommendations(results['checks'])
@@ -263,7 +368,19 @@ class RepositoryHealthChecker:
 
     def _check_issues_enabled(self) -> Dict:
         """Check if issues are enabled (requires GitHub API or git config)"""
-        # This is a placeholder - actual check would need GitHub API
+        metadata = self.remote_metadata or {}
+        if 'hasIssuesEnabled' in metadata:
+            enabled = metadata['hasIssuesEnabled']
+            return {
+                'name': 'Issues',
+                'status': 'good' if enabled else 'missing',
+                'score': 5 if enabled else 0,
+                'max_score': 5,
+                'message': '[*] Issues enabled' if enabled else '[!] Enable in Settings -> Features -> Issues',
+                'priority': 'low'
+            }
+
+        # Placeholder when remote metadata is unavailable
         return {
             'name': 'Issues',
             'status': 'unknown',
@@ -275,7 +392,29 @@ class RepositoryHealthChecker:
 
     def _check_wiki_enabled(self) -> Dict:
         """Check if wiki is enabled"""
-        # This is a placeholder - actual check would need GitHub API
+        metadata = self.remote_metadata or {}
+        if 'hasWikiEnabled' in metadata:
+            if metadata['hasWikiEnabled']:
+                return {
+                    'name': 'Wiki',
+                    'status': 'good',
+                    'score': 5,
+                    'max_score': 5,
+                    'message': '[*] Wiki enabled',
+                    'priority': 'low'
+                }
+            return {
+                'name': 'Wiki',
+                'status': 'missing',
+                'score': 0,
+                'max_score': 5,
+                'message': '[!] Enable in Settings -> Features -> Wiki',
+                'priority': 'low',
+                'fix_time': '30 seconds',
+                'learn_url': 'https://docs.github.com/en/communities/documenting-your-project-with-wikis'
+            }
+
+        # Placeholder when remote metadata is unavailable
         return {
             'name': 'Wiki',
             'status': 'unknown',
@@ -288,25 +427,49 @@ class RepositoryHealthChecker:
         }
 
     def _check_repo_description(self) -> Dict:
-        """Check for repository description (placeholder)"""
+        """Check for repository description"""
+        metadata = self.remote_metadata or {}
+        if metadata.get('description'):
+            return {
+                'name': 'Description',
+                'status': 'good',
+                'score': 3,
+                'max_score': 3,
+                'message': '[*] Repository description set',
+                'priority': 'normal'
+            }
+
+        fetched = 'description' in metadata
         return {
             'name': 'Description',
-            'status': 'unknown',
+            'status': 'missing' if fetched else 'unknown',
             'score': 0,
             'max_score': 3,
-            'message': '? Add repository description in GitHub settings',
+            'message': f"{'[!]' if fetched else '?'} Add repository description in GitHub settings",
             'priority': 'medium',
             'fix_time': '1 minute'
         }
 
     def _check_topics(self) -> Dict:
-        """Check for repository topics (placeholder)"""
+        """Check for repository topics"""
+        metadata = self.remote_metadata or {}
+        if metadata.get('repositoryTopics'):
+            return {
+                'name': 'Topics',
+                'status': 'good',
+                'score': 3,
+                'max_score': 3,
+                'message': f"[*] {len(metadata['repositoryTopics'])} topics set",
+                'priority': 'normal'
+            }
+
+        fetched = 'repositoryTopics' in metadata
         return {
             'name': 'Topics',
-            'status': 'unknown',
+            'status': 'missing' if fetched else 'unknown',
             'score': 0,
             'max_score': 3,
-            'message': '? Add 3-5 topics to improve discoverability',
+            'message': f"{'[!]' if fetched else '?'} Add 3-5 topics to improve discoverability",
             'priority': 'medium',
             'fix_time': '2 minutes'
         }
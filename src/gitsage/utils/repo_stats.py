@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Local Repository Statistics
+===========================
+Compute contributors, commit activity, code size and languages from the git
+object store and render them as static SVG cards cached by HEAD commit.
+"""
+
+import json
+import subprocess
+from collections import defaultdict
+from datetime import datetime, timezone
+from html import escape
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from .project_detector import ProjectDetector
+
+# Extensions counted towards code size, on top of the detector's language map
+STATS_EXTENSIONS = {
+    **ProjectDetector.LANGUAGE_EXTENSIONS,
+    '.sh': 'Shell',
+    '.bash': 'Shell',
+    '.ps1': 'PowerShell',
+    '.bat': 'Batchfile',
+    '.html': 'HTML',
+    '.css': 'CSS',
+    '.scss': 'SCSS',
+    '.vue': 'Vue',
+    '.dart': 'Dart',
+    '.h': 'C',
+    '.hpp': 'C++',
+}
+
+LANGUAGE_COLORS = {
+    'Python': '#3572A5', 'JavaScript': '#f1e05a', 'TypeScript': '#3178c6', 'Java': '#b07219',
+    'Go': '#00ADD8', 'Rust': '#dea584', 'Ruby': '#701516', 'PHP': '#4F5D95', 'C++': '#f34b7d',
+    'C': '#555555', 'C#': '#178600', 'Swift': '#F05138', 'Kotlin': '#A97BFF', 'Shell': '#89e051',
+    'PowerShell': '#012456', 'HTML': '#e34c26', 'CSS': '#563d7c', 'Solidity': '#AA6746',
+    'Batchfile': '#C1F12E', 'Vue': '#41b883', 'Dart': '#00B4AB', 'SCSS': '#c6538c',
+}
+DEFAULT_LANGUAGE_COLOR = '#8b8b8b'
+
+ACTIVITY_WEEKS = 52
+WEEK_SECONDS = 7 * 24 * 3600
+
+
+class RepoStatsEngine:
+    """Compute repository statistics locally and render static SVG charts"""
+
+    CARD_FILES = {
+        'languages': 'languages.svg',
+        'activity': 'activity.svg',
+        'contributors': 'contributors.svg',
+    }
+
+    def __init__(self, repo_path: str = ".", output_dir: Optional[str] = None):
+        self.repo_path = Path(repo_path)
+        self.output_dir = Path(output_dir) if output_dir else self.repo_path / 'assets' / 'stats'
+
+    def _git_lines(self, args: List[str]) -> Iterator[str]:
+        """Stream stdout lines of a git command"""
+        process = subprocess.Popen(
+            ['git'] + args,
+            cwd=self.repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            errors='replace'
+        )
+        try:
+            for line in process.stdout:
+                yield line.rstrip('\n')
+        finally:
+            process.stdout.close()
+            process.wait()
+
+    def head_commit(self) -> Optional[str]:
+        """Current HEAD commit, or None outside a repository / before the first commit"""
+        try:
+            result = subprocess.run(
+                ['git', 'rev-parse', '--verify', '-q', 'HEAD'],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            return result.stdout.strip() or None
+        except Exception:
+            return None
+
+    def compute(self, head: Optional[str] = None) -> Dict:
+        """
+        Compute statistics for ``head`` in one streamed pass over tree and history
+
+        Returns:
+            Dict with head, code_size, languages, contributors, activity and totals
+        """
+        head = head or self.head_commit()
+        stats = {
+            'head': head,
+            'code_size': 0,
+            'languages': {},
+            'contributors': [],
+            'activity': [0] * ACTIVITY_WEEKS,
+            'total_commits': 0,
+            'first_commit': None,
+            'last_commit': None,
+        }
+        if not head:
+            return stats
+
+        # Code size and languages from blob sizes in the HEAD tree
+        language_bytes = defaultdict(int)
+        for line in self._git_lines(['ls-tree', '-r', '-l', '--full-tree', head]):
+            meta, _, path = line.partition('\t')
+            parts = meta.split()
+            if len(parts) < 4 or parts[1] != 'blob' or not parts[3].isdigit():
+                continue
+            language = STATS_EXTENSIONS.get(Path(path).suffix.lower())
+            if language:
+                size = int(parts[3])
+                language_bytes[language] += size
+                stats['code_size'] += size
+
+        total_bytes = sum(language_bytes.values())
+        stats['languages'] = {
+            lang: {'bytes': size, 'percentage': size * 100.0 / total_bytes}
+            for lang, size in sorted(language_bytes.items(), key=lambda item: item[1], reverse=True)
+        }
+
+        # Contributors and weekly activity from history
+        contributors: Dict[str, Dict] = {}
+        timestamps = []
+        current = None
+        for line in self._git_lines(['log', '--no-merges', '--numstat',
+                                     '--format=\x01%at\t%aN\t%aE', head]):
+            if line.startswith('\x01'):
+                timestamp, name, email = (line[1:].split('\t') + ['', ''])[:3]
+                timestamps.append(int(timestamp))
+                current = contributors.setdefault(email or name, {
+                    'name': name, 'email': email, 'commits': 0, 'additions': 0, 'deletions': 0
+                })
+                current['commits'] += 1
+            elif line and current is not None:
+                added, deleted, _ = (line.split('\t') + ['', ''])[:3]
+                if added.isdigit():
+                    current['additions'] += int(added)
+                if deleted.isdigit():
+                    current['deletions'] += int(deleted)
+
+        if timestamps:
+            latest = max(timestamps)
+            for timestamp in timestamps:
+                week = (latest - timestamp) // WEEK_SECONDS
+                if week < ACTIVITY_WEEKS:
+                    stats['activity'][ACTIVITY_WEEKS - 1 - week] += 1
+            stats['total_commits'] = len(timestamps)
+            stats['first_commit'] = datetime.fromtimestamp(min(timestamps), timezone.utc).isoformat()
+            stats['last_commit'] = datetime.fromtimestamp(latest, timezone.utc).isoformat()
+
+        stats['contributors'] = sorted(
+            contributors.values(), key=lambda c: (c['commits'], c['additions']), reverse=True
+        )
+        return stats
+
+    def render(self, force: bool = False) -> Dict:
+        """
+        Compute stats and write SVG cards, reusing the cache when HEAD is unchanged
+
+        Returns:
+            Stats dict with a 'cards' mapping of card name to SVG path
+        """
+        head = self.head_commit()
+        cache_file = self.output_dir / 'stats.json'
+
+        if not force and head and cache_file.exists():
+            try:
+                cached = json.loads(cache_file.read_text(encoding='utf-8'))
+                if cached.get('head') == head and all(
+                    (self.output_dir / name).exists() for name in self.CARD_FILES.values()
+                ):
+                    cached['cards'] = {k: self.output_dir / v for k, v in self.CARD_FILES.items()}
+                    cached['cached'] = True
+                    return cached
+            except (OSError, ValueError):
+                pass
+
+        stats = self.compute(head)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        svgs = {
+            'languages': self.render_languages_svg(stats),
+            'activity': self.render_activity_svg(stats),
+            'contributors': self.render_contributors_svg(stats),
+        }
+        for name, svg in svgs.items():
+            (self.output_dir / self.CARD_FILES[name]).write_text(svg, encoding='utf-8')
+        cache_file.write_text(json.dumps(stats, indent=2), encoding='utf-8')
+
+        stats['cards'] = {k: self.output_dir / v for k, v in self.CARD_FILES.items()}
+        stats['cached'] = False
+        return stats
+
+    @staticmethod
+    def _card(width: int, height: int, title: str, body: str) -> str:
+        """Wrap chart markup in a titled card"""
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}" role="img" aria-label="{escape(title)}">'
+            f'<title>{escape(title)}</title>'
+            f'<rect x="0.5" y="0.5" width="{width - 1}" height="{height - 1}" rx="4.5" '
+            f'fill="#fffefe" stroke="#e4e2e2"/>'
+            f'<g font-family="Segoe UI,Ubuntu,Helvetica,Arial,sans-serif">'
+            f'<text x="20" y="30" font-size="16" font-weight="600" fill="#2f80ed">{escape(title)}</text>'
+            f'{body}</g></svg>'
+        )
+
+    def render_languages_svg(self, stats: Dict, top: int = 6) -> str:
+        """Stacked bar of the top languages by bytes"""
+        languages = list(stats['languages'].items())[:top]
+        width, bar_width = 300, 260
+        rows = (len(languages) + 1) // 2
+        height = 80 + rows * 22
+
+        bar, legend, x = [], [], 20.0
+        for i, (lang, info) in enumerate(languages):
+            color = LANGUAGE_COLORS.get(lang, DEFAULT_LANGUAGE_COLOR)
+            w = bar_width * info['percentage'] / 100.0
+            bar.append(f'<rect x="{x:.2f}" y="45" width="{w:.2f}" height="8" fill="{color}"/>')
+            x += w
+            lx = 20 + (i % 2) * 140
+            ly = 75 + (i // 2) * 22
+            legend.append(
+                f'<circle cx="{lx + 5}" cy="{ly - 4}" r="5" fill="{color}"/>'
+                f'<text x="{lx + 15}" y="{ly}" font-size="11" fill="#333">'
+                f'{escape(lang)} {info["percentage"]:.1f}%</text>'
+            )
+        if not languages:
+            legend.append('<text x="20" y="75" font-size="11" fill="#333">No source files</text>')
+
+        return self._card(width, height, 'Top Languages', ''.join(bar + legend))
+
+    def render_activity_svg(self, stats: Dict) -> str:
+        """Weekly commit bars over the last year of history"""
+        activity = stats['activity']
+        width, height = 20 + ACTIVITY_WEEKS * 9 + 20, 140
+        peak = max(activity) or 1
+        bars = []
+        for i, count in enumerate(activity):
+            h = 70.0 * count / peak
+            bars.append(
+                f'<rect x="{20 + i * 9}" y="{115 - h:.2f}" width="7" height="{h:.2f}" '
+                f'fill="#2f80ed"><title>{count} commits</title></rect>'
+            )
+        caption = f'{stats["total_commits"]} commits'
+        body = ''.join(bars) + (
+            f'<line x1="20" y1="115.5" x2="{width - 20}" y2="115.5" stroke="#e4e2e2"/>'
+            f'<text x="{width - 20}" y="30" font-size="11" text-anchor="end" fill="#666">{caption}</text>'
+        )
+        return self._card(width, height, 'Commit Activity', body)
+
+    def render_contributors_svg(self, stats: Dict, top: int = 10) -> str:
+        """Horizontal bars of commits per contributor"""
+        contributors = stats['contributors'][:top]
+        width = 400
+        height = 60 + max(len(contributors), 1) * 22
+        peak = max((c['commits'] for c in contributors), default=1)
+        rows = []
+        for i, contributor in enumerate(contributors):
+            y = 55 + i * 22
+            w = 200.0 * contributor['commits'] / peak
+            rows.append(
+                f'<text x="20" y="{y + 9}" font-size="11" fill="#333">{escape(contributor["name"][:22])}</text>'
+                f'<rect x="160" y="{y}" width="{w:.2f}" height="12" rx="2" fill="#2f80ed"/>'
+                f'<text x="{165 + w:.2f}" y="{y + 10}" font-size="10" fill="#666">{contributor["commits"]}</text>'
+            )
+        if not contributors:
+            rows.append('<text x="20" y="64" font-size="11" fill="#333">No commits yet</text>')
+        return self._card(width, height, 'Contributors', ''.join(rows))
+
+
+if __name__ == "__main__":
+    result = RepoStatsEngine().render()
+    print(f"HEAD {result['head']} ({'cached' if result['cached'] else 'rendered'})")
+    for card, path in result['cards'].items():
+        print(f"  {card}: {path}")
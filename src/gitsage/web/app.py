@@ -1,10 +1,23 @@
 """GitSage Web Interface - Flask application."""
 
+import json
 import os
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
-from flask import Flask, flash, jsonify, redirect, render_template, request, url_for
+from flask import (
+    Flask,
+    Response,
+    flash,
+    jsonify,
+    redirect,
+    render_template,
+    request,
+    stream_with_context,
+    url_for,
+)
 from flask_cors import CORS
 try:
     from flask_wtf.csrf import CSRFProtect
@@ -35,6 +48,9 @@ def create_app(config: Optional[dict] = None) -> Flask:
     app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "dev-secret-key-change-in-production")
     app.config["GITSAGE_VERSION"] = __version__
     app.config["PROJECT_NAME"] = PROJECT_NAME
+    app.config["DOCS_SEARCH_INDEX"] = os.path.join("generated-docs", "search-index.bin")
+    app.config["HEALTH_WATCH_LIMIT"] = 4
+    app.config["HEALTH_WATCH_POLL_INTERVAL"] = 1.0  # Seconds between idle keepalives (and polled scans)
 
     if config:
         app.config.update(config)
@@ -373,6 +389,94 @@ echo "Script generation will be fully implemented"
             logger.error(f"Health check error: {e}")
             return jsonify({"success": False, "error": str(e)}), 500
 
+    # Each watch stream holds a recursive file observer until the client disconnects
+    health_watch_slots = threading.BoundedSemaphore(app.config["HEALTH_WATCH_LIMIT"])
+
+    @app.route("/api/health/watch")
+    def api_health_watch():
+        """Stream health score deltas as Server-Sent Events."""
+        from gitsage.utils.health_watcher import HealthWatcher
+
+        # Only the served repository or a directory inside it may be watched
+        root = Path.cwd().resolve()
+        path = (root / request.args.get("path", ".")).resolve()
+        if path != root and root not in path.parents:
+            return jsonify({"success": False, "error": "Path must be inside the repository"}), 400
+        if not path.is_dir():
+            return jsonify({"success": False, "error": "Directory not found"}), 404
+        if not health_watch_slots.acquire(blocking=False):
+            return jsonify({"success": False, "error": "Too many health watchers running"}), 503
+
+        try:
+            watcher = HealthWatcher(str(path), poll_interval=app.config["HEALTH_WATCH_POLL_INTERVAL"])
+        except Exception as e:
+            health_watch_slots.release()
+            logger.error(f"Health watch error: {e}")
+            return jsonify({"success": False, "error": str(e)}), 500
+
+        def stream():
+            events = watcher.events(heartbeat=True)
+            try:
+                for event in events:
+                    if event["type"] == "heartbeat":
+                        # The server only sees a closed connection when it writes, so an idle
+                        # stream sends an SSE comment; the failed write ends it and runs close()
+                        yield ": keepalive\n\n"
+                    else:
+                        yield f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+            finally:
+                events.close()
+
+        def close():
+            watcher.stop()
+            health_watch_slots.release()
+
+        response = Response(
+            stream_with_context(stream()),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+        # Runs once the stream ends: the client disconnected (noticed at the next event or
+        # keepalive) or went away before the first event
+        response.call_on_close(close)
+        return response
+
+    # Memory-mapped search index, reopened when wiki-generator.py replaces the file
+    search_index = {"key": None, "index": None}
+    search_lock = threading.Lock()
+
+    def docs_search_index():
+        from gitsage.generators.search_index import SearchIndex
+
+        path = app.config["DOCS_SEARCH_INDEX"]
+        stat = os.stat(path)
+        key = (path, stat.st_ino, stat.st_mtime_ns)
+        with search_lock:
+            if search_index["key"] != key:
+                # The replaced index stays mapped for requests still using it
+                search_index["index"] = SearchIndex(path)
+                search_index["key"] = key
+            return search_index["index"]
+
+    @app.route("/api/docs/search")
+    def api_docs_search():
+        """Search the generated documentation."""
+        query = request.args.get("q", "").strip()
+        if not query:
+            return jsonify({"success": False, "error": "Missing query parameter 'q'"}), 400
+        limit = max(1, min(request.args.get("limit", 10, type=int), 100))
+
+        try:
+            index = docs_search_index()
+        except (OSError, ValueError) as e:
+            logger.error(f"Docs search index error: {e}")
+            return jsonify({"success": False, "error": "Search index not available; run wiki-generator.py"}), 404
+
+        start = time.perf_counter()
+        results = index.search(query, limit=limit)
+        took_ms = round((time.perf_counter() - start) * 1000, 2)
+        return jsonify({"success": True, "query": query, "results": results, "took_ms": took_ms})
+
     @app.route("/api/beautification-score", methods=["POST"])
     def api_beautification_score():
         """Get beautification score."""
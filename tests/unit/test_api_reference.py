@@ -0,0 +1,129 @@
+"""Tests for the static-analysis API reference builder"""
+
+import ast
+import os
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.generators.api_reference import (  # noqa: E402
+    API_CACHE, ApiReferenceBuilder, _render, parse_module, render_api_section, render_wiki_pages,
+)
+
+MODULE = '''"""Widget helpers."""
+
+__all__ = ["Widget", "build"]
+
+
+class Widget(Base):
+    """A widget."""
+
+    def __init__(self, name: str, size: int = 1):
+        self.name = name
+
+    def render(self, fmt: str = "md") -> str:
+        """Render the widget."""
+
+    @property
+    def area(self) -> int:
+        return 0
+
+    def _private(self):
+        pass
+
+
+async def build(*parts, **options) -> "Widget":
+    """Build a widget.
+
+    Longer description.
+    """
+
+
+def helper():
+    """Not exported."""
+
+raise SystemExit("never imported")
+'''
+
+
+def _make_package(root: Path) -> Path:
+    package = root / "src" / "demo"
+    (package / "core").mkdir(parents=True)
+    (package / "__init__.py").write_text('"""Demo package."""\n')
+    (package / "core" / "__init__.py").write_text("")
+    (package / "core" / "widgets.py").write_text(MODULE)
+    (package / "_internal.py").write_text("def hidden():\n    pass\n")
+    (package / "broken.py").write_text("def broken(:\n")
+    return root
+
+
+def test_parse_module_extracts_public_api():
+    """Test that signatures, docstrings and __all__ are read from the AST"""
+    module = parse_module(MODULE)
+
+    assert module["doc"] == "Widget helpers."
+    assert [c["name"] for c in module["classes"]] == ["Widget"]
+    widget = module["classes"][0]
+    assert widget["signature"] == "(name: str, size: int=1)"
+    assert widget["bases"] == ["Base"]
+    assert [(m["name"], m["kind"], m["signature"]) for m in widget["methods"]] == [
+        ("render", "method", "(fmt: str='md') -> str"),
+        ("area", "property", "() -> int"),
+    ]
+    assert [f["name"] for f in module["functions"]] == ["build"]
+    assert module["functions"][0]["async"] is True
+    assert "error" in parse_module("def broken(:\n")
+
+
+def test_fallback_renderer_matches_unparse():
+    """Test that the Python 3.8 signature renderer agrees with ast.unparse"""
+    source = (
+        "def f(a, /, b: Dict[str, List[int]] = {}, *args: 'T', c: Optional[x.Y] = None, d=-1, "
+        "**kw: int | None) -> Tuple[int, ...]: pass\n"
+        "def g(*, key=(1,), mode=sorted(x, key=len), fill=(a + b) * 2): pass\n"
+    )
+    for node in ast.parse(source).body:
+        assert _render(node.args) == ast.unparse(node.args)
+        assert _render(node.returns or ast.Constant(None)) == ast.unparse(node.returns or ast.Constant(None))
+    assert _render(ast.parse("lambda: 0", mode="eval").body) == "..."
+
+
+def test_builder_names_modules_and_caches_by_hash(temp_dir):
+    """Test module discovery, the parse cache and invalidation on content change"""
+    root = _make_package(temp_dir)
+    builder = ApiReferenceBuilder(str(root), jobs=1)
+    modules = builder.build()
+
+    assert [m["name"] for m in modules] == ["demo", "demo.broken", "demo.core", "demo.core.widgets"]
+    assert builder.stats["parsed"] == 4
+    assert (root / API_CACHE).exists()
+
+    # Touching a file without changing it is answered by the content hash
+    widgets = root / "src" / "demo" / "core" / "widgets.py"
+    os.utime(widgets, ns=(1, 1))
+    rebuilt = ApiReferenceBuilder(str(root), jobs=1)
+    assert rebuilt.build() == modules
+    assert rebuilt.stats["parsed"] == 0
+
+    widgets.write_text(MODULE.replace("size: int = 1", "size: int = 2"))
+    changed = ApiReferenceBuilder(str(root), jobs=1)
+    assert "size: int=2" in render_api_section(changed.build())
+    assert changed.stats["parsed"] == 1
+
+
+def test_api_section_and_wiki_pages(temp_dir):
+    """Test README and wiki rendering of the parsed API"""
+    modules = ApiReferenceBuilder(str(_make_package(temp_dir)), cache_path=None).build()
+
+    section = render_api_section(modules)
+    assert "### `demo.core.widgets`" in section
+    assert "- **class `Widget(name: str, size: int=1)`** - A widget." in section
+    assert "- `async build(*parts, **options) -> 'Widget'` - Build a widget." in section
+    assert "`helper(" not in section
+
+    pages = render_wiki_pages(modules)
+    assert set(pages) == {"API-Reference.md", "API-demo.core.widgets.md"}
+    assert "Longer description." in pages["API-demo.core.widgets.md"]
+    assert "[demo.core.widgets](API-demo.core.widgets)" in pages["API-Reference.md"]
@@ -0,0 +1,115 @@
+"""Tests for the shared atomic writer"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.utils import AtomicWriter, write_if_changed  # noqa: E402
+from gitsage.utils.atomic_writer import MANIFEST_NAME, content_hash  # noqa: E402
+
+
+def test_write_if_changed_skips_identical_content(temp_dir):
+    """Test that unchanged content leaves the file and its mtime untouched"""
+    target = temp_dir / "out" / "README.md"
+    assert write_if_changed(target, "hello\n") is True
+    os.utime(target, ns=(1, 1))
+
+    assert write_if_changed(target, "hello\n") is False
+    assert target.stat().st_mtime_ns == 1
+    assert write_if_changed(target, "changed\n") is True
+    assert target.read_text() == "changed\n"
+    assert not [p for p in target.parent.iterdir() if p.suffix == ".tmp"]
+
+
+def test_manifest_skips_without_reading(temp_dir, monkeypatch):
+    """Test that the manifest answers unchanged writes with a stat only"""
+    manifest = temp_dir / MANIFEST_NAME
+    with AtomicWriter(manifest) as writer:
+        writer.write(temp_dir / "page.md", "# Page\n")
+        writer.write(temp_dir / "deploy.sh", "#!/bin/sh\n", mode=0o755)
+    assert manifest.exists()
+    if sys.platform != "win32":
+        assert (temp_dir / "deploy.sh").stat().st_mode & 0o777 == 0o755
+
+    writer = AtomicWriter(manifest)
+    monkeypatch.setattr("builtins.open", None)  # Any file read would raise
+    assert writer.write(temp_dir / "page.md", "# Page\n") is False
+    monkeypatch.undo()
+
+    assert (writer.written, writer.skipped) == (0, 1)
+    assert writer.find(content_hash("#!/bin/sh\n")) == (temp_dir / "deploy.sh").resolve()
+    assert writer.find(content_hash("missing")) is None
+
+
+def test_write_queue_is_bounded_and_reports_errors(temp_dir):
+    """Test that queued writes all land, put() blocks when full and failures reach the producer"""
+    import threading
+
+    from gitsage.utils import WriteQueue
+
+    release = threading.Event()
+    writer = AtomicWriter(temp_dir / MANIFEST_NAME)
+
+    def slow_write(path, content, mode, depends):
+        release.wait()
+        return writer.write(path, content, mode, depends)
+
+    write_queue = WriteQueue(slow_write, workers=2, maxsize=2)
+    producer = threading.Thread(target=lambda: [write_queue.put(temp_dir / f"{i}.md", str(i)) for i in range(8)])
+    producer.start()
+    producer.join(0.2)
+    assert producer.is_alive() and write_queue.queued <= 4  # Two in flight, two waiting
+    release.set()
+    producer.join()
+    write_queue.close()
+    assert write_queue.written == writer.written == 8
+    assert sorted(p.name for p in temp_dir.glob("*.md")) == [f"{i}.md" for i in range(8)]
+
+    failing = WriteQueue(lambda *write_args: 1 / 0, workers=1)
+    failing.put(temp_dir / "x.md", "x")
+    try:
+        failing.close()
+    except ZeroDivisionError:
+        pass
+    else:
+        raise AssertionError("write error was swallowed")
+
+
+def test_is_built_tracks_dependencies(temp_dir):
+    """Test that recorded dependencies answer is_built() until they or the file change"""
+    target = temp_dir / "page.md"
+    writer = AtomicWriter(temp_dir / MANIFEST_NAME)
+    writer.write(target, "v1\n", depends={"project.version": "1.0", "template:page": "abc"})
+    writer.save()
+
+    reloaded = AtomicWriter(temp_dir / MANIFEST_NAME)
+    assert reloaded.entries[target.name]["depends"] == ["project.version", "template:page"]
+    assert reloaded.is_built(target, {"template:page": "abc", "project.version": "1.0"})
+    assert not reloaded.is_built(target, {"project.version": "1.1", "template:page": "abc"})
+
+    target.write_text("edited by hand\n")
+    assert not reloaded.is_built(target, {"project.version": "1.0", "template:page": "abc"})
+
+
+def test_prune_removes_outputs_a_build_no_longer_produces(temp_dir):
+    """Test that prune() deletes stale manifest files under a directory and keeps everything else"""
+    docs = temp_dir / "docs"
+    first = AtomicWriter(temp_dir / MANIFEST_NAME)
+    for name in ("keep.md", "old/gone.md", "built.md"):
+        first.write(docs / name, f"{name}\n", depends={"page": name})
+    first.write(temp_dir / "outside.md", "other format\n")
+    first.save()
+    (docs / "by-hand.md").write_text("not generated\n")
+
+    second = AtomicWriter(temp_dir / MANIFEST_NAME)
+    second.write(docs / "keep.md", "keep.md\n")
+    assert second.is_built(docs / "built.md", {"page": "built.md"})
+    assert second.prune(docs) == [docs.resolve() / "old" / "gone.md"]
+    second.save()
+
+    assert sorted(p.relative_to(docs).as_posix() for p in docs.rglob("*")) == ["built.md", "by-hand.md", "keep.md"]
+    assert (temp_dir / "outside.md").exists()
+    assert "docs/old/gone.md" not in AtomicWriter(temp_dir / MANIFEST_NAME).entries
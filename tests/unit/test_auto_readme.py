@@ -0,0 +1,139 @@
+"""Tests for the detection-driven README pipeline"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.generators import auto_readme, build_config, render_readme  # noqa: E402
+from gitsage.generators.auto_readme import detect_license, select_sections  # noqa: E402
+from gitsage.utils.git_remote import clear_cache, read_head  # noqa: E402
+from gitsage.utils.project_detector import ProjectDetector  # noqa: E402
+
+
+def _make_project(root: Path) -> Path:
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "__init__.py").write_text("")
+    (root / "pkg" / "core.py").write_text("import flask\n")
+    (root / "tests").mkdir()
+    (root / "tests" / "test_core.py").write_text("def test_ok():\n    pass\n")
+    (root / ".github" / "workflows").mkdir(parents=True)
+    (root / ".github" / "workflows" / "ci.yml").write_text("on: push\n")
+    (root / "static.js").write_text("console.log(1);\n")
+    (root / "pyproject.toml").write_text(
+        '[project]\nname = "demo-lib"\nversion = "0.3.0"\ndescription = "Demo library"\n'
+    )
+    (root / "requirements.txt").write_text("flask\npytest\n")
+    (root / "LICENSE").write_text("MIT License\n\nCopyright (c) 2024 Octo\n")
+    return root
+
+
+def _make_git(root: Path, sha: str = "a" * 40) -> None:
+    git_dir = root / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "config").write_text('[remote "origin"]\n\turl = git@github.com:octo/demo-lib.git\n')
+    (git_dir / "packed-refs").write_text(f"# pack-refs with: peeled\n{sha} refs/heads/main\n")
+    clear_cache()
+
+
+def test_read_head_follows_loose_and_packed_refs(temp_dir):
+    """Test that HEAD resolves through packed-refs and prefers loose refs"""
+    _make_git(temp_dir)
+    assert read_head(str(temp_dir)) == "a" * 40
+
+    (temp_dir / ".git" / "refs" / "heads" / "main").write_text("b" * 40 + "\n")
+    assert read_head(str(temp_dir)) == "b" * 40
+    assert read_head(str(temp_dir / "missing-parent-is-fine")) == "b" * 40
+
+
+def test_detection_uses_single_walk_and_finds_workflows(temp_dir):
+    """Test that indexed detection finds directory markers like .github/workflows/"""
+    project = _make_project(temp_dir)
+    results = ProjectDetector(str(project)).detect()
+
+    assert "GitHub Actions" in results["technologies"]
+    assert "Pytest" in results["technologies"]
+    assert results["languages"]["Python"] == 3
+
+
+def test_detect_cached_reuses_index_until_inputs_change(temp_dir):
+    """Test that the detection cache hits on rerun and misses after a marker file changes"""
+    project = _make_project(temp_dir)
+    _make_git(project)
+
+    first = ProjectDetector(str(project)).detect_cached()
+    assert first["cached"] is False
+    assert (project / ".gitsage" / "detection.json").exists()
+
+    second = ProjectDetector(str(project)).detect_cached()
+    assert second["cached"] is True
+    assert second["languages"] == first["languages"]
+
+    (project / "package.json").write_text(json.dumps({"name": "demo"}))
+    assert ProjectDetector(str(project)).detect_cached()["cached"] is False
+
+    (project / ".git" / "refs" / "heads" / "main").write_text("c" * 40 + "\n")
+    assert ProjectDetector(str(project)).detect_cached()["cached"] is False
+
+
+def test_sections_follow_detection(temp_dir):
+    """Test that sections and install methods come from what was detected"""
+    project = _make_project(temp_dir)
+    _make_git(project)
+    config = build_config(ProjectDetector(str(project)).detect(), str(project))
+
+    assert config["project"]["name"] == "demo-lib"
+    assert config["project"]["github_username"] == "octo"
+    assert "build-status" in config["badges"]["shields"]
+    assert select_sections(config) == [
+        "languages", "features", "installation", "usage", "tech_stack", "testing", "contributing", "license",
+    ]
+
+    readme = render_readme(config)
+    assert "pip install demo-lib" in readme
+    assert "npm install" not in readme  # A stray .js file is not an npm package
+    assert "import demo_lib" in readme
+
+
+def test_auto_readme_is_zero_prompt(temp_dir, monkeypatch):
+    """Test that the pipeline never prompts and reports stage timings"""
+    project = _make_project(temp_dir)
+    monkeypatch.setattr("builtins.input", None)  # Any prompt would raise
+
+    markdown, info = auto_readme(str(project), fast=True)
+    assert markdown.startswith("<!-- gitsage:begin title ")
+    assert "# demo-lib\n" in markdown
+    assert set(info["timings"]) == {"detect", "config", "render", "total"}
+
+
+def test_license_is_read_from_the_license_file(temp_dir):
+    """Test SPDX tags and license titles, and that unknown licenses get no badge"""
+    license_file = temp_dir / "LICENSE"
+    assert detect_license(temp_dir) == ""
+    license_file.write_text("        Apache License\n    Version 2.0, January 2004\n")
+    assert detect_license(temp_dir) == "Apache-2.0"
+    license_file.write_text("    GNU GENERAL PUBLIC LICENSE\n     Version 3, 29 June 2007\n")
+    assert detect_license(temp_dir) == "GPL-3.0"
+    license_file.write_text("# SPDX-License-Identifier: BSD-3-Clause\n")
+    assert detect_license(temp_dir) == "BSD-3-Clause"
+    license_file.write_text("Copyright Octo Corp. All rights reserved.\n")
+    assert detect_license(temp_dir) == ""
+
+    config = build_config({"languages": {"Python": 1}}, str(temp_dir))
+    assert config["project"]["license"] == ""
+    assert "license" not in select_sections(config)
+
+
+def test_footer_does_not_change_with_the_date(temp_dir):
+    """Test that the footer uses the last commit date, so reruns give identical output"""
+    project = _make_project(temp_dir)
+    config = build_config(ProjectDetector(str(project)).detect(), str(project))
+    assert config["project"]["license"] == "MIT"
+    assert config["last_commit"] == ""
+    assert render_readme(config).endswith("*README generated by GitSage*\n")
+
+    config["last_commit"] = "2024-05-01"
+    assert render_readme(config).endswith("*README generated by GitSage (last commit 2024-05-01)*\n")
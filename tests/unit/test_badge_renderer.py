@@ -0,0 +1,64 @@
+"""Tests for the offline badge renderer"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.utils import GitHubStatsGenerator  # noqa: E402
+from gitsage.utils.badge_renderer import render_badge, text_width, write_badges  # noqa: E402
+
+
+def test_render_badge_is_valid_cached_svg():
+    """Test that badges render to SVG and repeated renders hit the cache"""
+    render_badge.cache_clear()
+    svg = render_badge("license", "MIT", "green", "flat")
+    assert svg.startswith("<svg") and svg.endswith("</svg>")
+    assert "#97ca00" in svg and ">MIT<" in svg
+
+    assert render_badge("license", "MIT", "green", "flat") is svg
+    assert render_badge.cache_info().hits == 1
+
+
+def test_text_width_uses_font_table():
+    """Test that narrow glyphs measure narrower than wide ones"""
+    assert text_width("iii") < text_width("WWW")
+    assert ">THE-BADGE<" in render_badge("for", "the-badge", "blue", "for-the-badge")
+
+
+def test_write_badges_and_local_stats_badges(temp_dir):
+    """Test bulk badge writing and local badges from GitHubStatsGenerator"""
+    paths = write_badges([("license", "MIT", "green"), {"label": "PRs", "message": "welcome"}],
+                         temp_dir / "assets" / "badges")
+    assert all(path.exists() for path in paths)
+
+    stats = GitHubStatsGenerator("user", "repo", repo_path=str(temp_dir),
+                                 badge_dir=str(temp_dir / "assets" / "badges"))
+    markdown = stats.generate_badge("pr-welcome")
+    assert markdown.startswith("![Pr Welcome](assets/badges/")
+    assert "img.shields.io" in stats.generate_badge("stars")
+
+
+def test_badge_batch_matches_single_badges_and_streams():
+    """Test that batch badge generation matches generate_badge and can stream to a writer"""
+    import io
+
+    single = GitHubStatsGenerator("user", "repo")
+    types = ["license", "stars", "downloads", "pr-welcome", "unknown"]
+    batch = GitHubStatsGenerator.generate_badge_batch(
+        ["user/repo", ("other", "proj")], types, styles=["flat", "social"]
+    )
+    expected = " ".join(b for b in (single.generate_badge(t, "social") for t in types) if b)
+    assert batch["user/repo"]["social"] == expected
+    assert "github/downloads/other/proj/total?style=flat)" in batch["other/proj"]["flat"]
+
+    repos = [f"owner{i}/repo{i}" for i in range(2000)]
+    styles = ["flat", "flat-square"]
+    stream = io.StringIO()
+    # A generator: streaming must work in one pass without building the result dict
+    assert GitHubStatsGenerator.generate_badge_batch((r for r in repos), types, styles, writer=stream) is None
+    returned = GitHubStatsGenerator.generate_badge_batch(repos, types, styles)
+    assert stream.getvalue() == "".join(f"<!-- {repo} [{style}] -->\n{returned[repo][style]}\n"
+                                        for repo in repos for style in styles)
+    assert stream.getvalue().count("<!-- owner") == 4000
@@ -0,0 +1,112 @@
+"""Tests for the repository content harvester"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.generators.content_harvester import (  # noqa: E402
+    HARVEST_CACHE, ContentHarvester, extract, leading_docstring,
+)
+from gitsage.generators.doc_pages import build_site  # noqa: E402
+
+CLI = '''#!/usr/bin/env python3
+"""
+Demo Tool
+=========
+Does demo things.
+"""
+import argparse
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the demo")
+    parser.add_argument("--fast", "-f", action="store_true", help="Go fast | skip checks")
+    parser.add_argument("--mode", choices=["a", "b"], default="a", help="Mode")
+'''
+
+
+def _make_repo(root: Path) -> Path:
+    (root / "docs" / "user-guides").mkdir(parents=True)
+    (root / "docs" / "intro.md").write_text("# Introduction\n\nHello.\n")
+    (root / "docs" / "user-guides" / "setup.md").write_text("Install it.\n")
+    (root / "examples").mkdir()
+    (root / "examples" / "basic_usage.py").write_text('"""Smallest example."""\nprint("hi")\n')
+    (root / "src" / "demo").mkdir(parents=True)
+    (root / "src" / "demo" / "__init__.py").write_text('"""Demo package."""\n')
+    (root / "src" / "demo" / "plain.py").write_text("x = 1\n")
+    (root / "demo-tool.py").write_text(CLI)
+    (root / "tests").mkdir()
+    (root / "tests" / "test_demo.py").write_text('"""Not harvested."""\n')
+    return root
+
+
+def test_extract_fragments():
+    """Test docstring, argparse and Markdown extraction"""
+    assert leading_docstring('# comment\n\n"""Title."""\nx = 1\n') == "Title."
+    assert leading_docstring("x = 1\n") == ""
+
+    module, cli = extract("demo-tool.py", "python", CLI.encode())
+    assert module["doc"].startswith("Demo Tool")
+    assert cli["description"] == "Run the demo"
+    assert [a["flags"] for a in cli["arguments"]] == [["--fast", "-f"], ["--mode"]]
+    assert cli["arguments"][1]["choices"] == ["a", "b"]
+
+    odd = 'import argparse\nargparse.ArgumentParser().add_argument("--n", type=int, default={[1]: 2})\n'
+    cli, = extract("odd.py", "python", odd.encode())
+    assert cli["arguments"][0]["default"] == "{[1]: 2}"
+
+    doc, = extract("docs/x.md", "doc", b"Intro\n\n# Real Title\n")
+    assert doc["title"] == "Real Title"
+
+
+def test_harvest_sections_and_cache(temp_dir):
+    """Test the mapping into sections and that only changed files are re-read"""
+    root = _make_repo(temp_dir)
+    harvester = ContentHarvester(str(root))
+    sections = harvester.sections()
+
+    pages = {s["title"]: [p["name"] for p in s["pages"]] for s in sections}
+    assert pages == {
+        "Guides": ["Introduction"],
+        "User Guides": ["Setup"],
+        "Command Line": ["demo-tool.py"],
+        "Modules": ["Scripts", "demo"],
+        "Examples": ["Basic Usage Example"],
+    }
+    cli_page = sections[2]["pages"][0]["markdown"]
+    assert "| `--fast`, `-f` | Go fast \\| skip checks |  |" in cli_page
+    assert "| `--mode` | Mode (choices: a, b) | `a` |" in cli_page
+    assert "## Demo Tool\n\n`demo-tool.py`\n\nDoes demo things." in sections[3]["pages"][0]["markdown"]
+    assert harvester.stats["harvested"] == 6
+    assert (root / HARVEST_CACHE).exists()
+
+    # Touched but unchanged files are answered by the hash, edited ones are re-read
+    os.utime(root / "docs" / "intro.md", ns=(1, 1))
+    (root / "docs" / "user-guides" / "setup.md").write_text("# Setup Guide\n")
+    rebuilt = ContentHarvester(str(root))
+    sections = rebuilt.sections()
+    assert rebuilt.stats["harvested"] == 1
+    assert rebuilt.stats["cached"] == 5
+    assert sections[1]["pages"][0]["name"] == "Setup Guide"
+
+    only_docs = ContentHarvester(str(root), modules=False, cli=False, cache_path=None).sections()
+    assert [s["title"] for s in only_docs] == ["Guides", "User Guides", "Examples"]
+
+
+def test_harvested_pages_fill_site(temp_dir):
+    """Test that a harvested page replaces the configured page of the same name"""
+    sections = ContentHarvester(str(_make_repo(temp_dir)), cache_path=None).sections()
+    config = {
+        "project": {"name": "Demo"},
+        "content": {"sections": [{"title": "Start", "pages": [{"name": "Introduction"}, {"name": "FAQ"}]}]},
+    }
+    site = build_site(config, harvested=sections)
+
+    assert [s.title for s in site.sections] == [
+        "Start", "User Guides", "Command Line", "Modules", "Examples"]
+    intro = site.sections[0].pages[0]
+    assert intro.body == "# Introduction\n\nHello.\n"
+    assert intro.depends["sources"] == {"docs/intro.md": sections[0]["pages"][0]["sources"]["docs/intro.md"]}
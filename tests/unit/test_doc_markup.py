@@ -0,0 +1,80 @@
+"""Tests for the documentation block model and its serializers"""
+
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.generators.doc_markup import parse_markdown, to_html, to_rst, to_storage  # noqa: E402
+
+PAGE = """# Guide 🚀
+
+Read **[Setup](setup)** and `run`now, or see [the site](https://example.com/?a=1&b=2).
+Second line of the paragraph.
+
+**Steps:**
+1. Install
+2. Configure
+
+| Name | Value |
+|------|-------|
+| *mode* | fast |
+
+```bash
+echo "]]>"
+```
+
+---
+"""
+
+
+def _titles(slug):
+    return {"setup": "Setup"}.get(slug)
+
+
+def test_parse_markdown_blocks():
+    """Test that headings, paragraphs, lists, tables and code fences are recognised"""
+    blocks = parse_markdown(PAGE)
+
+    assert [b.kind for b in blocks] == ["heading", "paragraph", "paragraph", "list", "table", "code", "rule"]
+    assert blocks[1].inline[1] == ("link", "Setup", "setup")
+    assert blocks[1].inline[-2][0] == "link" and "Second line" in blocks[1].inline[-1][1]
+    assert blocks[3].ordered and len(blocks[3].items) == 2
+    assert blocks[4].rows[1][0] == [("em", "mode", "")]
+    assert blocks[5].lang == "bash" and blocks[5].code == 'echo "]]>"'
+
+
+def test_rst_and_storage_output():
+    """Test reStructuredText and Confluence storage serialization of the same blocks"""
+    blocks = parse_markdown(PAGE + "\nSee [missing](nowhere).\n")
+
+    rst = to_rst(blocks, _titles)
+    assert "Guide 🚀\n========\n" in rst  # The emoji is two columns wide
+    assert ":doc:`Setup <setup>` and ``run``\\ now" in rst
+    assert "`the site <https://example.com/?a=1&b=2>`__" in rst
+    assert "#. Install\n#. Configure\n" in rst
+    assert ".. code-block:: bash\n\n   echo" in rst
+    assert "See missing." in rst
+
+    storage = to_storage(blocks, _titles)
+    ET.fromstring(f'<root xmlns:ac="urn:ac" xmlns:ri="urn:ri">{storage}</root>')
+    assert '<ri:page ri:content-title="Setup"/>' in storage
+    assert '<a href="https://example.com/?a=1&amp;b=2">' in storage
+    assert "<ol><li>Install</li>" in storage
+    assert "<![CDATA[echo \"]]]]><![CDATA[>\"]]>" in storage
+
+
+def test_link_targets_are_safe():
+    """Test that script URLs lose their link and that targets keep balanced parentheses"""
+    blocks = parse_markdown("[x](javascript:alert(1)) [d](DATA:text/html,x) "
+                            "[py](https://en.wikipedia.org/wiki/Python_(language)) [m](mailto:a@b.c) [r](../LICENSE)\n")
+    expected = ('x d <a href="https://en.wikipedia.org/wiki/Python_(language)">py</a> '
+                '<a href="mailto:a@b.c">m</a> <a href="../LICENSE">r</a>')
+
+    assert expected in to_html(blocks, _titles)
+    assert expected in to_storage(blocks, _titles)
+    rst = to_rst(blocks, _titles)
+    assert rst.startswith("x d `py <https://en.wikipedia.org/wiki/Python_(language)>`__")
+    assert "javascript" not in rst and "data:" not in rst.lower()
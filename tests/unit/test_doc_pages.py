@@ -0,0 +1,132 @@
+"""Tests for the render-once documentation page pipeline"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.generators import doc_pages  # noqa: E402
+from gitsage.generators.doc_pages import EMITTERS, build_site  # noqa: E402
+
+CONFIG = {
+    "project": {
+        "name": "Demo Tool",
+        "github_url": "https://github.com/octo/demo-tool",
+        "issues_url": "https://github.com/octo/demo-tool/issues",
+        "main_script": "demo.py",
+        "version": "1.2.0",
+    },
+    "content": {
+        "sections": [
+            {"title": "Getting Started", "icon": "[ROCKET]", "pages": [
+                {"name": "Home"},
+                {"name": "Quick Start", "template": "quickstart"},
+            ]},
+            {"title": "Guides", "pages": ["Advanced Usage"]},
+        ]
+    },
+}
+
+
+def test_pages_render_once_for_all_formats(monkeypatch):
+    """Test that page templates run once per page no matter how many formats are emitted"""
+    calls = []
+    render_page = doc_pages.render_page
+    monkeypatch.setattr(doc_pages, "render_page", lambda *args: calls.append(args[0]) or render_page(*args))
+
+    site = build_site(CONFIG)
+    outputs = {fmt: dict(emitter.emit(site)) for fmt, emitter in EMITTERS.items()}
+
+    assert calls == ["Home", "Quick Start", "Advanced Usage"]
+    # Only links to pages of the site differ between formats; Quick Start links to none
+    assert outputs["github-wiki"]["Quick-Start.md"] == outputs["gitbook"]["quick-start.md"]
+    assert "- [Quick Start](Quick-Start)" in outputs["github-wiki"]["Advanced-Usage.md"]
+    assert "- [Quick Start](quick-start.md)" in outputs["gitbook"]["advanced-usage.md"]
+    assert "cd demo-tool\npython demo.py" in outputs["gitbook"]["quick-start.md"]
+    assert "information about advanced usage" in outputs["github-wiki"]["Advanced-Usage.md"]
+
+
+def test_emitters_write_navigation():
+    """Test the GitHub Wiki sidebar and GitBook SUMMARY built from the shared site"""
+    site = build_site(CONFIG, api_reference="API-Reference")
+
+    wiki = dict(EMITTERS["github-wiki"].emit(site, skip=("Home.md",)))
+    assert "Home.md" not in wiki
+    sidebar = wiki["_Sidebar.md"]
+    assert "## [ROCKET] Getting Started\n\n- **[Home](Home)**\n- **[Quick Start](Quick-Start)**\n" in sidebar
+    assert "## 📄 Guides" in sidebar
+    assert "- **[API Reference](API-Reference)**" in sidebar
+    assert sidebar.endswith("*v1.2.0*\n")
+
+    assert EMITTERS["gitbook"].navigation_file == "SUMMARY.md"
+    summary = EMITTERS["gitbook"].navigation(site)
+    assert "## Guides\n\n* [Advanced Usage](advanced-usage.md)\n" in summary
+
+
+def test_sphinx_mkdocs_and_confluence_share_parsed_pages(monkeypatch):
+    """Test that the serialization-only formats parse each page once and cross-link pages"""
+    import xml.etree.ElementTree as ET
+
+    import yaml
+
+    parsed = []
+    parse_markdown = doc_pages.parse_markdown
+    monkeypatch.setattr(doc_pages, "parse_markdown", lambda text: parsed.append(text) or parse_markdown(text))
+
+    config = dict(CONFIG, formats={"confluence": {"space_key": "DEMO"}, "mkdocs": {"theme": "readthedocs"}})
+    site = build_site(config)
+    outputs = {fmt: dict(EMITTERS[fmt].emit(site)) for fmt in ("readthedocs", "confluence", "mkdocs")}
+    assert len(parsed) == 4  # Three pages and the landing page, shared by Sphinx and Confluence
+
+    rst = outputs["readthedocs"]
+    assert ":doc:`Quick Start <quick-start>`" in rst["docs/index.rst"]
+    assert ":caption: Guides\n\n   advanced-usage\n" in rst["docs/index.rst"]
+    assert {"docs/conf.py", ".readthedocs.yaml", "docs/quick-start.rst"} <= set(rst)
+
+    confluence = outputs["confluence"]
+    space = ET.fromstring(confluence["space.xml"].encode("utf-8"))
+    assert space.get("key") == "DEMO"
+    assert [p.get("title") for p in space.iter("page")][:3] == ["Documentation", "Getting Started", "Home"]
+    for name, content in confluence.items():
+        if name != "space.xml":
+            ET.fromstring(f'<root xmlns:ac="urn:ac" xmlns:ri="urn:ri">{content}</root>')
+
+    mkdocs = outputs["mkdocs"]
+    mkdocs_config = yaml.safe_load(mkdocs["mkdocs.yml"])
+    assert mkdocs_config["theme"] == {"name": "readthedocs"}
+    assert mkdocs_config["nav"][1] == {"Getting Started": [{"Home": "home.md"}, {"Quick Start": "quick-start.md"}]}
+    assert "- [Quick Start](quick-start.md)" in mkdocs["docs/index.md"]
+
+
+def test_sphinx_theme_is_a_module_name():
+    """Test that pip theme names are normalized and other strings never reach conf.py"""
+    for theme, module in (("furo", "furo"), ("sphinx-rtd-theme", "sphinx_rtd_theme"),
+                          ("os; import shutil", "sphinx_rtd_theme"), ("x\n--index-url evil", "sphinx_rtd_theme")):
+        site = build_site(dict(CONFIG, formats={"readthedocs": {"theme": theme}}))
+        outputs = dict(EMITTERS["readthedocs"].emit(site))
+        compile(outputs["docs/conf.py"], "conf.py", "exec")
+        assert f"    import {module}  # noqa: F401\n    html_theme = '{module}'" in outputs["docs/conf.py"]
+        assert outputs["docs/requirements.txt"] == f"sphinx\n{module.replace('_', '-')}\n"
+
+
+def test_emitter_must_name_pages_and_navigation():
+    """Test that an emitter missing page_file or navigation fails when created, not mid-build"""
+    class Partial(doc_pages.Emitter):
+        def page_file(self, page):
+            return f"{page.slug}.txt"
+
+    with pytest.raises(TypeError, match="navigation"):
+        Partial()
+
+
+def test_prune_links_drops_links_to_undefined_pages():
+    """Test that boilerplate links to pages outside the site are removed with the headings they leave empty"""
+    markdown = ("# Title\n\n## Next\n\n- [Gone](gone) - away\n- [Here](here)\n\n## Help\n\n**[Gone](gone)**\n\n"
+                "---\n\nSee [Gone](gone#x) or [Here](here).\n\n```\n[Gone](gone)\n```\n")
+    pruned = doc_pages.prune_links(markdown, {"here": True}.get)
+    assert pruned == ("# Title\n\n## Next\n\n- [Here](here)\n\n---\n\nSee Gone or [Here](here).\n\n"
+                      "```\n[Gone](gone)\n```\n")
+    assert doc_pages.prune_links(markdown, lambda slug: True) is markdown
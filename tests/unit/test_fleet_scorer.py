@@ -0,0 +1,69 @@
+"""Tests for vectorized fleet scoring"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+
+from gitsage.utils import BeautificationScorer  # noqa: E402
+from gitsage.utils.fleet_scorer import FleetScorer  # noqa: E402
+
+
+def _health_result(readme=15, license_score=10, actions=0):
+    """Build a minimal check_all()-shaped result"""
+    return {
+        "max_score": 100,
+        "checks": {
+            "README.md": {"score": readme, "max_score": 15},
+            "LICENSE": {"score": license_score, "max_score": 10},
+            "GitHub Actions": {"score": actions, "max_score": 10},
+        },
+    }
+
+
+def test_category_scores_match_scalar_scorer(temp_dir):
+    """Test that vectorized category percentages equal BeautificationScorer's"""
+    results = [_health_result(), _health_result(readme=5, license_score=0, actions=10)]
+    fleet = FleetScorer()
+    scored = fleet.score(fleet.pack(results, repo_ids=["a", "b"]))
+
+    scalar = BeautificationScorer(str(temp_dir))
+    for row, result in enumerate(results):
+        expected = scalar._calculate_category_scores(result["checks"])
+        for j, cat_id in enumerate(fleet.category_ids):
+            assert scored["category_percentage"][row, j] == pytest.approx(
+                expected[cat_id]["percentage"]
+            )
+
+
+def test_levels_and_milestones():
+    """Test level assignment and next-milestone gap"""
+    fleet = FleetScorer()
+    packed = fleet.pack([_health_result(readme=15, license_score=10, actions=10)])
+    scored = fleet.score(packed)
+    report = fleet.describe(scored, 0)
+
+    assert report["percentage"] == pytest.approx(35.0)
+    assert report["level"] == "intermediate"
+    assert report["next_milestone"]["level"] == "intermediate"
+    assert report["next_milestone"]["points_needed"] == "24.0"
+
+
+def test_rank_and_round_trip(temp_dir):
+    """Test ranking order and stored matrix reload"""
+    fleet = FleetScorer()
+    packed = fleet.pack(
+        [_health_result(readme=0), _health_result(), _health_result(actions=10)],
+        repo_ids=["low", "mid", "high"],
+    )
+    path = fleet.save(packed, temp_dir / "fleet.npz")
+    scored = fleet.score(fleet.load(path))
+
+    ranked = fleet.rank(scored, top=2)
+    assert [entry["repo"] for entry in ranked] == ["high", "mid"]
+    assert ranked[0]["percentile"] == pytest.approx(100.0)
@@ -0,0 +1,84 @@
+"""Tests for cached git remote introspection"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.utils import GitHubStatsGenerator  # noqa: E402
+from gitsage.utils import git_remote  # noqa: E402
+
+CONFIG = """[core]
+\trepositoryformatversion = 0
+[remote "origin"]
+\turl = git@github.com:octo/hello-world.git
+\tfetch = +refs/heads/*:refs/remotes/origin/*
+[remote "upstream"]
+\turl = https://github.example.com/corp/platform
+[remote "mirror"]
+\turl = gh:octo/mirror
+[url "https://github.com/"]
+\tinsteadOf = gh:
+"""
+
+
+@pytest.fixture
+def repo(temp_dir, monkeypatch):
+    """A fake working tree with a .git/config"""
+    (temp_dir / ".git").mkdir()
+    (temp_dir / ".git" / "config").write_text(CONFIG)
+    monkeypatch.setenv("GITSAGE_GITHUB_HOSTS", "github.example.com")
+    git_remote.clear_cache()
+    yield temp_dir
+    git_remote.clear_cache()
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://github.com/user/repo.git", ("github.com", "user", "repo")),
+        ("git@github.com:user/repo.git", ("github.com", "user", "repo")),
+        ("ssh://git@github.com:22/user/repo", ("github.com", "user", "repo")),
+        ("not a url", None),
+    ],
+)
+def test_parse_remote_url(url, expected):
+    """Test common remote URL forms"""
+    assert git_remote.parse_remote_url(url) == expected
+
+
+def test_multiple_remotes_and_enterprise_hosts(repo):
+    """Test that every remote is parsed, including insteadOf and GHE hosts"""
+    remotes = git_remote.get_remotes(str(repo))
+
+    assert remotes["origin"].owner == "octo"
+    assert remotes["upstream"].host == "github.example.com"
+    assert remotes["upstream"].is_github
+    assert remotes["mirror"].url == "gh:octo/mirror"
+    assert remotes["mirror"].repo == "mirror"
+
+
+def test_cache_reused_until_config_changes(repo, monkeypatch):
+    """Test that config is parsed once and re-read after modification"""
+    first = git_remote.get_remotes(str(repo))
+    assert git_remote.get_remotes(str(repo)) is first
+
+    config = repo / ".git" / "config"
+    config.write_text(CONFIG.replace("hello-world", "renamed"))
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert git_remote.get_remotes(str(repo))["origin"].repo == "renamed"
+
+
+def test_stats_generator_uses_remote_without_subprocess(repo, monkeypatch):
+    """Test that GitHubStatsGenerator detects owner/repo without spawning git"""
+    import subprocess
+
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: pytest.fail("spawned subprocess"))
+    stats = GitHubStatsGenerator(repo_path=str(repo))
+    assert (stats.username, stats.repo) == ("octo", "hello-world")
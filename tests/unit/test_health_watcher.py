@@ -0,0 +1,124 @@
+"""Tests for incremental health re-scoring"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.utils.health_watcher import HealthWatcher  # noqa: E402
+
+
+def test_changed_paths_map_to_affected_checks(temp_dir):
+    """Test that only checks reading a changed path are selected"""
+    watcher = HealthWatcher(str(temp_dir))
+    assert [c.id for c in watcher.checks_for_paths(["README.md"])] == ["readme"]
+    assert [c.id for c in watcher.checks_for_paths([".github/workflows/ci.yml"])] == [
+        "github_actions"
+    ]
+    assert [c.id for c in watcher.checks_for_paths([".github"])] == ["github_actions"]
+    assert watcher.checks_for_paths(["src/app.py"]) == []
+
+
+def test_rescore_only_runs_affected_checks(temp_dir, monkeypatch):
+    """Test that a README save re-runs the README check and reports a delta"""
+    watcher = HealthWatcher(str(temp_dir))
+    watcher.snapshot()
+
+    def fail():
+        raise AssertionError("LICENSE check should not re-run")
+
+    monkeypatch.setattr(watcher.checker, "_check_license", fail)
+    (temp_dir / "README.md").write_text("# Title\n")
+    delta = watcher.rescore(["README.md"])
+
+    assert delta["changed_checks"]["README.md"]["old_score"] == 0
+    assert delta["score_delta"] == delta["changed_checks"]["README.md"]["new_score"]
+    assert watcher.rescore(["README.md"]) is None
+
+
+def test_polling_events_are_debounced(temp_dir):
+    """Test that repeated saves produce a single delta via the polling backend"""
+    watcher = HealthWatcher(str(temp_dir), debounce=0.2, poll_interval=0.05, use_polling=True)
+    events = watcher.events()
+    assert next(events)["type"] == "snapshot"
+
+    def edit():
+        for i in range(3):
+            (temp_dir / "README.md").write_text(f"# Title {i}\n")
+
+    threading.Timer(0.1, edit).start()
+    delta = next(events)
+    watcher.stop()
+    events.close()
+
+    assert delta["type"] == "delta"
+    assert list(delta["changed_checks"]) == ["README.md"]
+
+
+def test_watch_endpoint_rejects_paths_and_caps_watchers(temp_dir, monkeypatch):
+    """Test that /api/health/watch only watches inside the cwd and limits running watchers"""
+    pytest.importorskip("flask_cors")
+    from gitsage.web import create_app
+
+    (temp_dir / "docs").mkdir()
+    monkeypatch.chdir(temp_dir)
+    client = create_app({"TESTING": True, "HEALTH_WATCH_LIMIT": 1}).test_client()
+
+    assert client.get("/api/health/watch?path=..").status_code == 400
+    assert client.get("/api/health/watch?path=/etc").status_code == 400
+    assert client.get("/api/health/watch?path=missing").status_code == 404
+
+    first = client.get("/api/health/watch?path=docs", buffered=False)
+    assert first.status_code == 200
+    assert client.get("/api/health/watch").status_code == 503
+    first.close()
+    second = client.get("/api/health/watch", buffered=False)
+    assert second.status_code == 200
+    second.close()
+
+
+def test_idle_watch_stream_releases_slot_on_disconnect(temp_dir, monkeypatch):
+    """Test that keepalives let the server notice a client gone from an idle stream and free its slot"""
+    pytest.importorskip("flask_cors")
+    import socket
+    import time
+
+    from werkzeug.serving import make_server
+
+    from gitsage.web import create_app
+
+    monkeypatch.chdir(temp_dir)
+    app = create_app({"TESTING": True, "HEALTH_WATCH_LIMIT": 1, "HEALTH_WATCH_POLL_INTERVAL": 0.05})
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    request = b"GET /api/health/watch HTTP/1.1\r\nHost: localhost\r\n\r\n"
+
+    def connect(until: bytes = b"\r\n\r\n"):
+        client = socket.create_connection(("127.0.0.1", server.server_port), timeout=5)
+        client.sendall(request)
+        received = b""
+        while until not in received:
+            received += client.recv(4096)
+        return received.split(b" ", 2)[1], client
+
+    def status() -> bytes:
+        code, client = connect()
+        client.close()
+        return code
+
+    try:
+        code, idle = connect(until=b": keepalive")  # Snapshot sent, then only keepalives: the repo is idle
+        assert code == b"200"
+        assert status() == b"503"
+        idle.close()
+
+        deadline = time.monotonic() + 5
+        while status() != b"200":
+            assert time.monotonic() < deadline, "the disconnected stream kept its watcher slot"
+            time.sleep(0.05)
+    finally:
+        server.shutdown()
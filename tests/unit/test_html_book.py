@@ -0,0 +1,86 @@
+"""Tests for the offline HTML site and print book"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.generators.doc_markup import parse_markdown, to_html  # noqa: E402
+from gitsage.generators.doc_pages import EMITTERS, build_site  # noqa: E402
+from gitsage.generators.html_book import BookRenderer, book_chunks, print_fragment  # noqa: E402
+from gitsage.generators.link_graph import check_links  # noqa: E402
+
+
+def _site(faq: str = "Ask away."):
+    pages = [
+        {"name": "Guide", "markdown": "# Guide\n\n## Setup\n\n## Setup\n\nSee [FAQ](faq#ask) and [Gone](gone).\n",
+         "sources": {}},
+        {"name": "FAQ", "markdown": f"# FAQ\n\n## Ask\n\n{faq} `<b>\"x\"</b>`\n", "sources": {}},
+    ]
+    config = {"project": {"name": "Demo", "version": "1.0"}, "content": {"sections": []}}
+    return build_site(config, harvested=[{"title": "Docs", "pages": pages}])
+
+
+def test_to_html_and_print_fragment():
+    """Test heading ids, link resolution, escaping and the book's id/link rewriting"""
+    fragment = to_html(parse_markdown("# Guide\n\n## Setup\n\n## Setup\n\n[FAQ](faq#ask) [Gone](gone) `\"q\"`\n"),
+                       {"faq": "FAQ"}.get)
+    assert '<h2 id="setup">Setup</h2>\n<h2 id="setup-1">Setup</h2>' in fragment
+    assert '<a href="faq.html#ask">FAQ</a> Gone <code>&quot;q&quot;</code>' in fragment
+
+    book = print_fragment("guide", fragment)
+    assert '<h2 id="guide--setup-1">' in book
+    assert '<a href="#faq--ask">FAQ</a>' in book
+
+
+def test_renderer_cache_and_book(temp_dir):
+    """Test that only edited pages are converted again and that the book holds every page"""
+    cache = temp_dir / "cache"
+    site = _site()
+    renderer = BookRenderer(site, cache, jobs=1)
+    renderer.prefetch(site.pages)
+    assert renderer.stats == {"converted": 2, "cached": 0}
+
+    book = "".join(book_chunks(site, renderer, {"format": "Letter", "toc": True}))
+    assert "size: Letter;" in book
+    assert '<li><a href="#faq">FAQ</a></li>' in book
+    assert '<section class="page" id="guide">' in book and '<section class="page" id="faq">' in book
+    assert "&lt;b&gt;&quot;x&quot;&lt;/b&gt;" in book
+
+    edited = _site("Ask more.")
+    again = BookRenderer(edited, cache, jobs=1)
+    again.prefetch(edited.pages)
+    assert again.stats == {"converted": 1, "cached": 1}
+    assert again.prune() == 1
+    assert len(list(cache.iterdir())) == 2
+
+
+def test_html_site_links_resolve(temp_dir):
+    """Test that the emitted site and book pass the link check"""
+    site = _site()
+    out = temp_dir / "pdf"
+    for filename, content in EMITTERS["pdf"].emit(site):
+        (out / filename).parent.mkdir(parents=True, exist_ok=True)
+        (out / filename).write_text(content, encoding="utf-8")
+    (out / "book.html").write_text("".join(book_chunks(site, BookRenderer(site, None))), encoding="utf-8")
+
+    assert sorted(p.name for p in (out / "site").iterdir()) == ["faq.html", "guide.html", "index.html", "style.css"]
+    assert "<title>Guide - Demo</title>" in (out / "site" / "guide.html").read_text()
+    assert check_links(str(out), "pdf") == []
+
+    (out / "site" / "faq.html").unlink()
+    assert {problem.target for problem in check_links(str(out), "pdf")} == {"faq.html", "faq.html#ask"}
+
+
+def test_prefetch_on_spawned_workers_matches_serial(monkeypatch):
+    """Test that cache misses converted on (spawned) worker processes equal in-process conversion"""
+    from gitsage.generators import html_book
+
+    monkeypatch.setattr(html_book, "PARALLEL_THRESHOLD", 1)
+    site = _site()
+    pooled = BookRenderer(site, None, jobs=2)
+    pooled.prefetch(site.pages)
+    serial = BookRenderer(site, None, jobs=1)
+    assert [pooled.fragment(page) for page in site.pages] == [serial.fragment(page) for page in site.pages]
+    assert pooled.stats["converted"] == 2
@@ -0,0 +1,116 @@
+"""Tests for the concurrent link health checker"""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.utils import LinkChecker, extract_links  # noqa: E402
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Local stand-in for GitHub, shields.io and friends"""
+
+    protocol_version = "HTTP/1.1"
+    requests = []
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self, with_body):
+        type(self).requests.append((self.command, self.path))
+        if self.path.startswith("/redirect"):
+            self.send_response(302)
+            self.send_header("Location", "/ok")
+            body = b""
+        elif self.path.startswith("/missing"):
+            self.send_response(404)
+            body = b"not found"
+        elif self.path.startswith("/github/v/release"):
+            self.send_response(200)
+            body = b"<svg><title>release: no releases or repo not found</title></svg>"
+        else:
+            self.send_response(200)
+            body = b"<svg><title>license: MIT</title></svg>"
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if with_body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond(True)
+
+    def do_HEAD(self):
+        self._respond(False)
+
+
+@pytest.fixture
+def stub_server():
+    _StubHandler.requests = []
+    _StubHandler.connections = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_extract_links_handles_nested_badges():
+    """Test that linked badges yield both the image and the link"""
+    text = (
+        "[![CI](https://github.com/u/r/actions/workflows/ci.yml/badge.svg)](https://github.com/u/r/actions)\n"
+        '<img src="https://img.shields.io/x.svg"> [docs](https://example.com/docs "Docs")\n'
+        "[ref]: https://example.com/ref\n"
+        "![CI](https://github.com/u/r/actions/workflows/ci.yml/badge.svg)"
+    )
+    assert extract_links(text) == [
+        ("image", "https://github.com/u/r/actions/workflows/ci.yml/badge.svg"),
+        ("link", "https://github.com/u/r/actions"),
+        ("image", "https://img.shields.io/x.svg"),
+        ("link", "https://example.com/docs"),
+        ("link", "https://example.com/ref"),
+    ]
+
+
+def test_verify_reports_dead_links_against_stub(stub_server, temp_dir):
+    """Test dead-link detection, shields error badges, redirects and connection reuse"""
+    markdown = (
+        f"![License](https://img.shields.io/github/license/u/r) "
+        f"![Version](https://img.shields.io/github/v/release/u/r)\n"
+        f"[ok]({stub_server}/ok) [moved]({stub_server}/redirect) [gone]({stub_server}/missing)\n"
+    )
+    checker = LinkChecker(rate=0, host_map={"img.shields.io": stub_server},
+                          cache_file=str(temp_dir / "links.json"))
+    report = checker.verify_markdown(markdown)
+
+    assert report["checked"] == 5
+    dead = {link["url"]: link for link in report["dead"]}
+    assert set(dead) == {"https://img.shields.io/github/v/release/u/r", f"{stub_server}/missing"}
+    assert dead[f"{stub_server}/missing"]["status"] == 404
+    assert checker.connections_opened < checker.requests_made
+
+    # Second run is served from the persisted TTL cache without touching the network
+    requests_before = len(_StubHandler.requests)
+    again = LinkChecker(host_map={"img.shields.io": stub_server},
+                        cache_file=str(temp_dir / "links.json")).verify_markdown(markdown)
+    assert again["cached"] == 5 and len(again["dead"]) == 2
+    assert len(_StubHandler.requests) == requests_before
+
+
+def test_network_errors_are_reported_not_cached():
+    """Test that unreachable hosts are dead but not cached"""
+    checker = LinkChecker(timeout=2)
+    [result] = checker.check_sync(["http://127.0.0.1:9/"])
+    assert not result.ok and result.status is None and result.error
+    assert checker._cached("http://127.0.0.1:9/") is None
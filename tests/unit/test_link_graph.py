@@ -0,0 +1,66 @@
+"""Tests for the post-build documentation link checker"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.generators.link_graph import check_links, github_anchor, mkdocs_anchor  # noqa: E402
+
+
+def _write(root: Path, files: dict) -> Path:
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return root
+
+
+def test_anchor_styles():
+    """Test GitHub and Python-Markdown heading anchors"""
+    assert github_anchor("Secrets & Security 🔒") == "secrets--security-"
+    assert github_anchor("Use `--jobs` [flag](x)") == "use---jobs-flag"
+    assert mkdocs_anchor("Secrets & Security") == "secrets-security"
+    assert mkdocs_anchor("Café - Menu") == "cafe-menu"
+
+
+def test_wiki_links_and_anchors(temp_dir):
+    """Test case-sensitive wiki page links, duplicate headings and code that is not checked"""
+    root = _write(temp_dir, {
+        "Home.md": "# Home\n\n[Setup](Quick-Start#setup-1) [Missing](quick-start) [Top](#home)\n"
+                   "`[code](Nowhere)`\n```\n[fenced](Nowhere)\n```\n[Bad anchor](Quick-Start#nope)\n",
+        "Quick-Start.md": "# Quick Start\n\n## Setup\n\n## Setup\n\n![logo](images/logo.png)\n"
+                          "[Site](https://example.com) [ref]: Home\n",
+    })
+    broken = [(b.source, b.line, b.target, b.reason) for b in check_links(str(root), "github-wiki")]
+    assert broken == [
+        ("Home.md", 3, "quick-start", "missing page"),
+        ("Home.md", 8, "Quick-Start#nope", "missing anchor"),
+        ("Quick-Start.md", 7, "images/logo.png", "missing file"),
+    ]
+
+
+def test_relative_rst_and_confluence_links(temp_dir):
+    """Test relative Markdown paths, Sphinx documents and Confluence page titles"""
+    md = _write(temp_dir / "mkdocs", {
+        "docs/index.md": "# Docs\n\n[Guide](guide/intro.md#secrets-security) [Gone](gone.md)\n",
+        "docs/guide/intro.md": "# Secrets & Security\n\n[Back](../index.md) [Folder](.)\n",
+    })
+    assert [(b.target, b.reason) for b in check_links(str(md), "mkdocs")] == [
+        ("gone.md", "missing page"), (".", "missing file")]
+
+    rst = _write(temp_dir / "rtd", {
+        "docs/index.rst": "Docs\n====\n\n.. toctree::\n   :hidden:\n\n   guide\n   missing\n\nSee :doc:`guide`.\n",
+        "docs/guide.rst": "Guide\n=====\n\n:doc:`Home <index>` and :doc:`Old <old>`\n",
+    })
+    assert [(b.source, b.target) for b in check_links(str(rst), "readthedocs")] == [
+        ("docs/guide.rst", "old"), ("docs/index.rst", "missing")]
+
+    storage = _write(temp_dir / "confluence", {
+        "space.xml": '<space>\n  <page title="Home" file="home.xml"/>\n  <page title="FAQ" file="faq.xml"/>\n</space>\n',
+        "home.xml": '<ac:link><ri:page ri:content-title="FAQ"/></ac:link>'
+                    '<ac:link><ri:page ri:content-title="Old"/></ac:link>\n',
+    })
+    assert [(b.target, b.reason) for b in check_links(str(storage), "confluence")] == [
+        ("faq.xml", "missing file"), ("Old", "missing page")]
@@ -0,0 +1,45 @@
+"""Tests for the compiled README template engine"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import gitsage  # noqa: E402
+from gitsage.generators import available_templates, compile_template, render_template  # noqa: E402
+from gitsage.generators.readme_engine import TEMPLATE_DIR, load_template, template_path  # noqa: E402
+
+CONFIG = {"project": {"name": "Demo", "tagline": "Does things", "github_username": "octo",
+                      "repo_name": "demo-repo", "license": "MIT", "version": "2.0.0"}}
+
+
+def test_compile_template_only_fills_known_placeholders():
+    """Test that code braces and unknown placeholders survive rendering"""
+    render = compile_template("# {PROJECT_NAME}\nconst x = { a: 1 };\n{ClassName} {project-name}")
+    output = render({"name": "Demo", "slug": "demo-repo"})
+    assert output == "# Demo\nconst x = { a: 1 };\n{ClassName} demo-repo"
+
+
+def test_template_choices_map_to_library_files():
+    """Test that --template choices resolve to templates/readme files"""
+    assert template_path("library").name == "python-library.md"
+    assert template_path("web-app").name == "web-application.md"
+    assert template_path("game") is None
+    assert render_template("game", CONFIG) is None
+
+
+def test_render_template_is_cached_and_filled():
+    """Test that templates compile once and render config values"""
+    assert load_template("cli-tool") is load_template("cli-tool")
+    output = render_template("cli-tool", CONFIG)
+    assert output.startswith("# Demo\n\n> Does things")
+    assert "https://github.com/octo/demo-repo" in output
+    assert "{PROJECT_NAME}" not in output and "{REPO_URL}" not in output
+
+
+def test_library_ships_inside_the_package():
+    """Test that the templates are package data, not a source-checkout directory"""
+    package = Path(gitsage.__file__).resolve().parent
+    assert TEMPLATE_DIR.resolve() == package / "templates" / "readme"
+    assert {"cli-tool", "python-library", "web-application"} <= set(available_templates())
@@ -101,3 +101,98 @@ def test_yaml_config_validity(temp_dir, sample_readme_config):
         loaded = yaml.safe_load(f)
 
     assert loaded == sample_readme_config
+
+
+def _load_readme_generator():
+    """Import readme-generator.py as a module"""
+    import importlib.util
+
+    path = Path(__file__).parent.parent.parent / "readme-generator.py"
+    spec = importlib.util.spec_from_file_location("readme_generator", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_batch_generation_skips_unchanged(temp_dir):
+    """Test that batch mode renders every repo and only rewrites changed READMEs"""
+    module = _load_readme_generator()
+    for name in ("app", "lib"):
+        (temp_dir / name).mkdir()
+        module.ReadmeGenerator(str(temp_dir / name / "readme-config.yaml"))
+    manifest = temp_dir / "manifest.yaml"
+    manifest.write_text(yaml.dump({
+        "defaults": {"project": {"author": "Batch Author"}},
+        "repos": [{"path": "app"}, {"path": "lib"}, {"path": "missing"}],
+    }))
+
+    results = module.run_batch(str(manifest), jobs=1)
+    assert [r["status"] for r in results] == ["written", "written", "error"]
+    assert all(r["seconds"] >= 0 for r in results)
+    readme = (temp_dir / "app" / "README.md").read_text()
+    assert "My Awesome Project" in readme
+
+    mtime = (temp_dir / "app" / "README.md").stat().st_mtime_ns
+    assert [r["status"] for r in module.run_batch(str(manifest), jobs=1)][:2] == ["unchanged", "unchanged"]
+    assert (temp_dir / "app" / "README.md").stat().st_mtime_ns == mtime
+
+
+def test_generate_updates_only_changed_sections(temp_dir, monkeypatch):
+    """Test that regenerating re-renders changed sections and keeps hand-written text"""
+    module = _load_readme_generator()
+    monkeypatch.chdir(temp_dir)
+    generator = module.ReadmeGenerator(str(temp_dir / "readme-config.yaml"))
+    generator.generate("README.md")
+
+    readme = Path("README.md").read_text()
+    notes = "".join(f"Hand-written line {i}\n" for i in range(5000))
+    readme = readme.replace("<!-- gitsage:begin features", notes + "<!-- gitsage:begin features")
+    Path("README.md").write_text(readme)
+
+    rendered = []
+    original = generator.generate_license
+    monkeypatch.setattr(generator, "generate_features", lambda: rendered.append("features") or "")
+    monkeypatch.setattr(generator, "generate_license", lambda: rendered.append("license") or original())
+    generator.config["project"]["license"] = "Apache-2.0"
+    generator.generate("README.md")
+
+    updated = Path("README.md").read_text()
+    assert rendered == ["license"]
+    assert notes in updated
+    assert "Apache-2.0 License" in updated
+    assert updated.replace("Apache-2.0", "MIT").count("\n") == readme.count("\n")
+
+
+def test_stream_matches_buffered_output_with_flat_memory(temp_dir, monkeypatch):
+    """Test that streamed READMEs equal buffered ones and memory does not grow with size"""
+    import tracemalloc
+
+    module = _load_readme_generator()
+    monkeypatch.chdir(temp_dir)
+    generator = module.ReadmeGenerator(str(temp_dir / "readme-config.yaml"))
+    code = "print('x')\n" * 200
+    generator.config["usage_examples"] = [
+        {"title": f"Example {i}", "code": code, "language": "python"} for i in range(2000)
+    ]
+
+    generator.generate("buffered.md")
+    tracemalloc.start()
+    stats = generator.stream("streamed.md")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    streamed = Path("streamed.md").read_text()
+    assert streamed == Path("buffered.md").read_text()
+    assert stats["written"] is True
+    assert stats["characters"] == len(streamed)
+    assert stats["lines"] == streamed.count("\n")
+    assert len(streamed) > 4_000_000
+    assert peak < len(streamed) // 4
+
+    # Merging into an existing marked README keeps hand-written text and skips the rewrite
+    Path("streamed.md").write_text(streamed + "Hand-written footer\n")
+    assert generator.stream("streamed.md")["written"] is False
+    generator.config["project"]["license"] = "Apache-2.0"
+    stats = generator.stream("streamed.md")
+    assert stats["merge"].updated == ["header", "license"]
+    assert Path("streamed.md").read_text().endswith("Hand-written footer\n")
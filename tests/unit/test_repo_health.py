@@ -0,0 +1,72 @@
+"""Tests for the health check registry and scheduler"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.utils import CHECK_REGISTRY, BeautificationScorer, RepositoryHealthChecker  # noqa: E402
+
+
+def test_registry_covers_scorer_categories():
+    """Test that every category check name is declared in the registry"""
+    registered = {check.name: check.category for check in CHECK_REGISTRY}
+    for cat_id, cat_info in BeautificationScorer.CATEGORIES.items():
+        for check_name in cat_info["checks"]:
+            assert registered[check_name] == cat_id
+
+
+def test_schedule_runs_cheap_checks_first(temp_dir):
+    """Test that local checks are scheduled before remote-metadata checks"""
+    checker = RepositoryHealthChecker(str(temp_dir))
+    costs = [check.cost for check in checker.schedule()]
+    assert costs == sorted(costs, key=["local", "git", "remote"].index)
+
+
+def test_category_subset_only_runs_requested_checks(temp_dir, monkeypatch):
+    """Test that requesting only security skips every other check"""
+    (temp_dir / "SECURITY.md").write_text("# Security\n")
+    checker = RepositoryHealthChecker(str(temp_dir))
+
+    def fail():
+        raise AssertionError("README check should not run")
+
+    monkeypatch.setattr(checker, "_check_readme", fail)
+    results = checker.check_all(categories=["security"])
+
+    assert set(results["checks"]) == {".gitignore", "SECURITY.md"}
+    assert results["overall_score"] == 5
+    assert results["max_score"] == 15
+    assert checker.remote_metadata is None
+
+
+def test_full_run_keeps_registry_order(temp_dir):
+    """Test that a full run reports checks in registry order"""
+    results = RepositoryHealthChecker(str(temp_dir)).check_all()
+    assert list(results["checks"]) == [check.name for check in CHECK_REGISTRY]
+    assert results["max_score"] == 100
+
+
+def test_disabled_categories_are_skipped(temp_dir):
+    """Test that disabled categories are neither checked nor scored"""
+    scorer = BeautificationScorer(str(temp_dir), disabled_categories=["engagement"])
+    results = scorer.calculate_score()
+    assert "engagement" not in results["category_scores"]
+
+
+def test_remote_checks_tell_missing_metadata_from_disabled(temp_dir):
+    """Test that fetched metadata saying disabled or empty scores zero instead of unknown"""
+    checker = RepositoryHealthChecker(str(temp_dir))
+    checker.remote_metadata = {}
+    assert (checker._check_wiki_enabled()["status"], checker._check_wiki_enabled()["score"]) == ("unknown", 3)
+    assert checker._check_topics()["status"] == "unknown"
+
+    checker.remote_metadata = {"hasWikiEnabled": False, "description": "", "repositoryTopics": None}
+    wiki = checker._check_wiki_enabled()
+    assert (wiki["status"], wiki["score"]) == ("missing", 0)
+    assert checker._check_repo_description()["status"] == "missing"
+    assert checker._check_topics()["status"] == "missing"
+
+    checker.remote_metadata = {"hasWikiEnabled": True}
+    assert checker._check_wiki_enabled()["score"] == 5
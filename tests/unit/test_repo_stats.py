@@ -0,0 +1,62 @@
+"""Tests for the local repository statistics engine"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.utils import GitHubStatsGenerator  # noqa: E402
+from gitsage.utils.repo_stats import RepoStatsEngine  # noqa: E402
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def git_repo(temp_dir):
+    """A small git repository with two authors"""
+    _git(temp_dir, "init", "-q")
+    (temp_dir / "app.py").write_text("print('hi')\n" * 10)
+    (temp_dir / "run.sh").write_text("echo hi\n")
+    _git(temp_dir, "add", ".")
+    _git(temp_dir, "-c", "user.name=Ada", "-c", "user.email=ada@example.com", "commit", "-qm", "one")
+    (temp_dir / "app.py").write_text("print('hello')\n")
+    _git(temp_dir, "-c", "user.name=Bob", "-c", "user.email=bob@example.com", "commit", "-qam", "two")
+    return temp_dir
+
+
+def test_compute_stats_from_git(git_repo):
+    """Test contributors, languages and activity computed from history"""
+    stats = RepoStatsEngine(str(git_repo)).compute()
+
+    assert stats["total_commits"] == 2
+    assert {c["name"] for c in stats["contributors"]} == {"Ada", "Bob"}
+    assert list(stats["languages"]) == ["Python", "Shell"]
+    assert stats["activity"][-1] == 2
+
+
+def test_render_is_cached_by_head(git_repo, monkeypatch):
+    """Test that an unchanged HEAD reuses rendered cards without recomputing"""
+    engine = RepoStatsEngine(str(git_repo))
+    first = engine.render()
+    assert not first["cached"]
+    assert all(path.read_text().startswith("<svg") for path in first["cards"].values())
+
+    monkeypatch.setattr(engine, "compute", lambda head=None: pytest.fail("recomputed"))
+    assert engine.render()["cached"]
+
+
+def test_stats_generator_embeds_local_cards(git_repo):
+    """Test that stats sections link local SVGs instead of remote services"""
+    stats = GitHubStatsGenerator("user", "repo", repo_path=str(git_repo),
+                                 stats_dir=str(git_repo / "assets" / "stats"))
+    section = stats.generate_stats_section() + stats.generate_language_stats_card()
+
+    assert "assets/stats/activity.svg" in section
+    assert "assets/stats/languages.svg" in section
+    assert "vercel.app" not in section and "shields.io" not in section
@@ -0,0 +1,81 @@
+"""Tests for the documentation search index"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.generators.doc_pages import build_site  # noqa: E402
+from gitsage.generators.search_index import (  # noqa: E402
+    SEARCH_INDEX, SearchIndex, build_index, site_documents, tokenize,
+)
+
+PAGES = [
+    ("quick-start", "Quick Start", "Getting Started", "Install the tool, then generate a README."),
+    ("write-queue", "Write Queue", "Internals", "Pages go to a queue; the write queue batches writes."),
+    ("deployment", "Deployment", "Guides", "Deploy the wiki. Queue writes are flushed first."),
+]
+
+
+@pytest.fixture
+def index(temp_dir):
+    path = temp_dir / SEARCH_INDEX
+    path.write_bytes(build_index(PAGES))
+    with SearchIndex(str(path)) as search_index:
+        yield search_index
+
+
+def test_tokenize():
+    """Test that tokens are lower-cased words and overlong runs are dropped"""
+    assert tokenize("Write-Queue, wörld_1! " + "x" * 80) == ["write", "queue", "wörld_1"]
+
+
+def test_search_ranks_and_filters(index):
+    """Test AND semantics, ranking, phrases and prefix matching"""
+    assert index.documents == 3
+    assert [r["slug"] for r in index.search("queue")] == ["write-queue", "deployment"]
+    assert [r["slug"] for r in index.search("queue deploy")] == ["deployment"]
+    assert [r["slug"] for r in index.search('"write queue"')] == ["write-queue"]
+    assert index.search('"queue write"') == []
+    assert [r["slug"] for r in index.search("readm")] == ["quick-start"]
+    assert index.search("readm", prefix=False) == []
+    assert index.search("missing") == []
+
+    result = index.search("install", limit=1)[0]
+    assert result["title"] == "Quick Start"
+    assert result["section"] == "Getting Started"
+    assert result["snippet"].startswith("Install the tool")
+
+
+def test_site_documents_and_invalid_file(temp_dir):
+    """Test indexing a DocSite's pages and rejecting files that are not an index"""
+    config = {"project": {"name": "Demo"}, "content": {"sections": [{"title": "Start", "pages": ["FAQ"]}]}}
+    (slug, title, section, text), = site_documents(build_site(config))
+    assert (slug, title, section) == ("faq", "FAQ", "Start")
+    assert "#" not in text
+
+    bogus = temp_dir / "bogus.bin"
+    bogus.write_bytes(b"not an index at all" * 10)
+    with pytest.raises(ValueError):
+        SearchIndex(str(bogus))
+
+
+def test_docs_search_endpoint(temp_dir):
+    """Test /api/docs/search against a generated index"""
+    pytest.importorskip("flask_cors")
+    from gitsage.web import create_app
+
+    path = temp_dir / SEARCH_INDEX
+    path.write_bytes(build_index(PAGES))
+    client = create_app({"TESTING": True, "DOCS_SEARCH_INDEX": str(path)}).test_client()
+
+    data = client.get("/api/docs/search?q=queue&limit=1").get_json()
+    assert data["success"] is True
+    assert [r["slug"] for r in data["results"]] == ["write-queue"]
+    assert client.get("/api/docs/search").status_code == 400
+
+    missing = create_app({"TESTING": True, "DOCS_SEARCH_INDEX": str(temp_dir / "none.bin")}).test_client()
+    assert missing.get("/api/docs/search?q=queue").status_code == 404
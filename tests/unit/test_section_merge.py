@@ -0,0 +1,58 @@
+"""Tests for README section markers and incremental merging"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.generators.section_merge import (  # noqa: E402
+    digest, merge_sections, parse_blocks, render_sections,
+)
+
+
+def _sections(**bodies):
+    return [(name, digest(body), lambda body=body: body) for name, body in bodies.items()]
+
+
+def test_render_and_parse_round_trip():
+    """Test that rendered sections parse back with unedited bodies"""
+    text = render_sections(_sections(intro="# Demo\n", usage="## Usage\n", empty=""))
+    blocks = parse_blocks(text)
+
+    assert [b.name for b in blocks] == ["intro", "usage"]
+    assert blocks[0].body == "# Demo\n"
+    assert not any(b.edited for b in blocks)
+    assert merge_sections("# Plain README\n", _sections(intro="x")) is None
+
+
+def test_merge_keeps_manual_text_and_unchanged_blocks():
+    """Test that only sections with new inputs are rendered and surrounding text is untouched"""
+    readme = "Preamble\n" + render_sections(_sections(intro="# Demo\n", usage="old\n")) + "Notes\n"
+    calls = []
+    sections = [
+        ("intro", digest("# Demo\n"), lambda: calls.append("intro") or "# Demo\n"),
+        ("usage", digest("new\n"), lambda: calls.append("usage") or "new\n"),
+    ]
+
+    merged = merge_sections(readme, sections)
+    assert calls == ["usage"]
+    assert merged.unchanged == ["intro"] and merged.updated == ["usage"]
+    assert merged.text == "Preamble\n" + render_sections(_sections(intro="# Demo\n", usage="new\n")) + "Notes\n"
+
+
+def test_merge_adds_removes_and_protects_edits():
+    """Test section insertion, removal and hand-edit conflicts"""
+    readme = render_sections(_sections(intro="a\n", usage="b\n", legacy="c\n"))
+    readme = readme.replace("b\n<!-- gitsage:end usage", "b edited\n<!-- gitsage:end usage")
+
+    merged = merge_sections(readme, _sections(intro="a\n", install="i\n", usage="B\n"))
+    assert merged.added == ["install"]
+    assert merged.removed == ["legacy"]
+    assert merged.conflicts == ["usage"]
+    assert [b.name for b in parse_blocks(merged.text)] == ["intro", "install", "usage"]
+    assert "b edited" in merged.text
+
+    forced = merge_sections(readme, _sections(intro="a\n", usage="B\n"), force=True)
+    assert forced.updated == ["usage"]
+    assert "b edited" not in forced.text
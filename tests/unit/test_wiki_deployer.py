@@ -0,0 +1,94 @@
+"""Tests for the git-plumbing wiki deployer"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from gitsage.managers.wiki_deployer import WikiDeployer, WikiDeployError, wiki_url  # noqa: E402
+from gitsage.utils.atomic_writer import MANIFEST_NAME, AtomicWriter  # noqa: E402
+
+
+def _git(remote: Path, *args: str) -> str:
+    return subprocess.run(["git", "--git-dir", str(remote), *args], capture_output=True, text=True,
+                          check=True).stdout
+
+
+@pytest.fixture
+def wiki(temp_dir):
+    """Generated wiki pages with a build manifest, and an empty bare remote"""
+    remote = temp_dir / "remote.wiki.git"
+    subprocess.run(["git", "init", "--quiet", "--bare", str(remote)], check=True)
+    docs = temp_dir / "generated-docs"
+    writer = AtomicWriter(docs / MANIFEST_NAME)
+    for name in ("Home", "Installation", "FAQ"):
+        writer.write(docs / "github-wiki" / f"{name}.md", f"# {name}\n")
+    writer.save()
+    return docs, remote
+
+
+def _deployer(docs: Path, remote: Path, **kwargs) -> WikiDeployer:
+    return WikiDeployer(docs / "github-wiki", str(remote), cache_dir=docs.parent / "cache",
+                        manifest_path=docs / MANIFEST_NAME, **kwargs)
+
+
+def test_wiki_url():
+    """Test deriving the wiki remote from a repository URL"""
+    assert wiki_url("https://github.com/u/r.git") == "https://github.com/u/r.wiki.git"
+    assert wiki_url("https://github.com/u/r/") == "https://github.com/u/r.wiki.git"
+    assert wiki_url("git@github.com:u/r.wiki.git") == "git@github.com:u/r.wiki.git"
+
+
+def test_deploy_pushes_only_changes(wiki):
+    """Test the first push, a no-op deploy and a one-page update"""
+    docs, remote = wiki
+    first = _deployer(docs, remote).deploy()
+    assert first.branch == "master"
+    assert first.updated == ["FAQ.md", "Home.md", "Installation.md"]
+    assert _git(remote, "rev-parse", "master").strip() == first.commit
+
+    assert _deployer(docs, remote).deploy().commit is None
+
+    writer = AtomicWriter(docs / MANIFEST_NAME)
+    writer.write(docs / "github-wiki" / "FAQ.md", "# FAQ\n\nNew answer.\n")
+    writer.save()
+    second = _deployer(docs, remote).deploy(message="Update FAQ")
+    assert second.updated == ["FAQ.md"]
+    assert _git(remote, "rev-parse", "master^").strip() == first.commit
+    assert _git(remote, "show", "master:FAQ.md") == "# FAQ\n\nNew answer.\n"
+    assert _git(remote, "log", "-1", "--format=%s", "master").strip() == "Update FAQ"
+
+
+def test_deploy_removes_only_pages_it_deployed(wiki, temp_dir):
+    """Test that dropped pages are deleted while pages added on the wiki are kept"""
+    docs, remote = wiki
+    _deployer(docs, remote).deploy()
+
+    # Someone edits the wiki online (a clone elsewhere pushes a new page)
+    other = temp_dir / "other"
+    subprocess.run(["git", "clone", "--quiet", str(remote), str(other)], check=True)
+    (other / "Notes.md").write_text("# Notes\n")
+    for args in (["add", "Notes.md"], ["-c", "user.name=x", "-c", "user.email=x@x", "commit", "-qm", "notes"],
+                 ["push", "--quiet", "origin", "HEAD:master"]):
+        subprocess.run(["git", "-C", str(other), *args], check=True)
+
+    (docs / "github-wiki" / "Installation.md").unlink()
+    result = _deployer(docs, remote).deploy()
+    assert (result.updated, result.removed) == ([], ["Installation.md"])
+    assert _git(remote, "ls-tree", "--name-only", "master").split() == ["FAQ.md", "Home.md", "Notes.md"]
+
+    pruned = _deployer(docs, remote, prune=True).deploy()
+    assert pruned.removed == ["Notes.md"]
+
+
+def test_deploy_errors(wiki, temp_dir):
+    """Test that a missing wiki directory or an unreachable remote raise WikiDeployError"""
+    docs, _ = wiki
+    with pytest.raises(WikiDeployError):
+        WikiDeployer(temp_dir / "missing", str(temp_dir / "remote.wiki.git")).deploy()
+    with pytest.raises(WikiDeployError):
+        _deployer(docs, temp_dir / "nowhere.git").deploy()
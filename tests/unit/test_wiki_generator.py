@@ -119,3 +119,200 @@ def test_yaml_config_validity(temp_dir, sample_wiki_config):
         loaded = yaml.safe_load(f)
 
     assert loaded == sample_wiki_config
+
+
+def _load_wiki_generator():
+    """Import wiki-generator.py as a module"""
+    import importlib.util
+
+    path = Path(__file__).parent.parent.parent / "wiki-generator.py"
+    spec = importlib.util.spec_from_file_location("wiki_generator", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_parallel_generation_matches_sequential(temp_dir, monkeypatch):
+    """Test that --jobs output, with pages rendered on worker processes, is identical to a sequential run"""
+    module = _load_wiki_generator()
+    from gitsage.generators import page_pool
+
+    monkeypatch.setattr(page_pool, "PARALLEL_THRESHOLD", 1)
+    pooled = []
+    render = page_pool.PagePool.render
+    monkeypatch.setattr(page_pool.PagePool, "render",
+                        lambda self, fmt, *args: pooled.append(fmt) or render(self, fmt, *args))
+    # Workers start from a format thread while writer threads run, so they must not be forked
+    start_methods = set()
+    executor = page_pool.ProcessPoolExecutor
+    monkeypatch.setattr(page_pool, "ProcessPoolExecutor", lambda *args, mp_context=None, **kwargs: (
+        start_methods.add(mp_context and mp_context.get_start_method()) or executor(*args, mp_context=mp_context,
+                                                                                      **kwargs)))
+
+    formats = ["github-wiki", "gitbook", "mkdocs", "readthedocs", "confluence"]
+    outputs = {}
+    for jobs in (1, 4):
+        root = temp_dir / f"jobs-{jobs}"
+        root.mkdir()
+        generator = module.DocumentationGenerator(str(root), jobs=jobs)
+        generator.generate_all(formats=formats)
+        docs = root / "generated-docs"
+        outputs[jobs] = {
+            # Deployment scripts hold the absolute project path
+            p.relative_to(docs).as_posix(): p.read_bytes().replace(str(root.resolve()).encode(), b"<root>")
+            for p in docs.rglob("*") if p.is_file() and p.name != module.MANIFEST_NAME
+        }
+        assert sorted(generator.stats["formats"]) == ["Confluence", "GitBook", "GitHub Wiki", "MkDocs",
+                                                      "Read the Docs"]
+
+    assert sorted(pooled) == sorted(formats)
+    assert start_methods == {"spawn"}
+    assert outputs[1] == outputs[4]
+    assert "gitbook/SUMMARY.md" in outputs[4] and "github-wiki/_Sidebar.md" in outputs[4]
+    # Format-neutral page links point at each format's page names
+    assert b"- [Quick Start](Quick-Start)" in outputs[4]["github-wiki/FAQ.md"]
+    assert b"- [Quick Start](quick-start.md)" in outputs[4]["gitbook/faq.md"]
+
+
+def test_rebuild_only_regenerates_changed_dependencies(temp_dir):
+    """Test that a no-op rebuild writes nothing and a version bump rewrites only files showing it"""
+    module = _load_wiki_generator()
+    assert module.DocumentationGenerator(str(temp_dir), jobs=1).generate_all()  # No broken links
+
+    noop = module.DocumentationGenerator(str(temp_dir), jobs=1)
+    noop.generate_all()
+    assert noop.writer.written == 0 and noop.writer.skipped == 0
+    assert noop.stats["up_to_date"] > 20
+
+    config_path = temp_dir / "wiki-config.yaml"
+    config = yaml.safe_load(config_path.read_text())
+    config["project"]["version"] = "9.9.9"
+    config_path.write_text(yaml.dump(config, sort_keys=False))
+
+    rendered = []
+    bumped = module.DocumentationGenerator(str(temp_dir), jobs=1)
+    write_file = bumped._write_file
+    bumped._write_file = lambda path, *args: rendered.append(path.name) or write_file(path, *args)
+    bumped.generate_all()
+    assert sorted(rendered) == ["Home.md", "README.md", "_Sidebar.md"]
+    assert "*v9.9.9*" in (temp_dir / "generated-docs" / "github-wiki" / "_Sidebar.md").read_text()
+
+
+def test_farm_builds_each_config_into_its_own_root(temp_dir):
+    """Test farm mode: one output root per config, summary rows and a missing config reported"""
+    module = _load_wiki_generator()
+    config = module.DocumentationGenerator(str(temp_dir)).generate_enhanced_config()
+    config["formats"] = {"mkdocs": {"enabled": True}}
+    for path, name in ((temp_dir / "alpha" / "wiki-config.yaml", "Alpha"), (temp_dir / "alpha" / "lite.yaml", "Lite"),
+                       (temp_dir / "beta" / "wiki-config.yaml", "Beta")):
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(yaml.dump(dict(config, project=dict(config["project"], name=name))))
+
+    configs = [str(temp_dir / p) for p in ("alpha/wiki-config.yaml", "alpha/lite.yaml", "beta/wiki-config.yaml",
+                                           "missing/wiki-config.yaml")]
+    results = module.build_farm(configs, jobs=1)
+
+    assert [r["name"] for r in results[:3]] == ["Alpha", "Lite", "Beta"]
+    assert all(r["pages"] > 0 and r["written"] > 0 and r["error"] is None for r in results[:3])
+    assert "FileNotFoundError" in results[3]["error"]
+    assert "site_name: Lite" in (temp_dir / "alpha" / "generated-docs-lite" / "mkdocs" / "mkdocs.yml").read_text()
+    assert "site_name: Alpha" in (temp_dir / "alpha" / "generated-docs" / "mkdocs" / "mkdocs.yml").read_text()
+    assert not (temp_dir / "beta" / "generated-docs" / "github-wiki").exists()
+
+    # Deploying runs this generator with the project's own config, from any directory
+    script = (temp_dir / "alpha" / "generated-docs-lite" / "deployment" / "deploy-wiki.sh").read_text()
+    assert f"{Path(module.__file__).resolve()} --config {temp_dir.resolve() / 'alpha' / 'lite.yaml'}" in script
+    assert "cd " not in script
+
+    # A single project honours its config file name too
+    single = module.DocumentationGenerator(str(temp_dir / "alpha"), jobs=1, config_file="lite.yaml")
+    single.generate_all()
+    assert single.config["project"]["name"] == "Lite"
+
+
+def test_page_names_cannot_escape_the_output_root(temp_dir):
+    """Test that harvested headings become flat file names and that no output leaves its format directory"""
+    import pytest
+
+    module = _load_wiki_generator()
+    project = temp_dir / "project"
+    (project / "docs").mkdir(parents=True)
+    (project / "docs" / "evil.md").write_text("# ../../../hv-escape\n\nGotcha.\n")
+    (project / "docs" / "ci.md").write_text("# CI/CD Setup\n\nPipelines.\n")
+    config = module.DocumentationGenerator(str(project)).generate_enhanced_config()
+    config["harvest"] = {"enabled": True, "docs": ["docs"], "examples": [], "modules": False, "cli": False}
+    (project / "wiki-config.yaml").write_text(yaml.dump(config))
+
+    module.DocumentationGenerator(str(project), jobs=1).generate_all(formats=["github-wiki"])
+    wiki = project / "generated-docs" / "github-wiki"
+    assert (wiki / "CI-CD-Setup.md").is_file() and (wiki / "hv-escape.md").is_file()
+    assert not (wiki / "CI").exists()
+    assert not list(temp_dir.glob("**/hv-escape.md"))[1:]  # Only the one inside the wiki
+
+    config["harvest"]["enabled"] = False
+    config["content"]["sections"][0]["pages"].append({"name": "../../outside"})
+    (project / "wiki-config.yaml").write_text(yaml.dump(config))
+    with pytest.raises(ValueError, match="outside"):
+        module.DocumentationGenerator(str(project), jobs=1).generate_all(formats=["github-wiki"])
+    assert not (project / "outside.md").exists()
+
+
+def test_minimal_config_has_no_boilerplate_broken_links(temp_dir):
+    """Test that Home, sidebar and template links to pages a config does not define are left out"""
+    module = _load_wiki_generator()
+    config = module.DocumentationGenerator(str(temp_dir)).generate_enhanced_config()
+    config["content"]["sections"] = [{"title": "Docs", "pages": [{"name": "Home", "template": "home"},
+                                                                 {"name": "Usage"},
+                                                                 {"name": "Install", "template": "installation"}]}]
+    config["formats"] = {fmt: {"enabled": True} for fmt in ("github_wiki", "gitbook", "mkdocs", "readthedocs",
+                                                            "confluence", "pdf")}
+    (temp_dir / "wiki-config.yaml").write_text(yaml.dump(config))
+
+    generator = module.DocumentationGenerator(str(temp_dir), jobs=1)
+    assert generator.generate_all()
+    assert generator.stats["broken_links"] == []
+
+    wiki = temp_dir / "generated-docs" / "github-wiki"
+    home = (wiki / "Home.md").read_text()
+    assert "Quick-Start" not in home and "Documentation Navigation" not in home
+    assert "## [STATS] **Project Information**" in home
+    assert "Support" not in (wiki / "_Sidebar.md").read_text()
+    usage = (wiki / "Usage.md").read_text()
+    assert "- [Home](Home)" in usage and "Quick Start" not in usage
+    assert "see the Troubleshooting Guide." in (wiki / "Install.md").read_text()
+
+
+def test_renamed_page_removes_its_old_files(temp_dir):
+    """Test that a rebuild deletes the files and manifest entries of a renamed page"""
+    module = _load_wiki_generator()
+    formats = ["github-wiki", "gitbook"]
+    module.DocumentationGenerator(str(temp_dir), jobs=1).generate_all(formats=formats)
+    docs = temp_dir / "generated-docs"
+    (docs / "github-wiki" / "Notes.md").write_text("# Added by hand\n")
+    assert (docs / "github-wiki" / "FAQ.md").is_file() and (docs / "gitbook" / "faq.md").is_file()
+
+    config_path = temp_dir / "wiki-config.yaml"
+    config = yaml.safe_load(config_path.read_text())
+    for section in config["content"]["sections"]:
+        for page in section["pages"]:
+            if page["name"] == "FAQ":
+                page["name"] = "Questions"
+    config_path.write_text(yaml.dump(config, sort_keys=False))
+
+    generator = module.DocumentationGenerator(str(temp_dir), jobs=1)
+    generator.generate_all(formats=formats)
+    assert generator.writer.removed == 2
+    assert not (docs / "github-wiki" / "FAQ.md").exists() and not (docs / "gitbook" / "faq.md").exists()
+    assert (docs / "github-wiki" / "Questions.md").is_file() and (docs / "gitbook" / "questions.md").is_file()
+    assert (docs / "github-wiki" / "Notes.md").is_file()
+    manifest = module.AtomicWriter(docs / module.MANIFEST_NAME).entries
+    assert "github-wiki/FAQ.md" not in manifest and "github-wiki/Questions.md" in manifest
+
+
+def test_missing_gitsage_package_is_a_clear_error(monkeypatch):
+    """Test that the generator stops at import with install advice instead of failing mid-build"""
+    import pytest
+
+    monkeypatch.setitem(sys.modules, "gitsage.managers.wiki_deployer", None)
+    with pytest.raises(SystemExit, match="needs the gitsage package"):
+        _load_wiki_generator()
@@ -11,12 +11,18 @@ import os
 import sys
 import json
 import yaml
+import shlex
 import shutil
 import subprocess
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import argparse
+import contextlib
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 
 try:
     from rich import print as rprint
@@ -29,9 +35,43 @@ except ImportError:
     RICH_AVAILABLE = False
     rprint = print
 
+# The gitsage package renders, writes and checks every format
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+try:
+    from gitsage.utils.atomic_writer import MANIFEST_NAME, AtomicWriter, WriteQueue, file_hash
+    from gitsage.generators.api_reference import ApiReferenceBuilder, render_wiki_pages
+    from gitsage.generators.content_harvester import ContentHarvester
+    from gitsage.generators.search_index import SEARCH_INDEX, build_index, site_documents
+    from gitsage.generators.link_graph import check_links
+    from gitsage.generators import doc_pages
+    from gitsage.generators.doc_pages import EMITTERS, DocSite, Emitter, HtmlEmitter, build_site
+    from gitsage.generators.page_pool import PagePool
+    from gitsage.generators.html_book import (BOOK_HTML, BOOK_PDF, HTML_CACHE, WEASYPRINT_AVAILABLE,
+                                              BookRenderer, book_chunks, render_pdf)
+    from gitsage.managers.wiki_deployer import WikiDeployer, WikiDeployError, deploy_cache, wiki_url
+except ImportError as e:
+    raise SystemExit(f"[ERROR] wiki-generator.py needs the gitsage package ({e}).\n"
+                     f"Run it from a GitSage checkout (with src/ beside it) or install it: pip install gitsage")
+
 
 console = Console() if RICH_AVAILABLE else None
 
+# Project fields shown on the generated wiki Home page
+WIKI_HOME_PROJECT_KEYS = (
+    "name", "tagline", "description", "version", "author", "license", "language",
+    "main_script", "homepage", "github_url", "issues_url",
+)
+
+
+@lru_cache(maxsize=1)
+def generator_digest() -> str:
+    """Hash of the generator code, computed once per process and shared by every project"""
+    pages_source = Path(doc_pages.__file__)
+    sources = [Path(__file__), pages_source, pages_source.with_name("doc_markup.py"),
+               pages_source.with_name("content_harvester.py"), pages_source.with_name("search_index.py"),
+               pages_source.with_name("html_book.py")]
+    return "".join(file_hash(source)[:12] for source in sources)
+
 
 class DocumentationGenerator:
     """
@@ -40,9 +80,9 @@ class DocumentationGenerator:
     Supports:
     - GitHub Wiki
     - GitBook
-    - Confluence (XML export)
+    - Confluence (storage-format XML)
     - Notion (Markdown export)
-    - Read the Docs
+    - Read the Docs (Sphinx)
     - MkDocs
     - PDF
     """
@@ -81,16 +121,101 @@ class DocumentationGenerator:
         "startup"        # Fun and energetic
     ]
 
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: str = ".", jobs: Optional[int] = None,
+                 config_file: str = "wiki-config.yaml", output_dir: Optional[str] = None):
+        """
+        Args:
+            project_root: Directory holding the config and receiving generated-docs/
+            jobs: Workers for formats, page rendering and file writes (default: CPU count; 1 is sequential)
+            config_file: Configuration file, relative to project_root
+            output_dir: Where the formats are written (default: <project_root>/generated-docs)
+        """
         self.project_root = Path(project_root)
+        self.jobs = jobs
+        self.config_file = config_file
         self.config = {}
         self.templates_dir = self.project_root / "templates"
-        self.output_dir = self.project_root / "generated-docs"
+        self.output_dir = Path(output_dir) if output_dir else self.project_root / "generated-docs"
+        self.writer = AtomicWriter(self.output_dir / MANIFEST_NAME)
         self.stats = {
             "pages_generated": 0,
+            "up_to_date": 0,
             "formats": [],
+            "broken_links": [],
             "start_time": datetime.now()
         }
+        self._site = None
+        self._site_args = None
+        self._queue = None
+        self._pages = None
+        self._stats_lock = threading.Lock()
+
+    def _write(self, path: Path, content: str, mode: Optional[int] = None,
+               depends: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Write an output file, skipping it when the content is unchanged
+
+        During a parallel generate_all() the write is queued for the writer threads
+        (True is returned without waiting for it).
+        """
+        self._check_inside(path, self.output_dir)
+        if self._queue is not None:
+            self._queue.put(path, content, mode, depends)
+            return True
+        return self._write_file(path, content, mode, depends)
+
+    @staticmethod
+    def _check_inside(path: Path, root: Path) -> None:
+        """Refuse an output path that resolves outside ``root`` (page names come from harvested headings)"""
+        root = os.path.realpath(root)
+        if os.path.commonpath([root, os.path.realpath(path)]) != root:
+            raise ValueError(f"Refusing to write {path}: outside {root}")
+
+    def _write_file(self, path: Path, content: str, mode: Optional[int] = None,
+                    depends: Optional[Dict[str, Any]] = None) -> bool:
+        return self.writer.write(path, content, mode, depends)
+
+    def _output(self, path: Path, depends: Dict[str, Any], render, mode: Optional[int] = None) -> bool:
+        """
+        Render and write an output file unless the build manifest shows it is up to date
+
+        Args:
+            path: Output file
+            depends: Config values and template ids the file is generated from
+            render: Returns the file content; only called when a dependency changed
+            mode: Permission bits to apply
+
+        Returns:
+            True if the file was rendered
+        """
+        depends = self._stale(path, depends)
+        if depends is None:
+            return False
+        self._write(path, render(), mode, depends)
+        return True
+
+    def _stale(self, path: Path, depends: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Full dependencies of an output file that must be rendered, None when it is up to date"""
+        depends = dict(depends, generator=self._generator_digest())
+        if self.writer.is_built(path, depends):
+            with self._stats_lock:
+                self.stats["up_to_date"] += 1
+            return None
+        return depends
+
+    def _generator_digest(self) -> str:
+        """Hash of the generator code, so every output is rebuilt after an upgrade"""
+        return generator_digest()
+
+    def _depends(self, *keys: str) -> Dict[str, Any]:
+        """Dependency dict of dotted config keys (e.g. 'project.version')"""
+        depends = {}
+        for key in keys:
+            value = self.config
+            for part in key.split("."):
+                value = value.get(part) if isinstance(value, dict) else None
+            depends[key] = value
+        return depends
 
     def load_config(self, config_file: str = "wiki-config.yaml") -> Dict:
         """Load or generate configuration"""
@@ -103,6 +228,7 @@ class DocumentationGenerator:
             self.config = self.generate_enhanced_config()
             self.save_config(config_file)
 
+        self._site = None  # Pages are rendered from the config on first use
         return self.config
 
     def generate_enhanced_config(self) -> Dict[str, Any]:
@@ -219,8 +345,21 @@ class DocumentationGenerator:
                     }
                 ]
             },
+            "api_reference": {
+                "enabled": False,      # Generate API pages from the Python sources (static analysis)
+                "paths": None,         # Source directories; default src/ or the project root
+                "page_prefix": "API"
+            },
+            "harvest": {
+                "enabled": False,      # Add pages harvested from docs/, docstrings, CLIs and examples
+                "docs": ["docs"],
+                "examples": ["examples"],
+                "modules": True,
+                "cli": True
+            },
             "features": {
                 "search": True,
+                "link_check": True,    # Fail the build when an internal link or anchor does not resolve
                 "syntax_highlighting": True,
                 "code_copy": True,
                 "dark_mode": True,
@@ -263,8 +402,9 @@ class DocumentationGenerator:
 
         # Generate pages
         self._generate_wiki_home(wiki_dir)
-        self._generate_wiki_sidebar(wiki_dir)
-        self._generate_wiki_pages(wiki_dir)
+        # Pages and _Sidebar.md; Home.md is written by _generate_wiki_home
+        self._count_pages(self._emit(EMITTERS["github-wiki"], wiki_dir, skip=("Home.md",)))
+        self._generate_wiki_api_reference(wiki_dir)
 
         self.stats["formats"].append("GitHub Wiki")
 
@@ -287,9 +427,8 @@ class DocumentationGenerator:
 
         # Generate GitBook structure
         self._generate_gitbook_readme(gitbook_dir)
-        self._generate_gitbook_summary(gitbook_dir)
         self._generate_gitbook_config(gitbook_dir)
-        self._generate_gitbook_pages(gitbook_dir)
+        self._count_pages(self._emit(EMITTERS["gitbook"], gitbook_dir))  # Pages and SUMMARY.md
 
         self.stats["formats"].append("GitBook")
 
@@ -300,8 +439,78 @@ class DocumentationGenerator:
 
         return gitbook_dir
 
+    def generate_format(self, fmt: str) -> Path:
+        """Generate a format that is a pure serialization of the shared pages (MkDocs, Read the Docs, Confluence)"""
+        emitter = EMITTERS[fmt]
+        if RICH_AVAILABLE:
+            rprint(f"\n[cyan][DOCS] Generating {emitter.title}...[/cyan]")
+        else:
+            print(f"\n[DOCS] Generating {emitter.title}...")
+
+        out_dir = self.output_dir / emitter.directory
+        out_dir.mkdir(parents=True, exist_ok=True)
+        self._count_pages(self._emit(emitter, out_dir))
+
+        self.stats["formats"].append(emitter.title)
+
+        if RICH_AVAILABLE:
+            rprint(f"[green][OK] {emitter.title} generated:[/green] {out_dir}")
+        else:
+            print(f"[OK] {emitter.title} generated: {out_dir}")
+
+        return out_dir
+
+    def generate_pdf(self) -> Path:
+        """Generate the offline HTML site, the single-file print book and, with WeasyPrint, its PDF"""
+        emitter = EMITTERS["pdf"]
+        if RICH_AVAILABLE:
+            rprint(f"\n[cyan][DOCS] Generating {emitter.title}...[/cyan]")
+        else:
+            print(f"\n[DOCS] Generating {emitter.title}...")
+
+        out_dir = self.output_dir / emitter.directory
+        out_dir.mkdir(parents=True, exist_ok=True)
+        site = self._doc_site()
+        cache_dir = self.project_root / HTML_CACHE
+        if self.output_dir != self.project_root / "generated-docs":
+            cache_dir = cache_dir / self.output_dir.name  # Projects sharing a root prune only their own fragments
+        renderer = BookRenderer(site, cache_dir, jobs=self.jobs)
+
+        depends = {"pages": [page.depends for page in site.pages], "structure": site.structure,
+                   **self._depends("project.name", "project.description", "project.version", "formats.pdf"),
+                   "generator": self._generator_digest()}
+        book = out_dir / BOOK_HTML
+        if self.writer.is_built(book, depends):
+            with self._stats_lock:
+                self.stats["up_to_date"] += 1
+        else:
+            renderer.prefetch(site.pages)  # Cache misses are converted on worker processes
+            self.writer.write_stream(book, book_chunks(site, renderer, site.options("pdf")), depends=depends)
+            renderer.prune()
+        self._count_pages(self._emit(HtmlEmitter(renderer.fragment), out_dir))
+
+        if WEASYPRINT_AVAILABLE:
+            self._output(out_dir / BOOK_PDF, depends, partial(render_pdf, book))
+        else:
+            print(f"[INFO] Install weasyprint for {BOOK_PDF}, or print {book} from a browser")
+
+        self.stats["formats"].append(emitter.title)
+        if RICH_AVAILABLE:
+            rprint(f"[green][OK] {emitter.title} generated:[/green] {out_dir}")
+        else:
+            print(f"[OK] {emitter.title} generated: {out_dir}")
+
+        return out_dir
+
     def _generate_wiki_home(self, wiki_dir: Path) -> None:
         """Generate enhanced wiki home page"""
+        depends = self._depends(*(f"project.{key}" for key in WIKI_HOME_PROJECT_KEYS), "template.theme")
+        depends["date"] = datetime.now().strftime("%Y-%m-%d")  # Shown as "Last Updated"
+        depends["structure"] = self._doc_site().structure  # Links to pages the config leaves out are dropped
+        self._output(wiki_dir / "Home.md", depends, self._wiki_home_content)
+        self._count_pages(1)
+
+    def _wiki_home_content(self) -> str:
         project = self.config["project"]
         theme = self.config["template"]["theme"]
 
@@ -369,7 +578,7 @@ python {project["main_script"]}
 - **[Examples](Examples)** - Real-world use cases
 
 ### [TOOL] API & Development
-- **[API Overview](API-Overview)** - Integration reference
+- **[API Overview](Overview)** - Integration reference
 - **[Architecture](Architecture)** - How it works internally
 - **[Contributing](Contributing)** - Join the project
 - **[Testing Guide](Testing)** - Quality assurance
@@ -406,7 +615,7 @@ python {project["main_script"]}
 ## [!] **Need Help?**
 
 - 📖 **[Start with Quick Start](Quick-Start)** - Best first step
-- [SEARCH] **[Search Documentation](Search)** - Find what you need
+- [SEARCH] **[Browse All Pages]({project["github_url"]}/wiki/_pages)** - Find what you need
 - [CHAT] **[Ask the Community](Community)** - Get answers fast
 - 🐛 **[Report a Bug]({project["issues_url"]})** - Help us improve
 
@@ -417,71 +626,38 @@ python {project["main_script"]}
 *This documentation is automatically generated and maintained. {theme_styles.get(theme, "professional")} theme.*
 '''
 
-        with open(wiki_dir / "Home.md", 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        self.stats["pages_generated"] += 1
-
-    def _generate_wiki_sidebar(self, wiki_dir: Path) -> None:
-        """Generate enhanced sidebar navigation"""
-        sections = self.config["content"]["sections"]
-        project = self.config["project"]
-
-        sidebar = "# [DOCS] Documentation\n\n"
+        return doc_pages.prune_links(content, self._doc_site().page)
 
-        for section in sections:
-            icon = section.get("icon", "📄")
-            sidebar += f"## {icon} {section['title']}\n\n"
+    def _api_reference_enabled(self) -> bool:
+        return bool(self.config.get("api_reference", {}).get("enabled"))
 
-            for page in section["pages"]:
-                page_name = page["name"] if isinstance(page, dict) else page
-                page_link = page_name.replace(" ", "-")
-                sidebar += f"- **[{page_name}]({page_link})**\n"
+    def _generate_wiki_api_reference(self, wiki_dir: Path) -> None:
+        """Generate API reference pages from the project's Python sources"""
+        if not self._api_reference_enabled():
+            return
 
-            sidebar += "\n"
+        options = self.config["api_reference"]
+        builder = ApiReferenceBuilder(str(self.project_root), paths=options.get("paths"))
+        pages = render_wiki_pages(builder.build(), prefix=options.get("page_prefix", "API"))
+        for page_file, content in pages.items():
+            self._write(wiki_dir / page_file, content)
+        self._count_pages(len(pages))
 
-        # Footer links
-        sidebar += f"""---
-
-## 🔗 Project Links
-
-- **[GitHub]({project["github_url"]})**
-- **[Issues]({project["issues_url"]})**
-- **[Releases]({project["github_url"]}/releases)**
-
-## 📞 Support
-
-- **[Troubleshooting](Troubleshooting)**
-- **[FAQ](FAQ)**
-- **[Community](Community)**
-
----
-
-*v{project["version"]}*
-"""
-
-        with open(wiki_dir / "_Sidebar.md", 'w', encoding='utf-8') as f:
-            f.write(sidebar)
-
-    def _generate_wiki_pages(self, wiki_dir: Path) -> None:
-        """Generate all wiki content pages"""
-        sections = self.config["content"]["sections"]
-
-        for section in sections:
-            for page in section["pages"]:
-                page_name = page["name"] if isinstance(page, dict) else page
-                page_file = page_name.replace(" ", "-") + ".md"
-
-                # Generate page content based on template
-                content = self._get_page_template(page_name, page.get("template") if isinstance(page, dict) else None)
-
-                with open(wiki_dir / page_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
-
-                self.stats["pages_generated"] += 1
+        stats = builder.stats
+        message = (f"API reference: {stats['modules']} modules ({stats['parsed']} parsed, "
+                   f"{stats['cached']} cached) in {stats['seconds']:.2f}s")
+        if RICH_AVAILABLE:
+            rprint(f"[dim]{message}[/dim]")
+        else:
+            print(message)
 
     def _generate_gitbook_readme(self, gitbook_dir: Path) -> None:
         """Generate GitBook README (landing page)"""
+        depends = self._depends(*(f"project.{key}" for key in (
+            "name", "description", "github_url", "main_script", "issues_url", "version", "license")))
+        self._output(gitbook_dir / "README.md", depends, self._gitbook_readme_content)
+
+    def _gitbook_readme_content(self) -> str:
         project = self.config["project"]
 
         content = f'''# {project["name"]}
@@ -518,31 +694,15 @@ Use the navigation on the left to explore:
 **Version:** {project["version"]} | **License:** {project["license"]}
 '''
 
-        with open(gitbook_dir / "README.md", 'w', encoding='utf-8') as f:
-            f.write(content)
-
-    def _generate_gitbook_summary(self, gitbook_dir: Path) -> None:
-        """Generate GitBook SUMMARY.md (table of contents)"""
-        sections = self.config["content"]["sections"]
-
-        summary = "# Summary\n\n"
-        summary += "* [Introduction](README.md)\n\n"
-
-        for section in sections:
-            summary += f"## {section['title']}\n\n"
-
-            for page in section["pages"]:
-                page_name = page["name"] if isinstance(page, dict) else page
-                page_file = page_name.replace(" ", "-").lower() + ".md"
-                summary += f"* [{page_name}]({page_file})\n"
-
-            summary += "\n"
-
-        with open(gitbook_dir / "SUMMARY.md", 'w', encoding='utf-8') as f:
-            f.write(summary)
+        return content
 
     def _generate_gitbook_config(self, gitbook_dir: Path) -> None:
         """Generate GitBook configuration"""
+        depends = self._depends("project.name", "project.description", "project.author", "project.github_url",
+                                "formats.gitbook.plugins", "formats.gitbook.pdf")
+        self._output(gitbook_dir / "book.json", depends, self._gitbook_config_content)
+
+    def _gitbook_config_content(self) -> str:
         project = self.config["project"]
         gitbook_config = self.config["formats"]["gitbook"]
 
@@ -576,211 +736,105 @@ Use the navigation on the left to explore:
             } if gitbook_config.get("pdf") else {}
         }
 
-        with open(gitbook_dir / "book.json", 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2)
-
-    def _generate_gitbook_pages(self, gitbook_dir: Path) -> None:
-        """Generate GitBook content pages"""
-        sections = self.config["content"]["sections"]
-
-        for section in sections:
-            for page in section["pages"]:
-                page_name = page["name"] if isinstance(page, dict) else page
-                page_file = page_name.replace(" ", "-").lower() + ".md"
-
-                content = self._get_page_template(page_name, page.get("template") if isinstance(page, dict) else None)
-
-                with open(gitbook_dir / page_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
-
-    def _get_page_template(self, page_name: str, template: Optional[str]) -> str:
-        """Get content template for a page"""
-        project = self.config["project"]
-
-        # Simple template system - can be vastly expanded
-        templates = {
-            "quickstart": f'''# Quick Start Guide
-
-Get up and running with {project["name"]} in just minutes.
-
-## Prerequisites
-
-- Git
-- Python 3.8+
-- GitHub CLI
-
-## Installation
-
-```bash
-git clone {project["github_url"]}.git
-cd {project["name"].lower().replace(" ", "-")}
-python {project["main_script"]}
-```
-
-## First Steps
-
-1. Run the launcher
-2. Follow the setup wizard
-3. Configure your preferences
-4. Start managing repositories!
-
-## Next Steps
-
-- [Read the Installation Guide](installation)
-- [Explore Advanced Features](advanced-features)
-- [Join the Community](community)
-''',
-            "installation": f'''# Installation Guide
-
-Complete installation instructions for {project["name"]}.
-
-## System Requirements
-
-- **Operating System:** Windows 10+, macOS 10.14+, Linux
-- **Python:** 3.8 or higher
-- **Git:** Latest version
-- **GitHub CLI:** Latest version
-
-## Installation Steps
-
-### 1. Install Prerequisites
-
-**Git:**
-- Windows: [Download from git-scm.com](https://git-scm.com/download/win)
-- macOS: `brew install git`
-- Linux: `sudo apt install git`
-
-**GitHub CLI:**
-- Windows: `winget install GitHub.cli`
-- macOS: `brew install gh`
-- Linux: `sudo snap install gh`
-
-### 2. Clone Repository
-
-```bash
-git clone {project["github_url"]}.git
-cd {project["name"].lower().replace(" ", "-")}
-```
-
-### 3. Install Dependencies
-
-```bash
-pip install -r requirements.txt
-```
-
-### 4. Run Setup Wizard
-
-```bash
-python utils/setup_wizard.py
-```
-
-## Verification
-
-Test your installation:
-
-```bash
-python launcher.py
-```
-
-You should see the main menu. Success!
-
-## Troubleshooting
-
-If you encounter issues, see the [Troubleshooting Guide](troubleshooting).
-'''
-        }
-
-        # Return template if available, otherwise generic page
-        if template and template in templates:
-            return templates[template]
-
-        return f'''# {page_name}
-
-This page contains information about {page_name.lower()}.
-
-## Overview
-
-Documentation coming soon...
+        return json.dumps(config, indent=2)
+
+    def _doc_site(self) -> "DocSite":
+        """Pages of the current config, rendered once and shared by every format"""
+        if self._site is None:
+            reference = None
+            if self._api_reference_enabled():
+                reference = self.config["api_reference"].get("page_prefix", "API") + "-Reference"
+            self._site_args = (self.config, reference, self._harvest_sections())
+            self._site = build_site(self.config, api_reference=reference, harvested=self._site_args[2])
+        return self._site
+
+    def _harvest_sections(self) -> Optional[List[Dict]]:
+        """Sections harvested from the repository, if enabled; unchanged files come from the cache"""
+        options = self.config.get("harvest", {})
+        if not options.get("enabled"):
+            return None
+
+        harvester = ContentHarvester(str(self.project_root), docs=options.get("docs", ["docs"]),
+                                     examples=options.get("examples", ["examples"]),
+                                     modules=options.get("modules", True), cli=options.get("cli", True))
+        sections = harvester.sections()
+
+        stats = harvester.stats
+        message = (f"Harvested content: {stats['files']} files ({stats['harvested']} read, "
+                   f"{stats['cached']} cached) in {stats['seconds']:.2f}s")
+        if RICH_AVAILABLE:
+            rprint(f"[dim]{message}[/dim]")
+        else:
+            print(message)
+        return sections
+
+    def _count_pages(self, count: int) -> None:
+        with self._stats_lock:  # Formats may be generated on several threads
+            self.stats["pages_generated"] += count
+
+    def _emit(self, emitter: "Emitter", out_dir: Path, skip: tuple = ()) -> int:
+        """Write one format's pages, navigation and support files; returns the number of pages"""
+        site = self._doc_site()
+        outputs = list(emitter.outputs(site, skip))
+        stale = []
+        for position, (page_file, depends, render) in enumerate(outputs):
+            self._check_inside(out_dir / page_file, out_dir)
+            depends = self._stale(out_dir / page_file, depends)
+            if depends is not None:
+                stale.append((position, page_file, depends, render))
+
+        # Built-in emitters of a large rebuild render on worker processes (see _run_tasks)
+        if self._pages and EMITTERS.get(emitter.format) is emitter and self._pages.wanted(emitter.format, len(stale)):
+            contents = self._pages.render(emitter.format, [(position, page_file) for position, page_file, _, _ in stale],
+                                          len(outputs), skip)
+        else:
+            contents = (render() for _, _, _, render in stale)
+        for (_, page_file, depends, _), content in zip(stale, contents):
+            self._write(out_dir / page_file, content, None, depends)
+        return sum(1 for page in site.pages if emitter.page_file(page) not in skip)
 
-## See Also
+    def generate_search_index(self) -> None:
+        """Write the full-text search index of every page (served by /api/docs/search)"""
+        if not self.config.get("features", {}).get("search"):
+            return
 
-- [Home](home)
-- [Quick Start](quick-start)
-'''
+        site = self._doc_site()
+        depends = {"pages": [page.depends for page in site.pages], "structure": site.structure}
+        self._output(self.output_dir / SEARCH_INDEX, depends, lambda: build_index(site_documents(site)))
 
     def create_deployment_scripts(self) -> None:
         """Create enhanced deployment scripts"""
         deploy_dir = self.output_dir / "deployment"
         deploy_dir.mkdir(parents=True, exist_ok=True)
 
-        # GitHub Wiki deploy script
-        wiki_deploy = '''#!/bin/bash
-# Enhanced GitHub Wiki Deployment
+        # GitHub Wiki deploy script: the deployment itself lives in WikiDeployer. Absolute paths,
+        # so the script works from anywhere and for any config (see farm_output_dir())
+        command = (f"exec python3 {shlex.quote(str(Path(__file__).resolve()))} "
+                   f"--config {shlex.quote(str((self.project_root / self.config_file).resolve()))} "
+                   f'--deploy-wiki "$1"')
+        wiki_deploy = f'''#!/bin/bash
+# GitHub Wiki Deployment (incremental, via a persistent clone in .gitsage/wiki-deploy)
 set -e
 
-REPO_URL="$1"
-WIKI_DIR="./generated-docs/github-wiki"
-
-if [ -z "$REPO_URL" ]; then
+if [ -z "$1" ]; then
     echo "Usage: $0 <repository-url>"
     exit 1
 fi
 
-WIKI_URL="${REPO_URL%.git}.wiki.git"
-
-echo "[ROCKET] Deploying GitHub Wiki..."
-echo "[PKG] Repository: $REPO_URL"
-echo "📖 Wiki URL: $WIKI_URL"
-
-TEMP_DIR=$(mktemp -d)
-trap "rm -rf $TEMP_DIR" EXIT
-
-cd "$TEMP_DIR"
-
-if git clone "$WIKI_URL" wiki 2>/dev/null; then
-    echo "[OK] Wiki repository cloned"
-    cd wiki
-else
-    echo "[EDIT] Creating new wiki repository"
-    mkdir wiki
-    cd wiki
-    git init
-    git remote add origin "$WIKI_URL"
-fi
-
-echo "📄 Copying wiki files..."
-cp -r "$(cd "$(dirname "$0")/../.." && pwd)/$WIKI_DIR"/* .
-
-echo "💾 Committing changes..."
-git add .
-
-if ! git diff --staged --quiet; then
-    git config user.name "Documentation Bot" 2>/dev/null || true
-    git config user.email "docs@generator.local" 2>/dev/null || true
-
-    git commit -m "[DOCS] Auto-update documentation - $(date '+%Y-%m-%d %H:%M:%S')"
-    git push -u origin main || git push -u origin master
-
-    echo "[OK] Wiki deployed successfully!"
-    echo "🔗 View at: ${REPO_URL%.git}/wiki"
-else
-    echo "[OK] No changes to commit"
-fi
+{command}
 '''
 
-        with open(deploy_dir / "deploy-wiki.sh", 'w', encoding='utf-8') as f:
-            f.write(wiki_deploy)
-
-        # Make executable (Unix/Linux/macOS only)
-        if sys.platform != 'win32':
-            os.chmod(deploy_dir / "deploy-wiki.sh", 0o755)
+        # Executable on Unix/Linux/macOS
+        self._output(deploy_dir / "deploy-wiki.sh", {"command": command}, lambda: wiki_deploy,
+                     None if sys.platform == 'win32' else 0o755)
 
         # GitBook deploy script
-        gitbook_deploy = '''#!/bin/bash
+        gitbook_dir = shlex.quote(str((self.output_dir / "gitbook").resolve()))
+        gitbook_deploy = f'''#!/bin/bash
 # GitBook Deployment
 set -e
 
-GITBOOK_DIR="./generated-docs/gitbook"
+GITBOOK_DIR={gitbook_dir}
 
 echo "[ROCKET] Building GitBook..."
 
@@ -809,22 +863,39 @@ echo "  2. GitHub Pages: Copy _book/* to gh-pages branch"
 echo "  3. Netlify: Deploy _book folder"
 '''
 
-        with open(deploy_dir / "deploy-gitbook.sh", 'w', encoding='utf-8') as f:
-            f.write(gitbook_deploy)
-
-        # Make executable (Unix/Linux/macOS only)
-        if sys.platform != 'win32':
-            os.chmod(deploy_dir / "deploy-gitbook.sh", 0o755)
+        self._output(deploy_dir / "deploy-gitbook.sh", {"gitbook_dir": gitbook_dir}, lambda: gitbook_deploy,
+                     None if sys.platform == 'win32' else 0o755)
+
+    def deploy_wiki(self, repo_url: str) -> bool:
+        """Push the generated GitHub Wiki pages to the repository's wiki; returns False on failure"""
+        remote = wiki_url(repo_url)
+        deployer = WikiDeployer(self.output_dir / "github-wiki", remote,
+                                cache_dir=deploy_cache(remote, self.project_root),
+                                manifest_path=self.output_dir / MANIFEST_NAME)
+        print(f"[ROCKET] Deploying GitHub Wiki to {remote}...")
+        try:
+            result = deployer.deploy()
+        except WikiDeployError as e:
+            print(f"[ERROR] {e}")
+            return False
+
+        if result.changed:
+            print(f"[OK] Pushed {result.commit[:10]} to {result.branch}: "
+                  f"{len(result.updated)} updated, {len(result.removed)} removed")
+            print(f"🔗 View at: {remote[:-len('.wiki.git')]}/wiki")
+        else:
+            print("[OK] Wiki is already up to date")
+        return True
 
-    def generate_all(self, formats: Optional[List[str]] = None) -> None:
-        """Generate all enabled formats"""
+    def generate_all(self, formats: Optional[List[str]] = None) -> bool:
+        """Generate all enabled formats; returns False when the link check found broken links"""
         if RICH_AVAILABLE:
             rprint("\n[bold cyan][ROCKET] Documentation Generation Starting...[/bold cyan]\n")
         else:
             print("\n[ROCKET] Documentation Generation Starting...\n")
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.load_config()
+        self.load_config(self.config_file)
 
         # Determine which formats to generate
         if formats:
@@ -835,18 +906,80 @@ echo "  3. Netlify: Deploy _book folder"
                 if isinstance(config, dict) and config.get("enabled", False)
             ]
 
-        # Generate each format
-        if "github_wiki" in enabled_formats or "github-wiki" in enabled_formats:
-            self.generate_github_wiki()
-
-        if "gitbook" in enabled_formats:
-            self.generate_gitbook()
-
-        # Create deployment scripts
-        self.create_deployment_scripts()
+        # Generate each format, plus the deployment scripts
+        generators = {
+            "github-wiki": self.generate_github_wiki,
+            "gitbook": self.generate_gitbook,
+            "mkdocs": partial(self.generate_format, "mkdocs"),
+            "readthedocs": partial(self.generate_format, "readthedocs"),
+            "confluence": partial(self.generate_format, "confluence"),
+            "pdf": self.generate_pdf,
+        }
+        selected = [fmt for fmt in generators if fmt in enabled_formats or fmt.replace("-", "_") in enabled_formats]
+        self._run_tasks([generators[fmt] for fmt in selected]
+                        + [self.create_deployment_scripts, self.generate_search_index])
+        # Pages renamed or removed since the last build would still be served and deployed
+        for fmt in selected:
+            self.writer.prune(self.output_dir / EMITTERS[fmt].directory)
+        self.writer.save()
+        self.check_links(selected)
 
         # Show summary
         self._show_summary()
+        return not self.stats["broken_links"]
+
+    def check_links(self, formats: List[str]) -> List[str]:
+        """Check every internal link and anchor of the generated formats; returns the broken ones"""
+        if not self.config.get("features", {}).get("link_check", True):
+            return []
+
+        broken = []
+        for fmt in formats:
+            fmt_dir = self.output_dir / EMITTERS[fmt].directory
+            broken.extend(f"{EMITTERS[fmt].directory}/{problem}" for problem in check_links(str(fmt_dir), fmt))
+        self.stats["broken_links"] = broken
+
+        for problem in broken[:20]:
+            if RICH_AVAILABLE:
+                rprint(f"[red]Broken link:[/red] {problem}")
+            else:
+                print(f"Broken link: {problem}")
+        if len(broken) > 20:
+            print(f"... and {len(broken) - 20} more broken links")
+        return broken
+
+    def _run_tasks(self, tasks: List) -> None:
+        """
+        Run generation tasks, in parallel when more than one job is allowed
+
+        Formats run on a thread pool. Their pages are rendered on a PagePool of worker
+        processes, since rendering is CPU-bound Python that threads would serialize on
+        the GIL, and the rendered files go to a bounded WriteQueue whose threads hash,
+        compare and replace them while the next pages render.
+        """
+        jobs = self.jobs or os.cpu_count() or 1
+        if jobs <= 1:
+            for task in tasks:
+                task()
+            return
+
+        self._doc_site()  # Rendered once before the format threads share it
+        self._pages = PagePool(*self._site_args, jobs=jobs)
+        self._queue = WriteQueue(self.writer.write, workers=jobs)
+        try:
+            with ThreadPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+                for future in [pool.submit(task) for task in tasks]:
+                    future.result()
+        finally:
+            write_queue, self._queue = self._queue, None
+            page_pool, self._pages = self._pages, None
+            page_pool.close()
+            write_queue.close()
+
+    def _script(self, name: str) -> str:
+        """Shell path of a generated deployment script"""
+        path = self.output_dir / "deployment" / name
+        return str(path) if path.is_absolute() else f"./{path.as_posix()}"
 
     def show_wiki_setup_instructions(self) -> None:
         """Display instructions for enabling GitHub Wiki"""
@@ -869,7 +1002,7 @@ echo "  3. Netlify: Deploy _book folder"
 [bold white]Step 4:[/bold white] Click "Save changes"
 
 [bold white]Step 5:[/bold white] Deploy your wiki pages
-  [dim]./generated-docs/deployment/deploy-wiki.sh https://github.com/{username}/{repo}.wiki.git[/dim]
+  [dim]{self._script("deploy-wiki.sh")} https://github.com/{username}/{repo}.wiki.git[/dim]
 
 [green]Takes 30 seconds[/green] | [blue]Learn more: https://docs.github.com/en/communities/documenting-your-project-with-wikis[/blue]
 """,
@@ -887,7 +1020,7 @@ echo "  3. Netlify: Deploy _book folder"
             print("Step 3: Check the 'Wikis' checkbox\n")
             print("Step 4: Click 'Save changes'\n")
             print("Step 5: Deploy your wiki pages")
-            print(f"        ./generated-docs/deployment/deploy-wiki.sh https://github.com/{username}/{repo}.wiki.git\n")
+            print(f"        {self._script('deploy-wiki.sh')} https://github.com/{username}/{repo}.wiki.git\n")
             print("Takes 30 seconds | Learn more: https://docs.github.com/en/communities/documenting-your-project-with-wikis")
             print("="*70 + "\n")
 
@@ -903,7 +1036,13 @@ echo "  3. Netlify: Deploy _book folder"
             table.add_column("Value", style="green")
 
             table.add_row("Pages Generated", str(self.stats["pages_generated"]))
+            unchanged = self.writer.skipped + self.stats["up_to_date"]
+            table.add_row("Files Written", f"{self.writer.written} ({unchanged} unchanged)")
+            if self.writer.removed:
+                table.add_row("Files Removed", str(self.writer.removed))
             table.add_row("Formats", ", ".join(self.stats["formats"]))
+            if self.stats["broken_links"]:
+                table.add_row("Broken Links", f"[red]{len(self.stats['broken_links'])}[/red]")
             table.add_row("Duration", f"{duration:.2f}s")
             table.add_row("Output Directory", str(self.output_dir))
 
@@ -915,16 +1054,22 @@ echo "  3. Netlify: Deploy _book folder"
                 self.show_wiki_setup_instructions()
 
             rprint("\n[bold]Next Steps:[/bold]")
-            rprint("  1. Review generated docs in [cyan]generated-docs/[/cyan]")
+            rprint(f"  1. Review generated docs in [cyan]{self.output_dir}/[/cyan]")
             if "github-wiki" in self.stats["formats"]:
                 rprint("  2. [yellow]Enable GitHub Wiki[/yellow] (see instructions above)")
-                rprint("  3. Deploy wiki: [cyan]./generated-docs/deployment/deploy-wiki.sh <repo-url>[/cyan]")
+                rprint(f"  3. Deploy wiki: [cyan]{self._script('deploy-wiki.sh')} <repo-url>[/cyan]")
             if "gitbook" in self.stats["formats"]:
-                rprint(f"  {'4' if 'github-wiki' in self.stats['formats'] else '2'}. Build GitBook: [cyan]./generated-docs/deployment/deploy-gitbook.sh[/cyan]")
+                rprint(f"  {'4' if 'github-wiki' in self.stats['formats'] else '2'}. Build GitBook: [cyan]{self._script('deploy-gitbook.sh')}[/cyan]")
         else:
             print("\nDocumentation Generation Complete!\n")
             print(f"Pages Generated: {self.stats['pages_generated']}")
+            unchanged = self.writer.skipped + self.stats["up_to_date"]
+            print(f"Files Written: {self.writer.written} ({unchanged} unchanged)")
+            if self.writer.removed:
+                print(f"Files Removed: {self.writer.removed}")
             print(f"Formats: {', '.join(self.stats['formats'])}")
+            if self.stats["broken_links"]:
+                print(f"Broken Links: {len(self.stats['broken_links'])}")
             print(f"Duration: {duration:.2f}s")
             print(f"Output: {self.output_dir}")
 
@@ -936,9 +1081,98 @@ echo "  3. Netlify: Deploy _book folder"
             print("  1. Review generated docs")
             if "github-wiki" in self.stats["formats"]:
                 print("  2. Enable GitHub Wiki (see instructions above)")
-                print("  3. Deploy wiki: ./generated-docs/deployment/deploy-wiki.sh <repo-url>")
+                print(f"  3. Deploy wiki: {self._script('deploy-wiki.sh')} <repo-url>")
             if "gitbook" in self.stats["formats"]:
-                print(f"  {'4' if 'github-wiki' in self.stats['formats'] else '2'}. Build GitBook: ./generated-docs/deployment/deploy-gitbook.sh")
+                print(f"  {'4' if 'github-wiki' in self.stats['formats'] else '2'}. Build GitBook: {self._script('deploy-gitbook.sh')}")
+
+
+def farm_output_dir(config_path: Path) -> Path:
+    """Output root for a config: generated-docs/ beside it, generated-docs-<name>/ for other config names"""
+    if config_path.name == "wiki-config.yaml":
+        return config_path.parent / "generated-docs"
+    return config_path.parent / f"generated-docs-{config_path.stem}"
+
+
+def _build_project(config_path: str, formats: Optional[List[str]], jobs: int) -> Dict[str, Any]:
+    """Build one farm project without console output; returns its summary row"""
+    path = Path(config_path)
+    output_dir = farm_output_dir(path)
+    result = {"config": config_path, "name": path.parent.name, "output": str(output_dir), "pages": 0,
+              "seconds": 0.0, "written": 0, "unchanged": 0, "broken_links": 0, "error": None}
+    start = time.perf_counter()
+    try:
+        if not path.is_file():
+            raise FileNotFoundError(f"{config_path} does not exist")
+        generator = DocumentationGenerator(str(path.parent), jobs=jobs, config_file=path.name,
+                                           output_dir=str(output_dir))
+        with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+            generator.generate_all(formats=formats)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    else:
+        result.update(name=generator.config["project"].get("name", result["name"]),
+                      pages=generator.stats["pages_generated"], broken_links=len(generator.stats["broken_links"]),
+                      written=generator.writer.written,
+                      unchanged=generator.writer.skipped + generator.stats["up_to_date"])
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def build_farm(configs: List[str], formats: Optional[List[str]] = None,
+               jobs: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Build many projects concurrently, each from its own config into its own output root
+
+    Projects run on worker processes, since page rendering is CPU-bound Python, and
+    split the job budget between them. A worker keeps the generator code hash and the
+    page-template digests memoised for every project it builds, and forked workers
+    inherit them from the parent.
+
+    Args:
+        configs: wiki-config.yaml paths; each project's root is its config's directory
+        formats: Formats to build (default: each config's enabled formats)
+        jobs: Total worker budget (default: CPU count)
+
+    Returns:
+        One summary row per config, in the given order
+    """
+    paths = list(dict.fromkeys(str(Path(config).resolve()) for config in configs))
+    jobs = jobs or os.cpu_count() or 1
+    workers = min(jobs, len(paths))
+    per_project = max(1, jobs // workers)
+    if workers <= 1:
+        return [_build_project(path, formats, per_project) for path in paths]
+
+    generator_digest()  # Computed once here, inherited by forked workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_build_project, paths, [formats] * len(paths), [per_project] * len(paths)))
+
+
+def show_farm_summary(results: List[Dict[str, Any]], seconds: float) -> None:
+    """Table of pages per second (and failures) per farm project"""
+    rows = []
+    for result in results:
+        rate = result["pages"] / result["seconds"] if result["seconds"] else 0.0
+        status = (result["error"] or (f"{result['broken_links']} broken links" if result["broken_links"] else "OK"))
+        rows.append((result["name"], os.path.relpath(result["output"]), str(result["pages"]), f"{result['seconds']:.2f}s",
+                     f"{rate:.0f}", f"{result['written']} ({result['unchanged']} unchanged)", status))
+    total = sum(result["pages"] for result in results)
+    footer = f"{len(results)} projects, {total} pages in {seconds:.2f}s ({total / seconds if seconds else 0:.0f} pages/s)"
+
+    columns = ("Project", "Output", "Pages", "Time", "Pages/s", "Files Written", "Status")
+    if RICH_AVAILABLE:
+        table = Table(show_header=True, header_style="bold magenta", title="Documentation Farm")
+        for column in columns:
+            table.add_column(column, style="cyan" if column == "Project" else None)
+        for row in rows:
+            table.add_row(*row[:-1], row[-1] if row[-1] == "OK" else f"[red]{row[-1]}[/red]")
+        console.print(table)
+        rprint(f"[bold green]{footer}[/bold green]")
+    else:
+        print("\nDocumentation Farm")
+        for row in rows:
+            print("  " + " | ".join(f"{column}: {value}" for column, value in zip(columns, row)))
+        print(footer)
 
 
 def main():
@@ -957,6 +1191,15 @@ Examples:
   # Generate multiple formats
   python wiki-generator.py --format github-wiki gitbook
 
+  # Generate on 8 worker threads
+  python wiki-generator.py --all --jobs 8
+
+  # Build several products concurrently, each into generated-docs/ beside its config
+  python wiki-generator.py --farm products/*/wiki-config.yaml
+
+  # Push the generated wiki (only changed pages are sent)
+  python wiki-generator.py --deploy-wiki https://github.com/user/repo.git
+
   # List available templates and themes
   python wiki-generator.py --list
         """
@@ -966,7 +1209,14 @@ Examples:
     parser.add_argument("--format", nargs="+", choices=DocumentationGenerator.SUPPORTED_FORMATS,
                        help="Specific format(s) to generate")
     parser.add_argument("--list", action="store_true", help="List available templates and themes")
-    parser.add_argument("--config", default="wiki-config.yaml", help="Configuration file path")
+    parser.add_argument("--config", default="wiki-config.yaml",
+                       help="Configuration file path; its directory is the project root")
+    parser.add_argument("--jobs", "-j", type=int,
+                       help="Workers for formats, page rendering and writes (default: CPU count, 1 = sequential)")
+    parser.add_argument("--deploy-wiki", metavar="REPO_URL",
+                       help="Push the config's generated github-wiki to the repository's wiki")
+    parser.add_argument("--farm", nargs="+", metavar="CONFIG",
+                       help="Build several projects concurrently, one per config file")
 
     args = parser.parse_args()
 
@@ -995,12 +1245,24 @@ Examples:
                 print(f"  • {fmt}")
         return
 
-    generator = DocumentationGenerator()
+    if args.farm:
+        start = time.perf_counter()
+        results = build_farm(args.farm, formats=args.format, jobs=args.jobs)
+        show_farm_summary(results, time.perf_counter() - start)
+        if any(result["error"] or result["broken_links"] for result in results):
+            sys.exit(1)
+        return
+
+    # Like a farm project: the config's directory is the project root, output goes beside it
+    config_path = Path(args.config)
+    generator = DocumentationGenerator(str(config_path.parent), jobs=args.jobs, config_file=config_path.name,
+                                       output_dir=str(farm_output_dir(config_path)))
 
-    if args.all:
-        generator.generate_all()
-    elif args.format:
-        generator.generate_all(formats=args.format)
+    if args.all or args.format or args.deploy_wiki:
+        if (args.all or args.format) and not generator.generate_all(formats=args.format):
+            sys.exit(1)
+        if args.deploy_wiki and not generator.deploy_wiki(args.deploy_wiki):
+            sys.exit(1)
     else:
         if RICH_AVAILABLE:
             rprint("[yellow]Usage: python wiki-generator.py --all[/yellow]")